@@ -18,11 +18,16 @@ These are *not* part of the API.
 """
 
 import base64
+from concurrent import futures
+import copy
 import datetime
 from hashlib import md5
+import json
+import logging
 import os
 import sys
 import secrets
+import threading
 from urllib.parse import urlsplit
 from urllib.parse import urlunsplit
 from uuid import uuid4
@@ -73,6 +78,19 @@ _GENERATION_MATCH_PARAMETERS = (
     ("if_source_metageneration_not_match", "ifSourceMetagenerationNotMatch"),
 )
 
+_CREDENTIALS_REFRESH_MARGIN = 300.0  # seconds
+"""Refresh credentials this long before they expire.
+
+Longer than the margin within which ``google-auth`` refreshes expiring
+credentials during a request, so that requests find them already refreshed.
+"""
+
+_CREDENTIALS_REFRESH_MIN_INTERVAL = 10.0  # seconds
+
+_CREDENTIALS_REFRESH_IDLE_INTERVAL = 300.0  # seconds
+
+_logger = logging.getLogger(__name__)
+
 # _NOW() returns the current local date and time.
 # It is preferred to use timezone-aware datetimes _NOW(_UTC),
 # which returns the current UTC date and time.
@@ -682,3 +700,166 @@ def generate_random_56_bit_integer():
     random_bytes = secrets.token_bytes(7)
     # Convert bytes to an integer
     return int.from_bytes(random_bytes, "big")
+
+
+class _SingleFlight(object):
+    """Merge identical calls made concurrently into a single call.
+
+    While a call for a key is in flight, callers of :meth:`do` with the same
+    key wait for it and share its result, rather than making their own call.
+    A call made after the in-flight one completes starts a new call.
+
+    The number of calls which waited for another call is kept in
+    ``merged``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self.merged = 0
+
+    @staticmethod
+    def make_key(*parts):
+        """Build a hashable key from JSON-serializable parts.
+
+        :rtype: str
+        :returns: A key which is equal for equal parts, whatever the order
+                  of the keys of any dictionaries among them.
+        """
+        return json.dumps(parts, sort_keys=True, default=str)
+
+    def do(self, key, func):
+        """Call ``func``, unless a call for ``key`` is already in flight.
+
+        :type key: str
+        :param key: Identifies calls which may be merged.
+
+        :type func: callable
+        :param func: Called with no arguments to make the call.
+
+        :returns: The result of the call. Callers which waited for another
+                  caller's call get a deep copy of its result, so that no
+                  two callers share objects and each may modify its result.
+
+        :raises: The exception raised by the call, if any.
+        """
+        with self._lock:
+            # The future of the call, and the number of callers waiting for it.
+            entry = self._in_flight.get(key)
+            leader = entry is None
+            if leader:
+                entry = self._in_flight[key] = [futures.Future(), 0]
+            else:
+                entry[1] += 1
+                self.merged += 1
+        future = entry[0]
+
+        if not leader:
+            return copy.deepcopy(future.result())
+
+        try:
+            result = func()
+        except BaseException as exc:
+            self._finish(key)
+            future.set_exception(exc)
+            raise
+        if self._finish(key):
+            # Waiters copy from a copy, which the caller can't modify meanwhile.
+            future.set_result(copy.deepcopy(result))
+        else:
+            future.set_result(None)
+        return result
+
+    def _finish(self, key):
+        """Stop merging calls for ``key`` into the current call.
+
+        Callers arriving from now on start a new call, rather than sharing the
+        result of a call which completed before they asked.
+
+        :rtype: int
+        :returns: The number of callers waiting for the current call.
+        """
+        with self._lock:
+            return self._in_flight.pop(key)[1]
+
+
+class _CredentialRefresher(object):
+    """Refresh credentials on a background thread ahead of their expiry.
+
+    Requests made with the credentials then find a valid token, rather than
+    each waiting for the token endpoint when it expires. If a refresh fails,
+    it is retried; meanwhile, requests refresh expired credentials
+    themselves, as they would without a refresher.
+
+    The numbers of refreshes made and failed are kept in ``refreshes`` and
+    ``errors``.
+
+    :type credentials: :class:`~google.auth.credentials.Credentials`
+    :param credentials: The credentials to refresh.
+
+    :type request: :class:`~google.auth.transport.Request`
+    :param request: Makes the HTTP requests of the refreshes.
+
+    :type margin: float
+    :param margin: (Optional) Refresh this many seconds before expiry.
+    """
+
+    def __init__(self, credentials, request, margin=_CREDENTIALS_REFRESH_MARGIN):
+        self._credentials = credentials
+        self._request = request
+        self._margin = margin
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="storage-credential-refresh", daemon=True
+        )
+        self.refreshes = 0
+        self.errors = 0
+
+    def start(self):
+        """Start refreshing in the background."""
+        self._thread.start()
+
+    def stop(self, wait=True):
+        """Stop refreshing.
+
+        :type wait: bool
+        :param wait: (Optional) If True, the default, wait for a refresh in
+                     progress to complete.
+        """
+        self._stopped.set()
+        if wait and self._thread.is_alive():
+            self._thread.join()
+
+    def _next_refresh(self):
+        """Seconds until the credentials are due to be refreshed."""
+        credentials = self._credentials
+        if credentials.token is None:
+            return 0.0
+        if credentials.expiry is None:
+            # Credentials without an expiry are checked now and then, in case
+            # they are given one.
+            return _CREDENTIALS_REFRESH_IDLE_INTERVAL
+        expiry = credentials.expiry.replace(tzinfo=_UTC)
+        remaining = (expiry - _NOW(_UTC)).total_seconds()
+        return max(remaining - self._margin, 0.0)
+
+    def _run(self):
+        delay = self._next_refresh()
+        while not self._stopped.wait(delay):
+            # A request may have refreshed the credentials meanwhile.
+            delay = self._next_refresh()
+            if delay > 0:
+                continue
+            try:
+                self._credentials.refresh(self._request)
+            except Exception:
+                self.errors += 1
+                _logger.warning(
+                    "Refreshing credentials in the background failed.", exc_info=True
+                )
+                delay = _CREDENTIALS_REFRESH_MIN_INTERVAL
+            else:
+                self.refreshes += 1
+                # Don't refresh continually credentials whose lifetime is
+                # shorter than the margin.
+                delay = max(self._next_refresh(), _CREDENTIALS_REFRESH_MIN_INTERVAL)
@@ -15,10 +15,19 @@
 """Create / interact with Google Cloud Storage connections."""
 
 import functools
+import socket
+import threading
+
+import requests
+from urllib3 import connectionpool
+from urllib3 import connection as urllib3_connection
+
 from google.cloud import _http
 from google.cloud.storage import __version__
 from google.cloud.storage import _helpers
 from google.cloud.storage._opentelemetry_tracing import create_trace_span
+from google.cloud.storage.constants import _DEFAULT_TIMEOUT
+from google.cloud.storage.retry import _limit_retries
 
 
 class Connection(_http.JSONConnection):
@@ -85,6 +94,157 @@ class Connection(_http.JSONConnection):
                     retry = retry.get_retry_policy_if_conditions_met(**kwargs)
                 except AttributeError:  # This is not a ConditionalRetryPolicy.
                     pass
-                if retry:
-                    call = retry(call)
+            retry = _limit_retries(retry, self._client)
+            if retry:
+                call = retry(call)
             return call()
+
+    def _do_request(
+        self, method, url, headers, data, target_object, timeout=_DEFAULT_TIMEOUT
+    ):
+        """Override JSONConnection:  batch the request if the client does.
+
+        Requests which the client's auto-batcher accepts wait for the batch
+        they join to be sent; others are sent immediately.
+
+        :type method: str
+        :param method: The HTTP method to use in the request.
+
+        :type url: str
+        :param url: The URL to send the request to.
+
+        :type headers: dict
+        :param headers: A dictionary of HTTP headers to send with the request.
+
+        :type data: str
+        :param data: The data to send as the body of the request.
+
+        :type target_object: object
+        :param target_object: (Optional) Unused here.
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :rtype: :class:`requests.Response`
+        :returns: The HTTP response.
+        """
+        batcher = getattr(self._client, "_auto_batcher", None)
+        if batcher is not None and batcher.accepts(method, url):
+            future = batcher.submit(method, url, headers, data, timeout=timeout)
+            return future.result()
+        return super(Connection, self)._do_request(
+            method, url, headers, data, target_object, timeout=timeout
+        )
+
+
+class _ConnectionPoolStats(object):
+    """Thread-safe counters of connection reuse for a client's HTTP pools."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {"requests": 0, "misses": 0, "discards": 0}
+
+    def record(self, name):
+        with self._lock:
+            self._counts[name] += 1
+
+    def snapshot(self):
+        """Return the current counts.
+
+        :rtype: dict
+        :returns: The counts, keyed by ``requests`` (connections taken from a
+                  pool), ``hits`` (of those, connections which were already
+                  open), ``misses`` (new connections opened) and ``discards``
+                  (connections closed on release because the pool was full).
+        """
+        with self._lock:
+            counts = dict(self._counts)
+        counts["hits"] = counts["requests"] - counts["misses"]
+        return counts
+
+
+def _counting_pool_class(base, stats):
+    """Subclass a urllib3 connection pool class to update ``stats``."""
+
+    class CountingPool(base):
+        def _new_conn(self):
+            stats.record("misses")
+            return super(CountingPool, self)._new_conn()
+
+        def _get_conn(self, timeout=None):
+            stats.record("requests")
+            return super(CountingPool, self)._get_conn(timeout=timeout)
+
+        def _put_conn(self, conn):
+            pool = self.pool
+            if conn is not None and pool is not None and pool.full():
+                stats.record("discards")
+            super(CountingPool, self)._put_conn(conn)
+
+    CountingPool.__name__ = "Counting" + base.__name__
+    return CountingPool
+
+
+def _keepalive_socket_options(idle):
+    """Socket options enabling TCP keepalive probes after ``idle`` seconds."""
+    options = list(urllib3_connection.HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    elif hasattr(socket, "TCP_KEEPALIVE"):  # pragma: NO COVER (macOS)
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, idle))
+    return options
+
+
+def _configure_connection_pools(
+    session, stats, pool_size=None, pool_maxsize=None, tcp_keepalive=None
+):
+    """Re-create the connection pools of a ``requests`` session.
+
+    Pools of every adapter mounted on ``session`` are re-created with the
+    given sizes (keeping an adapter's current size where ``None``), count
+    connection reuse in ``stats``, and enable TCP keepalive if requested.
+    Connections open in the previous pools are closed once released.
+
+    :type session: :class:`requests.Session`
+    :param session: The session to configure.
+
+    :type stats: :class:`_ConnectionPoolStats`
+    :param stats: The counters to update.
+
+    :type pool_size: int
+    :param pool_size: (Optional) The number of per-host pools to keep.
+
+    :type pool_maxsize: int
+    :param pool_maxsize: (Optional) The number of connections kept per host.
+
+    :type tcp_keepalive: int
+    :param tcp_keepalive:
+        (Optional) Seconds a connection is idle before TCP keepalive probes
+        are sent.
+    """
+    pool_classes = {
+        "http": _counting_pool_class(connectionpool.HTTPConnectionPool, stats),
+        "https": _counting_pool_class(connectionpool.HTTPSConnectionPool, stats),
+    }
+    pool_kwargs = {}
+    if tcp_keepalive is not None:
+        pool_kwargs["socket_options"] = _keepalive_socket_options(tcp_keepalive)
+
+    for adapter in session.adapters.values():
+        if not isinstance(adapter, requests.adapters.HTTPAdapter):
+            continue
+        previous = adapter.poolmanager
+        adapter.init_poolmanager(
+            pool_size if pool_size is not None else adapter._pool_connections,
+            pool_maxsize if pool_maxsize is not None else adapter._pool_maxsize,
+            block=adapter._pool_block,
+            **pool_kwargs,
+        )
+        adapter.poolmanager.pool_classes_by_scheme = pool_classes
+        if previous is not None:
+            previous.clear()
@@ -0,0 +1,216 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""HTTP/2 transport for ``requests`` sessions, backed by ``httpx``."""
+
+import io
+
+import requests
+from requests import structures
+from requests import utils as requests_utils
+from urllib3 import _collections
+from urllib3 import response as urllib3_response
+
+try:
+    import httpx
+
+    HAS_HTTPX = True
+except ImportError:  # pragma: NO COVER
+    httpx = None
+    HAS_HTTPX = False
+
+# The size of the blocks read from file-like request bodies.
+_BODY_BLOCK_SIZE = 65536
+
+# Connection-specific headers are not allowed in HTTP/2 requests.
+_HOP_BY_HOP_HEADERS = frozenset(
+    (
+        "connection",
+        "keep-alive",
+        "proxy-connection",
+        "transfer-encoding",
+        "upgrade",
+    )
+)
+
+
+def _httpx_timeout(timeout):
+    """Convert a ``requests`` timeout to an :class:`httpx.Timeout`."""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+class _ResponseStream(io.RawIOBase):
+    """File-like reader over the undecoded body of an ``httpx`` response.
+
+    Transport errors raised while reading are converted to the builtin
+    exceptions ``urllib3`` wraps for responses read from a socket.
+    """
+
+    def __init__(self, response):
+        self._response = response
+        self._chunks = response.iter_raw()
+        self._buffer = memoryview(b"")
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._buffer:
+            try:
+                self._buffer = memoryview(next(self._chunks))
+            except StopIteration:
+                self._response.close()
+                return 0
+            except httpx.TimeoutException as exc:
+                raise TimeoutError(str(exc)) from exc
+            except httpx.TransportError as exc:
+                raise ConnectionError(str(exc)) from exc
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._response.close()
+        super(_ResponseStream, self).close()
+
+
+class HTTP2Adapter(requests.adapters.BaseAdapter):
+    """A ``requests`` transport adapter which sends requests over HTTP/2.
+
+    Mounted on a :class:`requests.Session` (including the
+    :class:`~google.auth.transport.requests.AuthorizedSession` used by
+    :class:`~google.cloud.storage.client.Client`), requests are sent through
+    an :class:`httpx.Client`, so that concurrent requests to the same host
+    are multiplexed as streams over a few shared connections instead of
+    each needing its own connection. Servers which do not support HTTP/2
+    are spoken to over HTTP/1.1.
+
+    Responses are returned as ordinary :class:`requests.Response` objects
+    whose ``raw`` attribute is a :class:`urllib3.response.HTTPResponse`, so
+    that code reading response bodies, including the checksumming download
+    helpers, works unchanged.
+
+    Requires the ``http2`` extra (``pip install google-cloud-storage[http2]``).
+
+    :type http_client: :class:`httpx.Client`
+    :param http_client:
+        (Optional) The client used to send requests. Defaults to a new client
+        with HTTP/2 enabled. Its TLS settings are used in place of the
+        ``verify`` and ``cert`` arguments of individual requests.
+    """
+
+    def __init__(self, http_client=None):
+        if not HAS_HTTPX:  # pragma: NO COVER
+            raise ImportError(
+                "HTTP/2 support requires httpx; install it with "
+                "`pip install google-cloud-storage[http2]`."
+            )
+        super(HTTP2Adapter, self).__init__()
+        if http_client is None:
+            http_client = httpx.Client(http2=True)
+        self._http_client = http_client
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):
+        """Send a prepared request over HTTP/2.
+
+        :type request: :class:`requests.PreparedRequest`
+        :param request: The request to send.
+
+        :type stream: bool
+        :param stream:
+            Ignored; the body is always read from the response as needed.
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The timeout, or a ``(connect, read)`` tuple of timeouts,
+            in seconds.
+
+        :rtype: :class:`requests.Response`
+        :returns: The response, with its body not yet read.
+
+        :raises: :class:`requests.exceptions.Timeout` or
+            :class:`requests.exceptions.ConnectionError` if the request
+            could not be sent.
+        """
+        headers = [
+            (name, value)
+            for name, value in request.headers.items()
+            if name.lower() not in _HOP_BY_HOP_HEADERS
+        ]
+        body = request.body
+        if hasattr(body, "read"):
+            # httpx only sends bytes or iterables; the Content-Length set by
+            # requests is kept, so the body is not sent chunked.
+            body = iter(lambda: request.body.read(_BODY_BLOCK_SIZE), b"")
+        http_request = self._http_client.build_request(
+            request.method,
+            request.url,
+            headers=headers,
+            content=body,
+            timeout=_httpx_timeout(timeout),
+        )
+        try:
+            http_response = self._http_client.send(http_request, stream=True)
+        except httpx.ConnectTimeout as exc:
+            raise requests.exceptions.ConnectTimeout(exc, request=request)
+        except httpx.TimeoutException as exc:
+            raise requests.exceptions.ReadTimeout(exc, request=request)
+        except httpx.TransportError as exc:
+            raise requests.exceptions.ConnectionError(exc, request=request)
+        return self.build_response(request, http_response)
+
+    def build_response(self, request, http_response):
+        """Build a :class:`requests.Response` from an ``httpx`` response.
+
+        :type request: :class:`requests.PreparedRequest`
+        :param request: The request the response is for.
+
+        :type http_response: :class:`httpx.Response`
+        :param http_response: The streamed response.
+
+        :rtype: :class:`requests.Response`
+        :returns: The response.
+        """
+        raw = urllib3_response.HTTPResponse(
+            body=_ResponseStream(http_response),
+            headers=_collections.HTTPHeaderDict(http_response.headers.multi_items()),
+            status=http_response.status_code,
+            version=20 if http_response.http_version == "HTTP/2" else 11,
+            reason=http_response.reason_phrase,
+            preload_content=False,
+            decode_content=False,
+            request_method=request.method,
+            request_url=request.url,
+        )
+        response = requests.Response()
+        response.status_code = raw.status
+        response.headers = structures.CaseInsensitiveDict(raw.headers)
+        response.encoding = requests_utils.get_encoding_from_headers(response.headers)
+        response.raw = raw
+        response.reason = raw.reason
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        """Close the connections of the underlying ``httpx`` client."""
+        self._http_client.close()
@@ -19,6 +19,7 @@ import http.client
 import re
 
 from google.cloud.storage._media import _helpers
+from google.cloud.storage.exceptions import DataCorruption
 from google.cloud.storage.exceptions import InvalidResponse
 from google.cloud.storage.retry import DEFAULT_RETRY
 
@@ -30,6 +31,19 @@ _CONTENT_RANGE_RE = re.compile(
 _ACCEPTABLE_STATUS_CODES = (http.client.OK, http.client.PARTIAL_CONTENT)
 _GET = "GET"
 _ZERO_CONTENT_RANGE_HEADER = "bytes */0"
+_CHUNKED_CHECKSUM_MISMATCH = """\
+Checksum mismatch while downloading in chunks:
+
+  {}
+
+The X-Goog-Hash header indicated an {checksum_type} checksum of:
+
+  {}
+
+but the actual {checksum_type} checksum of the downloaded contents was:
+
+  {}
+"""
 
 
 class DownloadBase(object):
@@ -160,6 +174,10 @@ class Download(DownloadBase):
         single_shot_download (Optional[bool]): If true, download the object in a single request.
             Caution: Enabling this will increase the memory overload for your application.
             Please enable this as per your use case.
+        buffer_size (Optional[int]): The number of bytes to read from the
+            response at a time while streaming it to ``stream``. Larger
+            buffers reduce per-read overhead on fast networks at the cost of
+            memory. If not set, a transport-specific default is used.
 
     """
 
@@ -173,6 +191,7 @@ class Download(DownloadBase):
         checksum="auto",
         retry=DEFAULT_RETRY,
         single_shot_download=False,
+        buffer_size=None,
     ):
         super(Download, self).__init__(
             media_url, stream=stream, start=start, end=end, headers=headers, retry=retry
@@ -183,6 +202,7 @@ class Download(DownloadBase):
                 "crc32c" if _helpers._is_crc32c_available_and_fast() else "md5"
             )
         self.single_shot_download = single_shot_download
+        self.buffer_size = buffer_size
         self._bytes_downloaded = 0
         self._expected_checksum = None
         self._checksum_object = None
@@ -281,6 +301,19 @@ class ChunkedDownload(DownloadBase):
             See the retry.py source code and docstrings in this package
             (google.cloud.storage.retry) for information on retry types and how
             to configure them.
+        checksum (Optional[str]): The type of checksum to compute across all
+            chunks to verify the integrity of the object. It is checked
+            against the ``X-Goog-Hash`` header of the first response once the
+            last chunk has been downloaded. Only downloads of a whole object
+            can be verified; ranged downloads and objects stored with gzip
+            encoding are not checked. Supported values are "md5", "crc32c",
+            "auto" and None. The default is "auto", which will try to detect
+            if the C extension for crc32c is installed and fall back to md5
+            otherwise.
+        adaptive_chunk_size (Optional[bool]): If True, ``chunk_size`` is the
+            largest chunk size used. Chunks start at 1 MiB and grow while the
+            throughput of each request keeps improving, and shrink after a
+            request needs to be retried. The default is False.
 
     Attributes:
         media_url (str): The URL containing the media to be downloaded.
@@ -301,6 +334,8 @@ class ChunkedDownload(DownloadBase):
         end=None,
         headers=None,
         retry=DEFAULT_RETRY,
+        checksum="auto",
+        adaptive_chunk_size=False,
     ):
         if start < 0:
             raise ValueError(
@@ -315,9 +350,20 @@ class ChunkedDownload(DownloadBase):
             retry=retry,
         )
         self.chunk_size = chunk_size
+        self.checksum = checksum
+        if self.checksum == "auto":
+            self.checksum = (
+                "crc32c" if _helpers._is_crc32c_available_and_fast() else "md5"
+            )
         self._bytes_downloaded = 0
         self._total_bytes = None
         self._invalid = False
+        self._expected_checksum = None
+        self._checksum_object = None
+        self._chunk_sizer = None
+        if adaptive_chunk_size:
+            self._chunk_sizer = _helpers._AdaptiveChunkSize(chunk_size)
+            self.chunk_size = self._chunk_sizer.chunk_size
 
     @property
     def bytes_downloaded(self):
@@ -337,6 +383,33 @@ class ChunkedDownload(DownloadBase):
         """
         return self._invalid
 
+    @property
+    def chunk_size_decision(self):
+        """Optional[dict]: The last change (or not) of an adaptive chunk size.
+
+        See :attr:`._AdaptiveChunkSize.last_decision`. This is :data:`None`
+        unless ``adaptive_chunk_size`` was set and a chunk has been received.
+        """
+        if self._chunk_sizer is None:
+            return None
+        return self._chunk_sizer.last_decision
+
+    def _adapt_chunk_size(self, bytes_received, elapsed, retried=False):
+        """Update an adaptive chunk size after a chunk has been received.
+
+        Args:
+            bytes_received (int): The number of bytes in the chunk.
+            elapsed (float): The time taken to receive the chunk, in seconds.
+            retried (bool): Whether receiving the chunk needed to be retried.
+        """
+        if self._chunk_sizer is not None:
+            self.chunk_size = self._chunk_sizer.record(bytes_received, elapsed, retried)
+
+    def _adapt_chunk_size_after_failure(self):
+        """Update an adaptive chunk size after receiving a chunk failed."""
+        if self._chunk_sizer is not None:
+            self.chunk_size = self._chunk_sizer.record_failure()
+
     def _get_byte_range(self):
         """Determines the byte range for the next request.
 
@@ -476,6 +549,9 @@ class ChunkedDownload(DownloadBase):
             # 'content-length' header not allowed with chunked encoding.
             num_bytes = end_byte - start_byte + 1
 
+        if self._checksum_object is None:
+            self._prepare_checksum(response, total_bytes)
+
         # First update ``bytes_downloaded``.
         self._bytes_downloaded += num_bytes
         # If the end byte is past ``end`` or ``total_bytes - 1`` we are done.
@@ -487,8 +563,50 @@ class ChunkedDownload(DownloadBase):
         if self.total_bytes is None:
             self._total_bytes = total_bytes
         # Write the response body to the stream.
+        self._checksum_object.update(response_body)
         self._stream.write(response_body)
 
+        if self._finished and self._expected_checksum is not None:
+            actual_checksum = _helpers.prepare_checksum_digest(
+                self._checksum_object.digest()
+            )
+            if actual_checksum != self._expected_checksum:
+                msg = _CHUNKED_CHECKSUM_MISMATCH.format(
+                    self.media_url,
+                    self._expected_checksum,
+                    actual_checksum,
+                    checksum_type=self.checksum.upper(),
+                )
+                raise DataCorruption(response, msg)
+
+    def _prepare_checksum(self, response, total_bytes):
+        """Set up the running checksum from the first response of a download.
+
+        The ``X-Goog-Hash`` header describes the whole object, so it can only
+        be used to verify downloads that cover the whole object. Objects
+        stored with gzip encoding are also skipped, since their chunks may be
+        decoded in transit and so not match the stored checksum.
+
+        Args:
+            response (object): The HTTP response object.
+            total_bytes (int): The size of the object.
+        """
+        headers = self._get_headers(response)
+        whole_object = (
+            self.start == 0
+            and self._bytes_downloaded == 0
+            and (self.end is None or self.end >= total_bytes - 1)
+        )
+        stored_encoding = headers.get(_helpers._STORED_CONTENT_ENCODING_HEADER)
+        if whole_object and stored_encoding != "gzip":
+            expected_checksum, checksum_object = _helpers._get_expected_checksum(
+                response, self._get_headers, self.media_url, checksum_type=self.checksum
+            )
+        else:
+            expected_checksum, checksum_object = None, _helpers._DoNothingHash()
+        self._expected_checksum = expected_checksum
+        self._checksum_object = checksum_object
+
     def consume_next_chunk(self, transport, timeout=None):
         """Consume the next chunk of the resource to be downloaded.
 
@@ -19,6 +19,8 @@ from __future__ import absolute_import
 import base64
 import hashlib
 import logging
+import queue
+import threading
 
 from urllib.parse import parse_qs
 from urllib.parse import urlencode
@@ -26,6 +28,7 @@ from urllib.parse import urlsplit
 from urllib.parse import urlunsplit
 
 from google.cloud.storage import retry
+from google.cloud.storage._media.common import UPLOAD_CHUNK_SIZE
 from google.cloud.storage.exceptions import InvalidResponse
 
 
@@ -41,6 +44,14 @@ _SLOW_CRC32C_WARNING = (
 _GENERATION_HEADER = "x-goog-generation"
 _HASH_HEADER = "x-goog-hash"
 _STORED_CONTENT_ENCODING_HEADER = "x-goog-stored-content-encoding"
+# The number of chunks a download may read ahead of its checksum computation.
+_MAX_PENDING_CHECKSUM_CHUNKS = 4
+# The first chunk size used when the chunk size is adapted to throughput.
+_ADAPTIVE_INITIAL_CHUNK_SIZE = 4 * UPLOAD_CHUNK_SIZE  # 1 MiB
+# A larger chunk must improve throughput by this factor to keep growing.
+_ADAPTIVE_MIN_IMPROVEMENT = 1.1
+# The number of clean requests after a shrink before growing again.
+_ADAPTIVE_RECOVERY_CHUNKS = 4
 
 _MISSING_CHECKSUM = """\
 No {checksum_type} checksum was returned from the service while downloading {}
@@ -272,6 +283,42 @@ def _get_checksum_object(checksum_type):
         raise ValueError("checksum must be ``'md5'``, ``'crc32c'`` or ``None``")
 
 
+def _get_checksum_state(checksum_object):
+    """Return a JSON-serializable snapshot of a running checksum, if possible.
+
+    Only crc32c checksums can be captured: the running value of a CRC is a
+    plain integer, whereas the internal state of ``hashlib`` objects cannot
+    be exported.
+
+    Args:
+        checksum_object (object): A checksum object, as returned by
+            :func:`_get_checksum_object`.
+
+    Returns:
+        Optional[int]: The running CRC, or None if it cannot be captured.
+    """
+    crc = getattr(checksum_object, "_crc", None)
+    return crc if isinstance(crc, int) else None
+
+
+def _restore_checksum_object(checksum_type, state):
+    """Recreate a running checksum from :func:`_get_checksum_state`.
+
+    Args:
+        checksum_type (Optional[str]): The type of checksum.
+        state (Optional[int]): The captured state.
+
+    Returns:
+        Optional[object]: The checksum object, or None if it cannot be
+        restored.
+    """
+    if checksum_type != "crc32c" or not isinstance(state, int):
+        return None
+    checksum_object = _get_checksum_object(checksum_type)
+    checksum_object._crc = state
+    return checksum_object
+
+
 def _is_crc32c_available_and_fast():
     """Return True if the google_crc32c C extension is installed.
 
@@ -381,3 +428,180 @@ class _DoNothingHash(object):
         Args:
             unused_chunk (bytes): A chunk of data.
         """
+
+
+class _BackgroundChecksum(object):
+    """Checksum wrapper which applies updates on a helper thread.
+
+    Both ``google_crc32c`` and ``hashlib`` release the GIL while hashing large
+    chunks, so hashing on a helper thread lets a download keep reading from
+    the network while earlier chunks are being checksummed. Chunks are handed
+    over through a bounded queue, so at most ``max_pending`` chunks are held
+    in memory waiting to be hashed.
+
+    Chunks passed to :meth:`update` must not be modified afterwards. The
+    wrapped checksum object must not be used until :meth:`close` returns.
+    Updates to a ``_DoNothingHash`` are dropped without starting a thread.
+
+    For a body read in one or two chunks there is nothing to overlap, so
+    ``inline`` hashes each chunk in :meth:`update` instead of starting a
+    thread.
+
+    Args:
+        checksum_object (object): The checksum object to update, such as a
+            ``hashlib.md5()`` or ``google_crc32c.Checksum()``.
+        max_pending (int): The maximum number of chunks queued for hashing.
+        inline (bool): If true, hash chunks on the calling thread.
+    """
+
+    def __init__(
+        self,
+        checksum_object,
+        max_pending=_MAX_PENDING_CHECKSUM_CHUNKS,
+        inline=False,
+    ):
+        self._checksum_object = checksum_object
+        self._inline = inline
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = None
+        self._error = None
+
+    def _run(self):
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                return
+            # Keep draining after a failure so that ``update`` never blocks.
+            if self._error is None:
+                try:
+                    self._checksum_object.update(chunk)
+                except Exception as exc:
+                    self._error = exc
+
+    def update(self, chunk):
+        """Queue a chunk of data to be hashed.
+
+        Blocks if ``max_pending`` chunks are already waiting to be hashed.
+
+        Args:
+            chunk (bytes): A chunk of data.
+        """
+        if not chunk or isinstance(self._checksum_object, _DoNothingHash):
+            return
+        if self._inline:
+            self._checksum_object.update(chunk)
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        self._queue.put(chunk)
+
+    def close(self):
+        """Wait until all queued chunks have been hashed.
+
+        Raises:
+            Exception: Any error raised by the wrapped checksum object.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            raise self._error
+
+
+class _AdaptiveChunkSize(object):
+    """Chunk size for chunked transfers which adapts to measured throughput.
+
+    The chunk size starts small and doubles after each request while the
+    throughput of a request keeps improving by at least 10%, up to
+    ``maximum``. Once a larger chunk stops helping, the size is held. A
+    request which needed to be retried, or which failed, halves the size, and
+    growth only resumes after several requests succeed at the smaller size.
+    All sizes are multiples of :data:`.UPLOAD_CHUNK_SIZE` (unless
+    ``maximum`` itself is smaller).
+
+    Args:
+        maximum (int): The largest chunk size to use.
+        initial (Optional[int]): The chunk size of the first request. The
+            default is 1 MiB.
+
+    Attributes:
+        chunk_size (int): The chunk size to use for the next request.
+        last_decision (Optional[dict]): The decision made after the last
+            request, with keys ``action`` (one of ``"grow"``, ``"hold"`` or
+            ``"shrink"``), ``chunk_size`` (the size after the decision) and
+            ``throughput`` (of the request, in bytes per second, or
+            :data:`None` after a failure). This is :data:`None` if no
+            decision was made, e.g. after a short final chunk.
+    """
+
+    def __init__(self, maximum, initial=_ADAPTIVE_INITIAL_CHUNK_SIZE):
+        self.maximum = maximum
+        self.minimum = min(maximum, UPLOAD_CHUNK_SIZE)
+        self.chunk_size = self._align(initial)
+        self.last_decision = None
+        self._throughput = None
+        self._settled = False
+        self._recovery_chunks = 0
+
+    def _align(self, size):
+        size -= size % UPLOAD_CHUNK_SIZE
+        return max(self.minimum, min(size, self.maximum))
+
+    def _decide(self, action, throughput):
+        if action == "grow":
+            self.chunk_size = self._align(self.chunk_size * 2)
+        elif action == "shrink":
+            self.chunk_size = self._align(self.chunk_size // 2)
+        self.last_decision = {
+            "action": action,
+            "chunk_size": self.chunk_size,
+            "throughput": throughput,
+        }
+        return self.chunk_size
+
+    def record(self, num_bytes, elapsed, retried=False):
+        """Update the chunk size after a request has completed.
+
+        Args:
+            num_bytes (int): The number of bytes transferred by the request.
+            elapsed (float): The time taken by the request (including any
+                retries), in seconds.
+            retried (bool): Whether the request needed to be retried.
+
+        Returns:
+            int: The chunk size to use for the next request.
+        """
+        if retried:
+            return self.record_failure()
+        if num_bytes < self.chunk_size:
+            # A short (final) chunk says little about larger chunks.
+            self.last_decision = None
+            return self.chunk_size
+
+        throughput = num_bytes / max(elapsed, 1e-6)
+        previous, self._throughput = self._throughput, throughput
+        if self._recovery_chunks:
+            self._recovery_chunks -= 1
+            if not self._recovery_chunks:
+                # Growth resumes without comparing against the smaller size.
+                self._throughput = None
+            return self._decide("hold", throughput)
+        if self._settled or self.chunk_size >= self.maximum:
+            return self._decide("hold", throughput)
+        if previous is not None and throughput < previous * _ADAPTIVE_MIN_IMPROVEMENT:
+            self._settled = True
+            return self._decide("hold", throughput)
+        return self._decide("grow", throughput)
+
+    def record_failure(self):
+        """Update the chunk size after a request has failed.
+
+        Returns:
+            int: The chunk size to use for the next request.
+        """
+        self._throughput = None
+        self._settled = False
+        self._recovery_chunks = _ADAPTIVE_RECOVERY_CHUNKS
+        return self._decide("shrink", None)
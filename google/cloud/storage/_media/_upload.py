@@ -21,12 +21,17 @@ Supported here are:
 * resumable uploads (with metadata as well)
 """
 
+import concurrent.futures
 import http.client
+import io
 import json
+import mmap
 import os
 import random
 import re
+import stat
 import sys
+import threading
 import urllib.parse
 
 from google.cloud.storage._media import _helpers
@@ -49,11 +54,15 @@ _CRLF = b"\r\n"
 _MULTIPART_BEGIN = b"\r\ncontent-type: application/json; charset=UTF-8\r\n\r\n"
 _RELATED_HEADER = b'multipart/related; boundary="'
 _BYTES_RANGE_RE = re.compile(r"bytes=0-(?P<end_byte>\d+)", flags=re.IGNORECASE)
+_CHECKSUM_BLOCK_SIZE = 1024 * 1024
 _STREAM_ERROR_TEMPLATE = (
     "Bytes stream is in unexpected state. "
     "The local stream has had {:d} bytes read from it while "
     "{:d} bytes have already been updated (they should match)."
 )
+_STREAM_TOO_SHORT_TEMPLATE = (
+    "The stream ended after {:d} bytes, but {:d} bytes have already been " "uploaded."
+)
 _STREAM_READ_PAST_TEMPLATE = (
     "{:d} bytes have been read from the stream, which exceeds "
     "the expected total {:d}."
@@ -313,11 +322,12 @@ class MultipartUpload(UploadBase):
                 image has content type ``image/jpeg``.
 
         Returns:
-            Tuple[str, str, bytes, Mapping[str, str]]: The quadruple
+            Tuple[str, str, _MultipartBody, Mapping[str, str]]: The quadruple
 
               * HTTP verb for the request (always POST)
               * the URL for the request
-              * the body of the request
+              * the body of the request, as its encoded parts (so that
+                ``data`` is not copied into a new buffer)
               * headers for the request
 
         Raises:
@@ -339,12 +349,13 @@ class MultipartUpload(UploadBase):
             metadata_key = _helpers._get_metadata_key(self._checksum_type)
             metadata[metadata_key] = actual_checksum
 
-        content, multipart_boundary = construct_multipart_request(
-            data, metadata, content_type
+        head, tail, multipart_boundary = _construct_multipart_parts(
+            metadata, content_type
         )
         multipart_content_type = _RELATED_HEADER + multipart_boundary + b'"'
         self._headers[_CONTENT_TYPE_HEADER] = multipart_content_type
 
+        content = _MultipartBody(head, data, tail)
         return _POST, self.upload_url, content, self._headers
 
     def transmit(self, transport, data, metadata, content_type, timeout=None):
@@ -401,6 +412,16 @@ class ResumableUpload(UploadBase):
             See the retry.py source code and docstrings in this package
             (google.cloud.storage.retry) for information on retry types and how
             to configure them.
+        read_ahead (Optional[bool]): If True, read and checksum the next
+            chunk of the stream on a helper thread while the current chunk is
+            being transmitted, so that local I/O overlaps with the network
+            transfer. This holds one extra chunk in memory, and the stream
+            must not be used elsewhere while the upload is in progress. The
+            default is False.
+        adaptive_chunk_size (Optional[bool]): If True, ``chunk_size`` is the
+            largest chunk size used. Chunks start at 1 MiB and grow while the
+            throughput of each request keeps improving, and shrink after a
+            request needs to be retried. The default is False.
 
     Attributes:
         upload_url (str): The URL where the content will be uploaded.
@@ -417,6 +438,8 @@ class ResumableUpload(UploadBase):
         checksum="auto",
         headers=None,
         retry=DEFAULT_RETRY,
+        read_ahead=False,
+        adaptive_chunk_size=False,
     ):
         super(ResumableUpload, self).__init__(upload_url, headers=headers, retry=retry)
         if chunk_size % UPLOAD_CHUNK_SIZE != 0:
@@ -437,6 +460,12 @@ class ResumableUpload(UploadBase):
         self._total_bytes = None
         self._resumable_url = None
         self._invalid = False
+        self._read_ahead = read_ahead
+        self._next_chunk = None
+        self._chunk_sizer = None
+        if adaptive_chunk_size:
+            self._chunk_sizer = _helpers._AdaptiveChunkSize(chunk_size)
+            self._chunk_size = self._chunk_sizer.chunk_size
 
     @property
     def invalid(self):
@@ -452,6 +481,17 @@ class ResumableUpload(UploadBase):
         """int: The size of each chunk used to upload the resource."""
         return self._chunk_size
 
+    @property
+    def chunk_size_decision(self):
+        """Optional[dict]: The last change (or not) of an adaptive chunk size.
+
+        See :attr:`._AdaptiveChunkSize.last_decision`. This is :data:`None`
+        unless ``adaptive_chunk_size`` was set and a chunk has been sent.
+        """
+        if self._chunk_sizer is None:
+            return None
+        return self._chunk_sizer.last_decision
+
     @property
     def resumable_url(self):
         """Optional[str]: The URL of the in-progress resumable upload."""
@@ -462,6 +502,26 @@ class ResumableUpload(UploadBase):
         """int: Number of bytes that have been uploaded."""
         return self._bytes_uploaded
 
+    @property
+    def checksum_state(self):
+        """Optional[dict]: A JSON-serializable snapshot of the checksum.
+
+        The snapshot can be passed to :meth:`resume` by another process to
+        avoid re-reading the bytes that were already summed. It is
+        :data:`None` if no checksum has been computed yet, or if its state
+        cannot be captured (only crc32c checksums can be).
+        """
+        if self._checksum_object is None:
+            return None
+        value = _helpers._get_checksum_state(self._checksum_object)
+        if value is None:
+            return None
+        return {
+            "type": self._checksum_type,
+            "bytes": self._bytes_checksummed,
+            "value": value,
+        }
+
     @property
     def total_bytes(self):
         """Optional[int]: The total number of bytes to be uploaded.
@@ -644,11 +704,13 @@ class ResumableUpload(UploadBase):
         will (almost) certainly not be network I/O.
 
         Returns:
-            Tuple[str, str, bytes, Mapping[str, str]]: The quadruple
+            Tuple[str, str, Union[bytes, _FileChunk], Mapping[str, str]]: The
+            quadruple
 
               * HTTP verb for the request (always PUT)
               * the URL for the request
-              * the body of the request
+              * the body of the request (a memory-mapped :class:`_FileChunk`
+                if ``stream`` is a regular file)
               * headers for the request
 
             The headers incorporate the ``_headers`` on the current instance.
@@ -674,14 +736,18 @@ class ResumableUpload(UploadBase):
                 "initiate() before beginning to transmit chunks."
             )
 
-        start_byte, payload, content_range = get_next_chunk(
-            self._stream, self._chunk_size, self._total_bytes
-        )
-        if start_byte != self.bytes_uploaded:
-            msg = _STREAM_ERROR_TEMPLATE.format(start_byte, self.bytes_uploaded)
-            raise ValueError(msg)
+        chunk = self._take_next_chunk()
+        if chunk is None:
+            start_byte, payload, content_range = get_next_chunk(
+                self._stream, self._chunk_size, self._total_bytes
+            )
+            if start_byte != self.bytes_uploaded:
+                msg = _STREAM_ERROR_TEMPLATE.format(start_byte, self.bytes_uploaded)
+                raise ValueError(msg)
 
-        self._update_checksum(start_byte, payload)
+            self._update_checksum(start_byte, payload)
+        else:
+            start_byte, payload, content_range = chunk
 
         headers = {
             **self._headers,
@@ -695,8 +761,72 @@ class ResumableUpload(UploadBase):
                 self._checksum_object.digest()
             )
             headers["x-goog-hash"] = f"{self._checksum_type}={local_checksum}"
+
+        end_byte = start_byte + len(payload)
+        if self._read_ahead and end_byte != self._total_bytes:
+            if self._total_bytes is not None or len(payload) == self._chunk_size:
+                self._start_next_chunk()
         return _PUT, self.resumable_url, payload, headers
 
+    def _start_next_chunk(self):
+        """Read and checksum the next chunk on a helper thread.
+
+        The result is picked up by :meth:`_take_next_chunk` when the next
+        request is prepared.
+        """
+        future = concurrent.futures.Future()
+        position = self._stream.tell()
+
+        def read_next_chunk():
+            try:
+                chunk = get_next_chunk(
+                    self._stream, self._chunk_size, self._total_bytes
+                )
+                self._update_checksum(chunk[0], chunk[1])
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(chunk)
+
+        self._next_chunk = (position, future)
+        threading.Thread(target=read_next_chunk, daemon=True).start()
+
+    def _take_next_chunk(self):
+        """Wait for the chunk being read ahead, if any, and return it.
+
+        Returns:
+            Optional[Tuple[int, Union[bytes, _FileChunk], str]]: The result
+            of :func:`get_next_chunk` for the next chunk, or :data:`None` if
+            no chunk was read ahead or it cannot be used, e.g. because the
+            server persisted less than the whole of the previous chunk. In
+            that case the stream is restored to where the read started, so
+            the chunk can be read again normally.
+        """
+        if self._next_chunk is None:
+            return None
+        position, future = self._next_chunk
+        self._next_chunk = None
+        try:
+            chunk = future.result()
+        except Exception:
+            chunk = None
+        if chunk is not None and chunk[0] == self.bytes_uploaded:
+            return chunk
+
+        _close_chunk(chunk)
+        # Bytes that were already checksummed are skipped when re-read.
+        self._stream.seek(position)
+        return None
+
+    def _discard_next_chunk(self):
+        """Wait for the chunk being read ahead, if any, and drop it."""
+        if self._next_chunk is not None:
+            _, future = self._next_chunk
+            self._next_chunk = None
+            concurrent.futures.wait([future])
+            if future.exception() is None:
+                _close_chunk(future.result())
+
     def _update_checksum(self, start_byte, payload):
         """Update the checksum with the payload if not already updated.
 
@@ -712,12 +842,33 @@ class ResumableUpload(UploadBase):
 
         if start_byte < self._bytes_checksummed:
             offset = self._bytes_checksummed - start_byte
-            data = payload[offset:]
         else:
-            data = payload
+            offset = 0
+
+        if isinstance(payload, _FileChunk):
+            self._bytes_checksummed += payload.update_checksum(
+                self._checksum_object, offset
+            )
+        else:
+            data = payload[offset:]
+            self._checksum_object.update(data)
+            self._bytes_checksummed += len(data)
 
-        self._checksum_object.update(data)
-        self._bytes_checksummed += len(data)
+    def _adapt_chunk_size(self, bytes_sent, elapsed, retried=False):
+        """Update an adaptive chunk size after a chunk has been sent.
+
+        Args:
+            bytes_sent (int): The number of bytes in the chunk.
+            elapsed (float): The time taken to send the chunk, in seconds.
+            retried (bool): Whether sending the chunk needed to be retried.
+        """
+        if self._chunk_sizer is not None:
+            self._chunk_size = self._chunk_sizer.record(bytes_sent, elapsed, retried)
+
+    def _adapt_chunk_size_after_failure(self):
+        """Update an adaptive chunk size after sending a chunk failed."""
+        if self._chunk_sizer is not None:
+            self._chunk_size = self._chunk_sizer.record_failure()
 
     def _make_invalid(self):
         """Simple setter for ``invalid``.
@@ -907,6 +1058,7 @@ class ResumableUpload(UploadBase):
             # In this case, the upload has not "begun".
             self._bytes_uploaded = 0
 
+        self._discard_next_chunk()
         self._stream.seek(self._bytes_uploaded)
         self._invalid = False
 
@@ -929,6 +1081,78 @@ class ResumableUpload(UploadBase):
         """
         raise NotImplementedError("This implementation is virtual.")
 
+    def _prepare_resume(self, stream, resumable_url, content_type, total_bytes):
+        """Attach to an upload session that was initiated elsewhere.
+
+        The upload is left :attr:`invalid`, since only the server knows how
+        much of the session has been persisted; :meth:`recover` must be used
+        to find out before transmitting.
+
+        Args:
+            stream (IO[bytes]): The stream (i.e. file-like object) that is
+                being uploaded, which must be seekable.
+            resumable_url (str): The URL of the existing upload session.
+            content_type (str): The content type of the resource.
+            total_bytes (Optional[int]): The total number of bytes to be
+                uploaded.
+
+        Raises:
+            ValueError: If this upload has already been initiated.
+        """
+        if self.resumable_url is not None:
+            raise ValueError("This upload has already been initiated.")
+        self._stream = stream
+        self._content_type = content_type
+        self._total_bytes = total_bytes
+        self._resumable_url = resumable_url
+        self._invalid = True
+
+    def _restore_checksum(self, checksum_state=None):
+        """Bring the checksum up to :attr:`bytes_uploaded` after resuming.
+
+        The checksum is restored from ``checksum_state`` when it is usable,
+        and any remaining bytes that the server already holds are re-read from
+        the stream and summed. The stream is left at :attr:`bytes_uploaded`.
+
+        Args:
+            checksum_state (Optional[dict]): A snapshot previously taken from
+                :attr:`checksum_state`.
+
+        Raises:
+            ValueError: If the stream ends before :attr:`bytes_uploaded`.
+        """
+        self._checksum_object = None
+        self._bytes_checksummed = 0
+        if not self._checksum_type:
+            return
+
+        if (
+            checksum_state
+            and checksum_state.get("type") == self._checksum_type
+            and 0 <= checksum_state.get("bytes", -1) <= self._bytes_uploaded
+        ):
+            self._checksum_object = _helpers._restore_checksum_object(
+                self._checksum_type, checksum_state.get("value")
+            )
+            if self._checksum_object is not None:
+                self._bytes_checksummed = checksum_state["bytes"]
+
+        self._stream.seek(self._bytes_checksummed)
+        while self._bytes_checksummed < self._bytes_uploaded:
+            block = self._stream.read(
+                min(
+                    _CHECKSUM_BLOCK_SIZE, self._bytes_uploaded - self._bytes_checksummed
+                )
+            )
+            if not block:
+                msg = _STREAM_TOO_SHORT_TEMPLATE.format(
+                    self._bytes_checksummed, self._bytes_uploaded
+                )
+                raise ValueError(msg)
+            self._update_checksum(self._bytes_checksummed, block)
+        # Make sure a checksum object exists even if nothing was summed.
+        self._update_checksum(self._bytes_uploaded, b"")
+
 
 class XMLMPUContainer(UploadBase):
     """Initiate and close an upload using the XML MPU API.
@@ -1253,7 +1477,8 @@ class XMLMPUPart(UploadBase):
     Args:
         upload_url (str): The URL of the object (without query parameters).
         upload_id (str): The ID of the upload from the initialization response.
-        filename (str): The name (path) of the file to upload.
+        filename (Optional[str]): The name (path) of the file to upload. May be
+            :data:`None` if ``data`` is given.
         start (int): The byte index of the beginning of the part.
         end (int): The byte index of the end of the part.
         part_number (int): The part number. Part numbers will be assembled in
@@ -1274,11 +1499,14 @@ class XMLMPUPart(UploadBase):
             See the retry.py source code and docstrings in this package
             (google.cloud.storage.retry) for information on retry types and how
             to configure them.
+        data (Optional[bytes]): The content of the part, already in memory.
+            If given, it is sent instead of reading the part from ``filename``,
+            and ``start`` and ``end`` are informational only.
 
     Attributes:
         upload_url (str): The URL of the object (without query parameters).
         upload_id (str): The ID of the upload from the initialization response.
-        filename (str): The name (path) of the file to upload.
+        filename (Optional[str]): The name (path) of the file to upload.
         start (int): The byte index of the beginning of the part.
         end (int): The byte index of the end of the part.
         part_number (int): The part number. Part numbers will be assembled in
@@ -1297,9 +1525,11 @@ class XMLMPUPart(UploadBase):
         headers=None,
         checksum="auto",
         retry=DEFAULT_RETRY,
+        data=None,
     ):
         super().__init__(upload_url, headers=headers, retry=retry)
         self._filename = filename
+        self._data = data
         self._start = start
         self._end = end
         self._upload_id = upload_id
@@ -1364,9 +1594,12 @@ class XMLMPUPart(UploadBase):
         if self.finished:
             raise ValueError("This part has already been uploaded.")
 
-        with open(self._filename, "br") as f:
-            f.seek(self._start)
-            payload = f.read(self._end - self._start)
+        if self._data is not None:
+            payload = self._data
+        else:
+            with open(self._filename, "br") as f:
+                f.seek(self._start)
+                payload = f.read(self._end - self._start)
 
         self._checksum_object = _helpers._get_checksum_object(self._checksum_type)
         if self._checksum_object is not None:
@@ -1517,13 +1750,28 @@ def construct_multipart_request(data, metadata, content_type):
         Tuple[bytes, bytes]: The multipart request body and the boundary used
         between each part.
     """
+    head, tail, multipart_boundary = _construct_multipart_parts(metadata, content_type)
+    return head + data + tail, multipart_boundary
+
+
+def _construct_multipart_parts(metadata, content_type):
+    """Construct the parts of a multipart request body around the data.
+
+    Args:
+        metadata (Mapping[str, str]): The resource metadata, such as an
+            ACL list.
+        content_type (str): The content type of the resource, e.g. a JPEG
+            image has content type ``image/jpeg``.
+
+    Returns:
+        Tuple[bytes, bytes, bytes]: The part of the body before the resource
+        content, the part after it, and the boundary used between each part.
+    """
     multipart_boundary = get_boundary()
     json_bytes = json.dumps(metadata).encode("utf-8")
     content_type = content_type.encode("utf-8")
-    # Combine the two parts into a multipart payload.
-    # NOTE: We'd prefer a bytes template but are restricted by Python 3.4.
     boundary_sep = _MULTIPART_SEP + multipart_boundary
-    content = (
+    head = (
         boundary_sep
         + _MULTIPART_BEGIN
         + json_bytes
@@ -1533,14 +1781,38 @@ def construct_multipart_request(data, metadata, content_type):
         + b"content-type: "
         + content_type
         + _CRLF
-        + _CRLF
-        + data  # Empty line between headers and body.
-        + _CRLF
-        + boundary_sep
-        + _MULTIPART_SEP
+        + _CRLF  # Empty line between headers and body.
     )
+    tail = _CRLF + boundary_sep + _MULTIPART_SEP
+
+    return head, tail, multipart_boundary
+
+
+class _MultipartBody(object):
+    """A multipart request body that is sent as its parts.
+
+    Transports send each part in turn, so the resource content goes to the
+    socket as it is rather than being copied into one concatenated body.
+    ``len()`` gives the total size, so the body is sent with a
+    ``Content-Length`` header rather than chunked encoding, and the body can
+    be iterated again if the request is retried.
+
+    Args:
+        parts (bytes): The encoded parts of the body, in order.
+    """
 
-    return content, multipart_boundary
+    def __init__(self, *parts):
+        self._parts = parts
+        self._length = sum(len(part) for part in parts)
+
+    def __iter__(self):
+        return iter(self._parts)
+
+    def __len__(self):
+        return self._length
+
+    def __bytes__(self):
+        return b"".join(self._parts)
 
 
 def get_total_bytes(stream):
@@ -1576,8 +1848,11 @@ def get_next_chunk(stream, chunk_size, total_bytes):
         total_bytes (Optional[int]): The (expected) total number of bytes
             in the ``stream``.
 
+    If ``stream`` is a regular file, the chunk is memory-mapped rather than
+    read, so that no chunk-sized buffer is allocated for it.
+
     Returns:
-        Tuple[int, bytes, str]: Triple of:
+        Tuple[int, Union[bytes, _FileChunk], str]: Triple of:
 
           * the start byte index
           * the content in between the start and end bytes (inclusive)
@@ -1592,9 +1867,14 @@ def get_next_chunk(stream, chunk_size, total_bytes):
     """
     start_byte = stream.tell()
     if total_bytes is not None and start_byte + chunk_size >= total_bytes > 0:
-        payload = stream.read(total_bytes - start_byte)
+        num_bytes = total_bytes - start_byte
     else:
-        payload = stream.read(chunk_size)
+        num_bytes = chunk_size
+    payload = _map_file_chunk(stream, start_byte, num_bytes)
+    if payload is None:
+        payload = stream.read(num_bytes)
+    else:
+        stream.seek(start_byte + len(payload))
     end_byte = stream.tell() - 1
 
     num_bytes_read = len(payload)
@@ -1620,6 +1900,148 @@ def get_next_chunk(stream, chunk_size, total_bytes):
     return start_byte, payload, content_range
 
 
+class _FileChunk(object):
+    """A read-only, memory-mapped region of a file used as a request body.
+
+    The region is read by the HTTP transport in small blocks via
+    :meth:`read`, so sending it never copies the whole chunk. Once the region
+    has been read to the end it rewinds itself, so the same object can be
+    sent again when a request is retried or re-sent after a credential
+    refresh. The object deliberately has no ``tell()``, so that transports
+    always send the whole region.
+
+    Args:
+        fileno (int): A file descriptor open for reading.
+        start (int): The offset in the file of the first byte of the chunk.
+        length (int): The number of bytes in the chunk. The file must be at
+            least ``start + length`` bytes long.
+    """
+
+    def __init__(self, fileno, start, length):
+        map_start = start - start % mmap.ALLOCATIONGRANULARITY
+        self._offset = start - map_start
+        self._length = length
+        self._position = 0
+        self._mmap = mmap.mmap(
+            fileno, self._offset + length, access=mmap.ACCESS_READ, offset=map_start
+        )
+
+    def __len__(self):
+        return self._length
+
+    def read(self, size=-1):
+        """Read up to ``size`` bytes, or the rest of the chunk if negative.
+
+        Returns:
+            bytes: The data, or ``b""`` at the end of the chunk, after which
+            the next read starts again from the beginning.
+        """
+        remaining = self._length - self._position
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        if size == 0:
+            self._position = 0
+            return b""
+        begin = self._offset + self._position
+        self._position += size
+        return self._mmap[begin : begin + size]
+
+    def rewind(self):
+        """Restart reading from the beginning of the chunk."""
+        self._position = 0
+
+    def view(self, offset=0):
+        """Return a zero-copy view of the chunk.
+
+        Args:
+            offset (int): The number of leading bytes of the chunk to skip.
+
+        Returns:
+            memoryview: A read-only view, which must be released before the
+            chunk is closed.
+        """
+        begin = self._offset + offset
+        return memoryview(self._mmap)[begin : self._offset + self._length]
+
+    def update_checksum(self, checksum_object, offset=0):
+        """Update a checksum with the chunk, without copying it if possible.
+
+        Args:
+            checksum_object (object): A hashlib-like checksum object.
+            offset (int): The number of leading bytes of the chunk to skip.
+
+        Returns:
+            int: The number of bytes added to the checksum.
+        """
+        with self.view(offset) as view:
+            try:
+                checksum_object.update(view)
+            except TypeError:
+                # The crc32c C extension only accepts ``bytes``, so copy the
+                # chunk in bounded blocks instead.
+                for begin in range(0, len(view), _CHECKSUM_BLOCK_SIZE):
+                    block = view[begin : begin + _CHECKSUM_BLOCK_SIZE]
+                    checksum_object.update(block.tobytes())
+                    block.release()
+            return len(view)
+
+    def close(self):
+        """Unmap the chunk."""
+        self._mmap.close()
+
+
+def _close_chunk(chunk):
+    """Release a chunk returned by :func:`get_next_chunk` that won't be sent.
+
+    Args:
+        chunk (Optional[Tuple[int, Union[bytes, _FileChunk], str]]): The chunk.
+    """
+    if chunk is not None and isinstance(chunk[1], _FileChunk):
+        chunk[1].close()
+
+
+def _map_file_chunk(stream, start_byte, num_bytes):
+    """Memory-map the next chunk of a stream if it is a regular file.
+
+    Only unwrapped binary files are mapped: for any other stream the file
+    descriptor may not correspond to the bytes that ``stream.read()`` would
+    return (e.g. a decompressing wrapper), or writes may still be buffered.
+    A stream with a ``_read_file_chunk()`` method, such as the buffer of a
+    ``BlobWriter`` which holds data in temporary files, maps chunks itself.
+
+    Args:
+        stream (IO[bytes]): The stream (i.e. file-like object).
+        start_byte (int): The current position in the stream.
+        num_bytes (int): The maximum size of the chunk.
+
+    Returns:
+        Optional[_FileChunk]: The chunk, truncated at the end of the file, or
+        :data:`None` if the chunk must be read from the stream instead.
+    """
+    read_file_chunk = getattr(stream, "_read_file_chunk", None)
+    if read_file_chunk is not None:
+        return read_file_chunk(num_bytes)
+    if not isinstance(stream, (io.BufferedReader, io.FileIO)):
+        return None
+    try:
+        if not stream.readable():
+            return None
+        fileno = stream.fileno()
+        file_stat = os.fstat(fileno)
+    except (OSError, ValueError):
+        return None
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None
+
+    num_bytes = min(num_bytes, file_stat.st_size - start_byte)
+    if num_bytes <= 0:
+        return None
+    try:
+        return _FileChunk(fileno, start_byte, num_bytes)
+    except (OSError, ValueError):
+        return None
+
+
 def get_content_range(start_byte, end_byte, total_bytes):
     """Convert start, end and total into content range header.
 
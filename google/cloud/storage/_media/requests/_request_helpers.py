@@ -17,7 +17,10 @@
 This utilities are explicitly catered to ``requests``-like transports.
 """
 
-_SINGLE_GET_CHUNK_SIZE = 8192
+# The number of bytes read from a response at a time while streaming a
+# download, unless overridden. Each read costs a Python-level write and checksum
+# update, so this is kept large enough for that overhead to be negligible.
+_SINGLE_GET_CHUNK_SIZE = 1024 * 1024  # 1 MiB
 # The number of seconds to wait to establish a connection
 # (connect() call on socket). Avoid setting this to a multiple of 3 to not
 # Align with TCP Retransmission timing. (typically 2.5-3s)
@@ -16,6 +16,7 @@
 
 import urllib3.response  # type: ignore
 import http
+import time
 
 from google.cloud.storage._media import _download
 from google.cloud.storage._media import _helpers
@@ -86,6 +87,9 @@ class Download(_request_helpers.RequestsMixin, _download.Download):
             See the retry.py source code and docstrings in this package
             (google.cloud.storage.retry) for information on retry types and how
             to configure them.
+        buffer_size (Optional[int]): The number of bytes to read from the
+            response at a time while streaming it to ``stream``. Defaults to
+            1 MiB.
 
     Attributes:
         media_url (str): The URL containing the media to be downloaded.
@@ -127,29 +131,42 @@ class Download(_request_helpers.RequestsMixin, _download.Download):
             checksum_object = self._checksum_object
 
         with response:
-            # NOTE: In order to handle compressed streams gracefully, we try
-            # to insert our checksum object into the decompression stream. If
-            # the stream is indeed compressed, this will delegate the checksum
-            # object to the decoder and return a _DoNothingHash here.
-            local_checksum_object = _add_decoder(response.raw, checksum_object)
-
-            # This is useful for smaller files, or when the user wants to
-            # download the entire file in one go.
-            if self.single_shot_download:
-                content = response.raw.read(decode_content=True)
-                self._stream.write(content)
-                self._bytes_downloaded += len(content)
-                local_checksum_object.update(content)
-                response._content_consumed = True
-            else:
-                body_iter = response.iter_content(
-                    chunk_size=_request_helpers._SINGLE_GET_CHUNK_SIZE,
-                    decode_unicode=False,
-                )
-                for chunk in body_iter:
-                    self._stream.write(chunk)
-                    self._bytes_downloaded += len(chunk)
-                    local_checksum_object.update(chunk)
+            # Hash on a helper thread, so that checksumming a chunk overlaps
+            # with reading the next one from the network. Small bodies, and
+            # those read at once, have nothing to overlap and are hashed inline.
+            background_checksum = _helpers._BackgroundChecksum(
+                checksum_object,
+                inline=_hash_inline(
+                    response.raw, self.single_shot_download, self.buffer_size
+                ),
+            )
+            try:
+                # NOTE: In order to handle compressed streams gracefully, we try
+                # to insert our checksum object into the decompression stream. If
+                # the stream is indeed compressed, this will delegate the checksum
+                # object to the decoder and return a _DoNothingHash here.
+                local_checksum_object = _add_decoder(response.raw, background_checksum)
+
+                # This is useful for smaller files, or when the user wants to
+                # download the entire file in one go.
+                if self.single_shot_download:
+                    content = response.raw.read(decode_content=True)
+                    local_checksum_object.update(content)
+                    self._stream.write(content)
+                    self._bytes_downloaded += len(content)
+                    response._content_consumed = True
+                else:
+                    body_iter = response.iter_content(
+                        chunk_size=self.buffer_size
+                        or _request_helpers._SINGLE_GET_CHUNK_SIZE,
+                        decode_unicode=False,
+                    )
+                    for chunk in body_iter:
+                        local_checksum_object.update(chunk)
+                        self._stream.write(chunk)
+                        self._bytes_downloaded += len(chunk)
+            finally:
+                background_checksum.close()
 
         # Don't validate the checksum for partial responses.
         if (
@@ -316,6 +333,9 @@ class RawDownload(_request_helpers.RawRequestsMixin, _download.Download):
             See the retry.py source code and docstrings in this package
             (google.cloud.storage.retry) for information on retry types and how
             to configure them.
+        buffer_size (Optional[int]): The number of bytes to read from the
+            response at a time while streaming it to ``stream``. Defaults to
+            1 MiB.
 
     Attributes:
         media_url (str): The URL containing the media to be downloaded.
@@ -356,21 +376,34 @@ class RawDownload(_request_helpers.RawRequestsMixin, _download.Download):
             checksum_object = self._checksum_object
 
         with response:
-            # This is useful for smaller files, or when the user wants to
-            # download the entire file in one go.
-            if self.single_shot_download:
-                content = response.raw.read()
-                self._stream.write(content)
-                self._bytes_downloaded += len(content)
-                checksum_object.update(content)
-            else:
-                body_iter = response.raw.stream(
-                    _request_helpers._SINGLE_GET_CHUNK_SIZE, decode_content=False
-                )
-                for chunk in body_iter:
-                    self._stream.write(chunk)
-                    self._bytes_downloaded += len(chunk)
-                    checksum_object.update(chunk)
+            # Hash on a helper thread, so that checksumming a chunk overlaps
+            # with reading the next one from the network. Small bodies, and
+            # those read at once, have nothing to overlap and are hashed inline.
+            background_checksum = _helpers._BackgroundChecksum(
+                checksum_object,
+                inline=_hash_inline(
+                    response.raw, self.single_shot_download, self.buffer_size
+                ),
+            )
+            try:
+                # This is useful for smaller files, or when the user wants to
+                # download the entire file in one go.
+                if self.single_shot_download:
+                    content = response.raw.read()
+                    background_checksum.update(content)
+                    self._stream.write(content)
+                    self._bytes_downloaded += len(content)
+                else:
+                    body_iter = response.raw.stream(
+                        self.buffer_size or _request_helpers._SINGLE_GET_CHUNK_SIZE,
+                        decode_content=False,
+                    )
+                    for chunk in body_iter:
+                        background_checksum.update(chunk)
+                        self._stream.write(chunk)
+                        self._bytes_downloaded += len(chunk)
+            finally:
+                background_checksum.close()
             response._content_consumed = True
 
         # Don't validate the checksum for partial responses.
@@ -527,6 +560,19 @@ class ChunkedDownload(_request_helpers.RequestsMixin, _download.ChunkedDownload)
             See the retry.py source code and docstrings in this package
             (google.cloud.storage.retry) for information on retry types and how
             to configure them.
+        checksum (Optional[str]): The type of checksum to compute across all
+            chunks to verify the integrity of the object. It is checked
+            against the ``X-Goog-Hash`` header of the first response once the
+            last chunk has been downloaded. Only downloads of a whole object
+            can be verified; ranged downloads and objects stored with gzip
+            encoding are not checked. Supported values are "md5", "crc32c",
+            "auto" and None. The default is "auto", which will try to detect
+            if the C extension for crc32c is installed and fall back to md5
+            otherwise.
+        adaptive_chunk_size (Optional[bool]): If True, ``chunk_size`` is the
+            largest chunk size used. Chunks start at 1 MiB and grow while the
+            throughput of each request keeps improving, and shrink after a
+            request needs to be retried. The default is False.
 
     Attributes:
         media_url (str): The URL containing the media to be downloaded.
@@ -566,9 +612,13 @@ class ChunkedDownload(_request_helpers.RequestsMixin, _download.ChunkedDownload)
             ValueError: If the current download has finished.
         """
         method, url, payload, headers = self._prepare_request()
+        bytes_downloaded = self.bytes_downloaded
+        attempts = 0
 
         # Wrap the request business logic in a function to be retried.
         def retriable_request():
+            nonlocal attempts
+            attempts += 1
             # NOTE: We assume "payload is None" but pass it along anyway.
             result = transport.request(
                 method,
@@ -580,7 +630,20 @@ class ChunkedDownload(_request_helpers.RequestsMixin, _download.ChunkedDownload)
             self._process_response(result)
             return result
 
-        return _request_helpers.wait_and_retry(retriable_request, self._retry_strategy)
+        start_time = time.monotonic()
+        try:
+            result = _request_helpers.wait_and_retry(
+                retriable_request, self._retry_strategy
+            )
+        except Exception:
+            self._adapt_chunk_size_after_failure()
+            raise
+        self._adapt_chunk_size(
+            self.bytes_downloaded - bytes_downloaded,
+            time.monotonic() - start_time,
+            retried=attempts > 1,
+        )
+        return result
 
 
 class RawChunkedDownload(_request_helpers.RawRequestsMixin, _download.ChunkedDownload):
@@ -608,6 +671,19 @@ class RawChunkedDownload(_request_helpers.RawRequestsMixin, _download.ChunkedDow
             See the retry.py source code and docstrings in this package
             (google.cloud.storage.retry) for information on retry types and how
             to configure them.
+        checksum (Optional[str]): The type of checksum to compute across all
+            chunks to verify the integrity of the object. It is checked
+            against the ``X-Goog-Hash`` header of the first response once the
+            last chunk has been downloaded. Only downloads of a whole object
+            can be verified; ranged downloads and objects stored with gzip
+            encoding are not checked. Supported values are "md5", "crc32c",
+            "auto" and None. The default is "auto", which will try to detect
+            if the C extension for crc32c is installed and fall back to md5
+            otherwise.
+        adaptive_chunk_size (Optional[bool]): If True, ``chunk_size`` is the
+            largest chunk size used. Chunks start at 1 MiB and grow while the
+            throughput of each request keeps improving, and shrink after a
+            request needs to be retried. The default is False.
 
     Attributes:
         media_url (str): The URL containing the media to be downloaded.
@@ -647,9 +723,13 @@ class RawChunkedDownload(_request_helpers.RawRequestsMixin, _download.ChunkedDow
             ValueError: If the current download has finished.
         """
         method, url, payload, headers = self._prepare_request()
+        bytes_downloaded = self.bytes_downloaded
+        attempts = 0
 
         # Wrap the request business logic in a function to be retried.
         def retriable_request():
+            nonlocal attempts
+            attempts += 1
             # NOTE: We assume "payload is None" but pass it along anyway.
             result = transport.request(
                 method,
@@ -662,7 +742,46 @@ class RawChunkedDownload(_request_helpers.RawRequestsMixin, _download.ChunkedDow
             self._process_response(result)
             return result
 
-        return _request_helpers.wait_and_retry(retriable_request, self._retry_strategy)
+        start_time = time.monotonic()
+        try:
+            result = _request_helpers.wait_and_retry(
+                retriable_request, self._retry_strategy
+            )
+        except Exception:
+            self._adapt_chunk_size_after_failure()
+            raise
+        self._adapt_chunk_size(
+            self.bytes_downloaded - bytes_downloaded,
+            time.monotonic() - start_time,
+            retried=attempts > 1,
+        )
+        return result
+
+
+def _hash_inline(response_raw, single_shot_download, buffer_size):
+    """Check if a response body should be hashed on the reading thread.
+
+    A body read at once, or no larger than one chunk, is hashed in a single
+    update, so a helper thread would only add overhead.
+
+    Args:
+        response_raw (urllib3.response.HTTPResponse): The raw response for
+            an HTTP request.
+        single_shot_download (bool): Whether the body is read at once.
+        buffer_size (Optional[int]): The size of the chunks the body is read
+            in, if not the default.
+
+    Returns:
+        bool: True if the body should be hashed inline.
+    """
+    if single_shot_download:
+        return True
+    chunk_size = buffer_size or _request_helpers._SINGLE_GET_CHUNK_SIZE
+    try:
+        content_length = int(response_raw.headers.get("content-length", ""))
+    except ValueError:
+        return False
+    return content_length <= chunk_size
 
 
 def _add_decoder(response_raw, checksum):
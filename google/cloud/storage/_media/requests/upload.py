@@ -18,6 +18,7 @@ Also supported here are simple (media) uploads and multipart
 uploads that contain both metadata and a small file as payload.
 """
 
+import time
 
 from google.cloud.storage._media import _upload
 from google.cloud.storage._media.requests import _request_helpers
@@ -352,6 +353,16 @@ class ResumableUpload(_request_helpers.RequestsMixin, _upload.ResumableUpload):
             See the retry.py source code and docstrings in this package
             (google.cloud.storage.retry) for information on retry types and how
             to configure them.
+        read_ahead (Optional[bool]): If True, read and checksum the next
+            chunk of the stream on a helper thread while the current chunk is
+            being transmitted, so that local I/O overlaps with the network
+            transfer. This holds one extra chunk in memory, and the stream
+            must not be used elsewhere while the upload is in progress. The
+            default is False.
+        adaptive_chunk_size (Optional[bool]): If True, ``chunk_size`` is the
+            largest chunk size used. Chunks start at 1 MiB and grow while the
+            throughput of each request keeps improving, and shrink after a
+            request needs to be retried. The default is False.
 
     Attributes:
         upload_url (str): The URL where the content will be uploaded.
@@ -515,18 +526,40 @@ class ResumableUpload(_request_helpers.RequestsMixin, _upload.ResumableUpload):
                 does not match or is not available.
         """
         method, url, payload, headers = self._prepare_request()
+        file_chunk = isinstance(payload, _upload._FileChunk)
+        bytes_sent = len(payload)
+        attempts = 0
 
         # Wrap the request business logic in a function to be retried.
         def retriable_request():
+            nonlocal attempts
+            attempts += 1
+            if file_chunk:
+                # A failed attempt may have stopped part way through the chunk.
+                payload.rewind()
             result = transport.request(
                 method, url, data=payload, headers=headers, timeout=timeout
             )
 
-            self._process_resumable_response(result, len(payload))
+            self._process_resumable_response(result, bytes_sent)
 
             return result
 
-        return _request_helpers.wait_and_retry(retriable_request, self._retry_strategy)
+        start_time = time.monotonic()
+        try:
+            result = _request_helpers.wait_and_retry(
+                retriable_request, self._retry_strategy
+            )
+        except Exception:
+            self._adapt_chunk_size_after_failure()
+            raise
+        finally:
+            if file_chunk:
+                payload.close()
+        self._adapt_chunk_size(
+            bytes_sent, time.monotonic() - start_time, retried=attempts > 1
+        )
+        return result
 
     def recover(self, transport):
         """Recover from a failure and check the status of the current upload.
@@ -566,6 +599,52 @@ class ResumableUpload(_request_helpers.RequestsMixin, _upload.ResumableUpload):
 
         return _request_helpers.wait_and_retry(retriable_request, self._retry_strategy)
 
+    def resume(
+        self,
+        transport,
+        stream,
+        resumable_url,
+        content_type,
+        total_bytes=None,
+        checksum_state=None,
+    ):
+        """Continue an upload session that was initiated elsewhere.
+
+        This is used instead of :meth:`initiate` to pick up a session whose
+        :attr:`resumable_url` was saved by an earlier process. The server is
+        asked how many bytes it has persisted (via :meth:`recover`), the
+        stream is positioned there, and the running checksum is rebuilt so
+        the final checksum still covers the whole object.
+
+        Args:
+            transport (~requests.Session): A ``requests`` object which can
+                make authenticated requests.
+            stream (IO[bytes]): The stream (i.e. file-like object) being
+                uploaded. It must be seekable and hold the same content as
+                when the session was started.
+            resumable_url (str): The URL of the existing upload session.
+            content_type (str): The content type of the resource.
+            total_bytes (Optional[int]): The total number of bytes to be
+                uploaded, if known.
+            checksum_state (Optional[dict]): A snapshot of the checksum taken
+                from :attr:`checksum_state` of the earlier upload. Without it
+                (or if it is stale), the bytes already uploaded are re-read
+                from ``stream`` to compute the checksum.
+
+        Returns:
+            ~requests.Response: The HTTP response returned by ``transport``
+            for the status check.
+
+        Raises:
+            ~google.cloud.storage.exceptions.InvalidResponse: If the session
+                cannot be continued, e.g. because it has expired or already
+                completed.
+        """
+        self._prepare_resume(stream, resumable_url, content_type, total_bytes)
+        response = self.recover(transport)
+        self._restore_checksum(checksum_state)
+        return response
+
 
 class XMLMPUContainer(_request_helpers.RequestsMixin, _upload.XMLMPUContainer):
     """Initiate and close an upload using the XML MPU API.
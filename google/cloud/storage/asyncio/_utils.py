@@ -15,6 +15,13 @@
 import google_crc32c
 
 from google.api_core import exceptions
+from google.api_core import retry_async
+
+from google.cloud.storage._helpers import _add_etag_match_headers
+from google.cloud.storage._helpers import _add_generation_match_parameters
+from google.cloud.storage.constants import _DEFAULT_TIMEOUT
+from google.cloud.storage.retry import DEFAULT_RETRY
+from google.cloud.storage.retry import DEFAULT_RETRY_IF_METAGENERATION_SPECIFIED
 
 
 def raise_if_no_fast_crc32c():
@@ -39,3 +46,262 @@ def update_write_handle_if_exists(obj, response):
     """Update the write_handle attribute of an object if it exists in the response."""
     if hasattr(response, "write_handle") and response.write_handle is not None:
         obj.write_handle = response.write_handle
+
+
+def to_async_retry(retry):
+    """Convert a retry policy for the synchronous API to an async one.
+
+    The predicate, backoff and timeout of ``retry`` are kept, so the
+    async API retries the same errors, the same way.
+
+    :type retry: google.api_core.retry.Retry or ``NoneType``
+    :param retry: The retry policy to convert.
+
+    :rtype: google.api_core.retry_async.AsyncRetry or ``NoneType``
+    :returns: The equivalent async retry policy, or ``None`` if ``retry``
+        is ``None``.
+    """
+    if retry is None:
+        return None
+    return retry_async.AsyncRetry(
+        predicate=retry._predicate,
+        initial=retry._initial,
+        maximum=retry._maximum,
+        multiplier=retry._multiplier,
+        timeout=retry._timeout,
+        on_error=retry._on_error,
+    )
+
+
+class AsyncPropertyMixin(object):
+    """Mixin for async wrappers of :class:`~google.cloud.storage.bucket.Bucket`
+    and :class:`~google.cloud.storage.blob.Blob`.
+
+    The wrapped resource (``_wrapped``) holds the properties and builds
+    request paths and parameters; properties of the wrapped resource, such
+    as ``size`` or ``metadata``, can be read and set on the wrapper
+    directly. Methods which make API requests are only available where the
+    wrapper defines a coroutine for them.
+
+    Non-abstract subclasses should set ``_wrapped`` and implement:
+      - client
+    """
+
+    def __getattr__(self, name):
+        wrapped = self.__dict__.get("_wrapped")
+        if wrapped is not None and isinstance(
+            getattr(type(wrapped), name, None), property
+        ):
+            return getattr(wrapped, name)
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def __setattr__(self, name, value):
+        wrapped = self.__dict__.get("_wrapped")
+        if (
+            wrapped is not None
+            and not hasattr(type(self), name)
+            and isinstance(getattr(type(wrapped), name, None), property)
+        ):
+            setattr(wrapped, name, value)
+        else:
+            object.__setattr__(self, name, value)
+
+    @property
+    def name(self):
+        """The name of the resource.
+
+        :rtype: str
+        :returns: The name.
+        """
+        return self._wrapped.name
+
+    @property
+    def path(self):
+        """The URL path to the resource.
+
+        :rtype: str
+        :returns: The path.
+        """
+        return self._wrapped.path
+
+    @property
+    def client(self):
+        """Abstract getter for the object client."""
+        raise NotImplementedError
+
+    @property
+    def _properties(self):
+        return self._wrapped._properties
+
+    def _set_properties(self, value):
+        self._wrapped._set_properties(value)
+
+    def _require_client(self, client):
+        if client is None:
+            client = self.client
+        return client
+
+    async def reload(
+        self,
+        client=None,
+        projection="noAcl",
+        if_etag_match=None,
+        if_etag_not_match=None,
+        if_generation_match=None,
+        if_generation_not_match=None,
+        if_metageneration_match=None,
+        if_metageneration_not_match=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY,
+        soft_deleted=None,
+    ):
+        """Reload properties from Cloud Storage.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type client: :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`
+        :param client:
+            (Optional) The client to use. If not passed, falls back to the
+            ``client`` stored on the current object.
+
+        :type projection: str
+        :param projection:
+            (Optional) If used, must be 'full' or 'noAcl'. Defaults to
+            ``'noAcl'``. Specifies the set of properties to return.
+
+        :type if_etag_match: Union[str, Set[str]]
+        :param if_etag_match:
+            (Optional) See :ref:`using-if-etag-match`
+
+        :type if_etag_not_match: Union[str, Set[str]])
+        :param if_etag_not_match:
+            (Optional) See :ref:`using-if-etag-not-match`
+
+        :type if_generation_match: long
+        :param if_generation_match:
+            (Optional) See :ref:`using-if-generation-match`
+
+        :type if_generation_not_match: long
+        :param if_generation_not_match:
+            (Optional) See :ref:`using-if-generation-not-match`
+
+        :type if_metageneration_match: long
+        :param if_metageneration_match:
+            (Optional) See :ref:`using-if-metageneration-match`
+
+        :type if_metageneration_not_match: long
+        :param if_metageneration_not_match:
+            (Optional) See :ref:`using-if-metageneration-not-match`
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+        :param retry:
+            (Optional) How to retry the RPC. See: :ref:`configuring_retries`
+
+        :type soft_deleted: bool
+        :param soft_deleted:
+            (Optional) If True, looks for a soft-deleted object. Will only
+            return the object metadata if the object exists and is in a
+            soft-deleted state.
+        """
+        client = self._require_client(client)
+        query_params = self._wrapped._query_params
+        query_params["projection"] = projection
+        _add_generation_match_parameters(
+            query_params,
+            if_generation_match=if_generation_match,
+            if_generation_not_match=if_generation_not_match,
+            if_metageneration_match=if_metageneration_match,
+            if_metageneration_not_match=if_metageneration_not_match,
+        )
+        if soft_deleted is not None:
+            query_params["softDeleted"] = soft_deleted
+            query_params["generation"] = self._wrapped.generation
+        headers = self._wrapped._encryption_headers()
+        _add_etag_match_headers(
+            headers, if_etag_match=if_etag_match, if_etag_not_match=if_etag_not_match
+        )
+        api_response = await client._get_resource(
+            self.path,
+            query_params=query_params,
+            headers=headers,
+            timeout=timeout,
+            retry=retry,
+        )
+        self._set_properties(api_response)
+
+    async def patch(
+        self,
+        client=None,
+        if_generation_match=None,
+        if_generation_not_match=None,
+        if_metageneration_match=None,
+        if_metageneration_not_match=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY_IF_METAGENERATION_SPECIFIED,
+    ):
+        """Sends all changed properties in a PATCH request.
+
+        Updates the properties with the response from the backend.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type client: :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`
+        :param client:
+            (Optional) The client to use. If not passed, falls back to the
+            ``client`` stored on the current object.
+
+        :type if_generation_match: long
+        :param if_generation_match:
+            (Optional) See :ref:`using-if-generation-match`
+
+        :type if_generation_not_match: long
+        :param if_generation_not_match:
+            (Optional) See :ref:`using-if-generation-not-match`
+
+        :type if_metageneration_match: long
+        :param if_metageneration_match:
+            (Optional) See :ref:`using-if-metageneration-match`
+
+        :type if_metageneration_not_match: long
+        :param if_metageneration_not_match:
+            (Optional) See :ref:`using-if-metageneration-not-match`
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+        :param retry:
+            (Optional) How to retry the RPC. See: :ref:`configuring_retries`
+        """
+        client = self._require_client(client)
+        query_params = self._wrapped._query_params
+        # Pass '?projection=full' here because 'PATCH' documented not
+        # to work properly w/ 'noAcl'.
+        query_params["projection"] = "full"
+        _add_generation_match_parameters(
+            query_params,
+            if_generation_match=if_generation_match,
+            if_generation_not_match=if_generation_not_match,
+            if_metageneration_match=if_metageneration_match,
+            if_metageneration_not_match=if_metageneration_not_match,
+        )
+        update_properties = {
+            key: self._wrapped._properties[key] for key in self._wrapped._changes
+        }
+        api_response = await client._patch_resource(
+            self.path,
+            update_properties,
+            query_params=query_params,
+            timeout=timeout,
+            retry=retry,
+        )
+        self._set_properties(api_response)
@@ -441,6 +441,8 @@ class AsyncAppendableObjectWriter:
         retry_manager = _BidiStreamRetryManager(
             _WriteResumptionStrategy(),
             lambda r, s: send_and_recv_generator(r, s, metadata),
+            retry_budget=self.client.retry_budget,
+            circuit_breaker=self.client.circuit_breaker,
         )
         await retry_manager.execute({"write_state": write_state}, retry_policy)
 
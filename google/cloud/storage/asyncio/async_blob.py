@@ -0,0 +1,719 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An async blob, for use with :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`."""
+
+import copy
+from email.parser import HeaderParser
+import gzip
+import http.client
+
+import httpx
+
+from google.cloud._helpers import _to_bytes
+from google.cloud.exceptions import NotFound
+from google.cloud.storage._helpers import _add_etag_match_headers
+from google.cloud.storage._helpers import _add_generation_match_parameters
+from google.cloud.storage._helpers import _get_default_headers
+from google.cloud.storage._media import _download
+from google.cloud.storage._media import _helpers as _media_helpers
+from google.cloud.storage._media import _upload
+from google.cloud.storage._media.requests import _request_helpers
+from google.cloud.storage._media.requests.download import _CHECKSUM_MISMATCH
+from google.cloud.storage.asyncio import _utils
+from google.cloud.storage.asyncio._utils import AsyncPropertyMixin
+from google.cloud.storage.blob import Blob
+from google.cloud.storage.blob import _get_encryption_headers
+from google.cloud.storage.blob import _raise_from_invalid_response
+from google.cloud.storage.constants import _DEFAULT_TIMEOUT
+from google.cloud.storage.exceptions import DataCorruption
+from google.cloud.storage.exceptions import InvalidResponse
+from google.cloud.storage.retry import ConditionalRetryPolicy
+from google.cloud.storage.retry import DEFAULT_RETRY
+from google.cloud.storage.retry import DEFAULT_RETRY_IF_GENERATION_SPECIFIED
+from google.cloud.storage.retry import _limit_retries
+
+
+class _AsyncDownload(_request_helpers.RequestsMixin, _download.Download):
+    """A single-use download, whose request is sent by the caller."""
+
+
+class _AsyncMultipartUpload(_request_helpers.RequestsMixin, _upload.MultipartUpload):
+    """A single-use multipart upload, whose request is sent by the caller."""
+
+
+def _media_retry(retry, if_generation_match, if_metageneration_match):
+    """Resolve the retry policy of a media operation.
+
+    Conditional retries are designed for non-media calls, which change
+    arguments into query_params dictionaries. Media operations work
+    differently, so here we make a "fake" query_params to feed to the
+    ConditionalRetryPolicy.
+    """
+    if isinstance(retry, ConditionalRetryPolicy):
+        query_params = {
+            "ifGenerationMatch": if_generation_match,
+            "ifMetagenerationMatch": if_metageneration_match,
+        }
+        retry = retry.get_retry_policy_if_conditions_met(query_params=query_params)
+    return _utils.to_async_retry(retry)
+
+
+class AsyncBlob(AsyncPropertyMixin):
+    """A blob, with the core :class:`~google.cloud.storage.blob.Blob`
+    operations as coroutines.
+
+    Properties of :class:`~google.cloud.storage.blob.Blob`, such as ``size``
+    or ``metadata``, can be read and set as on a ``Blob``.
+
+    :type name: str
+    :param name: The name of the blob.
+
+    :type bucket: :class:`~google.cloud.storage.asyncio.async_bucket.AsyncBucket`
+    :param bucket: The bucket to which this blob belongs.
+
+    :type encryption_key: bytes
+    :param encryption_key:
+        (Optional) 32 byte encryption key for customer-supplied encryption.
+
+    :type kms_key_name: str
+    :param kms_key_name:
+        (Optional) Resource name of Cloud KMS key used to encrypt the blob's
+        contents.
+
+    :type generation: long
+    :param generation:
+        (Optional) If present, selects a specific revision of this object.
+    """
+
+    def __init__(
+        self,
+        name,
+        bucket,
+        encryption_key=None,
+        kms_key_name=None,
+        generation=None,
+    ):
+        self._bucket = bucket
+        self._wrapped = Blob(
+            name,
+            bucket._wrapped,
+            encryption_key=encryption_key,
+            kms_key_name=kms_key_name,
+            generation=generation,
+        )
+
+    def __repr__(self):
+        return f"<AsyncBlob: {self._bucket.name}, {self.name}, {self.generation}>"
+
+    @property
+    def bucket(self):
+        """Bucket which contains the object.
+
+        :rtype: :class:`~google.cloud.storage.asyncio.async_bucket.AsyncBucket`
+        :returns: The object's bucket.
+        """
+        return self._bucket
+
+    @property
+    def client(self):
+        """The client bound to this blob.
+
+        :rtype: :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`
+        :returns: The client of the blob's bucket.
+        """
+        return self._bucket.client
+
+    @property
+    def user_project(self):
+        """Project ID billed for API requests made via this blob.
+
+        Derived from bucket's value.
+
+        :rtype: str
+        :returns: The project ID, if set.
+        """
+        return self._bucket.user_project
+
+    async def exists(
+        self,
+        client=None,
+        if_etag_match=None,
+        if_etag_not_match=None,
+        if_generation_match=None,
+        if_generation_not_match=None,
+        if_metageneration_match=None,
+        if_metageneration_not_match=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY,
+        soft_deleted=None,
+    ):
+        """Determines whether or not this blob exists.
+
+        If :attr:`user_project` is set on the bucket, bills the API request
+        to that project.
+
+        :type client: :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`
+        :param client:
+            (Optional) The client to use. If not passed, falls back to the
+            ``client`` stored on the blob's bucket.
+
+        :type if_etag_match: Union[str, Set[str]]
+        :param if_etag_match:
+            (Optional) See :ref:`using-if-etag-match`
+
+        :type if_etag_not_match: Union[str, Set[str]]
+        :param if_etag_not_match:
+            (Optional) See :ref:`using-if-etag-not-match`
+
+        :type if_generation_match: long
+        :param if_generation_match:
+            (Optional) See :ref:`using-if-generation-match`
+
+        :type if_generation_not_match: long
+        :param if_generation_not_match:
+            (Optional) See :ref:`using-if-generation-not-match`
+
+        :type if_metageneration_match: long
+        :param if_metageneration_match:
+            (Optional) See :ref:`using-if-metageneration-match`
+
+        :type if_metageneration_not_match: long
+        :param if_metageneration_not_match:
+            (Optional) See :ref:`using-if-metageneration-not-match`
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+        :param retry:
+            (Optional) How to retry the RPC. See: :ref:`configuring_retries`
+
+        :type soft_deleted: bool
+        :param soft_deleted:
+            (Optional) If True, looks for a soft-deleted object. Will only return True
+            if the object exists and is in a soft-deleted state.
+            :attr:`generation` is required to be set on the blob if ``soft_deleted`` is set to True.
+
+        :rtype: bool
+        :returns: True if the blob exists in Cloud Storage.
+        """
+        client = self._require_client(client)
+        # We only need the status code (200 or not) so we seek to
+        # minimize the returned payload.
+        query_params = self._wrapped._query_params
+        query_params["fields"] = "name"
+        if soft_deleted is not None:
+            query_params["softDeleted"] = soft_deleted
+        _add_generation_match_parameters(
+            query_params,
+            if_generation_match=if_generation_match,
+            if_generation_not_match=if_generation_not_match,
+            if_metageneration_match=if_metageneration_match,
+            if_metageneration_not_match=if_metageneration_not_match,
+        )
+        headers = {}
+        _add_etag_match_headers(
+            headers, if_etag_match=if_etag_match, if_etag_not_match=if_etag_not_match
+        )
+        try:
+            await client._get_resource(
+                self.path,
+                query_params=query_params,
+                headers=headers,
+                timeout=timeout,
+                retry=retry,
+            )
+        except NotFound:
+            return False
+        return True
+
+    async def delete(
+        self,
+        client=None,
+        if_generation_match=None,
+        if_generation_not_match=None,
+        if_metageneration_match=None,
+        if_metageneration_not_match=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY,
+    ):
+        """Deletes a blob from Cloud Storage.
+
+        If :attr:`user_project` is set on the bucket, bills the API request
+        to that project.
+
+        :type client: :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`
+        :param client:
+            (Optional) The client to use. If not passed, falls back to the
+            ``client`` stored on the blob's bucket.
+
+        :type if_generation_match: long
+        :param if_generation_match:
+            (Optional) See :ref:`using-if-generation-match`
+
+        :type if_generation_not_match: long
+        :param if_generation_not_match:
+            (Optional) See :ref:`using-if-generation-not-match`
+
+        :type if_metageneration_match: long
+        :param if_metageneration_match:
+            (Optional) See :ref:`using-if-metageneration-match`
+
+        :type if_metageneration_not_match: long
+        :param if_metageneration_not_match:
+            (Optional) See :ref:`using-if-metageneration-not-match`
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+        :param retry:
+            (Optional) How to retry the RPC. See: :ref:`configuring_retries`
+
+        :raises: :class:`google.cloud.exceptions.NotFound`
+                 (propagated from
+                 :meth:`google.cloud.storage.asyncio.async_client.AsyncClient._delete_resource`).
+        """
+        client = self._require_client(client)
+        query_params = copy.deepcopy(self._wrapped._query_params)
+        _add_generation_match_parameters(
+            query_params,
+            if_generation_match=if_generation_match,
+            if_generation_not_match=if_generation_not_match,
+            if_metageneration_match=if_metageneration_match,
+            if_metageneration_not_match=if_metageneration_not_match,
+        )
+        await client._delete_resource(
+            self.path, query_params=query_params, timeout=timeout, retry=retry
+        )
+
+    async def download_as_bytes(
+        self,
+        client=None,
+        start=None,
+        end=None,
+        raw_download=False,
+        if_etag_match=None,
+        if_etag_not_match=None,
+        if_generation_match=None,
+        if_generation_not_match=None,
+        if_metageneration_match=None,
+        if_metageneration_not_match=None,
+        timeout=_DEFAULT_TIMEOUT,
+        checksum="auto",
+        retry=DEFAULT_RETRY,
+    ):
+        """Download the contents of this blob as a bytes object.
+
+        If :attr:`user_project` is set on the bucket, bills the API request
+        to that project.
+
+        The contents are downloaded in a single request; if the request is
+        retried, the download starts over.
+
+        :type client: :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`
+        :param client:
+            (Optional) The client to use. If not passed, falls back to the
+            ``client`` stored on the blob's bucket.
+
+        :type start: int
+        :param start: (Optional) The first byte in a range to be downloaded.
+
+        :type end: int
+        :param end: (Optional) The last byte in a range to be downloaded.
+
+        :type raw_download: bool
+        :param raw_download:
+            (Optional) If true, download the object without any expansion.
+
+        :type if_etag_match: Union[str, Set[str]]
+        :param if_etag_match:
+            (Optional) See :ref:`using-if-etag-match`
+
+        :type if_etag_not_match: Union[str, Set[str]]
+        :param if_etag_not_match:
+            (Optional) See :ref:`using-if-etag-not-match`
+
+        :type if_generation_match: long
+        :param if_generation_match:
+            (Optional) See :ref:`using-if-generation-match`
+
+        :type if_generation_not_match: long
+        :param if_generation_not_match:
+            (Optional) See :ref:`using-if-generation-not-match`
+
+        :type if_metageneration_match: long
+        :param if_metageneration_match:
+            (Optional) See :ref:`using-if-metageneration-match`
+
+        :type if_metageneration_not_match: long
+        :param if_metageneration_not_match:
+            (Optional) See :ref:`using-if-metageneration-not-match`
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type checksum: str
+        :param checksum:
+            (Optional) The type of checksum to compute to verify the integrity
+            of the object. The response headers must contain a checksum of the
+            requested type. If the headers lack an appropriate checksum (for
+            instance in the case of transcoded or ranged downloads where the
+            remote service does not know the correct checksum, including
+            downloads where chunk_size is set) an INFO-level log will be
+            emitted. Supported values are "md5", "crc32c", "auto" and None. The
+            default is "auto", which will try to detect if the C extension for
+            crc32c is installed and fall back to md5 otherwise.
+
+        :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+        :param retry: (Optional) How to retry the RPC. A None value will disable
+            retries. A google.api_core.retry.Retry value will enable retries,
+            and the object will define retriable response codes and errors and
+            configure backoff and timeout options.
+
+            A google.cloud.storage.retry.ConditionalRetryPolicy value wraps a
+            Retry object and activates it only if certain conditions are met.
+            This class exists to provide safe defaults for RPC calls that are
+            not technically safe to retry normally (due to potential data
+            duplication or other side-effects) but become safe to retry if a
+            condition such as if_metageneration_match is set.
+
+            See the retry.py source code and docstrings in this package
+            (google.cloud.storage.retry) for information on retry types and how
+            to configure them.
+
+        :rtype: bytes
+        :returns: The data stored in this blob.
+
+        :raises: :class:`google.cloud.exceptions.NotFound`
+        """
+        client = self._require_client(client)
+        retry = _limit_retries(
+            _media_retry(retry, if_generation_match, if_metageneration_match),
+            client._client,
+        )
+
+        download_url = self._wrapped._get_download_url(
+            client,
+            if_generation_match=if_generation_match,
+            if_generation_not_match=if_generation_not_match,
+            if_metageneration_match=if_metageneration_match,
+            if_metageneration_not_match=if_metageneration_not_match,
+        )
+        headers = _get_encryption_headers(self._wrapped._encryption_key)
+        headers["accept-encoding"] = "gzip"
+        _add_etag_match_headers(
+            headers,
+            if_etag_match=if_etag_match,
+            if_etag_not_match=if_etag_not_match,
+        )
+        # Add any client attached custom headers to be sent with the request.
+        headers = {
+            **_get_default_headers(client._connection.user_agent),
+            **headers,
+            **client._extra_headers,
+        }
+
+        async def download():
+            return await self._do_download(
+                client,
+                download_url,
+                headers,
+                start,
+                end,
+                raw_download,
+                timeout=timeout,
+                checksum=checksum,
+            )
+
+        if retry is not None:
+            download = retry(download)
+        try:
+            return await download()
+        except InvalidResponse as exc:
+            _raise_from_invalid_response(exc)
+
+    async def _do_download(
+        self,
+        client,
+        download_url,
+        headers,
+        start=None,
+        end=None,
+        raw_download=False,
+        timeout=_DEFAULT_TIMEOUT,
+        checksum="auto",
+    ):
+        """Perform a single download request, verifying its checksum.
+
+        The checksum is computed over the bytes as sent, before any
+        ``gzip`` content encoding is removed.
+
+        :rtype: bytes
+        :returns: The downloaded data.
+        """
+        download = _AsyncDownload(
+            download_url,
+            start=start,
+            end=end,
+            headers=headers,
+            checksum=checksum,
+            retry=None,
+        )
+        method, url, _, request_headers = download._prepare_request()
+        response = await client._request(
+            method, url, headers=request_headers, timeout=timeout, stream=True
+        )
+        try:
+            if not 200 <= response.status_code < 300:
+                # Read the error body, for the exception message.
+                await response.aread()
+            download._process_response(response)
+            expected_checksum, checksum_object = _media_helpers._get_expected_checksum(
+                response, download._get_headers, download.media_url, download.checksum
+            )
+            chunks = []
+            try:
+                async for chunk in response.aiter_raw():
+                    checksum_object.update(chunk)
+                    chunks.append(chunk)
+            except httpx.TransportError as exc:
+                raise ConnectionError(str(exc)) from exc
+        finally:
+            await response.aclose()
+
+        # Don't validate the checksum for partial responses.
+        if (
+            expected_checksum is not None
+            and response.status_code != http.client.PARTIAL_CONTENT
+        ):
+            actual_checksum = _media_helpers.prepare_checksum_digest(
+                checksum_object.digest()
+            )
+            if actual_checksum != expected_checksum:
+                msg = _CHECKSUM_MISMATCH.format(
+                    download.media_url,
+                    expected_checksum,
+                    actual_checksum,
+                    checksum_type=download.checksum.upper(),
+                )
+                raise DataCorruption(response, msg)
+
+        self._wrapped._extract_headers_from_download(response)
+        data = b"".join(chunks)
+        if not raw_download and response.headers.get("content-encoding") == "gzip":
+            data = gzip.decompress(data)
+        return data
+
+    async def download_as_text(
+        self,
+        client=None,
+        start=None,
+        end=None,
+        raw_download=False,
+        encoding=None,
+        if_etag_match=None,
+        if_etag_not_match=None,
+        if_generation_match=None,
+        if_generation_not_match=None,
+        if_metageneration_match=None,
+        if_metageneration_not_match=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY,
+    ):
+        """Download the contents of this blob as text (*not* bytes).
+
+        If :attr:`user_project` is set on the bucket, bills the API request
+        to that project.
+
+        See :meth:`download_as_bytes` for the other arguments.
+
+        :type encoding: str
+        :param encoding: (Optional) encoding to be used to decode the
+            downloaded bytes.  Defaults to the ``charset`` param of
+            attr:`content_type`, or else to "utf-8".
+
+        :rtype: text
+        :returns: The data stored in this blob, decoded to text.
+        """
+        data = await self.download_as_bytes(
+            client=client,
+            start=start,
+            end=end,
+            raw_download=raw_download,
+            if_etag_match=if_etag_match,
+            if_etag_not_match=if_etag_not_match,
+            if_generation_match=if_generation_match,
+            if_generation_not_match=if_generation_not_match,
+            if_metageneration_match=if_metageneration_match,
+            if_metageneration_not_match=if_metageneration_not_match,
+            timeout=timeout,
+            retry=retry,
+        )
+
+        if encoding is not None:
+            return data.decode(encoding)
+
+        if self.content_type is not None:
+            msg = HeaderParser().parsestr("Content-Type: " + self.content_type)
+            params = dict(msg.get_params()[1:])
+            if "charset" in params:
+                return data.decode(params["charset"])
+
+        return data.decode("utf-8")
+
+    async def upload_from_string(
+        self,
+        data,
+        content_type="text/plain",
+        client=None,
+        predefined_acl=None,
+        if_generation_match=None,
+        if_generation_not_match=None,
+        if_metageneration_match=None,
+        if_metageneration_not_match=None,
+        timeout=_DEFAULT_TIMEOUT,
+        checksum="auto",
+        retry=DEFAULT_RETRY_IF_GENERATION_SPECIFIED,
+    ):
+        """Upload contents of this blob from the provided string.
+
+        The data and the blob's metadata are sent in a single multipart
+        request; if the request is retried, the upload starts over.
+
+        If :attr:`user_project` is set on the bucket, bills the API request
+        to that project.
+
+        :type data: bytes or str
+        :param data:
+            The data to store in this blob.  If the value is text, it will be
+            encoded as UTF-8.
+
+        :type content_type: str
+        :param content_type:
+            (Optional) Type of content being uploaded. Defaults to
+            ``'text/plain'``.
+
+        :type client: :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`
+        :param client:
+            (Optional) The client to use. If not passed, falls back to the
+            ``client`` stored on the blob's bucket.
+
+        :type predefined_acl: str
+        :param predefined_acl: (Optional) Predefined access control list
+
+        :type if_generation_match: long
+        :param if_generation_match:
+            (Optional) See :ref:`using-if-generation-match`
+
+        :type if_generation_not_match: long
+        :param if_generation_not_match:
+            (Optional) See :ref:`using-if-generation-not-match`
+
+        :type if_metageneration_match: long
+        :param if_metageneration_match:
+            (Optional) See :ref:`using-if-metageneration-match`
+
+        :type if_metageneration_not_match: long
+        :param if_metageneration_not_match:
+            (Optional) See :ref:`using-if-metageneration-not-match`
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type checksum: str
+        :param checksum:
+            (Optional) The type of checksum to compute to verify
+            the integrity of the object. The request metadata will be amended
+            to include the computed value. Using this option will override a
+            manually-set checksum value. Supported values are "md5", "crc32c",
+            "auto" and None. The default is "auto", which will try to detect if
+            the C extension for crc32c is installed and fall back to md5
+            otherwise.
+
+        :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+        :param retry: (Optional) How to retry the RPC. A None value will disable
+            retries. A google.api_core.retry.Retry value will enable retries,
+            and the object will define retriable response codes and errors and
+            configure backoff and timeout options.
+
+            A google.cloud.storage.retry.ConditionalRetryPolicy value wraps a
+            Retry object and activates it only if certain conditions are met.
+            This class exists to provide safe defaults for RPC calls that are
+            not technically safe to retry normally (due to potential data
+            duplication or other side-effects) but become safe to retry if a
+            condition such as if_generation_match is set.
+
+            See the retry.py source code and docstrings in this package
+            (google.cloud.storage.retry) for information on retry types and how
+            to configure them.
+        """
+        data = _to_bytes(data, encoding="utf-8")
+        client = self._require_client(client)
+        retry = _limit_retries(
+            _media_retry(retry, if_generation_match, if_metageneration_match),
+            client._client,
+        )
+        blob = self._wrapped
+
+        # Add the "metadata" key so that it is uploaded along with the object.
+        if "metadata" in blob._properties and "metadata" not in blob._changes:
+            blob._changes.add("metadata")
+
+        headers, object_metadata, content_type = blob._get_upload_arguments(
+            client, content_type
+        )
+        upload_url = blob._get_multipart_upload_url(
+            client,
+            predefined_acl,
+            if_generation_match,
+            if_generation_not_match,
+            if_metageneration_match,
+            if_metageneration_not_match,
+        )
+
+        async def upload():
+            multipart = _AsyncMultipartUpload(
+                upload_url, headers=headers, checksum=checksum, retry=None
+            )
+            method, url, payload, request_headers = multipart._prepare_request(
+                data, object_metadata, content_type
+            )
+            response = await client._request(
+                method,
+                url,
+                data=bytes(payload),
+                headers=request_headers,
+                timeout=timeout,
+            )
+            multipart._process_response(response)
+            return response
+
+        if retry is not None:
+            upload = retry(upload)
+        try:
+            response = await upload()
+        except InvalidResponse as exc:
+            _raise_from_invalid_response(exc)
+
+        self._set_properties(response.json())
@@ -0,0 +1,559 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An async bucket, for use with :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`."""
+
+from google.cloud.exceptions import NotFound
+from google.cloud.storage._helpers import _add_etag_match_headers
+from google.cloud.storage._helpers import _add_generation_match_parameters
+from google.cloud.storage.asyncio._utils import AsyncPropertyMixin
+from google.cloud.storage.asyncio.async_blob import AsyncBlob
+from google.cloud.storage.bucket import Bucket
+from google.cloud.storage.bucket import _blobs_page_start
+from google.cloud.storage.constants import _DEFAULT_TIMEOUT
+from google.cloud.storage.retry import DEFAULT_RETRY
+
+
+class AsyncBucket(AsyncPropertyMixin):
+    """A bucket, with the core :class:`~google.cloud.storage.bucket.Bucket`
+    operations as coroutines.
+
+    Properties of :class:`~google.cloud.storage.bucket.Bucket`, such as
+    ``location`` or ``labels``, can be read and set as on a ``Bucket``.
+
+    :type client: :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`
+    :param client: A client which holds credentials and project configuration
+                   for the bucket.
+
+    :type name: str
+    :param name: The name of the bucket. Bucket names must start and end with a
+                 number or letter.
+
+    :type user_project: str
+    :param user_project: (Optional) the project ID to be billed for API
+                         requests made via this instance.
+    """
+
+    def __init__(self, client, name, user_project=None):
+        self._client = client
+        self._wrapped = Bucket(client._client, name=name, user_project=user_project)
+
+    def __repr__(self):
+        return f"<AsyncBucket: {self.name}>"
+
+    @property
+    def client(self):
+        """The client bound to this bucket.
+
+        :rtype: :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`
+        :returns: The client.
+        """
+        return self._client
+
+    @property
+    def user_project(self):
+        """Project ID to be billed for API requests made via this bucket.
+
+        :rtype: str
+        :returns: The project ID, if set.
+        """
+        return self._wrapped.user_project
+
+    def blob(self, blob_name, encryption_key=None, kms_key_name=None, generation=None):
+        """Factory constructor for blob object.
+
+        .. note::
+          This will not make an HTTP request; it simply instantiates
+          a blob object owned by this bucket.
+
+        :type blob_name: str
+        :param blob_name: The name of the blob to be instantiated.
+
+        :type encryption_key: bytes
+        :param encryption_key:
+            (Optional) 32 byte encryption key for customer-supplied encryption.
+
+        :type kms_key_name: str
+        :param kms_key_name:
+            (Optional) Resource name of KMS key used to encrypt blob's content.
+
+        :type generation: long
+        :param generation: (Optional) If present, selects a specific revision of
+                           this object.
+
+        :rtype: :class:`~google.cloud.storage.asyncio.async_blob.AsyncBlob`
+        :returns: The blob object created.
+        """
+        return AsyncBlob(
+            name=blob_name,
+            bucket=self,
+            encryption_key=encryption_key,
+            kms_key_name=kms_key_name,
+            generation=generation,
+        )
+
+    async def exists(
+        self,
+        client=None,
+        timeout=_DEFAULT_TIMEOUT,
+        if_etag_match=None,
+        if_etag_not_match=None,
+        if_metageneration_match=None,
+        if_metageneration_not_match=None,
+        retry=DEFAULT_RETRY,
+    ):
+        """Determines whether or not this bucket exists.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type client: :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`
+        :param client: (Optional) The client to use. If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type if_etag_match: Union[str, Set[str]]
+        :param if_etag_match: (Optional) Make the operation conditional on whether the
+                              bucket's current ETag matches the given value.
+
+        :type if_etag_not_match: Union[str, Set[str]])
+        :param if_etag_not_match: (Optional) Make the operation conditional on whether the
+                                  bucket's current ETag does not match the given value.
+
+        :type if_metageneration_match: long
+        :param if_metageneration_match: (Optional) Make the operation conditional on whether the
+                                        bucket's current metageneration matches the given value.
+
+        :type if_metageneration_not_match: long
+        :param if_metageneration_not_match: (Optional) Make the operation conditional on whether the
+                                            bucket's current metageneration does not match the given value.
+
+        :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+        :param retry:
+            (Optional) How to retry the RPC. See: :ref:`configuring_retries`
+
+        :rtype: bool
+        :returns: True if the bucket exists in Cloud Storage.
+        """
+        client = self._require_client(client)
+        # We only need the status code (200 or not) so we seek to
+        # minimize the returned payload.
+        query_params = {"fields": "name"}
+        if self.user_project is not None:
+            query_params["userProject"] = self.user_project
+        _add_generation_match_parameters(
+            query_params,
+            if_metageneration_match=if_metageneration_match,
+            if_metageneration_not_match=if_metageneration_not_match,
+        )
+        headers = {}
+        _add_etag_match_headers(
+            headers, if_etag_match=if_etag_match, if_etag_not_match=if_etag_not_match
+        )
+        try:
+            await client._get_resource(
+                self.path,
+                query_params=query_params,
+                headers=headers,
+                timeout=timeout,
+                retry=retry,
+            )
+        except NotFound:
+            return False
+        return True
+
+    async def get_blob(
+        self,
+        blob_name,
+        client=None,
+        encryption_key=None,
+        generation=None,
+        if_etag_match=None,
+        if_etag_not_match=None,
+        if_generation_match=None,
+        if_generation_not_match=None,
+        if_metageneration_match=None,
+        if_metageneration_not_match=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY,
+        soft_deleted=None,
+    ):
+        """Get a blob object by name.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type blob_name: str
+        :param blob_name: The name of the blob to retrieve.
+
+        :type client: :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`
+        :param client: (Optional) The client to use. If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type encryption_key: bytes
+        :param encryption_key:
+            (Optional) 32 byte encryption key for customer-supplied encryption.
+
+        :type generation: long
+        :param generation:
+            (Optional) If present, selects a specific revision of this object.
+
+        :type if_etag_match: Union[str, Set[str]]
+        :param if_etag_match:
+            (Optional) See :ref:`using-if-etag-match`
+
+        :type if_etag_not_match: Union[str, Set[str]]
+        :param if_etag_not_match:
+            (Optional) See :ref:`using-if-etag-not-match`
+
+        :type if_generation_match: long
+        :param if_generation_match:
+            (Optional) See :ref:`using-if-generation-match`
+
+        :type if_generation_not_match: long
+        :param if_generation_not_match:
+            (Optional) See :ref:`using-if-generation-not-match`
+
+        :type if_metageneration_match: long
+        :param if_metageneration_match:
+            (Optional) See :ref:`using-if-metageneration-match`
+
+        :type if_metageneration_not_match: long
+        :param if_metageneration_not_match:
+            (Optional) See :ref:`using-if-metageneration-not-match`
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+        :param retry:
+            (Optional) How to retry the RPC. See: :ref:`configuring_retries`
+
+        :type soft_deleted: bool
+        :param soft_deleted:
+            (Optional) If True, looks for a soft-deleted object. Object
+            ``generation`` is required if ``soft_deleted`` is set to True.
+
+        :rtype: :class:`~google.cloud.storage.asyncio.async_blob.AsyncBlob` or None
+        :returns: The blob object if it exists, otherwise None.
+        """
+        blob = AsyncBlob(
+            name=blob_name,
+            bucket=self,
+            encryption_key=encryption_key,
+            generation=generation,
+        )
+        try:
+            await blob.reload(
+                client=client,
+                timeout=timeout,
+                if_etag_match=if_etag_match,
+                if_etag_not_match=if_etag_not_match,
+                if_generation_match=if_generation_match,
+                if_generation_not_match=if_generation_not_match,
+                if_metageneration_match=if_metageneration_match,
+                if_metageneration_not_match=if_metageneration_not_match,
+                retry=retry,
+                soft_deleted=soft_deleted,
+            )
+        except NotFound:
+            return None
+        return blob
+
+    def list_blobs(
+        self,
+        max_results=None,
+        page_token=None,
+        prefix=None,
+        delimiter=None,
+        start_offset=None,
+        end_offset=None,
+        include_trailing_delimiter=None,
+        versions=None,
+        projection="noAcl",
+        fields=None,
+        client=None,
+        page_size=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY,
+        match_glob=None,
+        soft_deleted=None,
+    ):
+        """Return an async iterator used to find blobs in the bucket.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        .. code-block:: python
+
+            async for blob in bucket.list_blobs(prefix="logs/"):
+                print(blob.name)
+
+        :type max_results: int
+        :param max_results:
+            (Optional) The maximum number of blobs to return.
+
+        :type page_token: str
+        :param page_token:
+            (Optional) If present, return the next batch of blobs, using the
+            value, which must correspond to the ``nextPageToken`` value
+            returned in the previous response.
+
+        :type prefix: str
+        :param prefix: (Optional) Prefix used to filter blobs.
+
+        :type delimiter: str
+        :param delimiter: (Optional) Delimiter, used with ``prefix`` to
+                          emulate hierarchy. The prefixes found are
+                          collected in the iterator's ``prefixes``.
+
+        :type start_offset: str
+        :param start_offset:
+            (Optional) Filter results to objects whose names are
+            lexicographically equal to or after ``startOffset``.
+
+        :type end_offset: str
+        :param end_offset:
+            (Optional) Filter results to objects whose names are
+            lexicographically before ``endOffset``.
+
+        :type include_trailing_delimiter: boolean
+        :param include_trailing_delimiter:
+            (Optional) If true, objects that end in exactly one instance of
+            ``delimiter`` will have their metadata included in ``items`` in
+            addition to ``prefixes``.
+
+        :type versions: bool
+        :param versions: (Optional) Whether object versions should be returned
+                         as separate blobs.
+
+        :type projection: str
+        :param projection: (Optional) If used, must be 'full' or 'noAcl'.
+                           Defaults to ``'noAcl'``. Specifies the set of
+                           properties to return.
+
+        :type fields: str
+        :param fields:
+            (Optional) Selector specifying which fields to include
+            in a partial response.
+
+        :type client: :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`
+        :param client: (Optional) The client to use. If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type page_size: int
+        :param page_size:
+            (Optional) Maximum number of blobs to return in each page.
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+        :param retry:
+            (Optional) How to retry each page request. See: :ref:`configuring_retries`
+
+        :type match_glob: str
+        :param match_glob:
+            (Optional) A glob pattern used to filter results (for example, foo*bar).
+
+        :type soft_deleted: bool
+        :param soft_deleted:
+            (Optional) If true, only soft-deleted objects will be listed as
+            distinct results in order of increasing generation number.
+
+        :rtype: :class:`~google.cloud.storage.asyncio.async_client.AsyncHTTPIterator`
+        :returns: Iterator of all :class:`~google.cloud.storage.asyncio.async_blob.AsyncBlob`
+                  in this bucket matching the arguments.
+        """
+        client = self._require_client(client)
+        extra_params = {"projection": projection}
+        if prefix is not None:
+            extra_params["prefix"] = prefix
+        if delimiter is not None:
+            extra_params["delimiter"] = delimiter
+        if match_glob is not None:
+            extra_params["matchGlob"] = match_glob
+        if start_offset is not None:
+            extra_params["startOffset"] = start_offset
+        if end_offset is not None:
+            extra_params["endOffset"] = end_offset
+        if include_trailing_delimiter is not None:
+            extra_params["includeTrailingDelimiter"] = include_trailing_delimiter
+        if versions is not None:
+            extra_params["versions"] = versions
+        if fields is not None:
+            extra_params["fields"] = fields
+        if soft_deleted is not None:
+            extra_params["softDeleted"] = soft_deleted
+        if self.user_project is not None:
+            extra_params["userProject"] = self.user_project
+
+        iterator = client._list_resource(
+            self.path + "/o",
+            _item_to_blob,
+            page_token=page_token,
+            max_results=max_results,
+            extra_params=extra_params,
+            page_start=_blobs_page_start,
+            page_size=page_size,
+            timeout=timeout,
+            retry=retry,
+        )
+        iterator.bucket = self
+        iterator.prefixes = set()
+        return iterator
+
+    async def delete(
+        self,
+        client=None,
+        if_metageneration_match=None,
+        if_metageneration_not_match=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY,
+    ):
+        """Delete this bucket.
+
+        The bucket **must** be empty in order to submit a delete request.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type client: :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`
+        :param client: (Optional) The client to use. If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type if_metageneration_match: long
+        :param if_metageneration_match: (Optional) Make the operation conditional on whether the
+                                        blob's current metageneration matches the given value.
+
+        :type if_metageneration_not_match: long
+        :param if_metageneration_not_match: (Optional) Make the operation conditional on whether the
+                                            blob's current metageneration does not match the given value.
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+        :param retry:
+            (Optional) How to retry the RPC. See: :ref:`configuring_retries`
+
+        :raises: :class:`google.cloud.exceptions.Conflict` if the bucket
+            is not empty.
+        """
+        client = self._require_client(client)
+        query_params = {}
+        if self.user_project is not None:
+            query_params["userProject"] = self.user_project
+        _add_generation_match_parameters(
+            query_params,
+            if_metageneration_match=if_metageneration_match,
+            if_metageneration_not_match=if_metageneration_not_match,
+        )
+        await client._delete_resource(
+            self.path, query_params=query_params, timeout=timeout, retry=retry
+        )
+
+    async def delete_blob(
+        self,
+        blob_name,
+        client=None,
+        generation=None,
+        if_generation_match=None,
+        if_generation_not_match=None,
+        if_metageneration_match=None,
+        if_metageneration_not_match=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY,
+    ):
+        """Deletes a blob from the current bucket.
+
+        If :attr:`user_project` is set, bills the API request to that project.
+
+        :type blob_name: str
+        :param blob_name: A blob name to delete.
+
+        :type client: :class:`~google.cloud.storage.asyncio.async_client.AsyncClient`
+        :param client: (Optional) The client to use. If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type generation: long
+        :param generation: (Optional) If present, permanently deletes a specific
+                           revision of this object.
+
+        :type if_generation_match: long
+        :param if_generation_match:
+            (Optional) See :ref:`using-if-generation-match`
+
+        :type if_generation_not_match: long
+        :param if_generation_not_match:
+            (Optional) See :ref:`using-if-generation-not-match`
+
+        :type if_metageneration_match: long
+        :param if_metageneration_match:
+            (Optional) See :ref:`using-if-metageneration-match`
+
+        :type if_metageneration_not_match: long
+        :param if_metageneration_not_match:
+            (Optional) See :ref:`using-if-metageneration-not-match`
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+        :param retry:
+            (Optional) How to retry the RPC. See: :ref:`configuring_retries`
+
+        :raises: :class:`google.cloud.exceptions.NotFound` if the blob
+            isn't found.
+        """
+        blob = self.blob(blob_name, generation=generation)
+        await blob.delete(
+            client=client,
+            if_generation_match=if_generation_match,
+            if_generation_not_match=if_generation_not_match,
+            if_metageneration_match=if_metageneration_match,
+            if_metageneration_not_match=if_metageneration_not_match,
+            timeout=timeout,
+            retry=retry,
+        )
+
+
+def _item_to_blob(iterator, item):
+    """Convert a JSON blob to the native object.
+
+    .. note::
+
+        This assumes that the ``bucket`` attribute has been
+        added to the iterator after being created.
+
+    :type iterator: :class:`~google.cloud.storage.asyncio.async_client.AsyncHTTPIterator`
+    :param iterator: The iterator that has retrieved the item.
+
+    :type item: dict
+    :param item: An item to be converted to a blob.
+
+    :rtype: :class:`~google.cloud.storage.asyncio.async_blob.AsyncBlob`
+    :returns: The next blob in the page.
+    """
+    blob = AsyncBlob(item.get("name"), bucket=iterator.bucket)
+    blob._set_properties(item)
+    return blob
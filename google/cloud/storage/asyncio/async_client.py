@@ -0,0 +1,852 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An async client for interacting with Google Cloud Storage using the JSON API."""
+
+import asyncio
+import functools
+import json
+
+import httpx
+
+from google.api_core import page_iterator
+from google.auth.credentials import AnonymousCredentials
+from google.auth.transport import requests as auth_requests
+from google.cloud import exceptions
+from google.cloud._http import CLIENT_INFO_HEADER
+from google.cloud.exceptions import NotFound
+from google.cloud.storage import _helpers
+from google.cloud.storage._http2 import _httpx_timeout
+from google.cloud.storage.asyncio import _utils
+from google.cloud.storage.asyncio.async_bucket import AsyncBucket
+from google.cloud.storage.client import Client
+from google.cloud.storage.client import _marker
+from google.cloud.storage.constants import _DEFAULT_TIMEOUT
+from google.cloud.storage.retry import ConditionalRetryPolicy
+from google.cloud.storage.retry import DEFAULT_RETRY
+from google.cloud.storage.retry import _limit_retries
+
+
+class AsyncClient(object):
+    """An asynchronous client for interacting with Google Cloud Storage using the JSON API.
+
+    Mirrors the core operations of :class:`~google.cloud.storage.client.Client`,
+    :class:`~google.cloud.storage.bucket.Bucket` and
+    :class:`~google.cloud.storage.blob.Blob` as coroutines, sending requests
+    with :mod:`httpx` instead of blocking a thread per request:
+
+    .. code-block:: python
+
+        async with AsyncClient() as client:
+            bucket = client.bucket("my-bucket")
+            blob = await bucket.get_blob("data.json")
+            data = await blob.download_as_bytes()
+
+    Projects, credentials, endpoints and retry policies are resolved exactly
+    as by :class:`~google.cloud.storage.client.Client`. Requires :mod:`httpx`
+    (``pip install google-cloud-storage[asyncio]``).
+
+    :type project: str or None
+    :param project: the project which the client acts on behalf of. Will be
+                    passed when creating a bucket. If not passed,
+                    falls back to the default inferred from the environment.
+
+    :type credentials: :class:`~google.auth.credentials.Credentials`
+    :param credentials: (Optional) The OAuth2 Credentials to use for this
+                        client. If not passed, falls back to the default
+                        inferred from the environment.
+
+    :type client_info: :class:`~google.api_core.client_info.ClientInfo`
+    :param client_info:
+        The client info used to send a user-agent string along with API
+        requests. If ``None``, then default info will be used.
+
+    :type client_options: :class:`~google.api_core.client_options.ClientOptions` or :class:`dict`
+    :param client_options: (Optional) Client options used to set user options
+        on the client.
+
+    :type extra_headers: dict
+    :param extra_headers:
+        (Optional) Custom headers to be sent with the requests attached to the client.
+        For example, you can add custom audit logging headers.
+
+    :type http2: bool
+    :param http2:
+        (Optional) If True, send requests over HTTP/2, so that concurrent
+        requests share a few multiplexed connections. Requires the ``http2``
+        extra. Defaults to False.
+
+    :type _http: :class:`httpx.AsyncClient`
+    :param _http: (Optional) HTTP client used to send requests. If not
+                  passed, one is created when first needed.
+    """
+
+    def __init__(
+        self,
+        project=_marker,
+        credentials=None,
+        client_info=None,
+        client_options=None,
+        *,
+        extra_headers={},
+        http2=False,
+        _http=None,
+    ):
+        # The synchronous client resolves the project, credentials and
+        # endpoint, and builds URLs and headers; it never sends requests.
+        self._client = Client(
+            project=project,
+            credentials=credentials,
+            client_info=client_info,
+            client_options=client_options,
+            extra_headers=extra_headers,
+        )
+        self._http_internal = _http
+        self._http2 = http2
+        self._auth_request = auth_requests.Request()
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def project(self):
+        """The project the client acts on behalf of.
+
+        :rtype: str
+        :returns: The project ID.
+        """
+        return self._client.project
+
+    @property
+    def _credentials(self):
+        return self._client._credentials
+
+    @property
+    def _connection(self):
+        return self._client._connection
+
+    @property
+    def _extra_headers(self):
+        return self._client._extra_headers
+
+    @property
+    def _http(self):
+        """Getter for the HTTP client used to send requests.
+
+        :rtype: :class:`httpx.AsyncClient`
+        :returns: The HTTP client.
+        """
+        if self._http_internal is None:
+            self._http_internal = httpx.AsyncClient(http2=self._http2)
+        return self._http_internal
+
+    async def close(self):
+        """Close the connections of the client's HTTP client, if created."""
+        if self._http_internal is not None:
+            await self._http_internal.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _authorize(self, headers, refresh=False):
+        """Add credentials to request headers, refreshing them if needed.
+
+        Refreshing credentials makes blocking requests, so it is done in a
+        thread, and only by one task at a time.
+        """
+        credentials = self._credentials
+        if refresh or not credentials.valid:
+            async with self._refresh_lock:
+                if refresh or not credentials.valid:
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(
+                        None, credentials.refresh, self._auth_request
+                    )
+        credentials.apply(headers)
+
+    async def _request(
+        self,
+        method,
+        url,
+        data=None,
+        headers=None,
+        timeout=_DEFAULT_TIMEOUT,
+        stream=False,
+    ):
+        """Send an authorized request.
+
+        As with :class:`~google.auth.transport.requests.AuthorizedSession`,
+        a request which fails with ``401 Unauthorized`` is sent once more
+        with refreshed credentials.
+
+        :type method: str
+        :param method: The HTTP method of the request.
+
+        :type url: str
+        :param url: The URL of the request.
+
+        :type data: bytes
+        :param data: (Optional) The body of the request.
+
+        :type headers: dict
+        :param headers: (Optional) The headers of the request.
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type stream: bool
+        :param stream:
+            (Optional) If True, the response body is not read; the caller must
+            close the response.
+
+        :rtype: :class:`httpx.Response`
+        :returns: The response.
+
+        :raises: :exc:`ConnectionError` if the request could not be sent or
+            the response could not be read.
+        """
+        refreshable = not isinstance(self._credentials, AnonymousCredentials)
+        for attempt in range(2):
+            # Header names are case-insensitive: as with ``requests``, the
+            # last of several spellings of a name wins.
+            request_headers = {
+                name.lower(): value for name, value in (headers or {}).items()
+            }
+            await self._authorize(request_headers, refresh=attempt > 0)
+            request = self._http.build_request(
+                method,
+                url,
+                content=data,
+                headers=request_headers,
+                timeout=_httpx_timeout(timeout),
+            )
+            try:
+                response = await self._http.send(request, stream=True)
+            except httpx.TransportError as exc:
+                raise ConnectionError(str(exc)) from exc
+            if response.status_code != 401 or not refreshable or attempt:
+                break
+            await response.aclose()
+
+        if not stream:
+            try:
+                await response.aread()
+            except httpx.TransportError as exc:
+                raise ConnectionError(str(exc)) from exc
+        return response
+
+    async def _api_request(
+        self,
+        method,
+        path,
+        query_params=None,
+        data=None,
+        headers=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=None,
+    ):
+        """Make a JSON API request, retrying it as ``retry`` allows.
+
+        Mirrors :meth:`google.cloud.storage._http.Connection.api_request`.
+
+        :rtype: dict or bytes
+        :returns: The parsed JSON response, or the empty body of a response
+            without one.
+
+        :raises ~google.cloud.exceptions.GoogleCloudError: if the response
+            code is not 2xx.
+        """
+        if isinstance(retry, ConditionalRetryPolicy):
+            retry = retry.get_retry_policy_if_conditions_met(
+                query_params=query_params or {}, data=data
+            )
+        call = functools.partial(
+            self._do_api_request,
+            method,
+            path,
+            query_params=query_params,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+        )
+        retry = _limit_retries(_utils.to_async_retry(retry), self._client)
+        if retry:
+            call = retry(call)
+        return await call()
+
+    async def _do_api_request(
+        self, method, path, query_params=None, data=None, headers=None, timeout=None
+    ):
+        connection = self._connection
+        url = connection.build_api_url(path=path, query_params=query_params)
+        headers = dict(headers or {})
+        headers.update(connection.extra_headers)
+        headers["Accept-Encoding"] = "gzip"
+        if data is not None:
+            data = json.dumps(data)
+            headers["Content-Type"] = "application/json"
+        headers[
+            CLIENT_INFO_HEADER
+        ] = f"{connection.user_agent} {_helpers._get_invocation_id()}"
+        headers["User-Agent"] = connection.user_agent
+
+        response = await self._request(
+            method, url, data=data, headers=headers, timeout=timeout
+        )
+        if not 200 <= response.status_code < 300:
+            raise exceptions.from_http_response(response)
+        if response.content:
+            return response.json()
+        return response.content
+
+    async def _get_resource(
+        self,
+        path,
+        query_params=None,
+        headers=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY,
+    ):
+        """Helper for bucket / blob methods making API 'GET' calls.
+
+        Mirrors :meth:`google.cloud.storage.client.Client._get_resource`.
+        """
+        return await self._api_request(
+            "GET",
+            path,
+            query_params=query_params,
+            headers=headers,
+            timeout=timeout,
+            retry=retry,
+        )
+
+    async def _patch_resource(
+        self,
+        path,
+        data,
+        query_params=None,
+        headers=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=None,
+    ):
+        """Helper for bucket / blob methods making API 'PATCH' calls.
+
+        Mirrors :meth:`google.cloud.storage.client.Client._patch_resource`.
+        """
+        return await self._api_request(
+            "PATCH",
+            path,
+            data=data,
+            query_params=query_params,
+            headers=headers,
+            timeout=timeout,
+            retry=retry,
+        )
+
+    async def _post_resource(
+        self,
+        path,
+        data,
+        query_params=None,
+        headers=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=None,
+    ):
+        """Helper for bucket / blob methods making API 'POST' calls.
+
+        Mirrors :meth:`google.cloud.storage.client.Client._post_resource`.
+        """
+        return await self._api_request(
+            "POST",
+            path,
+            data=data,
+            query_params=query_params,
+            headers=headers,
+            timeout=timeout,
+            retry=retry,
+        )
+
+    async def _delete_resource(
+        self,
+        path,
+        query_params=None,
+        headers=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY,
+    ):
+        """Helper for bucket / blob methods making API 'DELETE' calls.
+
+        Mirrors :meth:`google.cloud.storage.client.Client._delete_resource`.
+        """
+        return await self._api_request(
+            "DELETE",
+            path,
+            query_params=query_params,
+            headers=headers,
+            timeout=timeout,
+            retry=retry,
+        )
+
+    def _list_resource(
+        self,
+        path,
+        item_to_value,
+        page_token=None,
+        max_results=None,
+        extra_params=None,
+        page_start=page_iterator._do_nothing_page_start,
+        page_size=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY,
+    ):
+        """Helper for list methods making paged API 'GET' calls.
+
+        Mirrors :meth:`google.cloud.storage.client.Client._list_resource`.
+
+        :rtype: :class:`AsyncHTTPIterator`
+        :returns: An async iterator over the listed items.
+        """
+        return AsyncHTTPIterator(
+            client=self,
+            path=path,
+            item_to_value=item_to_value,
+            page_token=page_token,
+            max_results=max_results,
+            extra_params=extra_params,
+            page_start=page_start,
+            page_size=page_size,
+            timeout=timeout,
+            retry=retry,
+        )
+
+    def bucket(self, bucket_name, user_project=None):
+        """Factory constructor for bucket object.
+
+        .. note::
+          This will not make an HTTP request; it simply instantiates
+          a bucket object owned by this client.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the bucket to be instantiated.
+
+        :type user_project: str
+        :param user_project: (Optional) The project ID to be billed for API
+                             requests made via the bucket.
+
+        :rtype: :class:`~google.cloud.storage.asyncio.async_bucket.AsyncBucket`
+        :returns: The bucket object created.
+        """
+        return AsyncBucket(client=self, name=bucket_name, user_project=user_project)
+
+    def _bucket_arg_to_bucket(self, bucket_or_name):
+        if isinstance(bucket_or_name, AsyncBucket):
+            return bucket_or_name
+        return self.bucket(bucket_or_name)
+
+    async def get_bucket(
+        self,
+        bucket_or_name,
+        timeout=_DEFAULT_TIMEOUT,
+        if_metageneration_match=None,
+        if_metageneration_not_match=None,
+        retry=DEFAULT_RETRY,
+    ):
+        """Retrieve a bucket via a GET request.
+
+        :type bucket_or_name: str or :class:`~google.cloud.storage.asyncio.async_bucket.AsyncBucket`
+        :param bucket_or_name: The bucket, or name of the bucket, to retrieve.
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type if_metageneration_match: long
+        :param if_metageneration_match:
+            (Optional) Make the operation conditional on whether the
+            bucket's current metageneration matches the given value.
+
+        :type if_metageneration_not_match: long
+        :param if_metageneration_not_match:
+            (Optional) Make the operation conditional on whether the
+            bucket's current metageneration does not match the given value.
+
+        :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+        :param retry:
+            (Optional) How to retry the RPC. See: :ref:`configuring_retries`
+
+        :rtype: :class:`~google.cloud.storage.asyncio.async_bucket.AsyncBucket`
+        :returns: The bucket matching the name provided.
+
+        :raises: :class:`google.cloud.exceptions.NotFound` if the bucket is
+            not found.
+        """
+        bucket = self._bucket_arg_to_bucket(bucket_or_name)
+        await bucket.reload(
+            client=self,
+            timeout=timeout,
+            if_metageneration_match=if_metageneration_match,
+            if_metageneration_not_match=if_metageneration_not_match,
+            retry=retry,
+        )
+        return bucket
+
+    async def lookup_bucket(
+        self,
+        bucket_name,
+        timeout=_DEFAULT_TIMEOUT,
+        if_metageneration_match=None,
+        if_metageneration_not_match=None,
+        retry=DEFAULT_RETRY,
+    ):
+        """Get a bucket by name, returning None if not found.
+
+        See :meth:`get_bucket` for the arguments.
+
+        :rtype: :class:`~google.cloud.storage.asyncio.async_bucket.AsyncBucket` or ``NoneType``
+        :returns: The bucket matching the name provided or None if not found.
+        """
+        try:
+            return await self.get_bucket(
+                bucket_name,
+                timeout=timeout,
+                if_metageneration_match=if_metageneration_match,
+                if_metageneration_not_match=if_metageneration_not_match,
+                retry=retry,
+            )
+        except NotFound:
+            return None
+
+    async def create_bucket(
+        self,
+        bucket_or_name,
+        user_project=None,
+        project=None,
+        location=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY,
+    ):
+        """Create a new bucket via a POST request.
+
+        Properties set on a :class:`~google.cloud.storage.asyncio.async_bucket.AsyncBucket`
+        passed as ``bucket_or_name`` are sent with the request.
+
+        :type bucket_or_name: str or :class:`~google.cloud.storage.asyncio.async_bucket.AsyncBucket`
+        :param bucket_or_name: The bucket, or name of the bucket, to create.
+
+        :type user_project: str
+        :param user_project: (Optional) The project ID to be billed for API
+                             requests made via the created bucket.
+
+        :type project: str
+        :param project: (Optional) The project under which the bucket is to be
+                        created. If not passed, uses the project set on the
+                        client.
+
+        :type location: str
+        :param location: (Optional) The location of the bucket. If not passed,
+                         the default location, US, will be used.
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+        :param retry:
+            (Optional) How to retry the RPC. See: :ref:`configuring_retries`
+
+        :rtype: :class:`~google.cloud.storage.asyncio.async_bucket.AsyncBucket`
+        :returns: The newly created bucket.
+
+        :raises: :class:`google.cloud.exceptions.Conflict` if the bucket
+            already exists.
+        """
+        bucket = self._bucket_arg_to_bucket(bucket_or_name)
+        if project is None:
+            project = self.project
+        query_params = {} if project is None else {"project": project}
+        if user_project is not None:
+            query_params["userProject"] = user_project
+
+        properties = {key: bucket._properties[key] for key in bucket._wrapped._changes}
+        properties["name"] = bucket.name
+        if location is not None:
+            properties["location"] = location
+
+        api_response = await self._post_resource(
+            "/b",
+            properties,
+            query_params=query_params,
+            timeout=timeout,
+            retry=retry,
+        )
+        bucket._set_properties(api_response)
+        return bucket
+
+    def list_blobs(self, bucket_or_name, *args, **kwargs):
+        """Return an async iterator used to find blobs in the bucket.
+
+        See :meth:`~google.cloud.storage.asyncio.async_bucket.AsyncBucket.list_blobs`
+        for the arguments.
+
+        :type bucket_or_name: str or :class:`~google.cloud.storage.asyncio.async_bucket.AsyncBucket`
+        :param bucket_or_name: The bucket, or name of the bucket, to list.
+
+        :rtype: :class:`AsyncHTTPIterator`
+        :returns: Iterator of all :class:`~google.cloud.storage.asyncio.async_blob.AsyncBlob`
+                  in this bucket matching the arguments.
+        """
+        bucket = self._bucket_arg_to_bucket(bucket_or_name)
+        return bucket.list_blobs(*args, client=self, **kwargs)
+
+    def list_buckets(
+        self,
+        max_results=None,
+        page_token=None,
+        prefix=None,
+        projection="noAcl",
+        fields=None,
+        project=None,
+        page_size=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY,
+    ):
+        """Get all buckets in the project associated to the client.
+
+        :type max_results: int
+        :param max_results: (Optional) The maximum number of buckets to return.
+
+        :type page_token: str
+        :param page_token:
+            (Optional) If present, return the next batch of buckets, using the
+            value, which must correspond to the ``nextPageToken`` value
+            returned in the previous response.
+
+        :type prefix: str
+        :param prefix: (Optional) Filter results to buckets whose names begin
+                       with this prefix.
+
+        :type projection: str
+        :param projection:
+            (Optional) Specifies the set of properties to return. If used, must
+            be 'full' or 'noAcl'. Defaults to 'noAcl'.
+
+        :type fields: str
+        :param fields:
+            (Optional) Selector specifying which fields to include in a partial
+            response. Must be a list of fields.
+
+        :type project: str
+        :param project: (Optional) The project whose buckets are to be listed.
+                        If not passed, uses the project set on the client.
+
+        :type page_size: int
+        :param page_size: (Optional) Maximum number of buckets to return in
+                          each page.
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait
+            for the server response.  See: :ref:`configuring_timeouts`
+
+        :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+        :param retry:
+            (Optional) How to retry the RPC. See: :ref:`configuring_retries`
+
+        :rtype: :class:`AsyncHTTPIterator`
+        :returns: Iterator of all :class:`~google.cloud.storage.asyncio.async_bucket.AsyncBucket`
+                  belonging to this project.
+
+        :raises: :exc:`ValueError` if both ``project`` is ``None`` and the
+            client's project is also ``None``.
+        """
+        if project is None:
+            project = self.project
+        if project is None:
+            raise ValueError("Client project not set:  pass an explicit project.")
+
+        extra_params = {"project": project, "projection": projection}
+        if prefix is not None:
+            extra_params["prefix"] = prefix
+        if fields is not None:
+            extra_params["fields"] = fields
+
+        return self._list_resource(
+            "/b",
+            _item_to_bucket,
+            page_token=page_token,
+            max_results=max_results,
+            extra_params=extra_params,
+            page_size=page_size,
+            timeout=timeout,
+            retry=retry,
+        )
+
+
+class AsyncHTTPIterator(object):
+    """An async iterator over the items of a paged JSON API list call.
+
+    Mirrors :class:`google.api_core.page_iterator.HTTPIterator`: iterate over
+    the items with ``async for``, or over the pages with ``async for`` on
+    :attr:`pages`. Only one of the two may be iterated, once.
+
+    :type client: :class:`AsyncClient`
+    :param client: The client used to make requests.
+
+    :type path: str
+    :param path: The path of the list call.
+
+    :type item_to_value: callable
+    :param item_to_value: Called with the iterator and a JSON item to convert
+                          the item to a native object.
+
+    :type page_token: str
+    :param page_token: (Optional) A token identifying the page to start at.
+
+    :type max_results: int
+    :param max_results: (Optional) The maximum number of results to fetch.
+
+    :type extra_params: dict
+    :param extra_params: (Optional) Extra query string parameters.
+
+    :type page_start: callable
+    :param page_start: (Optional) Called with the iterator, each page and the
+                       JSON response for it as each page is fetched.
+
+    :type page_size: int
+    :param page_size: (Optional) The maximum number of results per page.
+
+    :type timeout: float or tuple
+    :param timeout:
+        (Optional) The amount of time, in seconds, to wait
+        for the server response.  See: :ref:`configuring_timeouts`
+
+    :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
+    :param retry:
+        (Optional) How to retry each page request. See: :ref:`configuring_retries`
+    """
+
+    def __init__(
+        self,
+        client,
+        path,
+        item_to_value,
+        page_token=None,
+        max_results=None,
+        extra_params=None,
+        page_start=page_iterator._do_nothing_page_start,
+        page_size=None,
+        timeout=_DEFAULT_TIMEOUT,
+        retry=DEFAULT_RETRY,
+    ):
+        self.client = client
+        self.path = path
+        self.item_to_value = item_to_value
+        self.next_page_token = page_token
+        self.max_results = max_results
+        self.extra_params = extra_params or {}
+        self.page_number = 0
+        self.num_results = 0
+        self._page_start = page_start
+        self._page_size = page_size
+        self._timeout = timeout
+        self._retry = retry
+        self._started = False
+
+    @property
+    def pages(self):
+        """Async iterator of pages in the response.
+
+        :rtype: async iterator of :class:`google.api_core.page_iterator.Page`
+        :returns: The pages, each of which is itself an iterator of items.
+
+        :raises ValueError: If the iterator has already been started.
+        """
+        if self._started:
+            raise ValueError("Iterator has already started", self)
+        self._started = True
+        return self._page_iter()
+
+    def __aiter__(self):
+        if self._started:
+            raise ValueError("Iterator has already started", self)
+        self._started = True
+        return self._items_iter()
+
+    async def _items_iter(self):
+        async for page in self._page_iter():
+            for item in page:
+                yield item
+
+    async def _page_iter(self):
+        while self._has_next_page():
+            response = await self.client._get_resource(
+                self.path,
+                query_params=self._get_query_params(),
+                timeout=self._timeout,
+                retry=self._retry,
+            )
+            items = response.get("items", [])
+            page = page_iterator.Page(
+                self, items, self.item_to_value, raw_page=response
+            )
+            self._page_start(self, page, response)
+            self.page_number += 1
+            self.num_results += page.num_items
+            self.next_page_token = response.get("nextPageToken")
+            yield page
+
+    def _has_next_page(self):
+        if self.page_number == 0:
+            return True
+        if self.max_results is not None and self.num_results >= self.max_results:
+            return False
+        return self.next_page_token is not None
+
+    def _get_query_params(self):
+        query_params = {}
+        if self.next_page_token is not None:
+            query_params["pageToken"] = self.next_page_token
+        page_size = None
+        if self.max_results is not None:
+            page_size = self.max_results - self.num_results
+            if self._page_size is not None:
+                page_size = min(page_size, self._page_size)
+        elif self._page_size is not None:
+            page_size = self._page_size
+        if page_size is not None:
+            query_params["maxResults"] = page_size
+        query_params.update(self.extra_params)
+        return query_params
+
+
+def _item_to_bucket(iterator, item):
+    """Convert a JSON bucket to the native object.
+
+    :type iterator: :class:`AsyncHTTPIterator`
+    :param iterator: The iterator that has retrieved the item.
+
+    :type item: dict
+    :param item: An item to be converted to a bucket.
+
+    :rtype: :class:`~google.cloud.storage.asyncio.async_bucket.AsyncBucket`
+    :returns: The next bucket in the page.
+    """
+    bucket = iterator.client.bucket(item.get("name"))
+    bucket._set_properties(item)
+    return bucket
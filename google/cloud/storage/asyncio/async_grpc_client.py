@@ -14,11 +14,16 @@
 
 """An async client for interacting with Google Cloud Storage using the gRPC API."""
 
+import weakref
+
+import google.auth
+import google.auth.transport.requests
 from google.cloud import _storage_v2 as storage_v2
 from google.cloud._storage_v2.services.storage.transports.base import (
     DEFAULT_CLIENT_INFO,
 )
 from google.cloud.storage import __version__
+from google.cloud.storage._helpers import _CredentialRefresher
 import grpc
 from google.auth import credentials as auth_credentials
 
@@ -44,6 +49,23 @@ class AsyncGrpcClient:
     :param attempt_direct_path:
         (Optional) Whether to attempt to use DirectPath for gRPC connections.
         Defaults to ``True``.
+
+    :type refresh_credentials_in_background: bool
+    :param refresh_credentials_in_background:
+        (Optional) If True, the credentials are refreshed on a background
+        thread a few minutes before they expire, so that RPCs don't wait for
+        the token endpoint when they do. The thread runs until :meth:`close`
+        is called, or the client is garbage collected. Defaults to ``False``.
+
+    :type retry_budget: :class:`~google.cloud.storage.retry.RetryBudget`
+    :param retry_budget:
+        (Optional) Limits the retries of the client's bidi streaming reads
+        and appends to a share of their successful attempts.
+
+    :type circuit_breaker: :class:`~google.cloud.storage.retry.CircuitBreaker`
+    :param circuit_breaker:
+        (Optional) Makes the client's bidi streaming reads and appends fail
+        fast, without retries, after sustained 429 or 5xx errors.
     """
 
     def __init__(
@@ -53,7 +75,13 @@ class AsyncGrpcClient:
         client_options=None,
         *,
         attempt_direct_path=True,
+        refresh_credentials_in_background=False,
+        retry_budget=None,
+        circuit_breaker=None,
     ):
+        self._credential_refresher = None
+        self.retry_budget = retry_budget
+        self.circuit_breaker = circuit_breaker
         if isinstance(credentials, auth_credentials.AnonymousCredentials):
             if client_options is None or client_options.api_endpoint is None:
                 raise ValueError(
@@ -73,6 +101,9 @@ class AsyncGrpcClient:
         if agent_version not in client_info.user_agent:
             client_info.user_agent += f" {agent_version} "
 
+        if refresh_credentials_in_background:
+            credentials = self._start_credential_refresh(credentials)
+
         self._grpc_client = self._create_async_grpc_client(
             credentials=credentials,
             client_info=client_info,
@@ -80,6 +111,31 @@ class AsyncGrpcClient:
             attempt_direct_path=attempt_direct_path,
         )
 
+    def _start_credential_refresh(self, credentials):
+        scopes = storage_v2.services.storage.transports.StorageTransport.AUTH_SCOPES
+        if credentials is None:
+            credentials, _ = google.auth.default(default_scopes=scopes)
+        # Scope the credentials here, rather than when the channel is
+        # created, so that the channel uses the credentials being refreshed.
+        credentials = auth_credentials.with_scopes_if_required(
+            credentials, None, default_scopes=scopes
+        )
+        refresher = _CredentialRefresher(
+            credentials, google.auth.transport.requests.Request()
+        )
+        self._credential_refresher = refresher
+        # The thread does not refer to the client, so doesn't keep it alive.
+        weakref.finalize(self, refresher.stop, wait=False)
+        refresher.start()
+        return credentials
+
+    async def close(self):
+        """Stop any background credential refresh, and close the channel."""
+        if self._credential_refresher is not None:
+            # Don't block the event loop on a refresh in progress.
+            self._credential_refresher.stop(wait=False)
+        await self._grpc_client.transport.close()
+
     def _create_anonymous_client(self, client_options, credentials):
         channel = grpc.aio.insecure_channel(client_options.api_endpoint)
         transport = storage_v2.services.storage.transports.StorageGrpcAsyncIOTransport(
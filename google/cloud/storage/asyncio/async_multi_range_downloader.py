@@ -503,7 +503,10 @@ class AsyncMultiRangeDownloader:
 
         strategy = _ReadResumptionStrategy()
         retry_manager = _BidiStreamRetryManager(
-            strategy, lambda r, s: send_ranges_and_get_bytes(r, s, metadata=metadata)
+            strategy,
+            lambda r, s: send_ranges_and_get_bytes(r, s, metadata=metadata),
+            retry_budget=self.client.retry_budget,
+            circuit_breaker=self.client.circuit_breaker,
         )
 
         await retry_manager.execute(initial_state, retry_policy)
@@ -0,0 +1,488 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Synchronous file-like access to objects over the bidi-gRPC streams.
+
+The classes in this module wrap
+:class:`~google.cloud.storage.asyncio.async_multi_range_downloader.AsyncMultiRangeDownloader`
+and
+:class:`~google.cloud.storage.asyncio.async_appendable_object_writer.AsyncAppendableObjectWriter`
+so that code expecting a regular (blocking) file object can use them. The
+underlying coroutines run on an event loop owned by each file object, which
+lives on a background thread for as long as the file object is open.
+"""
+
+import asyncio
+import io
+import logging
+import threading
+from typing import Optional
+
+from google.cloud import _storage_v2
+from google.cloud.storage.asyncio.async_appendable_object_writer import (
+    AsyncAppendableObjectWriter,
+    _DEFAULT_FLUSH_INTERVAL_BYTES,
+)
+from google.cloud.storage.asyncio.async_grpc_client import AsyncGrpcClient
+from google.cloud.storage.asyncio.async_multi_range_downloader import (
+    AsyncMultiRangeDownloader,
+)
+
+DEFAULT_READ_CHUNK_SIZE = 40 * 1024 * 1024  # 40 MiB
+DEFAULT_WRITE_CHUNK_SIZE = _DEFAULT_FLUSH_INTERVAL_BYTES
+
+logger = logging.getLogger(__name__)
+
+
+class _BackgroundEventLoop(object):
+    """An asyncio event loop running forever on a daemon thread.
+
+    Coroutines are submitted from other threads with :meth:`run`, which blocks
+    until the coroutine completes and returns its result (or raises its
+    exception).
+    """
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_forever, name="storage-bidi-event-loop", daemon=True
+        )
+        self._thread.start()
+
+    def _run_forever(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def run(self, coro):
+        if self.closed:
+            coro.close()
+            raise ValueError("Event loop is closed.")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self, client=None):
+        """Stop and close the loop.
+
+        :type client: :class:`~google.cloud.storage.asyncio.async_grpc_client.AsyncGrpcClient`
+        :param client:
+            (Optional) A client created on the loop, closed before the loop
+            is, as its channel is bound to the loop.
+        """
+        if self.closed:
+            return
+        try:
+            if client is not None:
+                self.run(client.close())
+        finally:
+            self._stop()
+
+    def _stop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    @property
+    def closed(self):
+        return self._loop.is_closed()
+
+
+class BidiBlobReader(io.BufferedIOBase):
+    """A file-like object that reads from an object over a bidi-gRPC stream.
+
+    This class offers the same interface as
+    :class:`~google.cloud.storage.fileio.BlobReader`, backed by an
+    :class:`~google.cloud.storage.asyncio.async_multi_range_downloader.AsyncMultiRangeDownloader`.
+    The stream is opened when the reader is constructed, and the object size
+    reported when opening it is used to validate seeks, so no separate
+    metadata request is needed.
+
+    Example usage:
+
+    .. code-block:: python
+
+        with BidiBlobReader(None, "my-bucket", "my-object") as reader:
+            table = pyarrow.parquet.read_table(reader)
+
+    :type client: :class:`~google.cloud.storage.asyncio.async_grpc_client.AsyncGrpcClient`
+    :param client:
+        (Optional) The asynchronous client to use. gRPC channels are bound to
+        the event loop they are first used on, so a client passed here must
+        not be used elsewhere. If ``None``, a default client is created on the
+        reader's event loop.
+
+    :type bucket_name: str
+    :param bucket_name: The name of the bucket containing the object.
+
+    :type object_name: str
+    :param object_name: The name of the object to be read.
+
+    :type generation: int
+    :param generation:
+        (Optional) If present, selects a specific revision of this object.
+        Otherwise, the reader is pinned to the generation that is live when
+        the stream is opened.
+
+    :type chunk_size: int
+    :param chunk_size:
+        (Optional) The minimum number of bytes to read at a time. If fewer
+        bytes than the chunk_size are requested, the remainder is buffered.
+        The default is 40MiB.
+
+    :type read_handle: _storage_v2.BidiReadHandle
+    :param read_handle:
+        (Optional) An existing handle for reading the object. If provided,
+        opening the bidi-gRPC stream will be faster.
+    """
+
+    def __init__(
+        self,
+        client: Optional[AsyncGrpcClient],
+        bucket_name: str,
+        object_name: str,
+        generation: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        read_handle: Optional[_storage_v2.BidiReadHandle] = None,
+    ):
+        self._pos = 0
+        self._buffer = io.BytesIO()
+        self._chunk_size = chunk_size or DEFAULT_READ_CHUNK_SIZE
+        self._loop = _BackgroundEventLoop()
+        # A client created by the reader, closed along with it.
+        self._own_client = None
+
+        async def _open():
+            grpc_client = client
+            if grpc_client is None:
+                grpc_client = self._own_client = AsyncGrpcClient()
+            return await AsyncMultiRangeDownloader.create_mrd(
+                grpc_client,
+                bucket_name,
+                object_name,
+                generation=generation,
+                read_handle=read_handle,
+            )
+
+        try:
+            self._mrd = self._loop.run(_open())
+        except BaseException:
+            self._loop.close(self._own_client)
+            raise
+
+    @property
+    def size(self):
+        """The size of the object, as reported when opening the stream.
+
+        :rtype: int or ``NoneType``
+        :returns: The size of the object in bytes, if known.
+        """
+        return self._mrd.persisted_size
+
+    @property
+    def generation(self):
+        """The generation of the object being read.
+
+        :rtype: int or ``NoneType``
+        :returns: The generation the stream is pinned to, if known.
+        """
+        return self._mrd.generation
+
+    def _fetch(self, start, length):
+        """Download ``length`` bytes from ``start``; 0 means to the end."""
+        if self.size is not None:
+            if start >= self.size:
+                return b""
+            if length:
+                length = min(length, self.size - start)
+        buffer = io.BytesIO()
+        self._loop.run(self._mrd.download_ranges([(start, length, buffer)]))
+        return buffer.getvalue()
+
+    def read(self, size=-1):
+        self._checkClosed()  # Raises ValueError if closed.
+
+        result = self._buffer.read(size)
+        # If the read request demands more bytes than are buffered, fetch more.
+        remaining_size = size - len(result)
+        if remaining_size > 0 or size < 0:
+            self._pos += self._buffer.tell()
+            read_size = len(result)
+
+            self._buffer.seek(0)
+            self._buffer.truncate(0)  # Clear the buffer to make way for new data.
+            if size > 0:
+                # Fetch the larger of self._chunk_size or the remaining_size.
+                fetch_length = max(remaining_size, self._chunk_size)
+            else:
+                fetch_length = 0
+            result += self._fetch(self._pos, fetch_length)
+
+            # If more bytes were read than is immediately needed, buffer the
+            # remainder and then trim the result.
+            if size > 0 and len(result) > size:
+                self._buffer.write(result[size:])
+                self._buffer.seek(0)
+                result = result[:size]
+            # Increment relative offset by true amount read.
+            self._pos += len(result) - read_size
+        return result
+
+    def read1(self, size=-1):
+        return self.read(size)
+
+    def seek(self, pos, whence=0):
+        """Seek within the object.
+
+        Seeks are validated against the object size reported when the stream
+        was opened; seeking past the end positions the reader at the end. If
+        the size is not known, seeks relative to the end are not supported.
+        """
+        self._checkClosed()  # Raises ValueError if closed.
+
+        if whence not in {0, 1, 2}:
+            raise ValueError("invalid whence value")
+
+        initial_offset = self._pos + self._buffer.tell()
+
+        if whence == 0:
+            target_pos = pos
+        elif whence == 1:
+            target_pos = initial_offset + pos
+        elif self.size is None:
+            raise io.UnsupportedOperation(
+                "cannot seek relative to the end of an object of unknown size"
+            )
+        else:
+            target_pos = self.size + pos
+
+        if self.size is not None and target_pos > self.size:
+            target_pos = self.size
+
+        # Seek or invalidate buffer as needed.
+        if target_pos < self._pos:
+            # Target position < relative offset <= true offset.
+            # As data is not in buffer, invalidate buffer.
+            self._buffer.seek(0)
+            self._buffer.truncate(0)
+            new_pos = target_pos
+            self._pos = target_pos
+        else:
+            # relative offset <= target position <= size of file.
+            difference = target_pos - initial_offset
+            new_pos = self._pos + self._buffer.seek(difference, 1)
+        return new_pos
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._mrd.is_stream_open:
+                self._loop.run(self._mrd.close())
+        finally:
+            self._buffer.close()
+            self._loop.close(self._own_client)
+
+    @property
+    def closed(self):
+        return self._buffer.closed
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return False
+
+    def seekable(self):
+        return True
+
+
+class BidiBlobWriter(io.BufferedIOBase):
+    """A file-like object that appends to an object over a bidi-gRPC stream.
+
+    This class offers the same interface as
+    :class:`~google.cloud.storage.fileio.BlobWriter`, backed by an
+    :class:`~google.cloud.storage.asyncio.async_appendable_object_writer.AsyncAppendableObjectWriter`.
+    Written data is buffered and appended to the object once ``chunk_size``
+    bytes are available, on :meth:`flush`, and on :meth:`close`.
+
+    Example usage:
+
+    .. code-block:: python
+
+        with BidiBlobWriter(None, "my-bucket", "my-object") as writer:
+            with tarfile.open(fileobj=writer, mode="w|") as tar:
+                tar.add("my-directory")
+
+    :type client: :class:`~google.cloud.storage.asyncio.async_grpc_client.AsyncGrpcClient`
+    :param client:
+        (Optional) The asynchronous client to use. gRPC channels are bound to
+        the event loop they are first used on, so a client passed here must
+        not be used elsewhere. If ``None``, a default client is created on the
+        writer's event loop.
+
+    :type bucket_name: str
+    :param bucket_name: The name of the bucket to write to.
+
+    :type object_name: str
+    :param object_name: The name of the appendable object to be written.
+
+    :type generation: int
+    :param generation:
+        (Optional) If present, appends to that revision of an existing
+        appendable object. If ``None``, a new object is created, overwriting
+        any existing object of the same name.
+
+    :type chunk_size: int
+    :param chunk_size:
+        (Optional) The number of bytes to buffer before appending them to the
+        object. The default is 16MiB.
+
+    :type finalize_on_close: bool
+    :param finalize_on_close:
+        (Optional) Whether to finalize the object when the writer is closed,
+        after which no more data can be appended. Defaults to ``True``.
+
+    :type writer_options: dict
+    :param writer_options:
+        (Optional) Options passed through to
+        :class:`~google.cloud.storage.asyncio.async_appendable_object_writer.AsyncAppendableObjectWriter`.
+    """
+
+    def __init__(
+        self,
+        client: Optional[AsyncGrpcClient],
+        bucket_name: str,
+        object_name: str,
+        generation: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        finalize_on_close: bool = True,
+        writer_options: Optional[dict] = None,
+    ):
+        self._buffer = bytearray()
+        self._chunk_size = chunk_size or DEFAULT_WRITE_CHUNK_SIZE
+        self._finalize_on_close = finalize_on_close
+        self._closed = False
+        self._loop = _BackgroundEventLoop()
+        # A client created by the writer, closed along with it.
+        self._own_client = None
+
+        async def _open():
+            grpc_client = client
+            if grpc_client is None:
+                grpc_client = self._own_client = AsyncGrpcClient()
+            writer = AsyncAppendableObjectWriter(
+                grpc_client,
+                bucket_name,
+                object_name,
+                generation=generation,
+                writer_options=writer_options,
+            )
+            await writer.open()
+            return writer
+
+        try:
+            self._writer = self._loop.run(_open())
+        except BaseException:
+            self._loop.close(self._own_client)
+            raise
+        self._offset = self._writer.offset or 0
+
+    @property
+    def object_resource(self):
+        """The finalized object resource, if the writer finalized the object.
+
+        :rtype: :class:`~google.cloud._storage_v2.types.Object` or ``NoneType``
+        :returns: The object resource returned when finalizing.
+        """
+        return self._writer.object_resource
+
+    def write(self, b):
+        self._checkClosed()  # Raises ValueError if closed.
+
+        self._buffer += b
+        written = len(b)
+        if len(self._buffer) >= self._chunk_size:
+            self._append_buffer()
+        return written
+
+    def _append_buffer(self):
+        if not self._buffer:
+            return
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        self._loop.run(self._writer.append(data))
+        self._offset += len(data)
+
+    def tell(self):
+        return self._offset + len(self._buffer)
+
+    def flush(self):
+        self._checkClosed()  # Raises ValueError if closed.
+
+        self._append_buffer()
+
+    def close(self):
+        if self._closed:
+            return
+        try:
+            self._append_buffer()
+            self._loop.run(
+                self._writer.close(finalize_on_close=self._finalize_on_close)
+            )
+        except BaseException:
+            # Tear down the stream, as terminate() can't be called afterwards.
+            if self._writer.is_stream_open:
+                try:
+                    self._loop.run(self._writer.close())
+                except Exception:
+                    logger.warning(
+                        "Failed to close the stream after an error.", exc_info=True
+                    )
+            raise
+        finally:
+            self._closed = True
+            self._loop.close(self._own_client)
+
+    def terminate(self):
+        """Close the stream without appending buffered data or finalizing.
+
+        Data appended before this call remains in the object, which can still
+        be appended to later by opening a writer with its generation.
+        """
+        if self._closed:
+            return
+        self._buffer.clear()
+        try:
+            if self._writer.is_stream_open:
+                self._loop.run(self._writer.close())
+        finally:
+            self._closed = True
+            self._loop.close(self._own_client)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self.terminate()
+        else:
+            self.close()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def readable(self):
+        return False
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return False
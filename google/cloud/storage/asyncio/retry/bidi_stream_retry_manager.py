@@ -13,11 +13,14 @@
 # limitations under the License.
 
 import logging
-from typing import Any, AsyncIterator, Callable
+from typing import Any, AsyncIterator, Callable, Optional
 
 from google.cloud.storage.asyncio.retry.base_strategy import (
     _BaseResumptionStrategy,
 )
+from google.cloud.storage.retry import CircuitBreaker
+from google.cloud.storage.retry import RetryBudget
+from google.cloud.storage.retry import _LimitedRetry
 
 logger = logging.getLogger(__name__)
 
@@ -29,15 +32,23 @@ class _BidiStreamRetryManager:
         self,
         strategy: _BaseResumptionStrategy,
         send_and_recv: Callable[..., AsyncIterator[Any]],
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ):
         """Initializes the retry manager.
         Args:
             strategy: The strategy for managing the state of a specific
                 bidi operation (e.g., reads or writes).
             send_and_recv: An async callable that opens a new gRPC stream.
+            retry_budget: The client's retry budget, if any, which limits
+                the retries of the operation.
+            circuit_breaker: The client's circuit breaker, if any, which
+                makes the operation fail fast after sustained server errors.
         """
         self._strategy = strategy
         self._send_and_recv = send_and_recv
+        self._retry_budget = retry_budget
+        self._circuit_breaker = circuit_breaker
 
     async def execute(self, initial_state: Any, retry_policy):
         """
@@ -64,6 +75,13 @@ class _BidiStreamRetryManager:
                     await self._strategy.recover_state_on_failure(e, state)
                 raise e
 
-        wrapped_attempt = retry_policy(attempt)
+        limited_policy = retry_policy
+        if self._retry_budget is not None or self._circuit_breaker is not None:
+            # ``attempt`` checks the unlimited policy, so that only actual
+            # retries are charged to the budget.
+            limited_policy = _LimitedRetry(
+                retry_policy, self._retry_budget, self._circuit_breaker
+            )
+        wrapped_attempt = limited_policy(attempt)
 
         await wrapped_attempt()
@@ -28,18 +28,22 @@ Examples of situations when you might want to use the Batch module:
 ``bucket.delete_blob()``
 ``bucket.patch()``
 ``bucket.update()``
+
+A batch holds up to 1000 calls, unless it is created with ``max_workers``, in which
+case it sends any number of calls in several batch requests, concurrently. A
+:class:`~google.cloud.storage.client.Client` created with ``auto_batch_window``
+also batches such calls automatically, when made concurrently from several threads.
 """
+import concurrent.futures
 from email.encoders import encode_noop
 from email.generator import Generator
 from email.mime.application import MIMEApplication
-from email.mime.multipart import MIMEMultipart
-from email.parser import Parser
-import io
 import json
+import re
+import threading
 
 import requests
 
-from google.cloud import _helpers
 from google.cloud import exceptions
 from google.cloud.storage._http import Connection
 from google.cloud.storage.constants import _DEFAULT_TIMEOUT
@@ -65,20 +69,42 @@ class MIMEApplicationHTTP(MIMEApplication):
     """
 
     def __init__(self, method, uri, headers, body):
-        if isinstance(body, dict):
-            body = json.dumps(body)
-            headers["Content-Type"] = "application/json"
-            headers["Content-Length"] = len(body)
-        if body is None:
-            body = ""
-        lines = [f"{method} {uri} HTTP/1.1"]
-        lines.extend([f"{key}: {value}" for key, value in sorted(headers.items())])
-        lines.append("")
-        lines.append(body)
-        payload = "\r\n".join(lines)
+        payload = _subrequest_payload(method, uri, headers, body)
         super().__init__(payload, "http", encode_noop)
 
 
+def _subrequest_payload(method, uri, headers, body):
+    """Format a request as the payload of an ``application/http`` part.
+
+    :type method: str
+    :param method: HTTP method
+
+    :type uri: str
+    :param uri: URI for HTTP request
+
+    :type headers:  dict
+    :param headers: HTTP headers, updated with the content headers of a
+                    ``dict`` body.
+
+    :type body: str
+    :param body: (Optional) HTTP payload
+
+    :rtype: str
+    :returns: The request line, headers and body.
+    """
+    if isinstance(body, dict):
+        body = json.dumps(body)
+        headers["Content-Type"] = "application/json"
+        headers["Content-Length"] = len(body)
+    if body is None:
+        body = ""
+    lines = [f"{method} {uri} HTTP/1.1"]
+    lines.extend([f"{key}: {value}" for key, value in sorted(headers.items())])
+    lines.append("")
+    lines.append(body)
+    return "\r\n".join(lines)
+
+
 class _FutureDict(object):
     """Class to hold a future value for a deferred request.
 
@@ -160,11 +186,21 @@ class Batch(Connection):
         to the list of return responses, the final exception will be raised.
         Note that exceptions are unwrapped after all operations are complete
         in success or failure, and only the last exception is raised.
+
+    :type max_workers: int
+    :param max_workers:
+        (Optional) If set, any number of requests may be deferred: they are
+        split into batch requests of up to ``_MAX_BATCH_SIZE`` requests each,
+        of which up to ``max_workers`` are sent concurrently, and their
+        responses are returned in the order the requests were deferred. If a
+        whole batch request fails, its error response is used for each of its
+        requests. By default, deferring more than ``_MAX_BATCH_SIZE`` requests
+        raises :class:`ValueError`.
     """
 
     _MAX_BATCH_SIZE = 1000
 
-    def __init__(self, client, raise_exception=True):
+    def __init__(self, client, raise_exception=True, max_workers=None):
         api_endpoint = client._connection.API_BASE_URL
         client_info = client._connection._client_info
         super(Batch, self).__init__(
@@ -174,13 +210,15 @@ class Batch(Connection):
         self._target_objects = []
         self._responses = []
         self._raise_exception = raise_exception
+        self._max_workers = max_workers
 
     def _do_request(
         self, method, url, headers, data, target_object, timeout=_DEFAULT_TIMEOUT
     ):
         """Override Connection:  defer actual HTTP request.
 
-        Only allow up to ``_MAX_BATCH_SIZE`` requests to be deferred.
+        Only allow up to ``_MAX_BATCH_SIZE`` requests to be deferred, unless
+        ``max_workers`` is set.
 
         :type method: str
         :param method: The HTTP method to use in the request.
@@ -209,7 +247,7 @@ class Batch(Connection):
                 and ``content`` (a string).
         :returns: The HTTP response object and the content of the response.
         """
-        if len(self._requests) >= self._MAX_BATCH_SIZE:
+        if self._max_workers is None and len(self._requests) >= self._MAX_BATCH_SIZE:
             raise ValueError(
                 "Too many deferred requests (max %d)" % self._MAX_BATCH_SIZE
             )
@@ -220,33 +258,32 @@ class Batch(Connection):
             target_object._properties = result
         return _FutureResponse(result)
 
-    def _prepare_batch_request(self):
+    def _prepare_batch_request(self, subrequests=None):
         """Prepares headers and body for a batch request.
 
+        :type subrequests: list of tuples
+        :param subrequests:
+            (Optional) The deferred requests to include. Defaults to all of
+            them.
+
         :rtype: tuple (dict, str)
         :returns: The pair of headers and body of the batch request to be sent.
         :raises: :class:`ValueError` if no requests have been deferred.
         """
-        if len(self._requests) == 0:
+        if subrequests is None:
+            subrequests = self._requests
+        if len(subrequests) == 0:
             raise ValueError("No deferred requests")
 
-        multi = MIMEMultipart()
-
         # Use timeout of last request, default to _DEFAULT_TIMEOUT
         timeout = _DEFAULT_TIMEOUT
-        for method, uri, headers, body, _timeout in self._requests:
-            subrequest = MIMEApplicationHTTP(method, uri, headers, body)
-            multi.attach(subrequest)
+        payloads = []
+        for method, uri, headers, body, _timeout in subrequests:
+            payloads.append(_subrequest_payload(method, uri, headers, body))
             timeout = _timeout
 
-        buf = io.StringIO()
-        generator = Generator(buf, False, 0)
-        generator.flatten(multi)
-        payload = buf.getvalue()
-
-        # Strip off redundant header text
-        _, body = payload.split("\n\n", 1)
-        return dict(multi._headers), body, timeout
+        headers, body = _encode_multipart_mixed(payloads)
+        return headers, body, timeout
 
     def _finish_futures(self, responses, raise_exception=True):
         """Apply all the batch responses to the futures created.
@@ -299,7 +336,30 @@ class Batch(Connection):
         :rtype: list of tuples
         :returns: one ``(headers, payload)`` tuple per deferred request.
         """
-        headers, body, timeout = self._prepare_batch_request()
+        if self._max_workers is None:
+            responses = self._send_batch_request(self._requests)
+        else:
+            responses = self._send_sharded_batch_requests()
+        self._finish_futures(responses, raise_exception=raise_exception)
+        self._responses = responses
+        return responses
+
+    def _send_batch_request(self, subrequests, raise_on_failure=True):
+        """Send deferred requests in a single `multipart/mixed` request.
+
+        :type subrequests: list of tuples
+        :param subrequests: The deferred requests to send.
+
+        :type raise_on_failure: bool
+        :param raise_on_failure:
+            (Optional) If True, the default, raise an exception if the batch
+            request fails as a whole. If False, return its response for each
+            of the ``subrequests`` instead.
+
+        :rtype: list of :class:`requests.Response`
+        :returns: The response to each of the ``subrequests``.
+        """
+        headers, body, timeout = self._prepare_batch_request(subrequests)
 
         url = f"{self.API_BASE_URL}/batch/storage/v1"
 
@@ -312,11 +372,41 @@ class Batch(Connection):
 
         # Raise exception if the top-level batch request fails
         if not 200 <= response.status_code < 300:
-            raise exceptions.from_http_response(response)
+            if raise_on_failure:
+                raise exceptions.from_http_response(response)
+            return [response] * len(subrequests)
 
-        responses = list(_unpack_batch_response(response))
-        self._finish_futures(responses, raise_exception=raise_exception)
-        self._responses = responses
+        # The deferred writes have now been made.
+        for method, url, _, _, _ in subrequests:
+            if method != "GET":
+                self._client._invalidate_object_metadata(url)
+
+        return list(_unpack_batch_response(response))
+
+    def _send_sharded_batch_requests(self):
+        """Send deferred requests in concurrent batch requests.
+
+        :rtype: list of :class:`requests.Response`
+        :returns: The response to each deferred request, in order.
+        """
+        if len(self._requests) == 0:
+            raise ValueError("No deferred requests")
+
+        size = self._MAX_BATCH_SIZE
+        shards = [
+            self._requests[start : start + size]
+            for start in range(0, len(self._requests), size)
+        ]
+        self._client._ensure_connection_pool_maxsize(self._max_workers)
+        with concurrent.futures.ThreadPoolExecutor(self._max_workers) as executor:
+            futures = [
+                executor.submit(self._send_batch_request, shard, False)
+                for shard in shards
+            ]
+        # Every shard has completed; raise the first error, if any.
+        responses = []
+        for future in futures:
+            responses.extend(future.result())
         return responses
 
     def current(self):
@@ -335,52 +425,267 @@ class Batch(Connection):
             self._client._pop_batch()
 
 
-def _generate_faux_mime_message(parser, response):
-    """Convert response, content -> (multipart) email.message.
+class _AutoBatcher(object):
+    """Gather concurrent metadata writes of a client into batch requests.
+
+    A request submitted while no batch is being gathered starts one, and
+    its thread waits ``window`` seconds, or until ``max_size`` requests
+    have arrived, for others to join it. It then sends them in a single
+    :class:`Batch` request, and sets the result of every request's future
+    to its own response.
+
+    :type client: :class:`google.cloud.storage.client.Client`
+    :param client: The client whose requests are batched.
 
-    Helper for _unpack_batch_response.
+    :type window: float
+    :param window: The number of seconds to wait for requests to batch.
+
+    :type max_size: int
+    :param max_size: (Optional) The number of requests in a full batch.
     """
-    # We coerce to bytes to get consistent concat across
-    # Py2 and Py3. Percent formatting is insufficient since
-    # it includes the b in Py3.
-    content_type = _helpers._to_bytes(response.headers.get("content-type", ""))
 
-    faux_message = b"".join(
-        [b"Content-Type: ", content_type, b"\nMIME-Version: 1.0\n\n", response.content]
-    )
+    _METHODS = frozenset(["PATCH", "PUT", "DELETE"])
+
+    def __init__(self, client, window, max_size=Batch._MAX_BATCH_SIZE):
+        if window < 0:
+            raise ValueError("window must not be negative.")
+        self._client = client
+        self._window = window
+        self._max_size = max_size
+        self._ready = threading.Condition()
+        self._pending = []
+        self.batches = 0
+        self.requests = 0
+
+    def accepts(self, method, url):
+        """Decide whether a request may be batched.
+
+        Only writes of bucket and object metadata, whose responses don't
+        depend on the order they are made in, are batched.
+
+        :type method: str
+        :param method: The HTTP method of the request.
+
+        :type url: str
+        :param url: The URL of the request.
+
+        :rtype: bool
+        :returns: True if the request may be submitted.
+        """
+        connection = self._client._base_connection
+        prefix = connection.API_URL_TEMPLATE.format(
+            api_base_url=connection.get_api_base_url_for_mtls(),
+            api_version=connection.API_VERSION,
+            path="/b/",
+        )
+        return method in self._METHODS and url.startswith(prefix)
+
+    def submit(self, method, url, headers, data, timeout=_DEFAULT_TIMEOUT):
+        """Add a request to the batch being gathered.
 
-    return parser.parsestr(faux_message.decode("utf-8"))
+        :type method: str
+        :param method: The HTTP method of the request.
+
+        :type url: str
+        :param url: The URL of the request.
+
+        :type headers: dict
+        :param headers: The HTTP headers of the request.
+
+        :type data: str
+        :param data: The body of the request.
+
+        :type timeout: float or tuple
+        :param timeout:
+            (Optional) The amount of time, in seconds, to wait for the
+            server response.  See: :ref:`configuring_timeouts`
+
+        :rtype: :class:`concurrent.futures.Future`
+        :returns: A future for the request's :class:`requests.Response`. It
+                  is done when this method returns, unless other threads
+                  are gathering the batch.
+        """
+        future = concurrent.futures.Future()
+        with self._ready:
+            pending = self._pending
+            pending.append(((method, url, headers, data, timeout), future))
+            if len(pending) >= self._max_size:
+                self._pending = []
+                self._ready.notify_all()
+            if len(pending) > 1:
+                return future
+            self._ready.wait_for(lambda: pending is not self._pending, self._window)
+            if pending is self._pending:
+                self._pending = []
+            self.batches += 1
+            self.requests += len(pending)
+        self._send(pending)
+        return future
+
+    def _send(self, pending):
+        """Send gathered requests, and set the results of their futures."""
+        try:
+            if len(pending) == 1:
+                (method, url, headers, data, timeout), _ = pending[0]
+                responses = [
+                    self._client._http.request(
+                        url=url,
+                        method=method,
+                        headers=headers,
+                        data=data,
+                        timeout=timeout,
+                    )
+                ]
+            else:
+                batch = Batch(self._client)
+                for (method, url, headers, data, timeout), _ in pending:
+                    batch._do_request(method, url, headers, data, None, timeout)
+                responses = batch.finish(raise_exception=False)
+        except Exception as exc:
+            for _, future in pending:
+                future.set_exception(exc)
+        else:
+            for (_, future), response in zip(pending, responses):
+                future.set_result(response)
+
+
+# Line endings which ``email.generator.Generator`` writes as ``"\n"``.
+_LINE_ENDINGS = re.compile(r"\r\n|\r")
+
+_PART_HEADERS = "Content-Type: application/http\nMIME-Version: 1.0\n\n"
+
+# A line which ``email.feedparser`` reads as a header, or its continuation.
+_HEADER_LINE = re.compile(rb"[\041-\071\073-\176]*:|[ \t]")
+
+_BOUNDARY_PARAM = re.compile(r';\s*boundary="?([^";]+)"?', re.IGNORECASE)
+
+
+def _encode_multipart_mixed(payloads):
+    """Encode ``application/http`` parts as a ``multipart/mixed`` body.
+
+    The body is the same as that written by ``email.generator.Generator``
+    for a ``MIMEMultipart`` of :class:`MIMEApplicationHTTP` parts, without
+    building the message objects.
+
+    :type payloads: list of str
+    :param payloads: The payloads of the parts.
+
+    :rtype: tuple (dict, str)
+    :returns: The pair of headers and body of the request.
+    """
+    parts = [
+        _PART_HEADERS
+        + (_LINE_ENDINGS.sub("\n", payload) if "\r" in payload else payload)
+        for payload in payloads
+    ]
+    boundary = Generator._make_boundary()
+    while any("--" + boundary in part for part in parts):  # pragma: NO COVER
+        boundary = Generator._make_boundary()
+
+    delimiter = f"\n--{boundary}\n"
+    body = f"--{boundary}\n{delimiter.join(parts)}\n--{boundary}--\n"
+    headers = {
+        "Content-Type": f'multipart/mixed; boundary="{boundary}"',
+        "MIME-Version": "1.0",
+    }
+    return headers, body
+
+
+def _parse_headers(data, pos=0):
+    """Parse the header lines of a message, as ``email.parser`` would.
+
+    :type data: bytes
+    :param data: The message.
+
+    :type pos: int
+    :param pos: (Optional) The offset at which the headers start.
+
+    :rtype: tuple (dict, int)
+    :returns: The headers, and the offset at which the body starts.
+    """
+    headers = []
+    while pos < len(data):
+        end = data.find(b"\n", pos)
+        end = len(data) if end == -1 else end + 1
+        line = data[pos:end]
+        if line in (b"\n", b"\r\n"):
+            pos = end
+            break
+        if not _HEADER_LINE.match(line):
+            break
+        pos = end
+        text = line.decode("utf-8")
+        if text[0] in " \t":
+            if headers:
+                name, value = headers[-1]
+                headers[-1] = (name, value + text)
+        elif text[0] != ":":
+            name, value = text.split(":", 1)
+            headers.append((name, value.lstrip(" \t")))
+    return {name: value.rstrip("\r\n") for name, value in headers}, pos
+
+
+def _unpack_part(part):
+    """Convert an ``application/http`` part -> requests.Response."""
+    _, start = _parse_headers(part)
+    status_line, rest = part[start:].split(b"\n", 1)
+    _, status, _ = status_line.split(b" ", 2)
+    msg_headers, start = _parse_headers(rest)
+    content_id = msg_headers.get("Content-ID")
+
+    # Prepare the request piecewise: ``requests.Request.prepare`` also
+    # merges cookies and auth, which a sub-response doesn't have.
+    request = requests.PreparedRequest()
+    request.prepare_method("BATCH")
+    request.prepare_url(f"contentid://{content_id}", None)
+    request.prepare_headers(None)
+    request.prepare_body(None, None)
+    request.prepare_hooks(None)
+
+    subresponse = requests.Response()
+    subresponse.request = request
+    subresponse.status_code = int(status)
+    subresponse.headers.update(msg_headers)
+    subresponse._content = rest[start:]
+    return subresponse
 
 
 def _unpack_batch_response(response):
     """Convert requests.Response -> [(headers, payload)].
 
     Creates a generator of tuples of emulating the responses to
-    :meth:`requests.Session.request`.
+    :meth:`requests.Session.request`. Parts are parsed as
+    ``email.parser`` would parse them, as they are reached.
 
     :type response: :class:`requests.Response`
     :param response: HTTP response / headers from a request.
     """
-    parser = Parser()
-    message = _generate_faux_mime_message(parser, response)
-
-    if not isinstance(message._payload, list):  # pragma: NO COVER
+    content_type = response.headers.get("content-type", "")
+    if isinstance(content_type, bytes):
+        content_type = content_type.decode("utf-8")
+    match = _BOUNDARY_PARAM.search(content_type)
+    if match is None:  # pragma: NO COVER
         raise ValueError("Bad response:  not multi-part")
 
-    for subrequest in message._payload:
-        status_line, rest = subrequest._payload.split("\n", 1)
-        _, status, _ = status_line.split(" ", 2)
-        sub_message = parser.parsestr(rest)
-        payload = sub_message._payload
-        msg_headers = dict(sub_message._headers)
-        content_id = msg_headers.get("Content-ID")
-
-        subresponse = requests.Response()
-        subresponse.request = requests.Request(
-            method="BATCH", url=f"contentid://{content_id}"
-        ).prepare()
-        subresponse.status_code = int(status)
-        subresponse.headers.update(msg_headers)
-        subresponse._content = payload.encode("utf-8")
-
-        yield subresponse
+    delimiter = re.compile(
+        rb"^--" + re.escape(match.group(1).encode("utf-8")) + rb"(--)?[ \t]*(\r?\n|\Z)",
+        re.MULTILINE,
+    )
+    content = response.content
+    start = None
+    for match in delimiter.finditer(content):
+        if start is not None:
+            # The line ending before a delimiter belongs to the delimiter.
+            end = match.start()
+            if content[end - 2 : end] == b"\r\n":
+                end -= 2
+            elif content[end - 1 : end] == b"\n":
+                end -= 1
+            yield _unpack_part(content[start:end])
+        if match.group(1):
+            return
+        start = match.end()
+
+    if start is None:  # pragma: NO COVER
+        raise ValueError("Bad response:  not multi-part")
+    yield _unpack_part(content[start:])
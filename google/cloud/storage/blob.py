@@ -78,6 +78,7 @@ from google.cloud.storage.retry import ConditionalRetryPolicy
 from google.cloud.storage.retry import DEFAULT_RETRY
 from google.cloud.storage.retry import DEFAULT_RETRY_IF_ETAG_IN_JSON
 from google.cloud.storage.retry import DEFAULT_RETRY_IF_GENERATION_SPECIFIED
+from google.cloud.storage.retry import _limit_retries
 from google.cloud.storage.fileio import BlobReader
 from google.cloud.storage.fileio import BlobWriter
 
@@ -109,10 +110,6 @@ _WRITABLE_FIELDS = (
 _READ_LESS_THAN_SIZE = (
     "Size {:d} was specified but the file-like object only had " "{:d} bytes remaining."
 )
-_CHUNKED_DOWNLOAD_CHECKSUM_MESSAGE = (
-    "A checksum of type `{}` was requested, but checksumming is not available "
-    "for downloads when chunk_size is set."
-)
 _COMPOSE_IF_GENERATION_LIST_DEPRECATED = (
     "'if_generation_match: type list' is deprecated and supported for "
     "backwards-compatability reasons only.  Use 'if_source_generation_match' "
@@ -143,6 +140,9 @@ _FROM_STRING_DEPRECATED = (
 _GS_URL_REGEX_PATTERN = re.compile(
     r"(?P<scheme>gs)://(?P<bucket_name>[a-z0-9_.-]+)/(?P<object_name>.+)"
 )
+_CONTENT_RANGE_SIZE_PATTERN = re.compile(
+    r"bytes \d+-\d+/(?P<size>\d+)", flags=re.IGNORECASE
+)
 
 _DEFAULT_CHUNKSIZE = 104857600  # 1024 * 1024 B * 100 = 100 MiB
 _MAX_MULTIPART_SIZE = 8388608  # 8 MiB
@@ -225,6 +225,8 @@ class Blob(_PropertyMixin):
         super(Blob, self).__init__(name=name)
 
         self.chunk_size = chunk_size  # Check that setter accepts value.
+        self._download_buffer_size = None
+        self._adaptive_chunk_size = False
         self._bucket = bucket
         self._acl = ObjectACL(self)
         _raise_if_more_than_one_set(
@@ -273,6 +275,62 @@ class Blob(_PropertyMixin):
             )
         self._chunk_size = value
 
+    @property
+    def download_buffer_size(self):
+        """Get the number of bytes read from the network at a time in downloads.
+
+        :rtype: int or ``NoneType``
+        :returns: The blob's download buffer size, if it is set. If not set,
+                  the client's ``download_buffer_size`` applies, and failing
+                  that a default of 1 MiB.
+        """
+        return self._download_buffer_size
+
+    @download_buffer_size.setter
+    def download_buffer_size(self, value):
+        """Set the number of bytes read from the network at a time in downloads.
+
+        Larger buffers reduce per-read overhead on fast networks, at the cost
+        of memory per concurrent download. This applies to downloads that are
+        not chunked (when ``chunk_size`` is not set).
+
+        :type value: int
+        :param value: (Optional) The buffer size in bytes.
+
+        :raises: :class:`ValueError` if ``value`` is not ``None`` and is not
+                 positive.
+        """
+        if value is not None and value <= 0:
+            raise ValueError("Download buffer size must be positive.")
+        self._download_buffer_size = value
+
+    @property
+    def adaptive_chunk_size(self):
+        """Whether chunked transfers adapt their chunk size to throughput.
+
+        :rtype: bool
+        :returns: True if the chunk size is adapted, False (the default) if
+                  every chunk is :attr:`chunk_size` bytes.
+        """
+        return self._adaptive_chunk_size
+
+    @adaptive_chunk_size.setter
+    def adaptive_chunk_size(self, value):
+        """Set whether chunked transfers adapt their chunk size to throughput.
+
+        If set, resumable uploads and chunked downloads (when
+        :attr:`chunk_size` is set) start with 1 MiB chunks. The chunk size
+        doubles after each request while the throughput per request keeps
+        improving, up to :attr:`chunk_size` (100 MiB for uploads if it is not
+        set), and halves after a request has to be retried. Sizes are always
+        multiples of 256 KiB. Each decision is recorded as a
+        ``chunk_size_decision`` event on the transfer's trace span.
+
+        :type value: bool
+        :param value: Whether to adapt the chunk size.
+        """
+        self._adaptive_chunk_size = bool(value)
+
     @property
     def encryption_key(self):
         """Retrieve the customer-supplied encryption key for the object.
@@ -963,6 +1021,12 @@ class Blob(_PropertyMixin):
         self._properties["metageneration"] = response.headers.get(
             "X-goog-metageneration", None
         )
+        # A ranged response reports the size of the whole object, which
+        # saves a metadata request when seeking relative to the end.
+        content_range = response.headers.get("Content-Range", "")
+        match = _CONTENT_RANGE_SIZE_PATTERN.match(content_range)
+        if match:
+            self._properties["size"] = match.group("size")
         #  'X-Goog-Hash': 'crc32c=4gcgLQ==,md5=CS9tHYTtyFntzj7B9nkkJQ==',
         x_goog_hash = response.headers.get("X-Goog-Hash", "")
 
@@ -990,6 +1054,7 @@ class Blob(_PropertyMixin):
         checksum="auto",
         retry=DEFAULT_RETRY,
         single_shot_download=False,
+        download_buffer_size=None,
     ):
         """Perform a download without any error handling.
 
@@ -1032,9 +1097,9 @@ class Blob(_PropertyMixin):
             of the object. The response headers must contain a checksum of the
             requested type. If the headers lack an appropriate checksum (for
             instance in the case of transcoded or ranged downloads where the
-            remote service does not know the correct checksum, including
-            downloads where chunk_size is set) an INFO-level log will be
-            emitted. Supported values are "md5", "crc32c", "auto" and None. The
+            remote service does not know the correct checksum) an INFO-level
+            log will be emitted.
+            Supported values are "md5", "crc32c", "auto" and None. The
             default is "auto", which will try to detect if the C extension for
             crc32c is installed and fall back to md5 otherwise.
 
@@ -1056,10 +1121,16 @@ class Blob(_PropertyMixin):
             (Optional) If true, download the object in a single request.
             Caution: Enabling this will increase the memory overload for your application.
             Please enable this as per your use case.
+
+        :type download_buffer_size: int
+        :param download_buffer_size:
+            (Optional) The number of bytes to read from the network at a time
+            for downloads that are not chunked.
         """
 
         extra_attributes = _get_opentelemetry_attributes_from_url(download_url)
         extra_attributes["download.chunk_size"] = f"{self.chunk_size}"
+        extra_attributes["download.adaptive_chunk_size"] = self.adaptive_chunk_size
         extra_attributes["download.raw_download"] = raw_download
         extra_attributes["upload.checksum"] = f"{checksum}"
         extra_attributes["download.single_shot_download"] = single_shot_download
@@ -1085,6 +1156,7 @@ class Blob(_PropertyMixin):
                 # classes, i.e., when chunk_size is set to None (the default value). It is
                 # not supported for chunked downloads.
                 single_shot_download=single_shot_download,
+                buffer_size=download_buffer_size,
             )
             with create_trace_span(
                 name=f"Storage.{download_class}/consume",
@@ -1094,10 +1166,6 @@ class Blob(_PropertyMixin):
                 response = download.consume(transport, timeout=timeout)
                 self._extract_headers_from_download(response)
         else:
-            if checksum:
-                msg = _CHUNKED_DOWNLOAD_CHECKSUM_MESSAGE.format(checksum)
-                _logger.info(msg)
-
             if raw_download:
                 klass = RawChunkedDownload
                 download_class = "RawChunkedDownload"
@@ -1113,15 +1181,20 @@ class Blob(_PropertyMixin):
                 start=start if start else 0,
                 end=end,
                 retry=retry,
+                checksum=checksum,
+                adaptive_chunk_size=self.adaptive_chunk_size,
             )
 
             with create_trace_span(
                 name=f"Storage.{download_class}/consumeNextChunk",
                 attributes=extra_attributes,
                 api_request=args,
-            ):
+            ) as span:
                 while not download.finished:
-                    download.consume_next_chunk(transport, timeout=timeout)
+                    try:
+                        download.consume_next_chunk(transport, timeout=timeout)
+                    finally:
+                        _add_chunk_size_decision_event(span, download)
 
     def download_to_file(
         self,
@@ -1212,9 +1285,9 @@ class Blob(_PropertyMixin):
             of the object. The response headers must contain a checksum of the
             requested type. If the headers lack an appropriate checksum (for
             instance in the case of transcoded or ranged downloads where the
-            remote service does not know the correct checksum, including
-            downloads where chunk_size is set) an INFO-level log will be
-            emitted. Supported values are "md5", "crc32c", "auto" and None. The
+            remote service does not know the correct checksum) an INFO-level
+            log will be emitted.
+            Supported values are "md5", "crc32c", "auto" and None. The
             default is "auto", which will try to detect if the C extension for
             crc32c is installed and fall back to md5 otherwise.
 
@@ -1368,9 +1441,9 @@ class Blob(_PropertyMixin):
             of the object. The response headers must contain a checksum of the
             requested type. If the headers lack an appropriate checksum (for
             instance in the case of transcoded or ranged downloads where the
-            remote service does not know the correct checksum, including
-            downloads where chunk_size is set) an INFO-level log will be
-            emitted. Supported values are "md5", "crc32c", "auto" and None. The
+            remote service does not know the correct checksum) an INFO-level
+            log will be emitted.
+            Supported values are "md5", "crc32c", "auto" and None. The
             default is "auto", which will try to detect if the C extension for
             crc32c is installed and fall back to md5 otherwise.
 
@@ -1490,9 +1563,9 @@ class Blob(_PropertyMixin):
             of the object. The response headers must contain a checksum of the
             requested type. If the headers lack an appropriate checksum (for
             instance in the case of transcoded or ranged downloads where the
-            remote service does not know the correct checksum, including
-            downloads where chunk_size is set) an INFO-level log will be
-            emitted. Supported values are "md5", "crc32c", "auto" and None. The
+            remote service does not know the correct checksum) an INFO-level
+            log will be emitted.
+            Supported values are "md5", "crc32c", "auto" and None. The
             default is "auto", which will try to detect if the C extension for
             crc32c is installed and fall back to md5 otherwise.
 
@@ -2005,6 +2078,73 @@ class Blob(_PropertyMixin):
         info = self._get_upload_arguments(client, content_type, command=command)
         headers, object_metadata, content_type = info
 
+        upload_url = self._get_multipart_upload_url(
+            client,
+            predefined_acl,
+            if_generation_match,
+            if_generation_not_match,
+            if_metageneration_match,
+            if_metageneration_not_match,
+        )
+        upload = MultipartUpload(
+            upload_url, headers=headers, checksum=checksum, retry=retry
+        )
+
+        extra_attributes = _get_opentelemetry_attributes_from_url(upload_url)
+        extra_attributes["upload.checksum"] = f"{checksum}"
+        args = {"timeout": timeout}
+        with create_trace_span(
+            name="Storage.MultipartUpload/transmit",
+            attributes=extra_attributes,
+            client=client,
+            api_request=args,
+        ):
+            try:
+                response = upload.transmit(
+                    transport, data, object_metadata, content_type, timeout=timeout
+                )
+            finally:
+                # Even a failed upload may have written the object.
+                client._invalidate_object_metadata(self.path)
+
+            return response
+
+    def _get_multipart_upload_url(
+        self,
+        client,
+        predefined_acl=None,
+        if_generation_match=None,
+        if_generation_not_match=None,
+        if_metageneration_match=None,
+        if_metageneration_not_match=None,
+    ):
+        """Get the URL for a multipart upload of the current blob.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client whose endpoint the upload is sent to.
+
+        :type predefined_acl: str
+        :param predefined_acl: (Optional) Predefined access control list
+
+        :type if_generation_match: long
+        :param if_generation_match:
+            (Optional) See :ref:`using-if-generation-match`
+
+        :type if_generation_not_match: long
+        :param if_generation_not_match:
+            (Optional) See :ref:`using-if-generation-not-match`
+
+        :type if_metageneration_match: long
+        :param if_metageneration_match:
+            (Optional) See :ref:`using-if-metageneration-match`
+
+        :type if_metageneration_not_match: long
+        :param if_metageneration_not_match:
+            (Optional) See :ref:`using-if-metageneration-not-match`
+
+        :rtype: str
+        :returns: The upload URL.
+        """
         hostname = _get_host_name(client._connection)
         base_url = _MULTIPART_URL_TEMPLATE.format(
             hostname=hostname,
@@ -2045,24 +2185,7 @@ class Blob(_PropertyMixin):
             )
 
         upload_url = _add_query_parameters(base_url, name_value_pairs)
-        upload = MultipartUpload(
-            upload_url, headers=headers, checksum=checksum, retry=retry
-        )
-
-        extra_attributes = _get_opentelemetry_attributes_from_url(upload_url)
-        extra_attributes["upload.checksum"] = f"{checksum}"
-        args = {"timeout": timeout}
-        with create_trace_span(
-            name="Storage.MultipartUpload/transmit",
-            attributes=extra_attributes,
-            client=client,
-            api_request=args,
-        ):
-            response = upload.transmit(
-                transport, data, object_metadata, content_type, timeout=timeout
-            )
-
-            return response
+        return upload_url
 
     def _initiate_resumable_upload(
         self,
@@ -2082,6 +2205,9 @@ class Blob(_PropertyMixin):
         retry=None,
         command=None,
         crc32c_checksum_value=None,
+        resumable_url=None,
+        checksum_state=None,
+        adaptive_chunk_size=False,
     ):
         """Initiate a resumable upload.
 
@@ -2209,6 +2335,21 @@ class Blob(_PropertyMixin):
             https://datatracker.ietf.org/doc/html/rfc4960#appendix-B and
             base64: https://datatracker.ietf.org/doc/html/rfc4648#section-4
 
+        :type resumable_url: str
+        :param resumable_url:
+            (Optional) The URI of an existing upload session to continue
+            instead of initiating a new one.
+
+        :type checksum_state: dict
+        :param checksum_state:
+            (Optional) The running checksum saved with ``resumable_url``.
+
+        :type adaptive_chunk_size: bool
+        :param adaptive_chunk_size:
+            (Optional) If True, adapt the chunk size to the measured
+            throughput, with ``chunk_size`` as the largest size used. See
+            :attr:`adaptive_chunk_size`.
+
         :rtype: tuple
         :returns:
             Pair of
@@ -2280,17 +2421,28 @@ class Blob(_PropertyMixin):
             headers=headers,
             checksum=checksum,
             retry=retry,
+            adaptive_chunk_size=adaptive_chunk_size,
         )
 
-        upload.initiate(
-            transport,
-            stream,
-            object_metadata,
-            content_type,
-            total_bytes=size,
-            stream_final=False,
-            timeout=timeout,
-        )
+        if resumable_url is not None:
+            upload.resume(
+                transport,
+                stream,
+                resumable_url,
+                content_type,
+                total_bytes=size,
+                checksum_state=checksum_state,
+            )
+        else:
+            upload.initiate(
+                transport,
+                stream,
+                object_metadata,
+                content_type,
+                total_bytes=size,
+                stream_final=False,
+                timeout=timeout,
+            )
 
         return upload, transport
 
@@ -2310,6 +2462,7 @@ class Blob(_PropertyMixin):
         retry=None,
         command=None,
         crc32c_checksum_value=None,
+        upload_session=None,
     ):
         """Perform a resumable upload.
 
@@ -2427,29 +2580,62 @@ class Blob(_PropertyMixin):
             https://datatracker.ietf.org/doc/html/rfc4960#appendix-B and
             base64: https://datatracker.ietf.org/doc/html/rfc4648#section-4
 
+        :type upload_session: tuple
+        :param upload_session:
+            (Optional) A pair of an
+            :class:`~google.cloud.storage.upload_session_store.UploadSessionStore`
+            and the path of the file being uploaded. If given, a resumable
+            upload continues a session saved for the file, and saves its own
+            session as it goes.
+
         :rtype: :class:`~requests.Response`
         :returns: The "200 OK" response object returned after the final chunk
                   is uploaded.
         """
-        upload, transport = self._initiate_resumable_upload(
-            client,
-            stream,
-            content_type,
-            size,
-            predefined_acl=predefined_acl,
-            if_generation_match=if_generation_match,
-            if_generation_not_match=if_generation_not_match,
-            if_metageneration_match=if_metageneration_match,
-            if_metageneration_not_match=if_metageneration_not_match,
-            timeout=timeout,
-            checksum=checksum,
-            retry=retry,
-            command=command,
-            crc32c_checksum_value=crc32c_checksum_value,
-        )
+        initiate_kwargs = {
+            "predefined_acl": predefined_acl,
+            "if_generation_match": if_generation_match,
+            "if_generation_not_match": if_generation_not_match,
+            "if_metageneration_match": if_metageneration_match,
+            "if_metageneration_not_match": if_metageneration_not_match,
+            "timeout": timeout,
+            "checksum": checksum,
+            "retry": retry,
+            "command": command,
+            "crc32c_checksum_value": crc32c_checksum_value,
+            "adaptive_chunk_size": self.adaptive_chunk_size,
+        }
+        upload = None
+        if upload_session is not None:
+            session_store, filename = upload_session
+            session_key = (self.bucket.name, self.name, filename)
+            session = session_store.get(*session_key)
+            if session is not None:
+                try:
+                    upload, transport = self._initiate_resumable_upload(
+                        client,
+                        stream,
+                        content_type,
+                        size,
+                        resumable_url=session["resumable_url"],
+                        checksum_state=session["checksum_state"],
+                        **initiate_kwargs,
+                    )
+                except InvalidResponse:
+                    # The session has expired or already completed.
+                    session_store.delete(*session_key)
+                    upload = None
+
+        if upload is None:
+            upload, transport = self._initiate_resumable_upload(
+                client, stream, content_type, size, **initiate_kwargs
+            )
+            if upload_session is not None:
+                session_store.put(*session_key, upload.resumable_url)
         extra_attributes = _get_opentelemetry_attributes_from_url(upload.resumable_url)
         extra_attributes["upload.chunk_size"] = upload.chunk_size
         extra_attributes["upload.checksum"] = f"{checksum}"
+        extra_attributes["upload.adaptive_chunk_size"] = self.adaptive_chunk_size
 
         args = {"timeout": timeout}
         with create_trace_span(
@@ -2457,14 +2643,30 @@ class Blob(_PropertyMixin):
             attributes=extra_attributes,
             client=client,
             api_request=args,
-        ):
-            while not upload.finished:
-                try:
-                    response = upload.transmit_next_chunk(transport, timeout=timeout)
-                except DataCorruption:
-                    # Attempt to delete the corrupted object.
-                    self.delete()
-                    raise
+        ) as span:
+            try:
+                while not upload.finished:
+                    try:
+                        response = upload.transmit_next_chunk(
+                            transport, timeout=timeout
+                        )
+                    except DataCorruption:
+                        if upload_session is not None:
+                            session_store.delete(*session_key)
+                        # Attempt to delete the corrupted object.
+                        self.delete()
+                        raise
+                    finally:
+                        _add_chunk_size_decision_event(span, upload)
+                    if upload_session is not None and not upload.finished:
+                        session_store.put(
+                            *session_key, upload.resumable_url, upload.checksum_state
+                        )
+            finally:
+                # Even a failed upload may have written the object.
+                self._require_client(client)._invalidate_object_metadata(self.path)
+            if upload_session is not None:
+                session_store.delete(*session_key)
             return response
 
     def _do_upload(
@@ -2483,6 +2685,7 @@ class Blob(_PropertyMixin):
         retry=None,
         command=None,
         crc32c_checksum_value=None,
+        upload_session=None,
     ):
         """Determine an upload strategy and then perform the upload.
 
@@ -2608,6 +2811,14 @@ class Blob(_PropertyMixin):
             https://datatracker.ietf.org/doc/html/rfc4960#appendix-B and
             base64: https://datatracker.ietf.org/doc/html/rfc4648#section-4
 
+        :type upload_session: tuple
+        :param upload_session:
+            (Optional) A pair of an
+            :class:`~google.cloud.storage.upload_session_store.UploadSessionStore`
+            and the path of the file being uploaded. If given, a resumable
+            upload continues a session saved for the file, and saves its own
+            session as it goes.
+
         :rtype: dict
         :returns: The parsed JSON from the "200 OK" response. This will be the
                   **only** response in the multipart case and it will be the
@@ -2625,6 +2836,7 @@ class Blob(_PropertyMixin):
                 "ifMetagenerationMatch": if_metageneration_match,
             }
             retry = retry.get_retry_policy_if_conditions_met(query_params=query_params)
+        retry = _limit_retries(retry, self._require_client(client))
 
         if size is not None and size <= _MAX_MULTIPART_SIZE:
             response = self._do_multipart_upload(
@@ -2658,6 +2870,7 @@ class Blob(_PropertyMixin):
                 retry=retry,
                 command=command,
                 crc32c_checksum_value=crc32c_checksum_value,
+                upload_session=upload_session,
             )
 
         return response.json()
@@ -2679,6 +2892,7 @@ class Blob(_PropertyMixin):
         retry=DEFAULT_RETRY,
         command=None,
         crc32c_checksum_value=None,
+        upload_session=None,
     ):
         """Upload the contents of this blob from a file-like object.
 
@@ -2825,6 +3039,14 @@ class Blob(_PropertyMixin):
             https://datatracker.ietf.org/doc/html/rfc4960#appendix-B and
             base64: https://datatracker.ietf.org/doc/html/rfc4648#section-4
 
+        :type upload_session: tuple
+        :param upload_session:
+            (Optional) A pair of an
+            :class:`~google.cloud.storage.upload_session_store.UploadSessionStore`
+            and the path of the file being uploaded. If given, a resumable
+            upload continues a session saved for the file, and saves its own
+            session as it goes.
+
         :raises: :class:`~google.cloud.exceptions.GoogleCloudError`
                  if the upload response returns an error status.
         """
@@ -2847,6 +3069,7 @@ class Blob(_PropertyMixin):
                 retry=retry,
                 command=command,
                 crc32c_checksum_value=crc32c_checksum_value,
+                upload_session=upload_session,
             )
             self._set_properties(created_json)
         except InvalidResponse as exc:
@@ -3029,7 +3252,9 @@ class Blob(_PropertyMixin):
                 crc32c_checksum_value=crc32c_checksum_value,
             )
 
-    def _handle_filename_and_upload(self, filename, content_type=None, *args, **kwargs):
+    def _handle_filename_and_upload(
+        self, filename, content_type=None, *args, upload_session_store=None, **kwargs
+    ):
         """Upload this blob's contents from the content of a named file.
 
         :type filename: str
@@ -3038,10 +3263,17 @@ class Blob(_PropertyMixin):
         :type content_type: str
         :param content_type: (Optional) Type of content being uploaded.
 
+        :type upload_session_store: :class:`~google.cloud.storage.upload_session_store.UploadSessionStore`
+        :param upload_session_store:
+            (Optional) Where to save the resumable upload session, so that it
+            can be continued by a later call.
+
         For *args and **kwargs, refer to the documentation for upload_from_filename() for more information.
         """
 
         content_type = self._get_content_type(content_type, filename=filename)
+        if upload_session_store is not None:
+            kwargs["upload_session"] = (upload_session_store, filename)
 
         with open(filename, "rb") as file_obj:
             total_bytes = os.fstat(file_obj.fileno()).st_size
@@ -3067,6 +3299,7 @@ class Blob(_PropertyMixin):
         checksum="auto",
         retry=DEFAULT_RETRY,
         crc32c_checksum_value=None,
+        upload_session_store=None,
     ):
         """Upload this blob's contents from the content of a named file.
 
@@ -3193,6 +3426,14 @@ class Blob(_PropertyMixin):
             More details on CRC32c can be found in Appendix B:
             https://datatracker.ietf.org/doc/html/rfc4960#appendix-B and
             base64: https://datatracker.ietf.org/doc/html/rfc4648#section-4
+
+        :type upload_session_store: :class:`~google.cloud.storage.upload_session_store.UploadSessionStore`
+        :param upload_session_store:
+            (Optional) If the file is uploaded with a resumable upload, save
+            the upload session in this store as the upload progresses. If an
+            earlier call for the same file was interrupted (for instance by a
+            process restart), its session is continued from the offset the
+            server has committed instead of starting again.
         """
         with create_trace_span(name="Storage.Blob.uploadFromFilename"):
             self._handle_filename_and_upload(
@@ -3208,6 +3449,7 @@ class Blob(_PropertyMixin):
                 checksum=checksum,
                 retry=retry,
                 crc32c_checksum_value=crc32c_checksum_value,
+                upload_session_store=upload_session_store,
             )
 
     def upload_from_string(
@@ -4328,12 +4570,26 @@ class Blob(_PropertyMixin):
         - ``raw_download``
         - ``single_shot_download``
 
+        Downloads also accept the following argument, which configures the
+        :class:`~google.cloud.storage.fileio.BlobReader` itself:
+
+        - ``block_cache``
+
         For uploads only, the following additional arguments are supported:
 
         - ``content_type``
         - ``predefined_acl``
         - ``checksum``
 
+        Uploads also accept the following arguments, which configure the
+        :class:`~google.cloud.storage.fileio.BlobWriter` itself:
+
+        - ``background_upload``
+        - ``max_pending_chunks``
+        - ``parallel_upload``
+        - ``max_parallel_parts``
+        - ``spill_threshold``
+
         :type mode: str
         :param mode:
             (Optional) A mode string, as per standard Python `open()` semantics.The first
@@ -4583,9 +4839,9 @@ class Blob(_PropertyMixin):
             of the object. The response headers must contain a checksum of the
             requested type. If the headers lack an appropriate checksum (for
             instance in the case of transcoded or ranged downloads where the
-            remote service does not know the correct checksum, including
-            downloads where chunk_size is set) an INFO-level log will be
-            emitted. Supported values are "md5", "crc32c", "auto" and None. The
+            remote service does not know the correct checksum) an INFO-level
+            log will be emitted.
+            Supported values are "md5", "crc32c", "auto" and None. The
             default is "auto", which will try to detect if the C extension for
             crc32c is installed and fall back to md5 otherwise.
 
@@ -4631,6 +4887,7 @@ class Blob(_PropertyMixin):
             retry = retry.get_retry_policy_if_conditions_met(query_params=query_params)
 
         client = self._require_client(client)
+        retry = _limit_retries(retry, client)
 
         download_url = self._get_download_url(
             client,
@@ -4668,6 +4925,9 @@ class Blob(_PropertyMixin):
                 checksum=checksum,
                 retry=retry,
                 single_shot_download=single_shot_download,
+                download_buffer_size=(
+                    self.download_buffer_size or client.download_buffer_size
+                ),
             )
         except InvalidResponse as exc:
             _raise_from_invalid_response(exc)
@@ -5158,6 +5418,30 @@ def _raise_from_invalid_response(error):
     raise exceptions.from_http_status(response.status_code, message, response=response)
 
 
+def _add_chunk_size_decision_event(span, transfer):
+    """Record an adaptive chunk size decision on a trace span.
+
+    :type span: :class:`opentelemetry.trace.Span`
+    :param span: The span of the transfer, or ``None`` if not tracing.
+
+    :type transfer: object
+    :param transfer:
+        The resumable upload or chunked download which sent the last chunk.
+    """
+    if span is None:
+        return
+    decision = transfer.chunk_size_decision
+    if decision is None:
+        return
+    attributes = {
+        "action": decision["action"],
+        "chunk_size": decision["chunk_size"],
+    }
+    if decision["throughput"] is not None:
+        attributes["throughput"] = decision["throughput"]
+    span.add_event("chunk_size_decision", attributes=attributes)
+
+
 def _add_query_parameters(base_url, name_value_pairs):
     """Add one query parameter to a base URL.
 
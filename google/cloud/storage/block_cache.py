@@ -0,0 +1,239 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local on-disk cache of blob data, used by BlobReader for repeated reads."""
+
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # pragma: NO COVER
+    fcntl = None
+
+DEFAULT_BLOCK_SIZE = 8 * 1024 * 1024  # 8 MiB
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024 * 1024  # 10 GiB
+
+_LOCK_FILE_NAME = ".lock"
+_TEMP_FILE_PREFIX = ".tmp-"
+
+
+class BlockCache(object):
+    """A size-bounded cache of fixed-size blob blocks in a local directory.
+
+    Blocks are keyed by bucket name, blob name, generation, block index and
+    whether the data is still content-encoded (``raw_download``).
+    Because the generation is part of the key, a cached block can never be
+    served for a different revision of the object, so entries never need to
+    be invalidated; they are only evicted to stay within ``max_bytes``,
+    least recently used first.
+
+    The cache directory may be shared by several processes on the same host.
+    Blocks are written to a temporary file and atomically renamed into place,
+    so readers never observe a partial block, and eviction is serialized
+    with an advisory lock on a file in the cache directory (on platforms
+    without ``fcntl``, eviction is only serialized within a process). The
+    directory is only scanned for blocks to evict once the size of the
+    cache, as last scanned plus the blocks stored since, exceeds
+    ``max_bytes``; blocks stored by other processes are counted at the next
+    scan.
+
+    Data is stored unencrypted, so blobs encrypted with a customer-supplied
+    key are not read through the cache.
+
+    Pass an instance as ``block_cache`` to
+    :class:`~google.cloud.storage.fileio.BlobReader`, or to ``blob.open()``:
+
+    .. code-block:: python
+
+        cache = BlockCache("/mnt/nvme/gcs-cache", max_bytes=500 * 1024**3)
+        with blob.open("rb", block_cache=cache) as reader:
+            data = reader.read()
+
+    :type directory: str
+    :param directory:
+        The directory to store blocks in. It is created if it does not exist.
+
+    :type max_bytes: int
+    :param max_bytes:
+        (Optional) The total size of cached blocks above which the least
+        recently used blocks are evicted. The default is 10 GiB.
+
+    :type block_size: int
+    :param block_size:
+        (Optional) The size of each cached block, and so the granularity of
+        downloads made through the cache. The default is 8 MiB.
+    """
+
+    def __init__(
+        self, directory, max_bytes=DEFAULT_MAX_BYTES, block_size=DEFAULT_BLOCK_SIZE
+    ):
+        if block_size <= 0:
+            raise ValueError("block_size must be a positive integer.")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.block_size = block_size
+        self._thread_lock = threading.Lock()
+        # The size of the cache as last scanned, plus the blocks stored since.
+        self._size_estimate = None
+
+    def _blob_directory(self, bucket_name, blob_name):
+        digest = hashlib.sha256(f"{bucket_name}/{blob_name}".encode("utf-8"))
+        return os.path.join(self.directory, digest.hexdigest())
+
+    def _block_path(
+        self, bucket_name, blob_name, generation, index, raw_download=False
+    ):
+        suffix = "-raw" if raw_download else ""
+        return os.path.join(
+            self._blob_directory(bucket_name, blob_name),
+            f"{generation}-{self.block_size}-{index}{suffix}",
+        )
+
+    def get(self, bucket_name, blob_name, generation, index, raw_download=False):
+        """Return a cached block, or ``None`` if it is not cached.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the bucket containing the blob.
+
+        :type blob_name: str
+        :param blob_name: The name of the blob.
+
+        :type generation: int
+        :param generation: The generation of the blob.
+
+        :type index: int
+        :param index: The index of the block within the blob.
+
+        :type raw_download: bool
+        :param raw_download:
+            (Optional) If True, look up the block as downloaded without
+            decoding its content encoding.
+
+        :rtype: bytes or ``NoneType``
+        :returns: The cached block data, if present.
+        """
+        path = self._block_path(bucket_name, blob_name, generation, index, raw_download)
+        try:
+            with open(path, "rb") as block_file:
+                data = block_file.read()
+            # Record the access for eviction; access times are not reliable.
+            os.utime(path)
+        except FileNotFoundError:
+            # Not cached, or evicted by another process in the meantime.
+            return None
+        return data
+
+    def put(self, bucket_name, blob_name, generation, index, data, raw_download=False):
+        """Store a block, evicting older blocks if the cache is over size.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the bucket containing the blob.
+
+        :type blob_name: str
+        :param blob_name: The name of the blob.
+
+        :type generation: int
+        :param generation: The generation of the blob.
+
+        :type index: int
+        :param index: The index of the block within the blob.
+
+        :type data: bytes
+        :param data: The block data.
+
+        :type raw_download: bool
+        :param raw_download:
+            (Optional) If True, the data was downloaded without decoding its
+            content encoding.
+        """
+        blob_directory = self._blob_directory(bucket_name, blob_name)
+        os.makedirs(blob_directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=blob_directory, prefix=_TEMP_FILE_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(data)
+            os.replace(
+                temp_path,
+                self._block_path(
+                    bucket_name, blob_name, generation, index, raw_download
+                ),
+            )
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+        with self._thread_lock:
+            if self._size_estimate is not None:
+                self._size_estimate += len(data)
+                if self._size_estimate <= self.max_bytes:
+                    return
+        self._evict()
+
+    @contextlib.contextmanager
+    def _lock(self):
+        with self._thread_lock:
+            if fcntl is None:  # pragma: NO COVER
+                yield
+                return
+            with open(os.path.join(self.directory, _LOCK_FILE_NAME), "a") as lock:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _list_blocks(self):
+        blocks = []
+        with os.scandir(self.directory) as blob_directories:
+            for blob_directory in blob_directories:
+                if not blob_directory.is_dir():
+                    continue
+                with os.scandir(blob_directory.path) as entries:
+                    for entry in entries:
+                        if entry.name.startswith(_TEMP_FILE_PREFIX):
+                            continue
+                        try:
+                            stat = entry.stat()
+                        except FileNotFoundError:
+                            continue
+                        blocks.append((stat.st_mtime, stat.st_size, entry.path))
+        return blocks
+
+    def _evict(self):
+        with self._lock():
+            blocks = self._list_blocks()
+            total = sum(size for _, size, _ in blocks)
+            if total > self.max_bytes:
+                for _, size, path in sorted(blocks):
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(path)
+                    total -= size
+                    if total <= self.max_bytes:
+                        break
+            self._size_estimate = total
+
+    @property
+    def size(self):
+        """The total size of the blocks currently in the cache.
+
+        :rtype: int
+        :returns: The size in bytes.
+        """
+        return sum(size for _, size, _ in self._list_blocks())
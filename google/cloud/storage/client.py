@@ -17,15 +17,21 @@
 import base64
 import binascii
 import collections
+import copy
 import datetime
 import functools
 import json
 import os
+import re
+from urllib.parse import unquote
 import warnings
+import weakref
 import google.api_core.client_options
+import requests
 
 from google.auth.credentials import AnonymousCredentials
 from google.auth.transport import mtls
+import google.auth.transport.requests
 from google.api_core import page_iterator
 from google.cloud._helpers import _LocalStack
 from google.cloud.client import ClientWithProject
@@ -42,9 +48,14 @@ from google.cloud.storage._helpers import _DEFAULT_SCHEME
 from google.cloud.storage._helpers import _STORAGE_HOST_TEMPLATE
 from google.cloud.storage._helpers import _NOW
 from google.cloud.storage._helpers import _UTC
+from google.cloud.storage._helpers import _SingleFlight
+from google.cloud.storage._helpers import _CredentialRefresher
 from google.cloud.storage._opentelemetry_tracing import create_trace_span
 
 from google.cloud.storage._http import Connection
+from google.cloud.storage._http import _ConnectionPoolStats
+from google.cloud.storage._http import _configure_connection_pools
+from google.cloud.storage._http2 import HTTP2Adapter
 from google.cloud.storage._signing import (
     get_expiration_seconds_v4,
     get_v4_now_dtstamps,
@@ -52,6 +63,7 @@ from google.cloud.storage._signing import (
     _sign_message,
 )
 from google.cloud.storage.batch import Batch
+from google.cloud.storage.batch import _AutoBatcher
 from google.cloud.storage.bucket import Bucket, _item_to_blob, _blobs_page_start
 from google.cloud.storage.blob import Blob
 from google.cloud.storage.hmac_key import HMACKeyMetadata
@@ -63,6 +75,10 @@ from google.cloud.storage.retry import DEFAULT_RETRY
 
 _marker = object()
 
+# Matches the path of an object, as in "/b/bucket/o/name"; object names are
+# percent-encoded, so contain no slashes.
+_OBJECT_PATH_PATTERN = re.compile(r"/b/(?P<bucket>[^/?]+)/o/(?P<blob>[^/?]+)")
+
 
 def _buckets_page_start(iterator, page, response):
     """Grab unreachable buckets after a :class:`~google.cloud.iterator.Page` started."""
@@ -124,6 +140,92 @@ class Client(ClientWithProject):
         (Optional) An API key. Mutually exclusive with any other credentials.
         This parameter is an alias for setting `client_options.api_key` and
         will supercede any api key set in the `client_options` parameter.
+
+    :type download_buffer_size: int
+    :param download_buffer_size:
+        (Optional) The number of bytes read from the network at a time in
+        downloads of blobs that do not set their own ``download_buffer_size``.
+        Defaults to 1 MiB.
+
+    :type connection_pool_size: int
+    :param connection_pool_size:
+        (Optional) The number of per-host connection pools to keep. Defaults
+        to 10. Only applies if ``_http`` is not passed.
+
+    :type connection_pool_maxsize: int
+    :param connection_pool_maxsize:
+        (Optional) The number of idle connections kept open per host.
+        Connections beyond this are closed once a request completes, so it
+        should be at least the number of threads using the client
+        concurrently. Defaults to 10; THREAD workers in
+        :mod:`~google.cloud.storage.transfer_manager` raise it to their
+        ``max_workers``. Only applies if ``_http`` is not passed.
+
+    :type tcp_keepalive: int
+    :param tcp_keepalive:
+        (Optional) If set, send TCP keepalive probes on connections idle for
+        this many seconds, so that idle pooled connections are not silently
+        dropped by intermediate network devices. By default, the operating
+        system's setting is used. Only applies if ``_http`` is not passed.
+
+    :type http2: bool
+    :param http2:
+        (Optional) If True, send HTTPS requests over HTTP/2, so that
+        concurrent requests share a few multiplexed connections rather than
+        each opening its own. Requires the ``http2`` extra
+        (``pip install google-cloud-storage[http2]``). Not used with mutual
+        TLS. Defaults to False. Only applies if ``_http`` is not passed.
+
+    :type coalesce_get_requests: bool
+    :param coalesce_get_requests:
+        (Optional) If True, identical metadata GET requests made concurrently
+        from several threads, such as many calls to
+        :meth:`~google.cloud.storage.bucket.Bucket.get_blob` or
+        :meth:`~google.cloud.storage.blob.Blob.reload` for the same object,
+        are merged: one request is sent, and every caller gets its response
+        or error. Requests are identical if their path, query parameters
+        (which include the ``userProject``) and headers are equal; they are
+        sent with the timeout and retry policy of the first caller. Requests
+        made within a batch are not merged. Defaults to False.
+
+    :type metadata_cache: :class:`~google.cloud.storage.metadata_cache.MetadataCache`
+    :param metadata_cache:
+        (Optional) A cache for the object metadata fetched by
+        :meth:`~google.cloud.storage.bucket.Bucket.get_blob`,
+        :meth:`~google.cloud.storage.blob.Blob.reload` and
+        :meth:`~google.cloud.storage.blob.Blob.exists`. Writes made through
+        the client invalidate the entries of the objects they write.
+
+    :type refresh_credentials_in_background: bool
+    :param refresh_credentials_in_background:
+        (Optional) If True, the client's credentials are refreshed on a
+        background thread a few minutes before they expire, so that requests
+        don't wait for the token endpoint when they do. The thread runs until
+        :meth:`close` is called, or the client is garbage collected. Defaults
+        to False.
+
+    :type retry_budget: :class:`~google.cloud.storage.retry.RetryBudget`
+    :param retry_budget:
+        (Optional) Limits the retries of all the client's calls, including
+        those of uploads and downloads, to a share of its successful
+        requests.
+
+    :type circuit_breaker: :class:`~google.cloud.storage.retry.CircuitBreaker`
+    :param circuit_breaker:
+        (Optional) Makes the client's calls fail fast, without retries, after
+        sustained 429 or 5xx responses, connection errors or timeouts.
+
+    :type auto_batch_window: float
+    :param auto_batch_window:
+        (Optional) If set, metadata writes of buckets and objects -- such as
+        :meth:`Blob.patch <google.cloud.storage.blob.Blob.patch>`,
+        :meth:`Blob.update <google.cloud.storage.blob.Blob.update>` and
+        :meth:`Blob.delete <google.cloud.storage.blob.Blob.delete>` -- made
+        concurrently from several threads are gathered for this many seconds
+        and sent in a single batch request. Each call still returns, or
+        raises, as if it was sent on its own, but is delayed by up to the
+        window; a window of 0.01 to 0.05 seconds suits most workloads.
+        Writes made within an explicit :meth:`batch` are not affected.
     """
 
     SCOPE = (
@@ -144,8 +246,33 @@ class Client(ClientWithProject):
         extra_headers={},
         *,
         api_key=None,
+        download_buffer_size=None,
+        connection_pool_size=None,
+        connection_pool_maxsize=None,
+        tcp_keepalive=None,
+        http2=False,
+        coalesce_get_requests=False,
+        metadata_cache=None,
+        refresh_credentials_in_background=False,
+        retry_budget=None,
+        circuit_breaker=None,
+        auto_batch_window=None,
     ):
         self._base_connection = None
+        self._auto_batcher = None
+        self._credential_refresher = None
+        self.download_buffer_size = download_buffer_size
+        self._connection_pool_size = connection_pool_size
+        self._connection_pool_maxsize = connection_pool_maxsize
+        self._tcp_keepalive = tcp_keepalive
+        self._http2 = http2
+        self._connection_pool_stats = _ConnectionPoolStats()
+        # Only a session created by the client has its pools configured.
+        self._owns_http = False
+        self._get_requests = _SingleFlight() if coalesce_get_requests else None
+        self._metadata_cache = metadata_cache
+        self._retry_budget = retry_budget
+        self._circuit_breaker = circuit_breaker
 
         if project is None:
             no_project = True
@@ -290,6 +417,22 @@ class Client(ClientWithProject):
         connection.extra_headers = extra_headers
         self._connection = connection
         self._batch_stack = _LocalStack()
+        if auto_batch_window is not None:
+            self._auto_batcher = _AutoBatcher(self, auto_batch_window)
+
+        credentials = self._credentials
+        if (
+            refresh_credentials_in_background
+            and credentials is not None
+            and not isinstance(credentials, AnonymousCredentials)
+        ):
+            refresher = _CredentialRefresher(
+                credentials, google.auth.transport.requests.Request()
+            )
+            self._credential_refresher = refresher
+            # The thread does not refer to the client, so doesn't keep it alive.
+            weakref.finalize(self, refresher.stop, wait=False)
+            refresher.start()
 
     @classmethod
     def create_anonymous_client(cls):
@@ -307,6 +450,79 @@ class Client(ClientWithProject):
         client.project = None
         return client
 
+    @property
+    def _http(self):
+        """Getter for object used for HTTP transport.
+
+        A session created by the client has its connection pools configured
+        from the client's connection options.
+
+        :rtype: :class:`~requests.Session`
+        :returns: An HTTP object.
+        """
+        if self._http_internal is None:
+            session = super(Client, self)._http
+            self._owns_http = True
+            if isinstance(session, requests.Session):
+                _configure_connection_pools(
+                    session,
+                    self._connection_pool_stats,
+                    pool_size=self._connection_pool_size,
+                    pool_maxsize=self._connection_pool_maxsize,
+                    tcp_keepalive=self._tcp_keepalive,
+                )
+                if self._http2 and not getattr(session, "is_mtls", False):
+                    session.mount("https://", HTTP2Adapter())
+        return self._http_internal
+
+    def close(self):
+        """Stop any background credential refresh, and close the transport."""
+        if self._credential_refresher is not None:
+            self._credential_refresher.stop()
+        super(Client, self).close()
+
+    def _ensure_connection_pool_maxsize(self, maxsize):
+        """Grow the connections kept per host to at least ``maxsize``.
+
+        Has no effect if the client was given its own ``_http`` object.
+
+        :type maxsize: int
+        :param maxsize: The number of connections needed per host.
+        """
+        if self._connection_pool_maxsize is not None:
+            if self._connection_pool_maxsize >= maxsize:
+                return
+        elif maxsize <= requests.adapters.DEFAULT_POOLSIZE:
+            return
+        self._connection_pool_maxsize = maxsize
+        session = self._http_internal
+        if self._owns_http and isinstance(session, requests.Session):
+            _configure_connection_pools(
+                session,
+                self._connection_pool_stats,
+                pool_size=self._connection_pool_size,
+                pool_maxsize=maxsize,
+                tcp_keepalive=self._tcp_keepalive,
+            )
+
+    @property
+    def connection_pool_stats(self):
+        """Counters of HTTP connection reuse by this client.
+
+        A high ``misses`` count relative to ``requests``, or any
+        ``discards``, means connections are being re-opened (with a new TLS
+        handshake each time) and ``connection_pool_maxsize`` should be
+        raised. Only requests made through a session created by the client
+        are counted.
+
+        :rtype: dict
+        :returns: Counts keyed by ``requests`` (connections taken from a
+                  pool), ``hits`` (connections reused), ``misses`` (new
+                  connections opened) and ``discards`` (connections closed
+                  because the pool was full).
+        """
+        return self._connection_pool_stats.snapshot()
+
     @property
     def universe_domain(self):
         return self._universe_domain or _DEFAULT_UNIVERSE_DOMAIN
@@ -445,7 +661,7 @@ class Client(ClientWithProject):
             generation=generation,
         )
 
-    def batch(self, raise_exception=True):
+    def batch(self, raise_exception=True, max_workers=None):
         """Factory constructor for batch object.
 
         .. note::
@@ -459,10 +675,24 @@ class Client(ClientWithProject):
             Note that exceptions are unwrapped after all operations are complete
             in success or failure, and only the last exception is raised.
 
+        :type max_workers: int
+        :param max_workers:
+            (Optional) If set, the batch accepts any number of requests, and
+            sends them in batch requests of up to 1000 requests each, up to
+            ``max_workers`` of them at a time:
+
+            .. code-block:: python
+
+                with client.batch(max_workers=8):
+                    for blob in blobs:
+                        blob.delete()
+
         :rtype: :class:`google.cloud.storage.batch.Batch`
         :returns: The batch object created.
         """
-        return Batch(client=self, raise_exception=raise_exception)
+        return Batch(
+            client=self, raise_exception=raise_exception, max_workers=max_workers
+        )
 
     def _get_resource(
         self,
@@ -520,7 +750,8 @@ class Client(ClientWithProject):
             google.cloud.exceptions.NotFound
                 If the bucket is not found.
         """
-        return self._connection.api_request(
+        call = functools.partial(
+            self._connection.api_request,
             method="GET",
             path=path,
             query_params=query_params,
@@ -529,6 +760,48 @@ class Client(ClientWithProject):
             retry=retry,
             _target_object=_target_object,
         )
+        # Requests within a batch are deferred, so cannot be shared.
+        if self.current_batch is not None:
+            return call()
+
+        if self._get_requests is None and self._metadata_cache is None:
+            return call()
+
+        key = _SingleFlight.make_key(path, query_params, headers)
+        if self._get_requests is not None:
+            call = functools.partial(self._get_requests.do, key, call)
+
+        cache = self._metadata_cache
+        match = _OBJECT_PATH_PATTERN.fullmatch(path)
+        if cache is None or match is None:
+            return call()
+
+        bucket_name, blob_name = _object_names(match)
+        cached = cache.get(bucket_name, blob_name, key)
+        if cached is not None:
+            return cached
+        epoch = cache.epoch
+        try:
+            response = call()
+        except NotFound as exc:
+            cache.put(bucket_name, blob_name, key, exc, epoch=epoch)
+            raise
+        cache.put(bucket_name, blob_name, key, copy.deepcopy(response), epoch=epoch)
+        return response
+
+    def _invalidate_object_metadata(self, path):
+        """Invalidate cached metadata of the objects a request writes.
+
+        :type path: str
+        :param path: The path, or URL, of the request. The objects named in
+                     it, such as both the source and destination of a
+                     rewrite, are invalidated.
+        """
+        cache = self._metadata_cache
+        if cache is None:
+            return
+        for match in _OBJECT_PATH_PATTERN.finditer(path):
+            cache.invalidate(*_object_names(match))
 
     def _list_resource(
         self,
@@ -628,16 +901,19 @@ class Client(ClientWithProject):
             google.cloud.exceptions.NotFound
                 If the bucket is not found.
         """
-        return self._connection.api_request(
-            method="PATCH",
-            path=path,
-            data=data,
-            query_params=query_params,
-            headers=headers,
-            timeout=timeout,
-            retry=retry,
-            _target_object=_target_object,
-        )
+        try:
+            return self._connection.api_request(
+                method="PATCH",
+                path=path,
+                data=data,
+                query_params=query_params,
+                headers=headers,
+                timeout=timeout,
+                retry=retry,
+                _target_object=_target_object,
+            )
+        finally:
+            self._invalidate_object_metadata(path)
 
     def _put_resource(
         self,
@@ -699,16 +975,19 @@ class Client(ClientWithProject):
             google.cloud.exceptions.NotFound
                 If the bucket is not found.
         """
-        return self._connection.api_request(
-            method="PUT",
-            path=path,
-            data=data,
-            query_params=query_params,
-            headers=headers,
-            timeout=timeout,
-            retry=retry,
-            _target_object=_target_object,
-        )
+        try:
+            return self._connection.api_request(
+                method="PUT",
+                path=path,
+                data=data,
+                query_params=query_params,
+                headers=headers,
+                timeout=timeout,
+                retry=retry,
+                _target_object=_target_object,
+            )
+        finally:
+            self._invalidate_object_metadata(path)
 
     def _post_resource(
         self,
@@ -771,16 +1050,19 @@ class Client(ClientWithProject):
                 If the bucket is not found.
         """
 
-        return self._connection.api_request(
-            method="POST",
-            path=path,
-            data=data,
-            query_params=query_params,
-            headers=headers,
-            timeout=timeout,
-            retry=retry,
-            _target_object=_target_object,
-        )
+        try:
+            return self._connection.api_request(
+                method="POST",
+                path=path,
+                data=data,
+                query_params=query_params,
+                headers=headers,
+                timeout=timeout,
+                retry=retry,
+                _target_object=_target_object,
+            )
+        finally:
+            self._invalidate_object_metadata(path)
 
     def _delete_resource(
         self,
@@ -838,15 +1120,18 @@ class Client(ClientWithProject):
             google.cloud.exceptions.NotFound
                 If the bucket is not found.
         """
-        return self._connection.api_request(
-            method="DELETE",
-            path=path,
-            query_params=query_params,
-            headers=headers,
-            timeout=timeout,
-            retry=retry,
-            _target_object=_target_object,
-        )
+        try:
+            return self._connection.api_request(
+                method="DELETE",
+                path=path,
+                query_params=query_params,
+                headers=headers,
+                timeout=timeout,
+                retry=retry,
+                _target_object=_target_object,
+            )
+        finally:
+            self._invalidate_object_metadata(path)
 
     def _bucket_arg_to_bucket(self, bucket_or_name, generation=None):
         """Helper to return given bucket or create new by name.
@@ -1225,9 +1510,9 @@ class Client(ClientWithProject):
                 of the object. The response headers must contain a checksum of the
                 requested type. If the headers lack an appropriate checksum (for
                 instance in the case of transcoded or ranged downloads where the
-                remote service does not know the correct checksum, including
-                downloads where chunk_size is set) an INFO-level log will be
-                emitted. Supported values are "md5", "crc32c", "auto" and None.
+                remote service does not know the correct checksum) an INFO-level
+                log will be emitted.
+                Supported values are "md5", "crc32c", "auto" and None.
                 The default is "auto", which will try to detect if the C
                 extension for crc32c is installed and fall back to md5 otherwise.
 
@@ -2019,3 +2304,15 @@ def _item_to_hmac_key_metadata(iterator, item):
     metadata = HMACKeyMetadata(iterator.client)
     metadata._properties = item
     return metadata
+
+
+def _object_names(match):
+    """Get the bucket and object names from an object path.
+
+    :type match: :class:`re.Match`
+    :param match: A match of ``_OBJECT_PATH_PATTERN``.
+
+    :rtype: tuple
+    :returns: The bucket name and the decoded object name.
+    """
+    return match.group("bucket"), unquote(match.group("blob"))
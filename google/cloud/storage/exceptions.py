@@ -33,6 +33,15 @@ except ImportError:
     DataCorruptionDynamicParent = Exception
 
 
+class CircuitBreakerOpen(Exception):
+    """Raised instead of making a request while a circuit breaker is open.
+
+    See :class:`~google.cloud.storage.retry.CircuitBreaker`.
+    """
+
+    pass
+
+
 class InvalidPathError(Exception):
     """Raised when the provided path string is malformed."""
 
@@ -14,16 +14,33 @@
 
 """Module for file-like access of blobs, usually invoked via Blob.open()."""
 
+import collections
+import concurrent.futures
 import io
+import logging
+import queue
+import tempfile
+import threading
 
 from google.api_core.exceptions import RequestRangeNotSatisfiable
+from google.cloud.storage._media._upload import _FileChunk
+from google.cloud.storage._media.requests.upload import XMLMPUPart
 from google.cloud.storage.retry import DEFAULT_RETRY
 from google.cloud.storage.retry import ConditionalRetryPolicy
+from google.cloud.storage.retry import _limit_retries
 
+_logger = logging.getLogger(__name__)
 
 # Resumable uploads require a chunk size of precisely a multiple of 256 KiB.
 CHUNK_SIZE_MULTIPLE = 256 * 1024  # 256 KiB
 DEFAULT_CHUNK_SIZE = 40 * 1024 * 1024  # 40 MiB
+DEFAULT_MAX_PENDING_CHUNKS = 2
+DEFAULT_MAX_PARALLEL_PARTS = 8
+# XML multipart uploads require all parts but the last to be at least 5 MiB.
+MIN_PARALLEL_UPLOAD_PART_SIZE = 5 * 1024 * 1024  # 5 MiB
+
+# Writes smaller than this are coalesced into shared SlidingBuffer segments.
+_MAX_COALESCED_SEGMENT_SIZE = 1024 * 1024  # 1 MiB
 
 # Valid keyword arguments for download methods, and blob.reload() if needed.
 # Note: Changes here need to be reflected in the blob.open() docstring.
@@ -52,6 +69,14 @@ VALID_UPLOAD_KWARGS = {
     "retry",
 }
 
+# Valid keyword arguments for uploads with parallel_upload set.
+VALID_PARALLEL_UPLOAD_KWARGS = {
+    "content_type",
+    "timeout",
+    "checksum",
+    "retry",
+}
+
 
 class BlobReader(io.BufferedIOBase):
     """A file-like object that reads from a blob.
@@ -104,9 +129,32 @@ class BlobReader(io.BufferedIOBase):
 
         Note that download_kwargs (excluding ``raw_download`` and ``single_shot_download``) are also applied to blob.reload(),
         if a reload is needed during seek().
+
+    :type block_cache: :class:`~google.cloud.storage.block_cache.BlockCache`
+    :param block_cache:
+        (Optional) A local cache of blob data. If set, data is downloaded in
+        blocks of the cache's block size, and blocks are served from and
+        stored into the cache. Blocks are only cached once the blob's
+        generation is known (it is learned from the first download if not
+        already set), and later downloads are pinned to that generation, so
+        the cache never serves data from a different revision of the blob.
+        Blobs with a customer-supplied ``encryption_key`` are read without
+        the cache, so that their decrypted data is not stored on disk.
+
+    If the blob size is not yet known, seek() learns it from the
+    ``Content-Range`` header of a speculative data read instead of reloading
+    the blob's metadata first. The generation reported by that response is
+    recorded on the blob, so subsequent reads are pinned to it.
     """
 
-    def __init__(self, blob, chunk_size=None, retry=DEFAULT_RETRY, **download_kwargs):
+    def __init__(
+        self,
+        blob,
+        chunk_size=None,
+        retry=DEFAULT_RETRY,
+        block_cache=None,
+        **download_kwargs,
+    ):
         for kwarg in download_kwargs:
             if kwarg not in VALID_DOWNLOAD_KWARGS:
                 raise ValueError(
@@ -118,6 +166,7 @@ class BlobReader(io.BufferedIOBase):
         self._buffer = io.BytesIO()
         self._chunk_size = chunk_size or blob.chunk_size or DEFAULT_CHUNK_SIZE
         self._retry = retry
+        self._block_cache = block_cache
         self._download_kwargs = download_kwargs
 
     def read(self, size=-1):
@@ -139,17 +188,11 @@ class BlobReader(io.BufferedIOBase):
             else:
                 fetch_end = None
 
-            # Download the blob. Checksumming must be disabled as we are using
-            # chunked downloads, and the server only knows the checksum of the
-            # entire file.
             try:
-                result += self._blob.download_as_bytes(
-                    start=fetch_start,
-                    end=fetch_end,
-                    checksum=None,
-                    retry=self._retry,
-                    **self._download_kwargs,
-                )
+                if self._block_cache is not None and self._blob._encryption_key is None:
+                    result += self._download_blocks(fetch_start, fetch_end)
+                else:
+                    result += self._download(fetch_start, fetch_end)
             except RequestRangeNotSatisfiable:
                 # We've reached the end of the file. Python file objects should
                 # return an empty response in this case, not raise an error.
@@ -165,6 +208,73 @@ class BlobReader(io.BufferedIOBase):
             self._pos += len(result) - read_size
         return result
 
+    def _download(self, start, end):
+        # Download the blob. Checksumming must be disabled as we are using
+        # chunked downloads, and the server only knows the checksum of the
+        # entire file.
+        return self._blob.download_as_bytes(
+            start=start,
+            end=end,
+            checksum=None,
+            retry=self._retry,
+            **self._download_kwargs,
+        )
+
+    def _download_blocks(self, start, end):
+        """Download the bytes from start to end (inclusive) via the cache."""
+        block_size = self._block_cache.block_size
+        first_index = start // block_size
+        blocks = []
+        index = first_index
+        while end is None or index * block_size <= end:
+            if self._blob.size is not None and index * block_size >= self._blob.size:
+                break
+            block = self._get_block(index)
+            blocks.append(block)
+            if len(block) < block_size:
+                break  # This was the last block of the blob.
+            index += 1
+
+        data = b"".join(blocks)
+        offset = first_index * block_size
+        if end is None:
+            return data[start - offset :]
+        return data[start - offset : end + 1 - offset]
+
+    def _get_block(self, index):
+        cache = self._block_cache
+        bucket_name = self._blob.bucket.name
+        raw_download = self._download_kwargs.get("raw_download", False)
+        if self._blob.generation is not None:
+            block = cache.get(
+                bucket_name,
+                self._blob.name,
+                self._blob.generation,
+                index,
+                raw_download=raw_download,
+            )
+            if block is not None:
+                return block
+
+        start = index * cache.block_size
+        try:
+            block = self._download(start, start + cache.block_size - 1)
+        except RequestRangeNotSatisfiable:
+            return b""
+
+        # The download records the generation it was served from on the blob,
+        # which also pins all later downloads to it.
+        if self._blob.generation is not None:
+            cache.put(
+                bucket_name,
+                self._blob.name,
+                self._blob.generation,
+                index,
+                block,
+                raw_download=raw_download,
+            )
+        return block
+
     def read1(self, size=-1):
         return self.read(size)
 
@@ -173,28 +283,31 @@ class BlobReader(io.BufferedIOBase):
 
         This implementation of seek() uses knowledge of the blob size to
         validate that the reported position does not exceed the blob last byte.
-        If the blob size is not already known it will call blob.reload().
+        If the blob size is not already known, it is discovered from the
+        response to a speculative read of the data around the target position,
+        which is kept in the buffer. If that is not possible (for instance when
+        the blob has a chunk_size set, or the response carries no range
+        information), seek() falls back to calling blob.reload().
         """
         self._checkClosed()  # Raises ValueError if closed.
 
-        if self._blob.size is None:
-            reload_kwargs = {
-                k: v
-                for k, v in self._download_kwargs.items()
-                if (k != "raw_download" and k != "single_shot_download")
-            }
-            self._blob.reload(**reload_kwargs)
+        if whence not in {0, 1, 2}:
+            raise ValueError("invalid whence value")
 
         initial_offset = self._pos + self._buffer.tell()
 
+        if whence == 1:
+            # Resolve relative seeks first, as size discovery may move _pos.
+            pos, whence = initial_offset + pos, 0
+
+        if self._blob.size is None:
+            self._discover_size(pos, whence)
+            initial_offset = self._pos + self._buffer.tell()
+
         if whence == 0:
             target_pos = pos
-        elif whence == 1:
-            target_pos = initial_offset + pos
-        elif whence == 2:
+        else:
             target_pos = self._blob.size + pos
-        if whence not in {0, 1, 2}:
-            raise ValueError("invalid whence value")
 
         if target_pos > self._blob.size:
             target_pos = self._blob.size
@@ -213,6 +326,58 @@ class BlobReader(io.BufferedIOBase):
             new_pos = self._pos + self._buffer.seek(difference, 1)
         return new_pos
 
+    def _discover_size(self, pos, whence):
+        """Learn the blob size, preferably without a metadata request.
+
+        ``pos`` is an absolute offset if ``whence`` is 0, or relative to the
+        end of the blob if ``whence`` is 2.
+
+        The blob's download path records the object size from the
+        ``Content-Range`` header of a ranged response, so reading the data the
+        caller is about to need also reveals the size. Data read this way
+        replaces the buffer. Chunked downloads do not report response headers,
+        so blobs with a chunk_size set always use blob.reload().
+        """
+        if self._blob.chunk_size is None:
+            if whence == 2:
+                # Read a suffix of the blob: the bytes just before the end are
+                # the likely target (e.g. file footers). For seeks to or past
+                # the end, a single byte is enough to learn the size.
+                fetch_start = -max(-pos, self._chunk_size) if pos < 0 else -1
+                fetch_end = None
+            else:
+                fetch_start = pos
+                fetch_end = fetch_start + self._chunk_size
+
+            if fetch_start >= 0 or whence == 2:
+                try:
+                    data = self._blob.download_as_bytes(
+                        start=fetch_start,
+                        end=fetch_end,
+                        checksum=None,
+                        retry=self._retry,
+                        **self._download_kwargs,
+                    )
+                except RequestRangeNotSatisfiable:
+                    data = None
+
+                if data is not None and self._blob.size is not None:
+                    if whence == 2:
+                        fetch_start = self._blob.size - len(data)
+                    self._buffer.seek(0)
+                    self._buffer.truncate(0)
+                    self._buffer.write(data)
+                    self._buffer.seek(0)
+                    self._pos = fetch_start
+                    return
+
+        reload_kwargs = {
+            k: v
+            for k, v in self._download_kwargs.items()
+            if (k != "raw_download" and k != "single_shot_download")
+        }
+        self._blob.reload(**reload_kwargs)
+
     def close(self):
         self._buffer.close()
 
@@ -257,6 +422,55 @@ class BlobWriter(io.BufferedIOBase):
         data to the remote server is to close() (using this object as a context
         manager is recommended).
 
+    :type background_upload: bool
+    :param background_upload:
+        (Optional) If True, chunks are transmitted by a background thread, so
+        write() can keep filling the next chunk while the previous one is
+        being sent. An error raised by the background upload is re-raised by
+        the next call to write(), flush() or close(). Defaults to False, which
+        transmits each chunk inline in write().
+
+    :type max_pending_chunks: int
+    :param max_pending_chunks:
+        (Optional) For background uploads only, the number of full chunks that
+        may wait for the background thread, in addition to the one being
+        transmitted. write() blocks while this many chunks are waiting, which
+        bounds memory use to roughly (max_pending_chunks + 2) * chunk_size.
+        Defaults to 2.
+
+    :type parallel_upload: bool
+    :param parallel_upload:
+        (Optional) If True, the blob is written with an XML multipart upload
+        (MPU) instead of a resumable upload. Each full chunk becomes a part,
+        and up to max_parallel_parts parts are uploaded concurrently by a
+        thread pool. close() uploads the last part and finalizes the upload;
+        terminate() cancels it. Blobs smaller than one chunk are sent with a
+        resumable upload instead. Errors are re-raised by the next call to
+        write(), flush() or close(). Preconditions and predefined_acl are not
+        supported in this mode.
+
+        The XML MPU API is significantly different from other uploads; see
+        `https://cloud.google.com/storage/docs/multipart-uploads`. Parts must
+        be at least 5 MiB, and an upload may have at most 10,000 parts, so
+        chunk_size bounds the maximum size of the blob. An incomplete upload
+        that could not be cancelled may persist until removed; consider an
+        `AbortIncompleteMultipartUpload` bucket lifecycle rule.
+
+    :type max_parallel_parts: int
+    :param max_parallel_parts:
+        (Optional) For parallel uploads only, the number of parts that may be
+        in flight at once. write() blocks while this many parts are uploading,
+        which bounds memory use to roughly (max_parallel_parts + 1) *
+        chunk_size. Defaults to 8.
+
+    :type spill_threshold: int
+    :param spill_threshold:
+        (Optional) The maximum number of bytes to buffer in memory. Buffered
+        data beyond this is written to temporary files (in the directory
+        chosen by the `tempfile` module) and read back when it is sent, so
+        large chunk sizes can be used without holding whole chunks in memory
+        between requests. The default of None buffers all data in memory.
+
     :type retry: google.api_core.retry.Retry or google.cloud.storage.retry.ConditionalRetryPolicy
     :param retry:
         (Optional) How to retry the RPC. A None value will disable
@@ -301,6 +515,11 @@ class BlobWriter(io.BufferedIOBase):
         chunk_size=None,
         ignore_flush=False,
         retry=DEFAULT_RETRY,
+        background_upload=False,
+        max_pending_chunks=DEFAULT_MAX_PENDING_CHUNKS,
+        parallel_upload=False,
+        max_parallel_parts=DEFAULT_MAX_PARALLEL_PARTS,
+        spill_threshold=None,
         **upload_kwargs,
     ):
         for kwarg in upload_kwargs:
@@ -308,8 +527,17 @@ class BlobWriter(io.BufferedIOBase):
                 raise ValueError(
                     f"BlobWriter does not support keyword argument {kwarg}."
                 )
+            if parallel_upload and kwarg not in VALID_PARALLEL_UPLOAD_KWARGS:
+                raise ValueError(
+                    f"BlobWriter does not support keyword argument {kwarg} "
+                    "with parallel_upload."
+                )
+        if parallel_upload and background_upload:
+            raise ValueError(
+                "parallel_upload and background_upload cannot both be set."
+            )
         self._blob = blob
-        self._buffer = SlidingBuffer()
+        self._buffer = SlidingBuffer(spill_threshold=spill_threshold)
         self._upload_and_transport = None
         # Resumable uploads require a chunk size of a multiple of 256KiB.
         # self._chunk_size must not be changed after the upload is initiated.
@@ -317,6 +545,27 @@ class BlobWriter(io.BufferedIOBase):
         self._ignore_flush = ignore_flush
         self._retry = retry
         self._upload_kwargs = upload_kwargs
+        self._background_upload = background_upload
+        self._max_pending_chunks = max_pending_chunks
+        self._upload_thread = None
+        self._upload_queue = None
+        self._upload_error = None
+        self._upload_cancelled = threading.Event()
+        self._bytes_written = 0
+        self._bytes_scheduled = 0
+        self._parallel_upload = parallel_upload
+        self._max_parallel_parts = max_parallel_parts
+        self._mpu_container = None
+        self._mpu_headers = None
+        self._mpu_retry = None
+        self._part_executor = None
+        self._part_futures = []
+        self._part_slots = threading.BoundedSemaphore(max_parallel_parts)
+        if parallel_upload and self._chunk_size < MIN_PARALLEL_UPLOAD_PART_SIZE:
+            raise ValueError(
+                "Chunk size must be at least %d with parallel_upload."
+                % MIN_PARALLEL_UPLOAD_PART_SIZE
+            )
 
     @property
     def _chunk_size(self):
@@ -345,9 +594,22 @@ class BlobWriter(io.BufferedIOBase):
 
     def write(self, b):
         self._checkClosed()  # Raises ValueError if closed.
+        self._raise_upload_error()
 
         pos = self._buffer.write(b)
 
+        if self._background_upload:
+            self._bytes_written += pos
+            self._schedule_chunks()
+            return pos
+
+        if self._parallel_upload:
+            self._bytes_written += pos
+            while len(self._buffer) >= self._chunk_size:
+                self._submit_part(self._buffer.read(self._chunk_size))
+                self._buffer.flush()
+            return pos
+
         # If there is enough content, upload chunks.
         num_chunks = len(self._buffer) // self._chunk_size
         if num_chunks:
@@ -372,6 +634,7 @@ class BlobWriter(io.BufferedIOBase):
                 ),
             }
             retry = retry.get_retry_policy_if_conditions_met(query_params=query_params)
+        retry = _limit_retries(retry, self._blob.bucket.client)
 
         self._upload_and_transport = self._blob._initiate_resumable_upload(
             self._blob.bucket.client,
@@ -391,12 +654,7 @@ class BlobWriter(io.BufferedIOBase):
             self._initiate_upload()
 
         upload, transport = self._upload_and_transport
-
-        # Attach timeout if specified in the keyword arguments.
-        # Otherwise, the default timeout will be used from the media library.
-        kwargs = {}
-        if "timeout" in self._upload_kwargs:
-            kwargs = {"timeout": self._upload_kwargs.get("timeout")}
+        kwargs = self._timeout_kwargs()
 
         # Upload chunks. The SlidingBuffer class will manage seek position.
         for _ in range(num_chunks):
@@ -405,10 +663,173 @@ class BlobWriter(io.BufferedIOBase):
         # Wipe the buffer of chunks uploaded, preserving any remaining data.
         self._buffer.flush()
 
+    def _schedule_chunks(self):
+        """Hand each full chunk in the buffer to the background thread."""
+        while self._bytes_written - self._bytes_scheduled >= self._chunk_size:
+            if self._upload_thread is None:
+                self._upload_queue = queue.Queue(maxsize=self._max_pending_chunks)
+                self._upload_thread = threading.Thread(
+                    target=self._upload_in_background, daemon=True
+                )
+                self._upload_thread.start()
+            # Blocks while max_pending_chunks are waiting to be transmitted.
+            self._upload_queue.put(False)
+            self._bytes_scheduled += self._chunk_size
+
+    def _upload_in_background(self):
+        """Transmit one chunk per queue item until the final item.
+
+        After an error or cancellation, items are still consumed (without
+        uploading) so that a writer blocked on a full queue can proceed.
+        """
+        while True:
+            final = self._upload_queue.get()
+            if self._upload_error is None and not self._upload_cancelled.is_set():
+                try:
+                    self._upload_chunks_from_buffer(1)
+                except Exception as exc:
+                    self._upload_error = exc
+            if final:
+                return
+
+    def _finish_background_upload(self):
+        """Send the final chunk and wait for the background thread to exit."""
+        if self._upload_thread is None:
+            self._upload_chunks_from_buffer(1)
+            return
+        self._upload_queue.put(True)
+        self._upload_thread.join()
+        self._raise_upload_error()
+
+    def _initiate_parallel_upload(self):
+        # Imported here, as transfer_manager depends on this module.
+        from google.cloud.storage.transfer_manager import _prepare_xml_mpu_container
+
+        retry = self._retry
+        if isinstance(retry, ConditionalRetryPolicy):
+            # Preconditions are not supported with parallel uploads, so the
+            # policy is evaluated without any.
+            retry = retry.get_retry_policy_if_conditions_met(query_params={})
+        retry = _limit_retries(retry, self._blob.client)
+
+        container, headers, content_type = _prepare_xml_mpu_container(
+            self._blob,
+            self._upload_kwargs.get("content_type"),
+            None,
+            retry,
+        )
+        container.initiate(
+            self._blob._get_transport(self._blob.client),
+            content_type,
+            **self._timeout_kwargs(),
+        )
+        self._mpu_container = container
+        self._mpu_headers = headers
+        self._mpu_retry = retry
+        self._part_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_parallel_parts
+        )
+
+    def _submit_part(self, data):
+        """Upload a part in the thread pool, initiating the MPU if necessary."""
+        if self._mpu_container is None:
+            self._initiate_parallel_upload()
+
+        # Blocks while max_parallel_parts are in flight.
+        self._part_slots.acquire()
+        try:
+            self._raise_upload_error()
+            part_number = len(self._part_futures) + 1
+            future = self._part_executor.submit(self._upload_part, data, part_number)
+        except Exception:
+            self._part_slots.release()
+            raise
+        future.add_done_callback(self._part_done)
+        self._part_futures.append(future)
+
+    def _upload_part(self, data, part_number):
+        """Upload a single part; runs in the thread pool."""
+        container = self._mpu_container
+        start = (part_number - 1) * self._chunk_size
+        part = XMLMPUPart(
+            container.upload_url,
+            container.upload_id,
+            None,
+            start=start,
+            end=start + len(data),
+            part_number=part_number,
+            headers=self._mpu_headers.copy(),
+            checksum=self._upload_kwargs.get("checksum", "auto"),
+            retry=self._mpu_retry,
+            data=data,
+        )
+        part.upload(
+            self._blob._get_transport(self._blob.client), **self._timeout_kwargs()
+        )
+        return part.etag
+
+    def _part_done(self, future):
+        self._part_slots.release()
+        if not future.cancelled() and future.exception() is not None:
+            if self._upload_error is None:
+                self._upload_error = future.exception()
+
+    def _finish_parallel_upload(self):
+        """Upload the last part, then finalize the MPU, or cancel it on error."""
+        if self._mpu_container is None:
+            # The blob is smaller than a chunk; a single request suffices.
+            self._upload_chunks_from_buffer(1)
+            return
+
+        try:
+            if len(self._buffer):
+                self._submit_part(self._buffer.read())
+            self._part_executor.shutdown(wait=True)
+            for part_number, future in enumerate(self._part_futures, start=1):
+                self._mpu_container.register_part(part_number, future.result())
+            self._mpu_container.finalize(
+                self._blob._get_transport(self._blob.client),
+                **self._timeout_kwargs(),
+            )
+        except Exception:
+            self._cancel_parallel_upload()
+            raise
+
+    def _cancel_parallel_upload(self):
+        """Abort the XML MPU.
+
+        This cleans up after another error, or as part of terminate(), so a
+        failure to abort is logged rather than raised in its place.
+        """
+        container, self._mpu_container = self._mpu_container, None
+        self._part_executor.shutdown(wait=True, cancel_futures=True)
+        try:
+            container.cancel(self._blob._get_transport(self._blob.client))
+        except Exception:
+            _logger.warning(
+                "Failed to cancel the XML multipart upload of %s.",
+                self._blob.name,
+                exc_info=True,
+            )
+
+    def _timeout_kwargs(self):
+        # Attach timeout if specified in the keyword arguments.
+        # Otherwise, the default timeout will be used from the media library.
+        if "timeout" in self._upload_kwargs:
+            return {"timeout": self._upload_kwargs.get("timeout")}
+        return {}
+
+    def _raise_upload_error(self):
+        if self._upload_error is not None:
+            raise self._upload_error
+
     def tell(self):
+        if self._background_upload or self._parallel_upload:
+            return self._bytes_written
         return self._buffer.tell() + len(self._buffer)
 
     def flush(self):
+        self._raise_upload_error()
         # flush() is not fully supported by the remote service, so raise an
         # error here, unless self._ignore_flush is set.
         if not self._ignore_flush:
@@ -420,11 +841,32 @@ class BlobWriter(io.BufferedIOBase):
 
     def close(self):
         if not self._buffer.closed:
-            self._upload_chunks_from_buffer(1)
+            try:
+                if self._background_upload:
+                    try:
+                        self._finish_background_upload()
+                    finally:
+                        self._buffer.close()
+                elif self._parallel_upload:
+                    try:
+                        self._finish_parallel_upload()
+                    finally:
+                        self._buffer.close()
+                else:
+                    self._upload_chunks_from_buffer(1)
+            finally:
+                # The upload may have written the object, even if it failed.
+                self._blob.client._invalidate_object_metadata(self._blob.path)
         self._buffer.close()
 
     def terminate(self):
-        """Cancel the ResumableUpload."""
+        """Cancel the ResumableUpload, or the XML MPU with parallel_upload."""
+        if self._mpu_container is not None:
+            self._cancel_parallel_upload()
+        if self._upload_thread is not None and self._upload_thread.is_alive():
+            self._upload_cancelled.set()
+            self._upload_queue.put(True)
+            self._upload_thread.join()
         if self._upload_and_transport:
             upload, transport = self._upload_and_transport
             transport.delete(upload.upload_url)
@@ -466,42 +908,181 @@ class SlidingBuffer(object):
     buffer including all deleted data. Additionally the class implements
     __len__() which will report the size of the actual underlying buffer.
 
+    Data is held as a deque of segments. Large writes are kept as segments of
+    their own and small writes are coalesced into segments of up to
+    ``_MAX_COALESCED_SEGMENT_SIZE`` bytes, so `flush()` releases consumed
+    segments (or slices a partially consumed one) without copying the unread
+    remainder.
+
+    If ``spill_threshold`` is set, writes that would take the data held in
+    memory beyond that many bytes go to a temporary file instead. Each
+    temporary file backs a single segment and is deleted once that segment has
+    been consumed and flushed. Resumable uploads send chunks held in a
+    temporary file straight from the file, via `_read_file_chunk()`.
+
+    Buffer operations are serialized by a lock, so one thread may write to the
+    buffer while another reads from it, as BlobWriter does in background upload
+    mode.
+
     This class does not attempt to implement the entire Python I/O interface.
+
+    :type spill_threshold: int
+    :param spill_threshold:
+        (Optional) The maximum number of bytes to hold in memory. Additional
+        data is written to temporary files. The default of None keeps all
+        data in memory.
     """
 
-    def __init__(self):
-        self._buffer = io.BytesIO()
+    def __init__(self, spill_threshold=None):
+        self._segments = collections.deque()
+        # Open segment that writes are appended to, or None.
+        self._tail = None
+        # Absolute offset of the first byte still held in _segments.
+        self._flushed = 0
+        self._size = 0
+        self._memory_size = 0
+        self._spill_threshold = spill_threshold
         self._cursor = 0
+        self._closed = False
+        self._lock = threading.Lock()
 
     def write(self, b):
         """Append to the end of the buffer without changing the position."""
-        self._checkClosed()  # Raises ValueError if closed.
-
-        bookmark = self._buffer.tell()
-        self._buffer.seek(0, io.SEEK_END)
-        pos = self._buffer.write(b)
-        self._buffer.seek(bookmark)
-        return pos
+        with self._lock:
+            self._checkClosed()  # Raises ValueError if closed.
+
+            size = memoryview(b).nbytes
+            if not size:
+                return 0
+
+            if (
+                self._spill_threshold is not None
+                and self._memory_size + size > self._spill_threshold
+            ):
+                if not isinstance(self._tail, _SpilledSegment):
+                    self._tail = _SpilledSegment(tempfile.TemporaryFile())
+                    self._segments.append(self._tail)
+                self._tail.append(b)
+            elif size < _MAX_COALESCED_SEGMENT_SIZE:
+                if (
+                    not isinstance(self._tail, bytearray)
+                    or len(self._tail) >= _MAX_COALESCED_SEGMENT_SIZE
+                ):
+                    self._tail = bytearray()
+                    self._segments.append(self._tail)
+                self._tail += b
+                self._memory_size += size
+            else:
+                # Copy, as the caller is free to reuse a mutable buffer. bytes()
+                # returns immutable bytes objects as they are.
+                self._segments.append(bytes(b))
+                self._tail = None
+                self._memory_size += size
+            self._size += size
+            return size
 
     def read(self, size=-1):
         """Read and move the cursor."""
-        self._checkClosed()  # Raises ValueError if closed.
-
-        data = self._buffer.read(size)
-        self._cursor += len(data)
-        return data
+        with self._lock:
+            self._checkClosed()  # Raises ValueError if closed.
+
+            offset = self._cursor - self._flushed
+            available = self._size - offset
+            if size is None or size < 0 or size > available:
+                size = available
+
+            pieces = []
+            views = []
+            remaining = size
+            for segment in self._segments:
+                if not remaining:
+                    break
+                if offset >= len(segment):
+                    offset -= len(segment)
+                    continue
+                length = min(len(segment) - offset, remaining)
+                if isinstance(segment, _SpilledSegment):
+                    piece = segment.read(offset, length)
+                else:
+                    piece = memoryview(segment)[offset : offset + length]
+                    views.append(piece)
+                pieces.append(piece)
+                remaining -= length
+                offset = 0
+
+            data = b"".join(pieces)
+            # Release views explicitly, as a bytearray segment with exported
+            # buffers can't be resized by a subsequent write().
+            for view in views:
+                view.release()
+            self._cursor += len(data)
+            return data
+
+    def _read_file_chunk(self, size):
+        """Read and move the cursor, if the data is held in a temporary file.
+
+        :type size: int
+        :param size: The maximum number of bytes to read.
+
+        :rtype: :class:`~google.cloud.storage._media._upload._FileChunk`
+        :returns: A memory-mapped chunk of the temporary file, or None if the
+                  data is not all held in a single one; ``read()`` must then
+                  be used instead.
+        """
+        with self._lock:
+            self._checkClosed()  # Raises ValueError if closed.
+
+            offset = self._cursor - self._flushed
+            size = min(size, self._size - offset)
+            if size <= 0:
+                return None
+            for segment in self._segments:
+                if offset < len(segment):
+                    break
+                offset -= len(segment)
+            if not isinstance(segment, _SpilledSegment):
+                return None
+            if offset + size > len(segment):
+                return None
+
+            chunk = segment.file_chunk(offset, size)
+            self._cursor += size
+            return chunk
 
     def flush(self):
         """Delete already-read data (all data to the left of the position)."""
-        self._checkClosed()  # Raises ValueError if closed.
-
-        # BytesIO can't be deleted from the left, so save any leftover, unread
-        # data and truncate at 0, then readd leftover data.
-        leftover = self._buffer.read()
-        self._buffer.seek(0)
-        self._buffer.truncate(0)
-        self._buffer.write(leftover)
-        self._buffer.seek(0)
+        with self._lock:
+            self._checkClosed()  # Raises ValueError if closed.
+
+            offset = self._cursor - self._flushed
+            while self._segments and offset >= len(self._segments[0]):
+                segment = self._segments.popleft()
+                self._release(segment)
+                offset -= len(segment)
+                self._flushed += len(segment)
+                self._size -= len(segment)
+
+            if offset:
+                # Slice the partially consumed segment without copying it.
+                segment = self._segments[0]
+                if segment is self._tail:
+                    self._tail = None
+                if isinstance(segment, _SpilledSegment):
+                    self._segments[0] = segment.sliced(offset)
+                else:
+                    self._segments[0] = memoryview(segment)[offset:]
+                    self._memory_size -= offset
+                self._flushed += offset
+                self._size -= offset
+
+    def _release(self, segment):
+        """Forget a segment removed from the buffer."""
+        if segment is self._tail:
+            self._tail = None
+        if isinstance(segment, _SpilledSegment):
+            segment.close()
+        else:
+            self._memory_size -= len(segment)
 
     def tell(self):
         """Report how many bytes have been read from the buffer in total."""
@@ -511,41 +1092,72 @@ class SlidingBuffer(object):
         """Seek to a position (backwards only) within the internal buffer.
 
         This implementation of seek() verifies that the seek destination is
-        contained in _buffer. It will raise ValueError if the destination byte
-        has already been purged from the buffer.
+        contained in the buffer. It will raise ValueError if the destination
+        byte has already been purged from the buffer.
 
         The "whence" argument is not supported in this implementation.
         """
-        self._checkClosed()  # Raises ValueError if closed.
+        with self._lock:
+            self._checkClosed()  # Raises ValueError if closed.
 
-        buffer_initial_pos = self._buffer.tell()
-        difference = pos - self._cursor
-        buffer_seek_result = self._buffer.seek(difference, io.SEEK_CUR)
-        if (
-            not buffer_seek_result - buffer_initial_pos == difference
-            or pos > self._cursor
-        ):
-            # The seek did not arrive at the expected byte because the internal
-            # buffer does not (or no longer) contains the byte. Reset and raise.
-            self._buffer.seek(buffer_initial_pos)
-            raise ValueError("Cannot seek() to that value.")
-
-        self._cursor = pos
-        return self._cursor
+            if not self._flushed <= pos <= self._cursor:
+                # The buffer does not (or no longer) contain the byte.
+                raise ValueError("Cannot seek() to that value.")
+
+            self._cursor = pos
+            return self._cursor
 
     def __len__(self):
-        """Determine the size of the buffer by seeking to the end."""
-        bookmark = self._buffer.tell()
-        length = self._buffer.seek(0, io.SEEK_END)
-        self._buffer.seek(bookmark)
-        return length
+        """Report the number of bytes held by the buffer."""
+        return self._size
 
     def close(self):
-        return self._buffer.close()
+        with self._lock:
+            while self._segments:
+                self._release(self._segments.popleft())
+            self._size = 0
+            self._closed = True
 
     def _checkClosed(self):
-        return self._buffer._checkClosed()
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
 
     @property
     def closed(self):
-        return self._buffer.closed
+        return self._closed
+
+
+class _SpilledSegment(object):
+    """A SlidingBuffer segment held in a temporary file.
+
+    The segment covers the file from ``start`` to its end. Slicing it returns
+    a new segment sharing the file, which is closed (and so deleted) by
+    close().
+    """
+
+    def __init__(self, file, start=0, length=0):
+        self._file = file
+        self._start = start
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def append(self, b):
+        self._file.seek(self._start + self._length)
+        self._length += self._file.write(b)
+
+    def read(self, offset, size):
+        self._file.seek(self._start + offset)
+        return self._file.read(size)
+
+    def file_chunk(self, offset, size):
+        # Writes may still be buffered by the file object.
+        self._file.flush()
+        return _FileChunk(self._file.fileno(), self._start + offset, size)
+
+    def sliced(self, offset):
+        return _SpilledSegment(self._file, self._start + offset, self._length - offset)
+
+    def close(self):
+        self._file.close()
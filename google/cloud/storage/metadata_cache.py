@@ -0,0 +1,200 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-memory cache of object metadata, used by Client for repeated lookups."""
+
+import collections
+import copy
+import threading
+import time
+
+from google.cloud.exceptions import NotFound
+
+DEFAULT_TTL = 60.0  # seconds
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class MetadataCache(object):
+    """A time- and size-bounded cache of object metadata lookups.
+
+    Passed as ``metadata_cache`` to :class:`~google.cloud.storage.client.Client`,
+    it caches the responses to the metadata requests made by
+    :meth:`Bucket.get_blob <google.cloud.storage.bucket.Bucket.get_blob>`,
+    :meth:`Blob.reload <google.cloud.storage.blob.Blob.reload>` and
+    :meth:`Blob.exists <google.cloud.storage.blob.Blob.exists>`, so that
+    repeated lookups of the same object are answered without a request:
+
+    .. code-block:: python
+
+        client = Client(metadata_cache=MetadataCache(ttl=300))
+        blob = client.bucket("my-bucket").get_blob("config.json")
+
+    Entries are keyed by bucket name, object name and the lookup's query
+    parameters (which include any ``generation``) and headers, and expire
+    ``ttl`` seconds after they were fetched. The least recently used entries
+    are evicted to keep at most ``max_entries``.
+
+    Writes made through the client -- uploads, ``patch``, ``update``,
+    ``delete``, ``rewrite``, ``compose`` and ACL changes -- invalidate the
+    entries of the objects they write. Changes made by other clients are
+    only seen once the entries expire, so ``ttl`` bounds how stale a lookup
+    can be; the cache suits objects which are rarely overwritten.
+
+    :type ttl: float
+    :param ttl:
+        (Optional) The number of seconds for which entries are kept. The
+        default is 60 seconds.
+
+    :type max_entries: int
+    :param max_entries:
+        (Optional) The number of entries above which the least recently used
+        entries are evicted. The default is 10000.
+
+    :type cache_not_found: bool
+    :param cache_not_found:
+        (Optional) If True, the default, lookups of objects which do not
+        exist are cached too, and raise
+        :class:`~google.cloud.exceptions.NotFound` until they expire.
+    """
+
+    def __init__(
+        self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES, cache_not_found=True
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer.")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cache_not_found = cache_not_found
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Maps (bucket_name, blob_name, key) to (expiry, response or error).
+        self._entries = collections.OrderedDict()
+        # Maps (bucket_name, blob_name) to the keys of its entries.
+        self._keys_by_object = collections.defaultdict(set)
+        self._epoch = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def epoch(self):
+        """A counter which changes whenever entries are invalidated.
+
+        Read it before fetching a value to be stored with :meth:`put`.
+
+        :rtype: int
+        :returns: The current epoch.
+        """
+        return self._epoch
+
+    def get(self, bucket_name, blob_name, key):
+        """Look up a cached response.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the bucket containing the object.
+
+        :type blob_name: str
+        :param blob_name: The name of the object.
+
+        :type key: str
+        :param key: Identifies the lookup among those of the object.
+
+        :rtype: dict or ``NoneType``
+        :returns: A copy of the cached response, or ``None`` if there is no
+                  unexpired entry.
+
+        :raises: :class:`~google.cloud.exceptions.NotFound` if the object
+            was cached as not found.
+        """
+        entry_key = (bucket_name, blob_name, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(entry_key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+            value = entry[1]
+
+        if isinstance(value, NotFound):
+            raise copy.copy(value).with_traceback(None)
+        return copy.deepcopy(value)
+
+    def put(self, bucket_name, blob_name, key, value, epoch=None):
+        """Cache a response, or a :class:`~google.cloud.exceptions.NotFound`.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the bucket containing the object.
+
+        :type blob_name: str
+        :param blob_name: The name of the object.
+
+        :type key: str
+        :param key: Identifies the lookup among those of the object.
+
+        :type value: dict or :class:`~google.cloud.exceptions.NotFound`
+        :param value: The response, or the error, of the lookup.
+
+        :type epoch: int
+        :param epoch:
+            (Optional) The :attr:`epoch` read before the lookup was made. If
+            entries have been invalidated since, the value may be stale, and
+            is not cached.
+        """
+        if isinstance(value, NotFound) and not self.cache_not_found:
+            return
+        entry_key = (bucket_name, blob_name, key)
+        with self._lock:
+            if epoch is not None and epoch != self._epoch:
+                return
+            self._entries[entry_key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(entry_key)
+            self._keys_by_object[(bucket_name, blob_name)].add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, bucket_name, blob_name):
+        """Remove the entries of an object.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the bucket containing the object.
+
+        :type blob_name: str
+        :param blob_name: The name of the object.
+        """
+        with self._lock:
+            self._epoch += 1
+            keys = self._keys_by_object.pop((bucket_name, blob_name), ())
+            for key in keys:
+                del self._entries[(bucket_name, blob_name, key)]
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+            self._keys_by_object.clear()
+
+    def _remove(self, entry_key):
+        bucket_name, blob_name, key = entry_key
+        del self._entries[entry_key]
+        keys = self._keys_by_object[(bucket_name, blob_name)]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_object[(bucket_name, blob_name)]
@@ -17,7 +17,11 @@
 See [Retry Strategy for Google Cloud Storage](https://cloud.google.com/storage/docs/retry-strategy#client-libraries)
 """
 
+import functools
 import http
+import inspect
+import threading
+import time
 
 import requests
 import requests.exceptions as requests_exceptions
@@ -26,6 +30,7 @@ import urllib3
 from google.api_core import exceptions as api_exceptions
 from google.api_core import retry
 from google.auth import exceptions as auth_exceptions
+from google.cloud.storage.exceptions import CircuitBreakerOpen
 from google.cloud.storage.exceptions import InvalidResponse
 
 
@@ -49,6 +54,23 @@ _RETRYABLE_TYPES = (
 )
 
 
+# Errors of requests which got no response from the service.
+_TRANSPORT_ERROR_TYPES = (
+    ConnectionError,
+    TimeoutError,
+    requests.ConnectionError,
+    requests_exceptions.ChunkedEncodingError,
+    requests_exceptions.Timeout,
+    http.client.BadStatusLine,
+    http.client.IncompleteRead,
+    http.client.ResponseNotReady,
+    urllib3.exceptions.PoolError,
+    urllib3.exceptions.ProtocolError,
+    urllib3.exceptions.SSLError,
+    urllib3.exceptions.TimeoutError,
+)
+
+
 _RETRYABLE_STATUS_CODES = (
     http.client.TOO_MANY_REQUESTS,  # 429
     http.client.REQUEST_TIMEOUT,  # 408
@@ -186,3 +208,285 @@ This retry setting will retry all _RETRYABLE_TYPES and any status codes from
 _ADDITIONAL_RETRYABLE_STATUS_CODES, but only if the request included an
 ``ETAG`` entry in its payload.
 """
+
+
+class RetryBudget(object):
+    """Limit the retries of a client's calls to a share of its requests.
+
+    Each call retries independently, so during an outage every concurrent
+    call backs off and retries, multiplying the load on the service as it
+    recovers. Passed as ``retry_budget`` to
+    :class:`~google.cloud.storage.client.Client`, a budget keeps a balance of
+    retries shared by all its calls: each successful request adds ``ratio``
+    to the balance, up to ``max_tokens``, and each retry takes one. While
+    the balance is below one, failed requests are not retried, and raise
+    their error.
+
+    :type ratio: float
+    :param ratio:
+        (Optional) The number of retries earned by each successful request.
+        The default, 0.1, allows retries of up to 10% of the requests.
+
+    :type max_tokens: float
+    :param max_tokens:
+        (Optional) The largest balance, which is also the initial one. It is
+        the number of retries which may be made in a burst, such as when no
+        requests have succeeded recently. Defaults to 100.
+    """
+
+    def __init__(self, ratio=0.1, max_tokens=100):
+        if ratio < 0:
+            raise ValueError("ratio must not be negative.")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1.")
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.successes = 0
+        self.retries = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._tokens = float(max_tokens)
+
+    @property
+    def tokens(self):
+        """The number of retries which may currently be made.
+
+        :rtype: float
+        :returns: The balance of the budget.
+        """
+        return self._tokens
+
+    def record_success(self):
+        """Credit the budget for a successful request."""
+        with self._lock:
+            self.successes += 1
+            self._tokens = min(self._tokens + self.ratio, self.max_tokens)
+
+    def acquire(self):
+        """Take a retry from the budget.
+
+        :rtype: bool
+        :returns: True if the retry may be made, or False if the budget is
+                  exhausted.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                self.rejected += 1
+                return False
+            self._tokens -= 1
+            self.retries += 1
+            return True
+
+
+class CircuitBreaker(object):
+    """Fail calls fast after sustained server errors.
+
+    Passed as ``circuit_breaker`` to
+    :class:`~google.cloud.storage.client.Client`, a breaker counts the
+    consecutive requests of the client which fail with a 429 or 5xx status,
+    or without a response, such as after a connection reset or a timeout.
+    Only a success or another response, such as a 404, resets the count;
+    other errors leave it as it is. After ``failure_threshold`` failures,
+    the breaker opens: for ``reset_timeout`` seconds, calls raise
+    :class:`~google.cloud.storage.exceptions.CircuitBreakerOpen` without
+    making a request, and failed requests are not retried. Then one request
+    is let through to probe the service: if it succeeds, or gets another
+    response, the breaker closes, and if it fails it opens again.
+
+    :type failure_threshold: int
+    :param failure_threshold:
+        (Optional) The number of consecutive failures which open the
+        breaker. Defaults to 20.
+
+    :type reset_timeout: float
+    :param reset_timeout:
+        (Optional) The number of seconds for which the breaker stays open
+        before probing the service. Defaults to 30.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=20, reset_timeout=30.0):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1.")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._changed_at = 0.0
+
+    @property
+    def state(self):
+        """The state of the breaker.
+
+        :rtype: str
+        :returns: :attr:`CLOSED`, :attr:`OPEN` or :attr:`HALF_OPEN`.
+        """
+        return self._state
+
+    def allow_request(self):
+        """Decide whether a request may be made.
+
+        Once ``reset_timeout`` seconds have passed since the breaker opened,
+        or since the last probe started without completing, the request is
+        let through as a probe.
+
+        :rtype: bool
+        :returns: False if the request should fail fast.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if time.monotonic() - self._changed_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._changed_at = time.monotonic()
+                return True
+            self.rejected += 1
+            return False
+
+    def allow_retry(self):
+        """Decide whether a failed request may be retried.
+
+        :rtype: bool
+        :returns: False while the breaker is open.
+        """
+        return self._state != self.OPEN
+
+    def record(self, exc=None):
+        """Record the outcome of a request.
+
+        :type exc: Exception
+        :param exc: (Optional) The error of the request, if it failed.
+        """
+        failed = exc is not None and (_is_overloaded(exc) or _is_transport_error(exc))
+        with self._lock:
+            if not failed:
+                if exc is None or _status_code(exc) is not None:
+                    # The service answered.
+                    self.failures = 0
+                    self._state = self.CLOSED
+                return
+            self.failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self.failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._changed_at = time.monotonic()
+                self.opened += 1
+
+
+def _status_code(exc):
+    """Return the status code of the response an error was raised for."""
+    if isinstance(exc, api_exceptions.GoogleAPICallError):
+        return exc.code
+    elif isinstance(exc, InvalidResponse):
+        return exc.response.status_code
+    return None
+
+
+def _is_overloaded(exc):
+    """Return True if an error shows the service failing or overloaded."""
+    code = _status_code(exc)
+    return code is not None and (code == http.client.TOO_MANY_REQUESTS or code >= 500)
+
+
+def _is_transport_error(exc):
+    """Return True if a request failed without a response."""
+    if isinstance(exc, auth_exceptions.TransportError) and exc.args:
+        return _is_transport_error(exc.args[0])
+    return isinstance(exc, _TRANSPORT_ERROR_TYPES)
+
+
+class _LimitedRetry(object):
+    """A retry policy honoring a client's retry budget and circuit breaker.
+
+    Like a :class:`google.api_core.retry.Retry`, calling it with a function
+    returns a function which retries it. Requests are counted by the budget
+    and the breaker even if ``retry_policy`` is None.
+    """
+
+    def __init__(self, retry_policy, retry_budget=None, circuit_breaker=None):
+        self._retry_policy = retry_policy
+        self._retry_budget = retry_budget
+        self._circuit_breaker = circuit_breaker
+
+    def _predicate(self, exc):
+        if not self._retry_policy._predicate(exc):
+            return False
+        breaker = self._circuit_breaker
+        if breaker is not None and not breaker.allow_retry():
+            return False
+        return self._retry_budget is None or self._retry_budget.acquire()
+
+    def _before_request(self):
+        breaker = self._circuit_breaker
+        if breaker is not None and not breaker.allow_request():
+            raise CircuitBreakerOpen(
+                "Not sending the request: the circuit breaker is open after "
+                "repeated server errors."
+            )
+
+    def _after_request(self, exc=None):
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record(exc)
+        if exc is None and self._retry_budget is not None:
+            self._retry_budget.record_success()
+
+    def _guard(self, func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def guarded(*args, **kwargs):
+                self._before_request()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as exc:
+                    self._after_request(exc)
+                    raise
+                self._after_request()
+                return result
+
+        else:
+
+            @functools.wraps(func)
+            def guarded(*args, **kwargs):
+                self._before_request()
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as exc:
+                    self._after_request(exc)
+                    raise
+                self._after_request()
+                return result
+
+        return guarded
+
+    def __call__(self, func):
+        guarded = self._guard(func)
+        if self._retry_policy is None:
+            return guarded
+        return self._retry_policy.with_predicate(self._predicate)(guarded)
+
+
+def _limit_retries(retry_policy, client):
+    """Apply the retry budget and circuit breaker of a client, if any.
+
+    :type retry_policy: :class:`google.api_core.retry.Retry`
+    :param retry_policy: The retry policy of a call, or None.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: The client making the call.
+
+    :returns: ``retry_policy``, or a policy which also honors the client's
+              budget and breaker.
+    """
+    retry_budget = getattr(client, "_retry_budget", None)
+    circuit_breaker = getattr(client, "_circuit_breaker", None)
+    if retry_budget is None and circuit_breaker is None:
+        return retry_policy
+    return _LimitedRetry(retry_policy, retry_budget, circuit_breaker)
@@ -227,6 +227,8 @@ def upload_many(
                 raise ValueError(
                     "Passing in a file object is only supported by the THREAD worker type. Please either select THREAD workers, or pass in filenames only."
                 )
+            if not needs_pickling:
+                _ensure_connection_pool_size(blob.client, max_workers)
 
             futures.append(
                 executor.submit(
@@ -394,6 +396,8 @@ def download_many(
             if skip_if_exists and isinstance(path_or_file, str):
                 if os.path.isfile(path_or_file):
                     continue
+            if not needs_pickling:
+                _ensure_connection_pool_size(blob.client, max_workers)
 
             futures.append(
                 executor.submit(
@@ -990,6 +994,8 @@ def download_chunks_concurrently(
     pool_class, needs_pickling = _get_pool_class_and_requirements(worker_type)
     # Pickle the blob ahead of time (just once, not once per chunk) if needed.
     maybe_pickled_blob = _pickle_client(blob) if needs_pickling else blob
+    if not needs_pickling:
+        _ensure_connection_pool_size(client, max_workers)
 
     futures = []
 
@@ -1176,32 +1182,16 @@ def upload_chunks_concurrently(
     :raises: :exc:`concurrent.futures.TimeoutError` if deadline is exceeded.
     """
 
-    bucket = blob.bucket
     client = blob.client
+    if worker_type == THREAD:
+        # Before the transport is first used, so no connections are dropped.
+        _ensure_connection_pool_size(client, max_workers)
     transport = blob._get_transport(client)
 
-    hostname = _get_host_name(client._connection)
-    url = "{hostname}/{bucket}/{blob}".format(
-        hostname=hostname, bucket=bucket.name, blob=_quote(blob.name)
-    )
-
-    base_headers, object_metadata, content_type = blob._get_upload_arguments(
-        client, content_type, filename=filename, command="tm.upload_sharded"
+    container, headers, content_type = _prepare_xml_mpu_container(
+        blob, content_type, filename, retry, command="tm.upload_sharded"
     )
-    headers = {**base_headers, **_headers_from_metadata(object_metadata)}
-
-    if blob.user_project is not None:
-        headers["x-goog-user-project"] = blob.user_project
-
-    # When a Customer Managed Encryption Key is used to encrypt Cloud Storage object
-    # at rest, object resource metadata will store the version of the Key Management
-    # Service cryptographic material. If a Blob instance with KMS Key metadata set is
-    # used to upload a new version of the object then the existing kmsKeyName version
-    # value can't be used in the upload request and the client instead ignores it.
-    if blob.kms_key_name is not None and "cryptoKeyVersions" not in blob.kms_key_name:
-        headers["x-goog-encryption-kms-key-name"] = blob.kms_key_name
-
-    container = XMLMPUContainer(url, filename, headers=headers, retry=retry)
+    url = container.upload_url
 
     container.initiate(transport=transport, content_type=content_type)
     upload_id = container.upload_id
@@ -1250,6 +1240,43 @@ def upload_chunks_concurrently(
     except Exception:
         container.cancel(blob._get_transport(client))
         raise
+    finally:
+        # Even a failed upload may have written the object.
+        client._invalidate_object_metadata(blob.path)
+
+
+def _prepare_xml_mpu_container(blob, content_type, filename, retry, command=None):
+    """Helper function to build an XML MPU container for a blob.
+
+    Returns a tuple of the (not yet initiated) container, the headers to send
+    with each part, and the resolved content type."""
+
+    bucket = blob.bucket
+    client = blob.client
+
+    hostname = _get_host_name(client._connection)
+    url = "{hostname}/{bucket}/{blob}".format(
+        hostname=hostname, bucket=bucket.name, blob=_quote(blob.name)
+    )
+
+    base_headers, object_metadata, content_type = blob._get_upload_arguments(
+        client, content_type, filename=filename, command=command
+    )
+    headers = {**base_headers, **_headers_from_metadata(object_metadata)}
+
+    if blob.user_project is not None:
+        headers["x-goog-user-project"] = blob.user_project
+
+    # When a Customer Managed Encryption Key is used to encrypt Cloud Storage object
+    # at rest, object resource metadata will store the version of the Key Management
+    # Service cryptographic material. If a Blob instance with KMS Key metadata set is
+    # used to upload a new version of the object then the existing kmsKeyName version
+    # value can't be used in the upload request and the client instead ignores it.
+    if blob.kms_key_name is not None and "cryptoKeyVersions" not in blob.kms_key_name:
+        headers["x-goog-encryption-kms-key-name"] = blob.kms_key_name
+
+    container = XMLMPUContainer(url, filename, headers=headers, retry=retry)
+    return container, headers, content_type
 
 
 def _upload_part(
@@ -1417,6 +1444,16 @@ def _pickle_client(obj):
     return f.getvalue()
 
 
+def _ensure_connection_pool_size(client, max_workers):
+    """Make sure a client keeps enough connections open for THREAD workers.
+
+    Without this, workers beyond the default pool size of 10 connections per
+    host would each open (and then discard) a new connection per request."""
+
+    if isinstance(client, Client):
+        client._ensure_connection_pool_maxsize(max_workers)
+
+
 def _get_pool_class_and_requirements(worker_type):
     """Returns the pool class, and whether the pool requires pickled Blobs."""
 
@@ -0,0 +1,162 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local store of resumable upload sessions, so uploads survive restarts."""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+
+_TEMP_FILE_PREFIX = ".tmp-"
+_SESSION_FILE_SUFFIX = ".json"
+
+
+class UploadSessionStore(object):
+    """A directory of in-progress resumable upload sessions for local files.
+
+    Pass an instance as ``upload_session_store`` to
+    :meth:`~google.cloud.storage.blob.Blob.upload_from_filename`. While a
+    resumable upload is in progress, the session URI and the running
+    checksum are saved after every chunk, keyed by bucket, blob name and file
+    path. If the process is restarted and the same upload is attempted again,
+    the saved session is continued from the offset the server has committed
+    instead of starting over:
+
+    .. code-block:: python
+
+        store = UploadSessionStore("/var/lib/my-job/upload-sessions")
+        blob.upload_from_filename("/data/huge.bin", upload_session_store=store)
+
+    A saved session is only used if the file still has the same path, size
+    and modification time; otherwise it is discarded and a new session is
+    started. Sessions are removed once the upload completes.
+
+    .. note::
+       A session URI authorizes uploads to the object without further
+       credentials, so the directory should only be readable by the user
+       running the upload. Session files are created with owner-only
+       permissions.
+
+    :type directory: str
+    :param directory:
+        The directory to store sessions in. It is created if it does not
+        exist.
+    """
+
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+
+    def _session_path(self, bucket_name, blob_name, filename):
+        key = json.dumps([bucket_name, blob_name, os.path.abspath(filename)])
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + _SESSION_FILE_SUFFIX)
+
+    @staticmethod
+    def _file_identity(filename):
+        file_stat = os.stat(filename)
+        return {
+            "path": os.path.abspath(filename),
+            "size": file_stat.st_size,
+            "mtime_ns": file_stat.st_mtime_ns,
+        }
+
+    def get(self, bucket_name, blob_name, filename):
+        """Return the saved session for uploading a file, if still usable.
+
+        A session saved for a different version of the file is deleted.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the bucket being uploaded to.
+
+        :type blob_name: str
+        :param blob_name: The name of the blob being uploaded.
+
+        :type filename: str
+        :param filename: The path of the file being uploaded.
+
+        :rtype: dict or ``NoneType``
+        :returns:
+            The session, with keys ``resumable_url`` and ``checksum_state``,
+            or ``None`` if there is no usable session.
+        """
+        path = self._session_path(bucket_name, blob_name, filename)
+        try:
+            with open(path, "r", encoding="utf-8") as session_file:
+                session = json.load(session_file)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            # A corrupt session cannot be resumed.
+            self.delete(bucket_name, blob_name, filename)
+            return None
+
+        if session.get("file") != self._file_identity(filename):
+            self.delete(bucket_name, blob_name, filename)
+            return None
+        return session
+
+    def put(self, bucket_name, blob_name, filename, resumable_url, checksum_state=None):
+        """Save the session for uploading a file.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the bucket being uploaded to.
+
+        :type blob_name: str
+        :param blob_name: The name of the blob being uploaded.
+
+        :type filename: str
+        :param filename: The path of the file being uploaded.
+
+        :type resumable_url: str
+        :param resumable_url: The URI of the resumable upload session.
+
+        :type checksum_state: dict
+        :param checksum_state:
+            (Optional) The running checksum of the bytes uploaded so far, as
+            given by ``ResumableUpload.checksum_state``.
+        """
+        session = {
+            "resumable_url": resumable_url,
+            "checksum_state": checksum_state,
+            "file": self._file_identity(filename),
+        }
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.directory, prefix=_TEMP_FILE_PREFIX, text=True
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                json.dump(session, temp_file)
+            os.replace(temp_path, self._session_path(bucket_name, blob_name, filename))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+    def delete(self, bucket_name, blob_name, filename):
+        """Remove the saved session for uploading a file, if any.
+
+        :type bucket_name: str
+        :param bucket_name: The name of the bucket being uploaded to.
+
+        :type blob_name: str
+        :param blob_name: The name of the blob being uploaded.
+
+        :type filename: str
+        :param filename: The path of the file being uploaded.
+        """
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._session_path(bucket_name, blob_name, filename))
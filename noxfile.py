@@ -120,7 +120,7 @@ def default(session, install_extras=True):
     )
 
     if install_extras:
-        session.install("opentelemetry-api", "opentelemetry-sdk")
+        session.install("opentelemetry-api", "opentelemetry-sdk", "httpx[http2]")
 
     session.install("-e", ".", "-c", constraints_path)
 
@@ -63,6 +63,12 @@ extras = {
     "tracing": [
         "opentelemetry-api >= 1.1.0, < 2.0.0",
     ],
+    "http2": [
+        "httpx[http2] >= 0.23.0, < 1.0.0",
+    ],
+    "asyncio": [
+        "httpx >= 0.23.0, < 1.0.0",
+    ],
     "testing": [
         "google-cloud-testutils",
         "numpy",
@@ -22,11 +22,13 @@ from google.cloud.storage._media import _helpers
 from google.cloud.storage._media.requests import download as download_mod
 from google.cloud.storage._media.requests import _request_helpers
 from google.cloud.storage.exceptions import DataCorruption
+from google.cloud.storage.exceptions import InvalidResponse
 
 
 URL_PREFIX = "https://www.googleapis.com/download/storage/v1/b/{BUCKET}/o/"
 EXAMPLE_URL = URL_PREFIX + "{OBJECT}?alt=media"
 EXPECTED_TIMEOUT = (61, 60)
+ONE_MB = 1024 * 1024
 
 
 class TestDownload(object):
@@ -51,6 +53,18 @@ class TestDownload(object):
             chunk_size=_request_helpers._SINGLE_GET_CHUNK_SIZE, decode_unicode=False
         )
 
+    def test__write_to_stream_w_buffer_size(self):
+        stream = io.BytesIO()
+        download = download_mod.Download(EXAMPLE_URL, stream=stream, buffer_size=4)
+
+        response = _mock_response(chunks=[b"abcd", b"ef"], headers={})
+        download._write_to_stream(response)
+
+        assert stream.getvalue() == b"abcdef"
+        response.iter_content.assert_called_once_with(
+            chunk_size=4, decode_unicode=False
+        )
+
     def test__write_to_stream_empty_chunks(self):
         stream = io.BytesIO()
         download = download_mod.Download(EXAMPLE_URL, stream=stream)
@@ -591,6 +605,16 @@ class TestRawDownload(object):
             _request_helpers._SINGLE_GET_CHUNK_SIZE, decode_content=False
         )
 
+    def test__write_to_stream_w_buffer_size(self):
+        stream = io.BytesIO()
+        download = download_mod.RawDownload(EXAMPLE_URL, stream=stream, buffer_size=4)
+
+        response = _mock_raw_response(chunks=[b"abcd", b"ef"], headers={})
+        download._write_to_stream(response)
+
+        assert stream.getvalue() == b"abcdef"
+        response.raw.stream.assert_called_once_with(4, decode_content=False)
+
     @pytest.mark.parametrize("checksum", ["auto", "md5", "crc32c", None])
     def test__write_to_stream_with_hash_check_success(self, checksum):
         stream = io.BytesIO()
@@ -1176,6 +1200,36 @@ class TestChunkedDownload(object):
             timeout=14.7,
         )
 
+    def test_consume_next_chunk_adaptive(self):
+        stream = io.BytesIO()
+        data = b"x" * ONE_MB
+        download = download_mod.ChunkedDownload(
+            EXAMPLE_URL, 8 * ONE_MB, stream, adaptive_chunk_size=True
+        )
+        transport = self._mock_transport(0, ONE_MB, 4 * ONE_MB, content=data)
+
+        download.consume_next_chunk(transport)
+
+        range_bytes = "bytes={:d}-{:d}".format(0, ONE_MB - 1)
+        assert transport.request.call_args.kwargs["headers"] == {"range": range_bytes}
+        assert download.chunk_size == 2 * ONE_MB
+        assert download.chunk_size_decision["action"] == "grow"
+
+    def test_consume_next_chunk_adaptive_failure(self):
+        download = download_mod.ChunkedDownload(
+            EXAMPLE_URL, 8 * ONE_MB, io.BytesIO(), adaptive_chunk_size=True
+        )
+        transport = mock.Mock(spec=["request"])
+        transport.request.return_value = self._mock_response(
+            0, 9, 10, content=b"", status_code=int(http.client.NOT_FOUND)
+        )
+
+        with pytest.raises(InvalidResponse):
+            download.consume_next_chunk(transport)
+
+        assert download.chunk_size == ONE_MB // 2
+        assert download.chunk_size_decision["action"] == "shrink"
+
 
 class TestRawChunkedDownload(object):
     @staticmethod
@@ -1285,6 +1339,52 @@ class TestRawChunkedDownload(object):
         assert download.total_bytes == total_bytes
 
 
+class Test__hash_inline(object):
+    @pytest.mark.parametrize(
+        "single_shot_download,buffer_size,headers,expected",
+        [
+            (True, None, {}, True),
+            (False, None, {}, False),
+            (False, None, {"content-length": "junk"}, False),
+            (False, None, {"content-length": str(ONE_MB)}, True),
+            (False, None, {"content-length": str(ONE_MB + 1)}, False),
+            (False, 1024, {"content-length": "1024"}, True),
+            (False, 1024, {"content-length": "1025"}, False),
+        ],
+    )
+    def test_it(self, single_shot_download, buffer_size, headers, expected):
+        response_raw = mock.Mock(headers=headers, spec=["headers"])
+
+        result = download_mod._hash_inline(
+            response_raw, single_shot_download, buffer_size
+        )
+
+        assert result is expected
+
+    @pytest.mark.parametrize("single_shot_download", [True, False])
+    def test__write_to_stream(self, single_shot_download):
+        download = download_mod.Download(
+            EXAMPLE_URL,
+            stream=io.BytesIO(),
+            checksum="md5",
+            single_shot_download=single_shot_download,
+        )
+        response = _mock_response(
+            chunks=[b"small"],
+            headers={
+                "content-length": "5",
+                "x-goog-hash": "md5=61wTmahxIRx+ftcy0V46iw==",
+            },
+        )
+
+        with mock.patch.object(
+            _helpers, "_BackgroundChecksum", wraps=_helpers._BackgroundChecksum
+        ) as background_checksum:
+            download._write_to_stream(response)
+
+        assert background_checksum.call_args.kwargs["inline"] is True
+
+
 class Test__add_decoder(object):
     def test_non_gzipped(self):
         response_raw = mock.Mock(headers={}, spec=["headers"])
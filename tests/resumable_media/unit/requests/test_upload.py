@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import base64
+import hashlib
 import http.client
 import io
 import json
@@ -20,6 +22,7 @@ import tempfile
 from unittest import mock
 
 import google.cloud.storage._media.requests.upload as upload_mod
+from google.cloud.storage.exceptions import InvalidResponse
 
 
 URL_PREFIX = "https://www.googleapis.com/upload/storage/v1/b/{BUCKET}/o"
@@ -129,10 +132,11 @@ class TestMultipartUpload(object):
         transport.request.assert_called_once_with(
             "POST",
             MULTIPART_URL,
-            data=expected_payload,
+            data=mock.ANY,
             headers=upload_headers,
             timeout=EXPECTED_TIMEOUT,
         )
+        assert bytes(transport.request.call_args.kwargs["data"]) == expected_payload
         assert upload.finished
         mock_get_boundary.assert_called_once_with()
 
@@ -169,10 +173,11 @@ class TestMultipartUpload(object):
         transport.request.assert_called_once_with(
             "POST",
             MULTIPART_URL,
-            data=expected_payload,
+            data=mock.ANY,
             headers=upload_headers,
             timeout=12.6,
         )
+        assert bytes(transport.request.call_args.kwargs["data"]) == expected_payload
         assert upload.finished
         mock_get_boundary.assert_called_once_with()
 
@@ -336,6 +341,149 @@ class TestResumableUpload(object):
             timeout=12.6,
         )
 
+    def test_transmit_next_chunk_from_file(self, filename):
+        import requests
+
+        upload = upload_mod.ResumableUpload(RESUMABLE_URL, ONE_MB)
+        # Make a fake chunk size smaller than 256 KB.
+        chunk_size = 256
+        upload._chunk_size = chunk_size
+        upload._retry_strategy = upload._retry_strategy.with_delay(
+            initial=0.0, maximum=0.0
+        )
+        upload._content_type = BASIC_CONTENT
+        upload._total_bytes = len(FILE_DATA)
+        upload._resumable_url = "http://test.invalid?upload_id=not-none"
+        response = _make_response(
+            status_code=http.client.PERMANENT_REDIRECT,
+            headers={"range": "bytes=0-{:d}".format(chunk_size - 1)},
+        )
+        bodies = []
+
+        def request(method, url, data=None, headers=None, timeout=None):
+            assert len(data) == chunk_size
+            if not bodies:
+                # Fail part of the way through sending the first attempt.
+                bodies.append(data.read(3))
+                raise requests.exceptions.ConnectionError()
+            bodies.append(data.read())
+            return response
+
+        transport = mock.Mock(spec=["request"])
+        transport.request.side_effect = request
+
+        with open(filename, "rb") as stream:
+            upload._stream = stream
+            assert upload.transmit_next_chunk(transport) is response
+
+        assert bodies == [FILE_DATA[:3], FILE_DATA[:chunk_size]]
+        assert upload._bytes_uploaded == chunk_size
+        payload = transport.request.call_args.kwargs["data"]
+        assert isinstance(payload, upload_mod._upload._FileChunk)
+        assert payload._mmap.closed
+
+    @staticmethod
+    def _adaptive_upload_in_flight(data):
+        upload = upload_mod.ResumableUpload(
+            RESUMABLE_URL, 4 * ONE_MB, adaptive_chunk_size=True
+        )
+        upload._retry_strategy = upload._retry_strategy.with_delay(
+            initial=0.0, maximum=0.0
+        )
+        upload._stream = io.BytesIO(data)
+        upload._content_type = BASIC_CONTENT
+        upload._total_bytes = len(data)
+        upload._resumable_url = "http://test.invalid?upload_id=not-none"
+        return upload
+
+    def test_transmit_next_chunk_adaptive(self):
+        upload = self._adaptive_upload_in_flight(b"x" * (3 * ONE_MB))
+        assert upload.chunk_size == ONE_MB
+        assert upload.chunk_size_decision is None
+        transport = self._chunk_mock(
+            http.client.PERMANENT_REDIRECT, {"range": "bytes=0-{:d}".format(ONE_MB - 1)}
+        )
+
+        upload.transmit_next_chunk(transport)
+
+        assert len(transport.request.call_args.kwargs["data"]) == ONE_MB
+        assert upload.chunk_size == 2 * ONE_MB
+        assert upload.chunk_size_decision["action"] == "grow"
+
+    def test_transmit_next_chunk_adaptive_retried(self):
+        import requests
+
+        upload = self._adaptive_upload_in_flight(b"x" * (3 * ONE_MB))
+        response = _make_response(
+            status_code=http.client.PERMANENT_REDIRECT,
+            headers={"range": "bytes=0-{:d}".format(ONE_MB - 1)},
+        )
+        transport = mock.Mock(spec=["request"])
+        transport.request.side_effect = [
+            requests.exceptions.ConnectionError(),
+            response,
+        ]
+
+        assert upload.transmit_next_chunk(transport) is response
+
+        assert upload.chunk_size == ONE_MB // 2
+        assert upload.chunk_size_decision["action"] == "shrink"
+
+    def test_transmit_next_chunk_adaptive_failure(self):
+        upload = self._adaptive_upload_in_flight(b"x" * (3 * ONE_MB))
+        transport = self._chunk_mock(http.client.BAD_REQUEST, {})
+
+        with pytest.raises(InvalidResponse):
+            upload.transmit_next_chunk(transport)
+
+        assert upload.chunk_size == ONE_MB // 2
+        assert upload.chunk_size_decision["action"] == "shrink"
+
+    def test_resume(self):
+        data = b"This time the data is official."
+        upload = upload_mod.ResumableUpload(RESUMABLE_URL, ONE_MB, checksum="md5")
+        stream = io.BytesIO(data)
+        resumable_url = "http://test.invalid?upload_id=big-deal"
+        transport = self._chunk_mock(
+            http.client.PERMANENT_REDIRECT, {"range": "bytes=0-9"}
+        )
+
+        ret_val = upload.resume(
+            transport, stream, resumable_url, BASIC_CONTENT, total_bytes=len(data)
+        )
+
+        assert ret_val is transport.request.return_value
+        assert upload.resumable_url == resumable_url
+        assert upload.bytes_uploaded == 10
+        assert upload.total_bytes == len(data)
+        assert not upload.invalid
+        assert stream.tell() == 10
+        assert upload._checksum_object.digest() == hashlib.md5(data[:10]).digest()
+        transport.request.assert_called_once_with(
+            "PUT",
+            resumable_url,
+            data=None,
+            headers={"content-range": "bytes */*"},
+            timeout=EXPECTED_TIMEOUT,
+        )
+
+        # The rest of the upload continues from there.
+        _, _, payload, headers = upload._prepare_request()
+        assert payload == data[10:]
+        assert headers["x-goog-hash"] == "md5={}".format(
+            base64.b64encode(hashlib.md5(data).digest()).decode("utf-8")
+        )
+
+    def test_resume_expired(self):
+        upload = upload_mod.ResumableUpload(RESUMABLE_URL, ONE_MB)
+        transport = self._chunk_mock(http.client.NOT_FOUND, {})
+
+        with pytest.raises(InvalidResponse):
+            upload.resume(
+                transport, io.BytesIO(b"data"), "http://test.invalid", BASIC_CONTENT
+            )
+        assert upload.invalid
+
     def test_recover(self):
         upload = upload_mod.ResumableUpload(RESUMABLE_URL, ONE_MB)
         upload._invalid = True  # Make sure invalid.
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import base64
+import hashlib
 import http.client
 import io
 
@@ -19,6 +21,7 @@ from unittest import mock
 import pytest  # type: ignore
 
 from google.cloud.storage._media import _download
+from google.cloud.storage.exceptions import DataCorruption
 from google.cloud.storage.exceptions import InvalidResponse
 from google.cloud.storage.retry import DEFAULT_RETRY
 
@@ -184,6 +187,38 @@ class TestChunkedDownload(object):
         with pytest.raises(ValueError):
             _download.ChunkedDownload(EXAMPLE_URL, 256, None, start=-11)
 
+    def test_constructor_adaptive_chunk_size(self):
+        chunk_size = 64 * 1024 * 1024
+        download = _download.ChunkedDownload(
+            EXAMPLE_URL, chunk_size, None, adaptive_chunk_size=True
+        )
+        # Starts small; the chunk size passed is the maximum.
+        assert download.chunk_size == 1024 * 1024
+        assert download._chunk_sizer.maximum == chunk_size
+        assert download.chunk_size_decision is None
+
+    def test__adapt_chunk_size(self):
+        download = _download.ChunkedDownload(
+            EXAMPLE_URL, 64 * 1024 * 1024, None, adaptive_chunk_size=True
+        )
+
+        download._adapt_chunk_size(1024 * 1024, 0.5)
+        assert download.chunk_size == 2 * 1024 * 1024
+        assert download.chunk_size_decision["action"] == "grow"
+        assert download._get_byte_range() == (0, 2 * 1024 * 1024 - 1)
+
+        download._adapt_chunk_size_after_failure()
+        assert download.chunk_size == 1024 * 1024
+        assert download.chunk_size_decision["action"] == "shrink"
+
+    def test__adapt_chunk_size_not_adaptive(self):
+        download = _download.ChunkedDownload(EXAMPLE_URL, 256, None)
+
+        download._adapt_chunk_size(256, 0.5)
+        download._adapt_chunk_size_after_failure()
+        assert download.chunk_size == 256
+        assert download.chunk_size_decision is None
+
     def test_bytes_downloaded_property(self):
         download = _download.ChunkedDownload(EXAMPLE_URL, 256, None)
         # Default value of @property.
@@ -594,6 +629,86 @@ class TestChunkedDownload(object):
         assert download.bytes_downloaded == 0
         assert download.total_bytes is None
 
+    def _consume_with_checksum(
+        self, data, chunk_size, x_goog_hash, stored_encoding=None, **kwargs
+    ):
+        stream = io.BytesIO()
+        download = _download.ChunkedDownload(
+            EXAMPLE_URL, chunk_size, stream, checksum="md5", **kwargs
+        )
+        _fix_up_virtual(download)
+        extra_headers = {"x-goog-hash": x_goog_hash}
+        if stored_encoding is not None:
+            extra_headers["x-goog-stored-content-encoding"] = stored_encoding
+        start = download.start
+        last = len(data) - 1 if download.end is None else download.end
+        while not download.finished:
+            end = min(start + chunk_size, last + 1) - 1
+            response = self._mock_response(
+                start,
+                end,
+                len(data),
+                content=data[start : end + 1],
+                status_code=int(http.client.PARTIAL_CONTENT),
+            )
+            response.headers.update(extra_headers)
+            # Only the first response is consulted for the expected checksum.
+            extra_headers = {}
+            download._process_response(response)
+            start = end + 1
+        return download, stream
+
+    def test__process_response_w_checksum(self):
+        data = b"abcdefghijklmnopqrstuvwxyz"
+        md5_hash = base64.b64encode(hashlib.md5(data).digest()).decode("utf-8")
+
+        download, stream = self._consume_with_checksum(data, 10, f"md5={md5_hash}")
+
+        assert download.checksum == "md5"
+        assert download._expected_checksum == md5_hash
+        assert stream.getvalue() == data
+
+    def test__process_response_w_checksum_mismatch(self):
+        data = b"abcdefghijklmnopqrstuvwxyz"
+        bad_hash = base64.b64encode(hashlib.md5(b"other").digest()).decode("utf-8")
+
+        with pytest.raises(DataCorruption) as exc_info:
+            self._consume_with_checksum(data, 10, f"md5={bad_hash}")
+
+        assert bad_hash in exc_info.value.args[0]
+        assert EXAMPLE_URL in exc_info.value.args[0]
+
+    def test__process_response_w_checksum_ranged(self):
+        data = b"abcdefghijklmnopqrstuvwxyz"
+        bad_hash = base64.b64encode(hashlib.md5(b"other").digest()).decode("utf-8")
+
+        # The header describes the whole object, so ranges are not checked.
+        download, stream = self._consume_with_checksum(
+            data, 10, f"md5={bad_hash}", start=3
+        )
+        assert download._expected_checksum is None
+        assert stream.getvalue() == data[3:]
+
+        download, stream = self._consume_with_checksum(
+            data, 10, f"md5={bad_hash}", end=12
+        )
+        assert download._expected_checksum is None
+        assert stream.getvalue() == data[:13]
+
+    def test__process_response_w_checksum_gzip_stored(self):
+        data = b"abcdefghijklmnopqrstuvwxyz"
+        bad_hash = base64.b64encode(hashlib.md5(b"other").digest()).decode("utf-8")
+
+        # Stored checksums of gzip objects may not match the bytes received.
+        download, stream = self._consume_with_checksum(
+            data,
+            10,
+            f"md5={bad_hash}",
+            stored_encoding="gzip",
+        )
+        assert download._expected_checksum is None
+        assert stream.getvalue() == data
+
     def test_consume_next_chunk(self):
         download = _download.ChunkedDownload(EXAMPLE_URL, 256, None)
         with pytest.raises(NotImplementedError) as exc_info:
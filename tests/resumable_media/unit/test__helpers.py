@@ -16,6 +16,7 @@ from __future__ import absolute_import
 
 import hashlib
 import http.client
+import threading
 
 from unittest import mock
 import pytest  # type: ignore
@@ -405,6 +406,160 @@ class Test__add_query_parameters(object):
         assert new_url == "{}&{}".format(MEDIA_URL, expected)
 
 
+class Test__BackgroundChecksum(object):
+    @pytest.mark.parametrize("checksum", ["md5", "crc32c"])
+    def test_update(self, checksum):
+        checksum_object = _helpers._get_checksum_object(checksum)
+        expected = _helpers._get_checksum_object(checksum)
+        background_checksum = _helpers._BackgroundChecksum(
+            checksum_object, max_pending=1
+        )
+
+        for chunk in (b"abc", b"", b"def", b"ghi" * 1000):
+            background_checksum.update(chunk)
+            expected.update(chunk)
+        background_checksum.close()
+
+        assert checksum_object.digest() == expected.digest()
+
+    def test_update_on_helper_thread(self):
+        threads = []
+        checksum_object = mock.Mock(spec=["update"])
+        checksum_object.update.side_effect = lambda chunk: threads.append(
+            threading.current_thread()
+        )
+        background_checksum = _helpers._BackgroundChecksum(checksum_object)
+
+        background_checksum.update(b"abc")
+        background_checksum.close()
+
+        checksum_object.update.assert_called_once_with(b"abc")
+        assert threads[0] is not threading.current_thread()
+
+    def test_update_inline(self):
+        threads = []
+        checksum_object = mock.Mock(spec=["update"])
+        checksum_object.update.side_effect = lambda chunk: threads.append(
+            threading.current_thread()
+        )
+        background_checksum = _helpers._BackgroundChecksum(checksum_object, inline=True)
+
+        background_checksum.update(b"abc")
+
+        checksum_object.update.assert_called_once_with(b"abc")
+        assert threads == [threading.current_thread()]
+        assert background_checksum._thread is None
+        background_checksum.close()
+
+    def test_update_w_do_nothing_hash(self):
+        background_checksum = _helpers._BackgroundChecksum(_helpers._DoNothingHash())
+
+        background_checksum.update(b"abc")
+
+        assert background_checksum._thread is None
+        background_checksum.close()
+
+    def test_close_reraises_error(self):
+        checksum_object = mock.Mock(spec=["update"])
+        checksum_object.update.side_effect = ValueError("boom")
+        background_checksum = _helpers._BackgroundChecksum(
+            checksum_object, max_pending=1
+        )
+
+        # Later updates do not block once hashing has failed.
+        for _ in range(3):
+            background_checksum.update(b"abc")
+        with pytest.raises(ValueError, match="boom"):
+            background_checksum.close()
+        checksum_object.update.assert_called_once_with(b"abc")
+
+
+class Test__AdaptiveChunkSize(object):
+    KIB = 1024
+    MIB = 1024 * 1024
+
+    def test_ctor(self):
+        sizer = _helpers._AdaptiveChunkSize(100 * self.MIB)
+        assert sizer.chunk_size == self.MIB
+        assert sizer.minimum == 256 * self.KIB
+        assert sizer.last_decision is None
+
+    def test_ctor_aligns_initial(self):
+        sizer = _helpers._AdaptiveChunkSize(100 * self.MIB, initial=300 * self.KIB)
+        assert sizer.chunk_size == 256 * self.KIB
+        sizer = _helpers._AdaptiveChunkSize(100 * self.MIB, initial=1)
+        assert sizer.chunk_size == 256 * self.KIB
+
+    def test_ctor_small_maximum(self):
+        sizer = _helpers._AdaptiveChunkSize(512 * self.KIB)
+        assert sizer.chunk_size == 512 * self.KIB
+        sizer = _helpers._AdaptiveChunkSize(1000)
+        assert sizer.chunk_size == 1000
+
+    def test_record_grows_while_improving(self):
+        sizer = _helpers._AdaptiveChunkSize(4 * self.MIB)
+
+        # The throughput per request doubles with the chunk size.
+        assert sizer.record(self.MIB, 1.0) == 2 * self.MIB
+        assert sizer.last_decision == {
+            "action": "grow",
+            "chunk_size": 2 * self.MIB,
+            "throughput": self.MIB,
+        }
+        assert sizer.record(2 * self.MIB, 1.0) == 4 * self.MIB
+        # Capped at the maximum.
+        assert sizer.record(4 * self.MIB, 1.0) == 4 * self.MIB
+        assert sizer.last_decision["action"] == "hold"
+
+    def test_record_holds_on_plateau(self):
+        sizer = _helpers._AdaptiveChunkSize(100 * self.MIB)
+
+        assert sizer.record(self.MIB, 1.0) == 2 * self.MIB
+        # Twice the bytes in twice the time: no improvement.
+        assert sizer.record(2 * self.MIB, 2.0) == 2 * self.MIB
+        assert sizer.last_decision["action"] == "hold"
+        # The size is held even if throughput later improves.
+        assert sizer.record(2 * self.MIB, 0.5) == 2 * self.MIB
+
+    def test_record_short_chunk(self):
+        sizer = _helpers._AdaptiveChunkSize(100 * self.MIB)
+        sizer.record(self.MIB, 1.0)
+
+        assert sizer.record(10, 0.1) == 2 * self.MIB
+        assert sizer.last_decision is None
+
+    def test_record_retried(self):
+        sizer = _helpers._AdaptiveChunkSize(100 * self.MIB, initial=8 * self.MIB)
+
+        assert sizer.record(8 * self.MIB, 1.0, retried=True) == 4 * self.MIB
+        assert sizer.last_decision == {
+            "action": "shrink",
+            "chunk_size": 4 * self.MIB,
+            "throughput": None,
+        }
+
+    def test_record_failure(self):
+        sizer = _helpers._AdaptiveChunkSize(100 * self.MIB, initial=self.MIB)
+
+        assert sizer.record_failure() == 512 * self.KIB
+        assert sizer.record_failure() == 256 * self.KIB
+        # Never below the 256 KiB minimum.
+        assert sizer.record_failure() == 256 * self.KIB
+        assert sizer.last_decision["action"] == "shrink"
+
+    def test_record_failure_then_recovers(self):
+        sizer = _helpers._AdaptiveChunkSize(100 * self.MIB, initial=2 * self.MIB)
+        sizer.record(2 * self.MIB, 1.0)
+        sizer.record(4 * self.MIB, 4.0)  # Settled at 4 MiB.
+
+        assert sizer.record_failure() == 2 * self.MIB
+        for _ in range(_helpers._ADAPTIVE_RECOVERY_CHUNKS):
+            assert sizer.record(2 * self.MIB, 1.0) == 2 * self.MIB
+            assert sizer.last_decision["action"] == "hold"
+        # Growth resumes after enough clean requests.
+        assert sizer.record(2 * self.MIB, 1.0) == 4 * self.MIB
+
+
 def test__get_uploaded_checksum_from_headers_error_handling():
     response = _mock_response({})
 
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import http.client
 import io
 import sys
 import tempfile
+import threading
 
 from unittest import mock
 import pytest  # type: ignore
@@ -298,7 +300,10 @@ class TestMultipartUpload(object):
         )
         expected_payload = preamble + metadata_payload + remainder
 
-        assert payload == expected_payload
+        assert bytes(payload) == expected_payload
+        assert len(payload) == len(expected_payload)
+        # The data is sent as it is, not copied into a new buffer.
+        assert any(part is data for part in payload)
         multipart_type = b'multipart/related; boundary="==3=="'
         mock_get_boundary.assert_called_once_with()
 
@@ -355,6 +360,25 @@ class TestMultipartUpload(object):
         exc_info.match("virtual")
 
 
+class Test_MultipartBody(object):
+    def test_parts(self):
+        data = b"data"
+        body = _upload._MultipartBody(b"head", data, b"tail")
+
+        assert len(body) == 12
+        assert bytes(body) == b"headdatatail"
+        parts = list(body)
+        assert parts == [b"head", b"data", b"tail"]
+        assert parts[1] is data
+        # The body can be sent again, e.g. when a request is retried.
+        assert list(body) == parts
+
+    def test_empty_data(self):
+        body = _upload._MultipartBody(b"head", b"", b"tail")
+        assert len(body) == 8
+        assert bytes(body) == b"headtail"
+
+
 class TestResumableUpload(object):
     def test_constructor(self):
         chunk_size = ONE_MB
@@ -377,6 +401,36 @@ class TestResumableUpload(object):
         with pytest.raises(ValueError):
             _upload.ResumableUpload(RESUMABLE_URL, 1)
 
+    def test_constructor_adaptive_chunk_size(self):
+        upload = _upload.ResumableUpload(
+            RESUMABLE_URL, 100 * ONE_MB, adaptive_chunk_size=True
+        )
+        # Starts small; the chunk size passed is the maximum.
+        assert upload.chunk_size == ONE_MB
+        assert upload._chunk_sizer.maximum == 100 * ONE_MB
+        assert upload.chunk_size_decision is None
+
+    def test__adapt_chunk_size(self):
+        upload = _upload.ResumableUpload(
+            RESUMABLE_URL, 100 * ONE_MB, adaptive_chunk_size=True
+        )
+
+        upload._adapt_chunk_size(ONE_MB, 0.5)
+        assert upload.chunk_size == 2 * ONE_MB
+        assert upload.chunk_size_decision["action"] == "grow"
+
+        upload._adapt_chunk_size_after_failure()
+        assert upload.chunk_size == ONE_MB
+        assert upload.chunk_size_decision["action"] == "shrink"
+
+    def test__adapt_chunk_size_not_adaptive(self):
+        upload = _upload.ResumableUpload(RESUMABLE_URL, ONE_MB)
+
+        upload._adapt_chunk_size(ONE_MB, 0.5)
+        upload._adapt_chunk_size_after_failure()
+        assert upload.chunk_size == ONE_MB
+        assert upload.chunk_size_decision is None
+
     def test_invalid_property(self):
         upload = _upload.ResumableUpload(RESUMABLE_URL, ONE_MB)
         # Default value of @property.
@@ -697,6 +751,96 @@ class TestResumableUpload(object):
         assert checksum_digest == checksums[checksum]
         assert upload._bytes_checksummed == len(data)
 
+    @staticmethod
+    def _read_ahead_upload(data, checksum=None, total_bytes=True):
+        upload = _upload.ResumableUpload(
+            RESUMABLE_URL, ONE_MB, checksum=checksum, read_ahead=True
+        )
+        # Make a fake chunk size smaller than 256 KB.
+        upload._chunk_size = 8
+        upload._stream = io.BytesIO(data)
+        upload._content_type = BASIC_CONTENT
+        upload._total_bytes = len(data) if total_bytes else None
+        upload._resumable_url = "http://test.invalid?upload_id=not-none"
+        return upload
+
+    @pytest.mark.parametrize("checksum", ["md5", "crc32c"])
+    def test__prepare_request_read_ahead(self, checksum):
+        data = b"All of the data goes in a stream."
+        upload = self._read_ahead_upload(data, checksum=checksum)
+        threads = []
+        original_get_next_chunk = _upload.get_next_chunk
+
+        def get_next_chunk(*args):
+            threads.append(threading.current_thread())
+            return original_get_next_chunk(*args)
+
+        payloads = []
+        with mock.patch.object(_upload, "get_next_chunk", new=get_next_chunk):
+            while upload.bytes_uploaded < len(data):
+                _, _, payload, headers = upload._prepare_request()
+                payloads.append(payload)
+                # Pretend the server persisted the whole chunk.
+                upload._bytes_uploaded += len(payload)
+
+        assert payloads == [data[i : i + 8] for i in range(0, len(data), 8)]
+        # Only the first chunk is read by the caller.
+        assert threads[0] is threading.current_thread()
+        assert all(thread is not threads[0] for thread in threads[1:])
+        assert len(threads) == len(payloads)
+        assert upload._next_chunk is None
+
+        checksums = {"md5": "GRvfKbqr5klAOwLkxgIf8w==", "crc32c": "Qg8thA=="}
+        assert headers["x-goog-hash"] == f"{checksum}={checksums[checksum]}"
+
+    def test__prepare_request_read_ahead_unknown_size(self):
+        data = b"0123456789abcdef"
+        upload = self._read_ahead_upload(data, total_bytes=False)
+
+        payloads = []
+        while not payloads or len(payloads[-1]) == 8:
+            _, _, payload, headers = upload._prepare_request()
+            payloads.append(payload)
+            upload._bytes_uploaded += len(payload)
+
+        assert payloads == [b"01234567", b"89abcdef", b""]
+        assert headers["content-range"] == "bytes */16"
+        assert upload._next_chunk is None
+
+    def test__prepare_request_read_ahead_partial_chunk(self):
+        data = b"All of the data goes in a stream."
+        upload = self._read_ahead_upload(data)
+
+        upload._prepare_request()
+        assert upload._next_chunk is not None
+        # The server only persisted half of the chunk, so the chunk read
+        # ahead is dropped and the chunk is read again, as without read-ahead.
+        upload._bytes_uploaded = 4
+        with pytest.raises(ValueError) as exc_info:
+            upload._prepare_request()
+        exc_info.match("Bytes stream is in unexpected state.")
+        assert upload._next_chunk is None
+        assert upload._stream.tell() == 16
+
+    def test__process_recover_response_read_ahead(self):
+        data = b"All of the data goes in a stream."
+        upload = self._read_ahead_upload(data, checksum="md5")
+        _fix_up_virtual(upload)
+
+        upload._prepare_request()
+        assert upload._next_chunk is not None
+        upload._invalid = True
+        response = _make_response(
+            status_code=http.client.PERMANENT_REDIRECT,
+            headers={"range": "bytes=0-3"},
+        )
+        upload._process_recover_response(response)
+
+        assert upload._next_chunk is None
+        assert upload._stream.tell() == 4
+        _, _, payload, _ = upload._prepare_request()
+        assert payload == data[4:12]
+
     @pytest.mark.parametrize("checksum", ["md5", "crc32c"])
     def test__update_checksum(self, checksum):
         data = b"All of the data goes in a stream."
@@ -757,6 +901,32 @@ class TestResumableUpload(object):
         )
         assert checksum_digest == checksums[checksum]
 
+    @pytest.mark.parametrize("checksum", ["md5", "crc32c"])
+    def test__update_checksum_file_chunks(self, checksum, tmp_path):
+        data = b"All of the data goes in a stream."
+        path = tmp_path / "data"
+        path.write_bytes(data)
+        upload = _upload.ResumableUpload(RESUMABLE_URL, ONE_MB, checksum=checksum)
+
+        with open(path, "rb") as stream:
+            start_byte, payload, _ = _upload.get_next_chunk(stream, 8, len(data))
+            upload._update_checksum(start_byte, payload)
+            # Rewind part of the way, as when recovering an upload.
+            stream.seek(4)
+            start_byte, payload, _ = _upload.get_next_chunk(
+                stream, len(data), len(data)
+            )
+            assert isinstance(payload, _upload._FileChunk)
+            upload._update_checksum(start_byte, payload)
+            payload.close()
+
+        assert upload._bytes_checksummed == len(data)
+        checksums = {"md5": "GRvfKbqr5klAOwLkxgIf8w==", "crc32c": "Qg8thA=="}
+        checksum_digest = _helpers.prepare_checksum_digest(
+            upload._checksum_object.digest()
+        )
+        assert checksum_digest == checksums[checksum]
+
     def test__update_checksum_none(self):
         data = b"All of the data goes in a stream."
         upload = self._upload_in_flight(data, checksum=None)
@@ -1124,6 +1294,94 @@ class TestResumableUpload(object):
 
         exc_info.match("virtual")
 
+    def test__prepare_resume(self):
+        upload = _upload.ResumableUpload(RESUMABLE_URL, ONE_MB)
+        stream = io.BytesIO(b"data")
+
+        upload._prepare_resume(stream, "http://test.invalid?upload_id=1", "a/b", 4)
+
+        assert upload._stream is stream
+        assert upload.resumable_url == "http://test.invalid?upload_id=1"
+        assert upload._content_type == "a/b"
+        assert upload.total_bytes == 4
+        # Only the server knows where the upload stands.
+        assert upload.invalid
+        with pytest.raises(ValueError):
+            upload._prepare_resume(stream, "http://test.invalid", "a/b", 4)
+
+    def test_checksum_state(self):
+        data = b"All of the data goes in a stream."
+        upload = self._upload_in_flight(data, checksum="crc32c")
+        assert upload.checksum_state is None
+
+        upload._prepare_request()
+
+        state = upload.checksum_state
+        assert state["type"] == "crc32c"
+        assert state["bytes"] == len(data)
+        restored = _helpers._restore_checksum_object("crc32c", state["value"])
+        assert restored.digest() == upload._checksum_object.digest()
+
+    def test_checksum_state_md5(self):
+        data = b"All of the data goes in a stream."
+        upload = self._upload_in_flight(data, checksum="md5")
+        upload._prepare_request()
+        # The state of hashlib objects cannot be captured.
+        assert upload.checksum_state is None
+
+    @pytest.mark.parametrize("use_state", [True, False])
+    @pytest.mark.parametrize("checksum", ["md5", "crc32c"])
+    def test__restore_checksum(self, checksum, use_state):
+        data = b"All of the data goes in a stream."
+        first = self._upload_in_flight(data, checksum="crc32c")
+        first._chunk_size = 8
+        first._prepare_request()
+        state = first.checksum_state if use_state else None
+
+        upload = self._upload_in_flight(data, checksum=checksum)
+        upload._bytes_uploaded = 20
+        upload._restore_checksum(state)
+
+        assert upload._bytes_checksummed == 20
+        assert upload._stream.tell() == 20
+        expected = _helpers._get_checksum_object(checksum)
+        expected.update(data[:20])
+        assert upload._checksum_object.digest() == expected.digest()
+
+    def test__restore_checksum_stale_state(self):
+        data = b"All of the data goes in a stream."
+        first = self._upload_in_flight(data, checksum="crc32c")
+        first._prepare_request()
+        # The server persisted less than was summed, so the state is unusable.
+        state = first.checksum_state
+
+        upload = self._upload_in_flight(data, checksum="crc32c")
+        upload._bytes_uploaded = 4
+        upload._restore_checksum(state)
+
+        expected = _helpers._get_checksum_object("crc32c")
+        expected.update(data[:4])
+        assert upload._checksum_object.digest() == expected.digest()
+
+    def test__restore_checksum_nothing_uploaded(self):
+        upload = self._upload_in_flight(b"data", checksum="md5")
+        upload._restore_checksum(None)
+        assert upload._bytes_checksummed == 0
+        assert upload._checksum_object.digest() == hashlib.md5().digest()
+
+    def test__restore_checksum_none(self):
+        upload = self._upload_in_flight(b"data", checksum=None)
+        upload._bytes_uploaded = 2
+        upload._restore_checksum({"type": "crc32c", "bytes": 0, "value": 0})
+        assert upload._checksum_object is None
+
+    def test__restore_checksum_stream_too_short(self):
+        upload = self._upload_in_flight(b"data", checksum="md5")
+        upload._bytes_uploaded = 10
+        with pytest.raises(ValueError) as exc_info:
+            upload._restore_checksum(None)
+        exc_info.match("The stream ended after 4 bytes")
+
 
 @mock.patch("random.randrange", return_value=1234567890123456789)
 def test_get_boundary(mock_rand):
@@ -1274,6 +1532,98 @@ class Test_get_next_chunk(object):
         assert result1 == (len(data), b"", "bytes */10")
         assert stream.tell() == len(data)
 
+    def test_success_file_chunks(self, tmp_path):
+        data = b"0123456789"
+        path = tmp_path / "data"
+        path.write_bytes(data)
+
+        with open(path, "rb") as stream:
+            result0 = _upload.get_next_chunk(stream, 6, len(data))
+            result1 = _upload.get_next_chunk(stream, 6, len(data))
+            assert stream.tell() == len(data)
+
+        start_byte, payload, content_range = result0
+        assert isinstance(payload, _upload._FileChunk)
+        assert (start_byte, payload.read(), content_range) == (
+            0,
+            b"012345",
+            "bytes 0-5/10",
+        )
+        start_byte, payload, content_range = result1
+        assert isinstance(payload, _upload._FileChunk)
+        assert (start_byte, payload.read(), content_range) == (
+            6,
+            b"6789",
+            "bytes 6-9/10",
+        )
+
+    def test_success_file_chunks_unknown_size(self, tmp_path):
+        data = b"abcdefghij"
+        path = tmp_path / "data"
+        path.write_bytes(data)
+
+        with open(path, "rb") as stream:
+            result0 = _upload.get_next_chunk(stream, 6, None)
+            result1 = _upload.get_next_chunk(stream, 6, None)
+            # The end of the file is read rather than mapped.
+            result2 = _upload.get_next_chunk(stream, 6, None)
+
+        assert result0[0] == 0
+        assert result0[1].read() == b"abcdef"
+        assert result0[2] == "bytes 0-5/*"
+        assert result1[0] == 6
+        assert result1[1].read() == b"ghij"
+        assert result1[2] == "bytes 6-9/10"
+        assert result2 == (len(data), b"", "bytes */10")
+
+    def test_text_and_wrapped_files_are_read(self, tmp_path):
+        data = b"abcdefghij"
+        path = tmp_path / "data"
+        path.write_bytes(data)
+
+        with open(path, "r+b") as stream:
+            # Buffered writes may not have reached the file yet.
+            result = _upload.get_next_chunk(stream, 6, len(data))
+        assert result == (0, b"abcdef", "bytes 0-5/10")
+
+
+class Test_FileChunk(object):
+    def test_read(self, tmp_path):
+        data = b"x" * 10 + b"0123456789"
+        path = tmp_path / "data"
+        path.write_bytes(data)
+
+        with open(path, "rb") as stream:
+            chunk = _upload._FileChunk(stream.fileno(), 10, 8)
+
+        assert len(chunk) == 8
+        assert chunk.read(3) == b"012"
+        assert chunk.read(100) == b"34567"
+        # The chunk rewinds after being read to the end.
+        assert chunk.read(3) == b""
+        assert chunk.read() == b"01234567"
+        assert chunk.read() == b""
+
+        chunk.read(2)
+        chunk.rewind()
+        assert chunk.read(2) == b"01"
+        chunk.close()
+
+    def test_view(self, tmp_path):
+        data = b"0123456789"
+        path = tmp_path / "data"
+        path.write_bytes(data)
+
+        with open(path, "rb") as stream:
+            chunk = _upload._FileChunk(stream.fileno(), 2, 6)
+
+        with chunk.view() as view:
+            assert view.readonly
+            assert view.tobytes() == b"234567"
+        with chunk.view(4) as view:
+            assert view.tobytes() == b"67"
+        chunk.close()
+
 
 class Test_get_content_range(object):
     def test_known_size(self):
@@ -1464,6 +1814,33 @@ def test_xml_mpu_part(filename):
     assert part.etag == ETAG
 
 
+def test_xml_mpu_part_w_data():
+    PART_NUMBER = 2
+    START = 256
+    END = 512
+    DATA = b"x" * (END - START)
+
+    part = _upload.XMLMPUPart(
+        EXAMPLE_XML_UPLOAD_URL,
+        UPLOAD_ID,
+        None,
+        START,
+        END,
+        PART_NUMBER,
+        headers=EXAMPLE_HEADERS,
+        checksum="md5",
+        data=DATA,
+    )
+    assert part.filename is None
+    verb, url, payload, headers = part._prepare_upload_request()
+    assert verb == _upload._PUT
+    assert url == EXAMPLE_XML_UPLOAD_URL + _upload._MPU_PART_QUERY_TEMPLATE.format(
+        part=PART_NUMBER, upload_id=UPLOAD_ID
+    )
+    assert payload is DATA
+    assert part._checksum_object.digest() == hashlib.md5(DATA).digest()
+
+
 def test_xml_mpu_part_invalid_response(filename):
     PART_NUMBER = 1
     START = 0
@@ -154,3 +154,53 @@ class TestBidiStreamRetryManager:
             )
 
         mock_strategy.recover_state_on_failure.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_w_retry_budget(self):
+        from google.cloud.storage.retry import RetryBudget
+
+        mock_strategy = mock.AsyncMock(spec=base_strategy._BaseResumptionStrategy)
+        attempt_count = 0
+
+        async def mock_send_and_recv(*args, **kwargs):
+            nonlocal attempt_count
+            attempt_count += 1
+            raise exceptions.ServiceUnavailable("Service is down")
+            yield
+
+        budget = RetryBudget(max_tokens=1)
+        retry_manager = manager._BidiStreamRetryManager(
+            strategy=mock_strategy,
+            send_and_recv=mock_send_and_recv,
+            retry_budget=budget,
+        )
+        retry_policy = AsyncRetry(predicate=_is_retriable, initial=0.01)
+
+        with mock.patch("asyncio.sleep", new_callable=mock.AsyncMock):
+            with pytest.raises(exceptions.ServiceUnavailable):
+                await retry_manager.execute(initial_state={}, retry_policy=retry_policy)
+
+        assert attempt_count == 2
+        assert (budget.retries, budget.rejected) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_execute_w_open_circuit_breaker(self):
+        from google.cloud.storage.exceptions import CircuitBreakerOpen
+        from google.cloud.storage.retry import CircuitBreaker
+
+        mock_strategy = mock.AsyncMock(spec=base_strategy._BaseResumptionStrategy)
+        mock_send_and_recv = mock.Mock()
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record(exceptions.ServiceUnavailable("Service is down"))
+        retry_manager = manager._BidiStreamRetryManager(
+            strategy=mock_strategy,
+            send_and_recv=mock_send_and_recv,
+            circuit_breaker=breaker,
+        )
+
+        with pytest.raises(CircuitBreakerOpen):
+            await retry_manager.execute(
+                initial_state={}, retry_policy=DEFAULT_TEST_RETRY
+            )
+
+        mock_send_and_recv.assert_not_called()
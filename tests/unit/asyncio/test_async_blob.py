@@ -0,0 +1,257 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import gzip
+import hashlib
+from unittest import mock
+
+import pytest
+from google.api_core import exceptions
+from google.auth import credentials as auth_credentials
+
+httpx = pytest.importorskip("httpx")
+
+from google.cloud.storage.asyncio.async_client import AsyncClient  # noqa: E402
+from google.cloud.storage.exceptions import DataCorruption  # noqa: E402
+from google.cloud.storage.retry import DEFAULT_RETRY  # noqa: E402
+from google.cloud.storage.retry import (  # noqa: E402
+    DEFAULT_RETRY_IF_GENERATION_SPECIFIED,
+)
+
+FAST_RETRY = DEFAULT_RETRY.with_delay(initial=0.001, maximum=0.001)
+
+
+def _make_blob(*responses, name="blob"):
+    requests = []
+    responses = list(responses)
+
+    def handler(request):
+        requests.append(request)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    credentials = mock.Mock(
+        spec=auth_credentials.Credentials, universe_domain="googleapis.com"
+    )
+    client = AsyncClient(
+        project="project",
+        credentials=credentials,
+        _http=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return client.bucket("bucket").blob(name), requests
+
+
+def _md5_header(data):
+    return "md5=" + base64.b64encode(hashlib.md5(data).digest()).decode()
+
+
+async def _stream(data):
+    yield data
+
+
+def _media_response(data, status_code=200, headers=None):
+    # The body is streamed, as from the network, rather than preloaded.
+    return httpx.Response(
+        status_code,
+        content=_stream(data),
+        headers={"x-goog-hash": _md5_header(data), **(headers or {})},
+    )
+
+
+def test_properties():
+    blob, _ = _make_blob()
+
+    blob.metadata = {"a": "b"}
+    blob._set_properties({"name": "blob", "size": "3", "generation": "7"})
+
+    assert repr(blob) == "<AsyncBlob: bucket, blob, 7>"
+    assert blob.path == "/b/bucket/o/blob"
+    assert blob.size == 3
+    assert blob.user_project is None
+
+
+@pytest.mark.asyncio
+async def test_exists():
+    blob, requests = _make_blob(
+        httpx.Response(200, json={"name": "blob"}), httpx.Response(404, json={})
+    )
+
+    assert await blob.exists(if_generation_match=1)
+    assert not await blob.exists()
+    assert requests[0].url.params["fields"] == "name"
+    assert requests[0].url.params["ifGenerationMatch"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_reload():
+    blob, requests = _make_blob(
+        httpx.Response(200, json={"name": "blob", "contentType": "text/csv"})
+    )
+
+    await blob.reload()
+
+    assert blob.content_type == "text/csv"
+    assert requests[0].url.params["projection"] == "noAcl"
+
+
+@pytest.mark.asyncio
+async def test_delete():
+    blob, requests = _make_blob(httpx.Response(204), httpx.Response(404, json={}))
+
+    await blob.delete(if_generation_match=3)
+
+    assert requests[0].method == "DELETE"
+    assert requests[0].url.params["ifGenerationMatch"] == "3"
+    with pytest.raises(exceptions.NotFound):
+        await blob.delete()
+
+
+@pytest.mark.asyncio
+async def test_download_as_bytes():
+    blob, requests = _make_blob(
+        _media_response(b"data", headers={"x-goog-generation": "5"})
+    )
+
+    data = await blob.download_as_bytes(checksum="md5", if_generation_match=5)
+
+    assert data == b"data"
+    assert blob.generation == 5
+    (request,) = requests
+    assert request.url.path == "/download/storage/v1/b/bucket/o/blob"
+    assert request.url.params["alt"] == "media"
+    assert request.url.params["ifGenerationMatch"] == "5"
+    assert request.headers["accept-encoding"] == "gzip"
+
+
+@pytest.mark.asyncio
+async def test_download_as_bytes_range():
+    blob, requests = _make_blob(
+        httpx.Response(
+            206,
+            content=_stream(b"at"),
+            # The hash of the whole object is not checked for a range.
+            headers={
+                "x-goog-hash": _md5_header(b"data"),
+                "content-range": "bytes 1-2/4",
+            },
+        )
+    )
+
+    data = await blob.download_as_bytes(start=1, end=2, checksum="md5")
+
+    assert data == b"at"
+    assert requests[0].headers["range"] == "bytes=1-2"
+    assert blob.size == 4
+
+
+@pytest.mark.asyncio
+async def test_download_as_bytes_gzip():
+    compressed = gzip.compress(b"data")
+    headers = {"content-encoding": "gzip"}
+    blob, _ = _make_blob(
+        _media_response(compressed, headers=headers),
+        _media_response(compressed, headers=headers),
+    )
+
+    assert await blob.download_as_bytes(checksum="md5") == b"data"
+    assert await blob.download_as_bytes(raw_download=True) == compressed
+
+
+@pytest.mark.asyncio
+async def test_download_as_bytes_checksum_mismatch():
+    blob, _ = _make_blob(
+        httpx.Response(
+            200, content=_stream(b"data"), headers={"x-goog-hash": _md5_header(b"")}
+        )
+    )
+
+    with pytest.raises(DataCorruption):
+        await blob.download_as_bytes(checksum="md5")
+
+
+@pytest.mark.asyncio
+async def test_download_as_bytes_not_found():
+    blob, _ = _make_blob(httpx.Response(404, content=_stream(b"No such object")))
+
+    with pytest.raises(exceptions.NotFound, match="No such object"):
+        await blob.download_as_bytes()
+
+
+@pytest.mark.asyncio
+async def test_download_as_bytes_retry():
+    blob, requests = _make_blob(
+        httpx.Response(503),
+        httpx.ReadError("reset"),
+        _media_response(b"data"),
+    )
+
+    assert await blob.download_as_bytes(retry=FAST_RETRY) == b"data"
+    assert len(requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_download_as_text():
+    blob, _ = _make_blob(
+        _media_response(
+            "é".encode("latin-1"),
+            headers={"content-type": "text/plain; charset=latin-1"},
+        ),
+        _media_response("é".encode()),
+    )
+
+    assert await blob.download_as_text() == "é"
+    assert await blob.download_as_text(encoding="utf-8") == "é"
+
+
+@pytest.mark.asyncio
+async def test_upload_from_string():
+    blob, requests = _make_blob(
+        httpx.Response(200, json={"name": "blob", "generation": "2", "size": "4"})
+    )
+    blob.metadata = {"a": "b"}
+
+    await blob.upload_from_string("data", predefined_acl="private", checksum="md5")
+
+    assert blob.generation == 2
+    (request,) = requests
+    assert request.method == "POST"
+    assert request.url.path == "/upload/storage/v1/b/bucket/o"
+    assert request.url.params["uploadType"] == "multipart"
+    assert request.url.params["predefinedAcl"] == "private"
+    assert request.headers["content-type"].startswith("multipart/related")
+    body = request.content
+    assert b'"metadata": {"a": "b"}' in body
+    assert b"content-type: text/plain\r\n\r\ndata\r\n" in body
+
+
+@pytest.mark.asyncio
+async def test_upload_from_string_conditional_retry():
+    blob, requests = _make_blob(
+        httpx.Response(503),
+        httpx.Response(503),
+        httpx.Response(200, json={"name": "blob", "generation": "2"}),
+    )
+
+    with pytest.raises(exceptions.ServiceUnavailable):
+        await blob.upload_from_string(b"data")
+    assert len(requests) == 1
+
+    retry = DEFAULT_RETRY_IF_GENERATION_SPECIFIED
+    with mock.patch.object(retry, "retry_policy", FAST_RETRY):
+        await blob.upload_from_string(b"data", if_generation_match=0, retry=retry)
+    assert len(requests) == 3
+    assert blob.generation == 2
@@ -0,0 +1,174 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest import mock
+
+import pytest
+from google.auth import credentials as auth_credentials
+
+httpx = pytest.importorskip("httpx")
+
+from google.cloud.storage.asyncio.async_blob import AsyncBlob  # noqa: E402
+from google.cloud.storage.asyncio.async_client import AsyncClient  # noqa: E402
+
+
+def _make_bucket(*responses, user_project=None):
+    requests = []
+    responses = list(responses)
+
+    def handler(request):
+        requests.append(request)
+        return responses.pop(0)
+
+    credentials = mock.Mock(
+        spec=auth_credentials.Credentials, universe_domain="googleapis.com"
+    )
+    client = AsyncClient(
+        project="project",
+        credentials=credentials,
+        _http=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return client.bucket("bucket", user_project=user_project), requests
+
+
+def test_properties():
+    bucket, _ = _make_bucket(user_project="billed")
+
+    bucket._set_properties({"name": "bucket", "location": "EU"})
+
+    assert repr(bucket) == "<AsyncBucket: bucket>"
+    assert bucket.name == "bucket"
+    assert bucket.path == "/b/bucket"
+    assert bucket.user_project == "billed"
+    assert bucket.location == "EU"
+    # Methods of Bucket which make blocking requests are not delegated.
+    with pytest.raises(AttributeError):
+        bucket.make_public
+
+
+def test_property_changes_tracked():
+    bucket, _ = _make_bucket()
+
+    bucket.labels = {"team": "storage"}
+
+    assert bucket._wrapped._changes == {"labels"}
+    assert bucket.labels == {"team": "storage"}
+
+
+def test_blob():
+    bucket, _ = _make_bucket()
+
+    blob = bucket.blob("name", generation=3)
+
+    assert isinstance(blob, AsyncBlob)
+    assert blob.bucket is bucket
+    assert blob.client is bucket.client
+    assert blob.generation == 3
+
+
+@pytest.mark.asyncio
+async def test_exists():
+    bucket, requests = _make_bucket(
+        httpx.Response(200, json={"name": "bucket"}),
+        httpx.Response(404, json={}),
+        user_project="billed",
+    )
+
+    assert await bucket.exists(if_etag_match="abc")
+    assert not await bucket.exists()
+    assert requests[0].url.params["fields"] == "name"
+    assert requests[0].url.params["userProject"] == "billed"
+    assert requests[0].headers["if-match"] == "abc"
+
+
+@pytest.mark.asyncio
+async def test_get_blob():
+    bucket, requests = _make_bucket(
+        httpx.Response(200, json={"name": "blob", "size": "10"}),
+        httpx.Response(404, json={}),
+    )
+
+    blob = await bucket.get_blob("blob")
+
+    assert blob.size == 10
+    assert requests[0].url.path == "/storage/v1/b/bucket/o/blob"
+    assert await bucket.get_blob("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_patch():
+    bucket, requests = _make_bucket(
+        httpx.Response(200, json={"name": "bucket", "labels": {"team": "storage"}})
+    )
+    bucket.labels = {"team": "storage"}
+
+    await bucket.patch(if_metageneration_match=2)
+
+    (request,) = requests
+    assert request.method == "PATCH"
+    assert request.url.params["projection"] == "full"
+    assert request.url.params["ifMetagenerationMatch"] == "2"
+    assert json.loads(request.content) == {"labels": {"team": "storage"}}
+    assert not bucket._wrapped._changes
+
+
+@pytest.mark.asyncio
+async def test_list_blobs():
+    bucket, requests = _make_bucket(
+        httpx.Response(
+            200,
+            json={
+                "items": [{"name": "logs/a"}],
+                "prefixes": ["logs/b/"],
+                "nextPageToken": "t",
+            },
+        ),
+        httpx.Response(200, json={"items": [{"name": "logs/c"}]}),
+    )
+
+    iterator = bucket.list_blobs(prefix="logs/", delimiter="/")
+    blobs = [blob async for blob in iterator]
+
+    assert [blob.name for blob in blobs] == ["logs/a", "logs/c"]
+    assert all(blob.bucket is bucket for blob in blobs)
+    assert iterator.prefixes == {"logs/b/"}
+    assert requests[0].url.path == "/storage/v1/b/bucket/o"
+    assert requests[0].url.params["delimiter"] == "/"
+    assert requests[1].url.params["pageToken"] == "t"
+
+
+@pytest.mark.asyncio
+async def test_delete():
+    bucket, requests = _make_bucket(httpx.Response(204))
+
+    await bucket.delete(if_metageneration_match=1)
+
+    (request,) = requests
+    assert request.method == "DELETE"
+    assert request.url.path == "/storage/v1/b/bucket"
+    assert request.url.params["ifMetagenerationMatch"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_delete_blob():
+    bucket, requests = _make_bucket(httpx.Response(204))
+
+    await bucket.delete_blob("blob", generation=5, if_generation_match=5)
+
+    (request,) = requests
+    assert request.method == "DELETE"
+    assert request.url.path == "/storage/v1/b/bucket/o/blob"
+    assert request.url.params["generation"] == "5"
+    assert request.url.params["ifGenerationMatch"] == "5"
@@ -0,0 +1,275 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from unittest import mock
+
+import pytest
+from google.api_core import exceptions
+from google.auth import credentials as auth_credentials
+from google.auth.credentials import AnonymousCredentials
+
+httpx = pytest.importorskip("httpx")
+
+from google.cloud.storage.asyncio import async_client  # noqa: E402
+from google.cloud.storage.asyncio.async_bucket import AsyncBucket  # noqa: E402
+from google.cloud.storage.retry import DEFAULT_RETRY  # noqa: E402
+from google.cloud.storage.retry import (  # noqa: E402
+    DEFAULT_RETRY_IF_METAGENERATION_SPECIFIED,
+)
+
+PROJECT = "my-project"
+FAST_RETRY = DEFAULT_RETRY.with_delay(initial=0.001, maximum=0.001)
+
+
+def _make_credentials():
+    credentials = mock.Mock(
+        spec=auth_credentials.Credentials, universe_domain="googleapis.com"
+    )
+    credentials.valid = True
+
+    def apply(headers):
+        headers["authorization"] = "Bearer token"
+
+    credentials.apply.side_effect = apply
+    return credentials
+
+
+def _make_client(handler, credentials=None, **kwargs):
+    if credentials is None:
+        credentials = _make_credentials()
+    return async_client.AsyncClient(
+        project=PROJECT,
+        credentials=credentials,
+        _http=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+class _Handler(object):
+    """Answers requests with queued responses, recording the requests."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _json_response(payload, status_code=200):
+    return httpx.Response(status_code, json=payload)
+
+
+def test_ctor():
+    credentials = _make_credentials()
+    client = async_client.AsyncClient(
+        project=PROJECT, credentials=credentials, extra_headers={"x-custom": "1"}
+    )
+
+    assert client.project == PROJECT
+    assert client._credentials is credentials
+    assert client._extra_headers == {"x-custom": "1"}
+    assert client._connection.API_BASE_URL == "https://storage.googleapis.com"
+
+
+@pytest.mark.asyncio
+async def test__http_default_and_close():
+    client = async_client.AsyncClient(
+        project=PROJECT, credentials=_make_credentials(), http2=True
+    )
+
+    http = client._http
+
+    assert isinstance(http, httpx.AsyncClient)
+    assert client._http is http
+    async with client:
+        pass
+    assert http.is_closed
+
+
+@pytest.mark.asyncio
+async def test_get_bucket():
+    handler = _Handler(_json_response({"name": "bucket", "location": "EU"}))
+    client = _make_client(handler, extra_headers={"x-custom": "1"})
+
+    bucket = await client.get_bucket("bucket", if_metageneration_match=3)
+
+    assert isinstance(bucket, AsyncBucket)
+    assert bucket.client is client
+    assert bucket.location == "EU"
+    (request,) = handler.requests
+    assert request.method == "GET"
+    assert request.url.path == "/storage/v1/b/bucket"
+    assert request.url.params["projection"] == "noAcl"
+    assert request.url.params["ifMetagenerationMatch"] == "3"
+    assert request.headers["authorization"] == "Bearer token"
+    assert request.headers["x-custom"] == "1"
+    assert request.headers["user-agent"] == client._connection.user_agent
+    assert "gccl-invocation-id/" in request.headers["x-goog-api-client"]
+
+
+@pytest.mark.asyncio
+async def test_lookup_bucket_miss():
+    handler = _Handler(_json_response({"error": {"message": "gone"}}, 404))
+    client = _make_client(handler)
+
+    assert await client.lookup_bucket("bucket") is None
+
+
+@pytest.mark.asyncio
+async def test_api_request_retries_transient_errors():
+    handler = _Handler(
+        _json_response({}, 503),
+        httpx.ConnectError("reset"),
+        _json_response({"name": "bucket"}),
+    )
+    client = _make_client(handler)
+
+    bucket = await client.get_bucket("bucket", retry=FAST_RETRY)
+
+    assert bucket.name == "bucket"
+    assert len(handler.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_api_request_conditional_retry_not_met():
+    handler = _Handler(_json_response({}, 503), _json_response({}))
+    client = _make_client(handler)
+
+    with pytest.raises(exceptions.ServiceUnavailable):
+        await client._patch_resource(
+            "/b/bucket", {}, retry=DEFAULT_RETRY_IF_METAGENERATION_SPECIFIED
+        )
+
+    assert len(handler.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_api_request_conditional_retry_met():
+    handler = _Handler(_json_response({}, 503), _json_response({"name": "bucket"}))
+    client = _make_client(handler)
+    retry = DEFAULT_RETRY_IF_METAGENERATION_SPECIFIED
+
+    with mock.patch.object(retry, "retry_policy", FAST_RETRY):
+        response = await client._patch_resource(
+            "/b/bucket",
+            {},
+            query_params={"ifMetagenerationMatch": 1},
+            retry=retry,
+        )
+
+    assert response == {"name": "bucket"}
+    assert len(handler.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_request_refreshes_credentials_on_401():
+    handler = _Handler(httpx.Response(401), _json_response({"name": "bucket"}))
+    credentials = _make_credentials()
+    client = _make_client(handler, credentials=credentials)
+
+    response = await client._request("GET", "https://storage.googleapis.com/b")
+
+    assert response.status_code == 200
+    credentials.refresh.assert_called_once_with(client._auth_request)
+    assert len(handler.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_request_anonymous_no_refresh():
+    handler = _Handler(httpx.Response(401))
+    client = _make_client(handler, credentials=AnonymousCredentials())
+
+    response = await client._request("GET", "https://storage.googleapis.com/b")
+
+    assert response.status_code == 401
+    assert len(handler.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_request_transport_error():
+    handler = _Handler(httpx.ReadError("reset"))
+    client = _make_client(handler)
+
+    with pytest.raises(ConnectionError):
+        await client._request("GET", "https://storage.googleapis.com/b")
+
+
+@pytest.mark.asyncio
+async def test_create_bucket():
+    handler = _Handler(_json_response({"name": "bucket", "location": "EU"}))
+    client = _make_client(handler)
+    bucket = client.bucket("bucket")
+    bucket.storage_class = "NEARLINE"
+
+    created = await client.create_bucket(bucket, location="EU")
+
+    assert created is bucket
+    assert bucket.location == "EU"
+    (request,) = handler.requests
+    assert request.method == "POST"
+    assert request.url.path == "/storage/v1/b"
+    assert request.url.params["project"] == PROJECT
+    assert json.loads(request.content) == {
+        "name": "bucket",
+        "location": "EU",
+        "storageClass": "NEARLINE",
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_buckets():
+    handler = _Handler(
+        _json_response({"items": [{"name": "a"}, {"name": "b"}], "nextPageToken": "t"}),
+        _json_response({"items": [{"name": "c"}]}),
+    )
+    client = _make_client(handler)
+
+    names = [bucket.name async for bucket in client.list_buckets(prefix="p")]
+
+    assert names == ["a", "b", "c"]
+    first, second = handler.requests
+    assert first.url.params["prefix"] == "p"
+    assert "pageToken" not in first.url.params
+    assert second.url.params["pageToken"] == "t"
+
+
+@pytest.mark.asyncio
+async def test_list_buckets_max_results():
+    handler = _Handler(
+        _json_response({"items": [{"name": "a"}, {"name": "b"}], "nextPageToken": "t"})
+    )
+    client = _make_client(handler)
+    iterator = client.list_buckets(max_results=2, page_size=5)
+
+    pages = [page async for page in iterator.pages]
+
+    assert len(pages) == 1
+    assert iterator.num_results == 2
+    assert handler.requests[0].url.params["maxResults"] == "2"
+    with pytest.raises(ValueError):
+        iterator.__aiter__()
+
+
+def test_list_buckets_wo_project():
+    client = _make_client(_Handler())
+    client._client.project = None
+
+    with pytest.raises(ValueError):
+        client.list_buckets()
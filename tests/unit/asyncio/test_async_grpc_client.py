@@ -225,6 +225,70 @@ class TestAsyncGrpcClient:
         expected_user_agent = f"custom-app/1.0 {agent_version} "
         assert client_info.user_agent == expected_user_agent
 
+    @mock.patch("google.cloud.storage.asyncio.async_grpc_client._CredentialRefresher")
+    @mock.patch("google.cloud._storage_v2.StorageAsyncClient")
+    @pytest.mark.asyncio
+    async def test_credential_refresh(self, mock_async_storage_client, refresher_cls):
+        mock_transport_cls = mock.MagicMock()
+        mock_async_storage_client.get_transport_class.return_value = mock_transport_cls
+        mock_gapic_client = mock.AsyncMock()
+        mock_async_storage_client.return_value = mock_gapic_client
+        mock_creds = _make_credentials()
+
+        client = async_grpc_client.AsyncGrpcClient(
+            credentials=mock_creds, refresh_credentials_in_background=True
+        )
+
+        refresher = refresher_cls.return_value
+        refresher_cls.assert_called_once_with(mock_creds, mock.ANY)
+        refresher.start.assert_called_once_with()
+        assert (
+            mock_transport_cls.create_channel.call_args.kwargs["credentials"]
+            is mock_creds
+        )
+
+        await client.close()
+
+        refresher.stop.assert_called_once_with(wait=False)
+        mock_gapic_client.transport.close.assert_awaited_once_with()
+
+    @mock.patch("google.cloud.storage.asyncio.async_grpc_client._CredentialRefresher")
+    @mock.patch("google.cloud._storage_v2.StorageAsyncClient")
+    def test_credential_refresh_scopes_credentials(
+        self, mock_async_storage_client, refresher_cls
+    ):
+        mock_transport_cls = mock.MagicMock()
+        mock_async_storage_client.get_transport_class.return_value = mock_transport_cls
+        mock_creds = mock.Mock(spec=auth_credentials.Scoped)
+        mock_creds.requires_scopes = True
+
+        async_grpc_client.AsyncGrpcClient(
+            credentials=mock_creds, refresh_credentials_in_background=True
+        )
+
+        # The channel uses the scoped credentials which are refreshed.
+        scoped = mock_creds.with_scopes.return_value
+        refresher_cls.assert_called_once_with(scoped, mock.ANY)
+        assert (
+            mock_transport_cls.create_channel.call_args.kwargs["credentials"] is scoped
+        )
+
+    @mock.patch("google.auth.default")
+    @mock.patch("google.cloud.storage.asyncio.async_grpc_client._CredentialRefresher")
+    @mock.patch("google.cloud._storage_v2.StorageAsyncClient")
+    def test_credential_refresh_default_credentials(
+        self, mock_async_storage_client, refresher_cls, mock_default
+    ):
+        mock_transport_cls = mock.MagicMock()
+        mock_async_storage_client.get_transport_class.return_value = mock_transport_cls
+        mock_creds = _make_credentials()
+        mock_default.return_value = (mock_creds, "project")
+
+        async_grpc_client.AsyncGrpcClient(refresh_credentials_in_background=True)
+
+        mock_default.assert_called_once_with(default_scopes=mock.ANY)
+        refresher_cls.assert_called_once_with(mock_creds, mock.ANY)
+
     @mock.patch("google.cloud._storage_v2.StorageAsyncClient")
     @pytest.mark.asyncio
     async def test_delete_object(self, mock_async_storage_client):
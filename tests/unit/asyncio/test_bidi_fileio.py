@@ -0,0 +1,332 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import threading
+from unittest import mock
+from unittest.mock import AsyncMock
+
+import pytest
+
+from google.cloud.storage.asyncio import bidi_fileio
+
+_TEST_BUCKET_NAME = "test-bucket"
+_TEST_OBJECT_NAME = "test-object"
+_TEST_GENERATION_NUMBER = 123456789
+_TEST_DATA = b"abcdefghijklmnopqrstuvwxyz"
+
+
+def _make_mrd(data=_TEST_DATA):
+    mrd = mock.MagicMock()
+    mrd.persisted_size = len(data)
+    mrd.generation = _TEST_GENERATION_NUMBER
+    mrd.is_stream_open = True
+    mrd.close = AsyncMock()
+    threads = []
+
+    async def download_ranges(read_ranges):
+        threads.append(threading.current_thread())
+        for start, length, buffer in read_ranges:
+            end = start + length if length else len(data)
+            buffer.write(data[start:end])
+
+    mrd.download_ranges = AsyncMock(side_effect=download_ranges)
+    return mrd, threads
+
+
+def _make_grpc_client_cls():
+    client_cls = mock.Mock()
+    client_cls.return_value.close = AsyncMock()
+    return client_cls
+
+
+def _make_reader(mrd, client=mock.sentinel.client, **kwargs):
+    with mock.patch.object(
+        bidi_fileio.AsyncMultiRangeDownloader,
+        "create_mrd",
+        new=AsyncMock(return_value=mrd),
+    ) as create_mrd:
+        reader = bidi_fileio.BidiBlobReader(
+            client, _TEST_BUCKET_NAME, _TEST_OBJECT_NAME, **kwargs
+        )
+    return reader, create_mrd
+
+
+class TestBidiBlobReader:
+    def test_attributes(self):
+        mrd, _ = _make_mrd()
+        reader, create_mrd = _make_reader(mrd, generation=_TEST_GENERATION_NUMBER)
+
+        create_mrd.assert_awaited_once_with(
+            mock.sentinel.client,
+            _TEST_BUCKET_NAME,
+            _TEST_OBJECT_NAME,
+            generation=_TEST_GENERATION_NUMBER,
+            read_handle=None,
+        )
+        assert reader.readable()
+        assert not reader.writable()
+        assert reader.seekable()
+        assert reader.size == len(_TEST_DATA)
+        assert reader.generation == _TEST_GENERATION_NUMBER
+        reader.close()
+
+    def test_read(self):
+        mrd, threads = _make_mrd()
+        reader, _ = _make_reader(mrd, chunk_size=8)
+
+        assert reader.read(1) == b"a"
+        mrd.download_ranges.assert_awaited_once()
+        assert mrd.download_ranges.await_args.args[0][0][:2] == (0, 8)
+        # Buffered data is served without another request.
+        assert reader.read(3) == b"bcd"
+        assert mrd.download_ranges.await_count == 1
+        # Reads beyond the buffer fetch at least another chunk.
+        assert reader.read(10) == b"efghijklmn"
+        assert mrd.download_ranges.await_args.args[0][0][:2] == (8, 8)
+        # Unbounded reads fetch everything after the buffered data.
+        assert reader.read() == _TEST_DATA[14:]
+        assert mrd.download_ranges.await_args.args[0][0][:2] == (16, 0)
+        # Reads at the end do not reach the server.
+        assert reader.read(5) == b""
+        assert mrd.download_ranges.await_count == 3
+
+        # Coroutines run on the reader's own event loop thread.
+        assert all(thread is not threading.current_thread() for thread in threads)
+        reader.close()
+
+    def test_seek(self):
+        mrd, _ = _make_mrd()
+        reader, _ = _make_reader(mrd, chunk_size=4)
+
+        assert reader.seek(-4, 2) == len(_TEST_DATA) - 4
+        assert reader.read() == b"wxyz"
+        assert reader.seek(2) == 2
+        assert reader.read(2) == b"cd"
+        assert reader.seek(1, 1) == 5
+        assert reader.read(1) == b"f"
+        assert reader.seek(100) == len(_TEST_DATA)
+        assert reader.read() == b""
+        with pytest.raises(ValueError):
+            reader.seek(0, 3)
+        reader.close()
+
+    def test_seek_unknown_size(self):
+        mrd, _ = _make_mrd()
+        mrd.persisted_size = None
+        reader, _ = _make_reader(mrd, chunk_size=4)
+
+        assert reader.seek(2) == 2
+        assert reader.read(2) == b"cd"
+        assert reader.seek(1, 1) == 5
+        assert reader.read(1) == b"f"
+        with pytest.raises(io.UnsupportedOperation):
+            reader.seek(-4, 2)
+        reader.close()
+
+    def test_close(self):
+        mrd, _ = _make_mrd()
+        reader, _ = _make_reader(mrd)
+        loop = reader._loop
+
+        reader.close()
+
+        mrd.close.assert_awaited_once()
+        assert reader.closed
+        assert loop.closed
+        with pytest.raises(ValueError):
+            reader.read()
+        with pytest.raises(ValueError):
+            reader.seek(0)
+        # Closing again is a no-op.
+        reader.close()
+        mrd.close.assert_awaited_once()
+
+    def test_open_failure_closes_loop(self):
+        loop = bidi_fileio._BackgroundEventLoop()
+        with mock.patch.object(
+            bidi_fileio, "_BackgroundEventLoop", return_value=loop
+        ), mock.patch.object(
+            bidi_fileio.AsyncMultiRangeDownloader,
+            "create_mrd",
+            new=AsyncMock(side_effect=ValueError("boom")),
+        ):
+            with pytest.raises(ValueError, match="boom"):
+                bidi_fileio.BidiBlobReader(
+                    mock.sentinel.client, _TEST_BUCKET_NAME, _TEST_OBJECT_NAME
+                )
+        assert loop.closed
+
+    def test_close_w_default_client(self):
+        mrd, _ = _make_mrd()
+        client_cls = _make_grpc_client_cls()
+        with mock.patch.object(bidi_fileio, "AsyncGrpcClient", new=client_cls):
+            reader, create_mrd = _make_reader(mrd, client=None)
+
+        grpc_client = client_cls.return_value
+        assert create_mrd.await_args.args[0] is grpc_client
+        reader.close()
+
+        mrd.close.assert_awaited_once()
+        grpc_client.close.assert_awaited_once_with()
+        assert reader._loop.closed
+
+    def test_open_failure_closes_default_client(self):
+        client_cls = _make_grpc_client_cls()
+        with mock.patch.object(
+            bidi_fileio, "AsyncGrpcClient", new=client_cls
+        ), mock.patch.object(
+            bidi_fileio.AsyncMultiRangeDownloader,
+            "create_mrd",
+            new=AsyncMock(side_effect=ValueError("boom")),
+        ):
+            with pytest.raises(ValueError, match="boom"):
+                bidi_fileio.BidiBlobReader(None, _TEST_BUCKET_NAME, _TEST_OBJECT_NAME)
+
+        client_cls.return_value.close.assert_awaited_once_with()
+
+    def test_wraps_as_text(self):
+        mrd, _ = _make_mrd(b"line one\nline two\n")
+        reader, _ = _make_reader(mrd, chunk_size=4)
+
+        with io.TextIOWrapper(reader) as text:
+            assert text.readlines() == ["line one\n", "line two\n"]
+
+
+def _make_writer(offset=None, client=mock.sentinel.client, **kwargs):
+    writer_cls = mock.MagicMock()
+    async_writer = writer_cls.return_value
+    async_writer.offset = offset
+    async_writer.is_stream_open = True
+    async_writer.open = AsyncMock()
+    async_writer.append = AsyncMock()
+    async_writer.close = AsyncMock()
+    with mock.patch.object(bidi_fileio, "AsyncAppendableObjectWriter", new=writer_cls):
+        writer = bidi_fileio.BidiBlobWriter(
+            client, _TEST_BUCKET_NAME, _TEST_OBJECT_NAME, **kwargs
+        )
+    return writer, writer_cls, async_writer
+
+
+class TestBidiBlobWriter:
+    def test_attributes(self):
+        writer, writer_cls, async_writer = _make_writer(
+            generation=_TEST_GENERATION_NUMBER, writer_options={"a": 1}
+        )
+
+        writer_cls.assert_called_once_with(
+            mock.sentinel.client,
+            _TEST_BUCKET_NAME,
+            _TEST_OBJECT_NAME,
+            generation=_TEST_GENERATION_NUMBER,
+            writer_options={"a": 1},
+        )
+        async_writer.open.assert_awaited_once_with()
+        assert not writer.readable()
+        assert writer.writable()
+        assert not writer.seekable()
+        writer.close()
+
+    def test_write_flush_close(self):
+        writer, _, async_writer = _make_writer(chunk_size=10)
+
+        assert writer.write(b"abcd") == 4
+        async_writer.append.assert_not_awaited()
+        assert writer.tell() == 4
+
+        writer.write(b"efghijkl")
+        async_writer.append.assert_awaited_once_with(b"abcdefghijkl")
+        assert writer.tell() == 12
+
+        writer.write(b"mn")
+        writer.flush()
+        async_writer.append.assert_awaited_with(b"mn")
+        writer.flush()
+        assert async_writer.append.await_count == 2
+
+        writer.write(b"op")
+        writer.close()
+        async_writer.append.assert_awaited_with(b"op")
+        async_writer.close.assert_awaited_once_with(finalize_on_close=True)
+        assert writer.closed
+        assert writer._loop.closed
+        with pytest.raises(ValueError):
+            writer.write(b"qr")
+
+    def test_tell_appending_to_existing_object(self):
+        writer, _, _ = _make_writer(offset=100, finalize_on_close=False)
+
+        writer.write(b"abc")
+        assert writer.tell() == 103
+
+        writer.close()
+        writer._writer.close.assert_awaited_once_with(finalize_on_close=False)
+
+    def test_context_manager_terminates_on_error(self):
+        writer, _, async_writer = _make_writer()
+
+        with pytest.raises(RuntimeError):
+            with writer:
+                writer.write(b"abc")
+                raise RuntimeError()
+
+        async_writer.append.assert_not_awaited()
+        async_writer.close.assert_awaited_once_with()
+        assert writer.closed
+
+    @pytest.mark.parametrize("failing", ["append", "close"])
+    def test_close_failure_closes_stream(self, failing):
+        writer, _, async_writer = _make_writer()
+        error = RuntimeError("boom")
+        if failing == "append":
+            async_writer.append.side_effect = error
+        else:
+            async_writer.close.side_effect = [error, None]
+
+        writer.write(b"abc")
+        with pytest.raises(RuntimeError, match="boom"):
+            writer.close()
+
+        # The stream is closed without finalizing, before the loop is.
+        async_writer.close.assert_awaited_with()
+        assert writer.closed
+        assert writer._loop.closed
+
+    def test_close_failure_w_stream_closed(self):
+        writer, _, async_writer = _make_writer()
+
+        def close_stream(**kwargs):
+            async_writer.is_stream_open = False
+            raise RuntimeError("boom")
+
+        async_writer.close.side_effect = close_stream
+
+        with pytest.raises(RuntimeError, match="boom"):
+            writer.close()
+
+        async_writer.close.assert_awaited_once_with(finalize_on_close=True)
+        assert writer._loop.closed
+
+    def test_close_w_default_client(self):
+        client_cls = _make_grpc_client_cls()
+        with mock.patch.object(bidi_fileio, "AsyncGrpcClient", new=client_cls):
+            writer, writer_cls, async_writer = _make_writer(client=None)
+
+        grpc_client = client_cls.return_value
+        assert writer_cls.call_args.args[0] is grpc_client
+        writer.close()
+
+        async_writer.close.assert_awaited_once_with(finalize_on_close=True)
+        grpc_client.close.assert_awaited_once_with()
+        assert writer._loop.closed
@@ -747,3 +747,229 @@ class _Base64(object):
     def b64encode(self, value):
         self._called_b64encode.append(value)
         return value
+
+
+class Test_SingleFlight(unittest.TestCase):
+    @staticmethod
+    def _make_one():
+        from google.cloud.storage._helpers import _SingleFlight
+
+        return _SingleFlight()
+
+    def test_make_key(self):
+        from google.cloud.storage._helpers import _SingleFlight
+
+        key = _SingleFlight.make_key("/b/bucket", {"a": 1, "b": 2}, None)
+
+        self.assertEqual(
+            key, _SingleFlight.make_key("/b/bucket", {"b": 2, "a": 1}, None)
+        )
+        self.assertNotEqual(key, _SingleFlight.make_key("/b/bucket", {"a": 1}, None))
+
+    def test_do_sequential_calls_not_merged(self):
+        single_flight = self._make_one()
+        func = mock.Mock(side_effect=[{"n": 1}, {"n": 2}])
+
+        self.assertEqual(single_flight.do("key", func), {"n": 1})
+        self.assertEqual(single_flight.do("key", func), {"n": 2})
+        self.assertEqual(single_flight._in_flight, {})
+
+    def test_do_wo_waiters_does_not_copy(self):
+        single_flight = self._make_one()
+        result = {"items": ["a"]}
+
+        with mock.patch("copy.deepcopy") as deepcopy:
+            self.assertIs(single_flight.do("key", lambda: result), result)
+
+        deepcopy.assert_not_called()
+
+    def test_do_result_not_shared_with_waiters(self):
+        single_flight = self._make_one()
+        result = {"items": ["a"]}
+        in_flight = []
+
+        def func():
+            in_flight.append(single_flight._in_flight["key"][0])
+            self._wait_for_merged(single_flight, 1)
+            return result
+
+        results = self._do_concurrently(single_flight, func, 2)
+        result["items"].append("b")
+
+        self.assertEqual(len([r for r in results if r is result]), 1)
+        # Waiters copy the result from the future, which the caller's changes
+        # must not reach.
+        self.assertEqual(in_flight[0].result(), {"items": ["a"]})
+
+    @staticmethod
+    def _do_concurrently(single_flight, func, count):
+        import threading
+
+        results = []
+
+        def call():
+            try:
+                results.append(single_flight.do("key", func))
+            except Exception as exc:
+                results.append(exc)
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def _wait_for_merged(self, single_flight, count):
+        import time
+
+        # Keep the call in flight until the other callers wait for it.
+        deadline = time.monotonic() + 5
+        while single_flight.merged < count:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.001)
+
+    def test_do_concurrent_calls_merged(self):
+        single_flight = self._make_one()
+        calls = []
+
+        def func():
+            calls.append(None)
+            self._wait_for_merged(single_flight, 3)
+            return {"items": ["a"]}
+
+        results = self._do_concurrently(single_flight, func, 4)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(single_flight.merged, 3)
+        self.assertEqual(results, [{"items": ["a"]}] * 4)
+        # Each caller gets its own copy of the result.
+        self.assertEqual(len({id(result) for result in results}), 4)
+        self.assertEqual(single_flight._in_flight, {})
+
+    def test_do_concurrent_calls_share_error(self):
+        from google.cloud.exceptions import NotFound
+
+        single_flight = self._make_one()
+        error = NotFound("missing")
+
+        def func():
+            self._wait_for_merged(single_flight, 2)
+            raise error
+
+        results = self._do_concurrently(single_flight, func, 3)
+
+        self.assertEqual(results, [error] * 3)
+        self.assertEqual(single_flight._in_flight, {})
+
+
+def _utcnow():
+    import datetime
+
+    # google-auth keeps credential expiries as naive UTC datetimes.
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+class _FakeCredentials(object):
+    """Credentials whose refreshes are recorded, and may be made to fail."""
+
+    def __init__(self, token=None, expiry=None, errors=()):
+        import threading
+
+        self.token = token
+        self.expiry = expiry
+        self.errors = list(errors)
+        self.requests = []
+        self.refreshed = threading.Event()
+
+    def refresh(self, request):
+        import datetime
+
+        self.requests.append(request)
+        if self.errors:
+            raise self.errors.pop(0)
+        self.token = f"token-{len(self.requests)}"
+        self.expiry = _utcnow() + datetime.timedelta(hours=1)
+        self.refreshed.set()
+
+
+class Test_CredentialRefresher(unittest.TestCase):
+    @staticmethod
+    def _make_one(*args, **kwargs):
+        from google.cloud.storage._helpers import _CredentialRefresher
+
+        return _CredentialRefresher(*args, **kwargs)
+
+    @staticmethod
+    def _expiring_in(seconds):
+        import datetime
+
+        return _utcnow() + datetime.timedelta(seconds=seconds)
+
+    def test__next_refresh_wo_token(self):
+        refresher = self._make_one(_FakeCredentials(), mock.sentinel.request)
+        self.assertEqual(refresher._next_refresh(), 0.0)
+
+    def test__next_refresh_wo_expiry(self):
+        from google.cloud.storage._helpers import _CREDENTIALS_REFRESH_IDLE_INTERVAL
+
+        credentials = _FakeCredentials(token="token")
+        refresher = self._make_one(credentials, mock.sentinel.request)
+
+        self.assertEqual(refresher._next_refresh(), _CREDENTIALS_REFRESH_IDLE_INTERVAL)
+
+    def test__next_refresh_w_expiry(self):
+        credentials = _FakeCredentials(token="token", expiry=self._expiring_in(1000))
+        refresher = self._make_one(credentials, mock.sentinel.request, margin=300)
+
+        self.assertAlmostEqual(refresher._next_refresh(), 700, delta=5)
+
+    def test__next_refresh_within_margin(self):
+        credentials = _FakeCredentials(token="token", expiry=self._expiring_in(100))
+        refresher = self._make_one(credentials, mock.sentinel.request, margin=300)
+
+        self.assertEqual(refresher._next_refresh(), 0.0)
+
+    def test_refresh_in_background(self):
+        credentials = _FakeCredentials(token="old", expiry=self._expiring_in(60))
+        refresher = self._make_one(credentials, mock.sentinel.request)
+
+        refresher.start()
+        self.assertTrue(credentials.refreshed.wait(5))
+        refresher.stop()
+
+        self.assertFalse(refresher._thread.is_alive())
+        self.assertEqual(credentials.token, "token-1")
+        self.assertEqual(credentials.requests, [mock.sentinel.request])
+        self.assertEqual((refresher.refreshes, refresher.errors), (1, 0))
+
+    def test_refresh_in_background_retries_errors(self):
+        from google.auth.exceptions import TransportError
+
+        credentials = _FakeCredentials(errors=[TransportError("unreachable")])
+        refresher = self._make_one(credentials, mock.sentinel.request)
+
+        with mock.patch(
+            "google.cloud.storage._helpers._CREDENTIALS_REFRESH_MIN_INTERVAL", 0.001
+        ):
+            refresher.start()
+            self.assertTrue(credentials.refreshed.wait(5))
+            refresher.stop()
+
+        self.assertEqual(credentials.token, "token-2")
+        self.assertEqual((refresher.refreshes, refresher.errors), (1, 1))
+
+    def test_no_refresh_before_due(self):
+        credentials = _FakeCredentials(token="token", expiry=self._expiring_in(3600))
+        refresher = self._make_one(credentials, mock.sentinel.request)
+
+        refresher.start()
+        refresher.stop()
+
+        self.assertEqual(credentials.requests, [])
+        self.assertFalse(refresher._thread.is_alive())
+
+    def test_stop_wo_start(self):
+        refresher = self._make_one(_FakeCredentials(), mock.sentinel.request)
+        refresher.stop()
+        self.assertTrue(refresher._stopped.is_set())
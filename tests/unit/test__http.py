@@ -181,6 +181,97 @@ class TestConnection(unittest.TestCase):
         conn.api_request("GET", "/rainbow", data=req_data, expect_json=False)
         http.request.assert_called_once()
 
+    def test_api_request_w_retry_budget(self):
+        import requests
+        from google.api_core import exceptions
+        from google.cloud.storage.retry import DEFAULT_RETRY
+        from google.cloud.storage.retry import RetryBudget
+
+        http = mock.create_autospec(requests.Session, instance=True)
+        budget = RetryBudget(max_tokens=1)
+        client = mock.Mock(
+            _http=http,
+            _retry_budget=budget,
+            _circuit_breaker=None,
+            spec=["_http", "_retry_budget", "_circuit_breaker"],
+        )
+        conn = self._make_one(client)
+        failure = requests.Response()
+        failure.status_code = 503
+        failure._content = b"{}"
+        failure.request = requests.Request("GET", "http://example.com/rainbow")
+        http.request.return_value = failure
+        retry = DEFAULT_RETRY.with_delay(initial=0.001, maximum=0.001)
+
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            conn.api_request("GET", "/rainbow", retry=retry)
+
+        self.assertEqual(http.request.call_count, 2)
+        self.assertEqual((budget.retries, budget.rejected), (1, 1))
+
+    def test_api_request_w_open_circuit_breaker(self):
+        import requests
+        from google.api_core import exceptions
+        from google.cloud.storage.exceptions import CircuitBreakerOpen
+        from google.cloud.storage.retry import CircuitBreaker
+
+        http = mock.create_autospec(requests.Session, instance=True)
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record(exceptions.ServiceUnavailable("down"))
+        client = mock.Mock(
+            _http=http,
+            _retry_budget=None,
+            _circuit_breaker=breaker,
+            spec=["_http", "_retry_budget", "_circuit_breaker"],
+        )
+        conn = self._make_one(client)
+
+        with self.assertRaises(CircuitBreakerOpen):
+            conn.api_request("GET", "/rainbow")
+
+        http.request.assert_not_called()
+
+    def test_api_request_w_auto_batcher(self):
+        import concurrent.futures
+        import requests
+        from google.cloud.storage.constants import _DEFAULT_TIMEOUT
+
+        http = mock.create_autospec(requests.Session, instance=True)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"name": "blob"}'
+        future = concurrent.futures.Future()
+        future.set_result(response)
+        batcher = mock.Mock(spec=["accepts", "submit"])
+        batcher.accepts.side_effect = lambda method, url: method == "PATCH"
+        batcher.submit.return_value = future
+        client = mock.Mock(
+            _http=http, _auto_batcher=batcher, spec=["_http", "_auto_batcher"]
+        )
+        conn = self._make_one(client)
+
+        result = conn.api_request("PATCH", "/b/bucket/o/blob", data={"a": 1})
+
+        self.assertEqual(result, {"name": "blob"})
+        http.request.assert_not_called()
+        (method, url, headers, data), kw = batcher.submit.call_args
+        self.assertEqual(method, "PATCH")
+        self.assertEqual(
+            url,
+            "https://storage.googleapis.com/storage/v1/b/bucket/o/blob"
+            "?prettyPrint=false",
+        )
+        self.assertEqual(headers["Content-Type"], "application/json")
+        self.assertEqual(data, '{"a": 1}')
+        self.assertEqual(kw, {"timeout": _DEFAULT_TIMEOUT})
+
+        # Requests which the batcher doesn't accept are sent immediately.
+        http.request.return_value = response
+        conn.api_request("GET", "/b/bucket/o/blob")
+
+        http.request.assert_called_once()
+        batcher.submit.assert_called_once()
+
     def test_api_request_basic_retry(self):
         # For this test, the "retry" function will just short-circuit.
         FAKE_RESPONSE_STRING = "fake_response"
@@ -305,3 +396,106 @@ class TestConnection(unittest.TestCase):
         client = mock.Mock(_connection=conn, spec=["_connection"])
         batch = Batch(client)
         self.assertEqual(batch._client_info.user_agent, expected_user_agent)
+
+
+class Test_ConnectionPoolStats(unittest.TestCase):
+    @staticmethod
+    def _make_one():
+        from google.cloud.storage._http import _ConnectionPoolStats
+
+        return _ConnectionPoolStats()
+
+    def test_snapshot_empty(self):
+        stats = self._make_one()
+        self.assertEqual(
+            stats.snapshot(), {"requests": 0, "hits": 0, "misses": 0, "discards": 0}
+        )
+
+    def test_snapshot(self):
+        stats = self._make_one()
+        for name in ("requests", "requests", "requests", "misses", "discards"):
+            stats.record(name)
+
+        self.assertEqual(
+            stats.snapshot(), {"requests": 3, "hits": 2, "misses": 1, "discards": 1}
+        )
+
+
+class Test__configure_connection_pools(unittest.TestCase):
+    @staticmethod
+    def _call_fut(*args, **kwargs):
+        from google.cloud.storage._http import _configure_connection_pools
+
+        return _configure_connection_pools(*args, **kwargs)
+
+    def _make_session(self):
+        import requests
+
+        session = requests.Session()
+        self.addCleanup(session.close)
+        return session
+
+    def test_defaults(self):
+        from google.cloud.storage._http import _ConnectionPoolStats
+
+        session = self._make_session()
+        adapter = session.get_adapter("https://storage.googleapis.com")
+        previous = adapter.poolmanager
+
+        self._call_fut(session, _ConnectionPoolStats())
+
+        self.assertIsNot(adapter.poolmanager, previous)
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 10)
+        self.assertNotIn("socket_options", adapter.poolmanager.connection_pool_kw)
+        self.assertEqual(
+            adapter.poolmanager.pool_classes_by_scheme["https"].__name__,
+            "CountingHTTPSConnectionPool",
+        )
+
+    def test_w_sizes_and_keepalive(self):
+        import socket
+        from google.cloud.storage._http import _ConnectionPoolStats
+
+        session = self._make_session()
+        mock_adapter = mock.Mock(spec=["close"])
+        session.mount("mock://", mock_adapter)
+
+        self._call_fut(
+            session,
+            _ConnectionPoolStats(),
+            pool_size=4,
+            pool_maxsize=32,
+            tcp_keepalive=60,
+        )
+
+        for prefix in ("http://", "https://"):
+            adapter = session.adapters[prefix]
+            self.assertEqual(adapter._pool_connections, 4)
+            self.assertEqual(adapter._pool_maxsize, 32)
+            self.assertEqual(adapter.poolmanager.pools._maxsize, 4)
+            pool_kw = adapter.poolmanager.connection_pool_kw
+            self.assertEqual(pool_kw["maxsize"], 32)
+            self.assertIn(
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), pool_kw["socket_options"]
+            )
+        self.assertIs(session.adapters["mock://"], mock_adapter)
+
+    def test_counts_connection_reuse(self):
+        from google.cloud.storage._http import _ConnectionPoolStats
+
+        stats = _ConnectionPoolStats()
+        session = self._make_session()
+        self._call_fut(session, stats, pool_maxsize=1)
+        adapter = session.get_adapter("http://example.com")
+        pool = adapter.poolmanager.connection_from_url("http://example.com")
+
+        first = pool._get_conn()
+        second = pool._get_conn()
+        pool._put_conn(first)
+        # The pool only keeps one connection, so the second is discarded.
+        pool._put_conn(second)
+        self.assertIs(pool._get_conn(), first)
+
+        self.assertEqual(
+            stats.snapshot(), {"requests": 3, "hits": 1, "misses": 2, "discards": 1}
+        )
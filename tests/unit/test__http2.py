@@ -0,0 +1,292 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import gzip
+import io
+import json
+import socket
+import threading
+
+import mock
+import pytest
+import requests
+
+httpx = pytest.importorskip("httpx")
+h2_config = pytest.importorskip("h2.config")
+h2_connection = pytest.importorskip("h2.connection")
+h2_events = pytest.importorskip("h2.events")
+
+from google.cloud.storage import _http2  # noqa: E402
+
+
+class _H2Server(object):
+    """A local cleartext HTTP/2 server.
+
+    Every request is answered with a JSON description of the request, or
+    with a gzipped body for ``/gzip``. The number of connections accepted is
+    recorded in ``connections``.
+    """
+
+    def __init__(self):
+        self._socket = socket.socket()
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.listen()
+        self.url = "http://127.0.0.1:{}".format(self._socket.getsockname()[1])
+        self.connections = 0
+        thread = threading.Thread(target=self._accept, daemon=True)
+        thread.start()
+
+    def _accept(self):
+        while True:
+            try:
+                sock, _ = self._socket.accept()
+            except OSError:
+                return
+            self.connections += 1
+            thread = threading.Thread(target=self._serve, args=(sock,), daemon=True)
+            thread.start()
+
+    def _serve(self, sock):
+        conn = h2_connection.H2Connection(
+            config=h2_config.H2Configuration(client_side=False)
+        )
+        conn.initiate_connection()
+        sock.sendall(conn.data_to_send())
+        requests_by_stream = {}
+        with sock:
+            while True:
+                data = sock.recv(65535)
+                if not data:
+                    return
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2_events.RequestReceived):
+                        headers = {
+                            name.decode(): value.decode()
+                            for name, value in event.headers
+                        }
+                        requests_by_stream[event.stream_id] = (headers, [])
+                    elif isinstance(event, h2_events.DataReceived):
+                        requests_by_stream[event.stream_id][1].append(event.data)
+                        conn.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id
+                        )
+                    elif isinstance(event, h2_events.StreamEnded):
+                        headers, body = requests_by_stream.pop(event.stream_id)
+                        self._respond(conn, event.stream_id, headers, b"".join(body))
+                sock.sendall(conn.data_to_send())
+
+    @staticmethod
+    def _respond(conn, stream_id, headers, body):
+        if headers[":path"] == "/gzip":
+            payload = gzip.compress(b"compressed data")
+            response_headers = [("content-encoding", "gzip")]
+        else:
+            payload = json.dumps(
+                {
+                    "method": headers[":method"],
+                    "path": headers[":path"],
+                    "body": body.decode(),
+                    "headers": sorted(name for name in headers),
+                }
+            ).encode()
+            response_headers = [("content-type", "application/json")]
+        conn.send_headers(
+            stream_id,
+            [(":status", "200"), ("content-length", str(len(payload)))]
+            + response_headers,
+        )
+        conn.send_data(stream_id, payload, end_stream=True)
+
+    def close(self):
+        self._socket.close()
+
+
+@pytest.fixture
+def server():
+    server = _H2Server()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def session():
+    session = requests.Session()
+    # Cleartext HTTP/2 needs "prior knowledge" that the server supports it.
+    session.mount("http://", _http2.HTTP2Adapter(httpx.Client(http1=False, http2=True)))
+    yield session
+    session.close()
+
+
+def test__httpx_timeout():
+    assert _http2._httpx_timeout(None) == httpx.Timeout(None)
+    assert _http2._httpx_timeout(5.0) == httpx.Timeout(5.0)
+    assert _http2._httpx_timeout((3.0, 60.0)) == httpx.Timeout(60.0, connect=3.0)
+
+
+def test_adapter_default_client():
+    adapter = _http2.HTTP2Adapter()
+    try:
+        assert isinstance(adapter._http_client, httpx.Client)
+    finally:
+        adapter.close()
+
+
+def test_adapter_close():
+    http_client = mock.Mock(spec=["close"])
+    adapter = _http2.HTTP2Adapter(http_client)
+
+    adapter.close()
+
+    http_client.close.assert_called_once_with()
+
+
+def test_request(server, session):
+    response = session.post(
+        server.url + "/b/bucket/o?alt=json", data=b"payload", timeout=(5, 10)
+    )
+
+    assert response.status_code == 200
+    assert response.raw.version == 20
+    assert response.json()["method"] == "POST"
+    assert response.json()["path"] == "/b/bucket/o?alt=json"
+    assert response.json()["body"] == "payload"
+    # Connection-specific headers set by requests are not sent.
+    assert "connection" not in response.json()["headers"]
+
+
+def test_request_w_iterable_body(server, session):
+    response = session.put(server.url + "/upload", data=iter([b"chunk1", b"chunk2"]))
+
+    assert response.json()["body"] == "chunk1chunk2"
+
+
+def test_request_w_file_chunk_body(server, session, tmp_path, monkeypatch):
+    from google.cloud.storage._media._upload import _FileChunk
+
+    monkeypatch.setattr(_http2, "_BODY_BLOCK_SIZE", 1024)
+    path = tmp_path / "data"
+    path.write_bytes(b"x" * 100000 + b"chunk" + b"y" * 5000)
+    with open(path, "rb") as file_obj:
+        chunk = _FileChunk(file_obj.fileno(), 100000, 5005)
+        try:
+            response = session.put(server.url + "/upload", data=chunk)
+        finally:
+            chunk.close()
+
+    body = response.json()["body"]
+    assert body == "chunk" + "y" * 5000
+    assert "content-length" in response.json()["headers"]
+    assert "transfer-encoding" not in response.json()["headers"]
+
+
+def test_concurrent_requests_share_connection(server, session):
+    def get(index):
+        return session.get("{}/o/{}".format(server.url, index)).json()["path"]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        paths = list(executor.map(get, range(32)))
+
+    assert paths == ["/o/{}".format(index) for index in range(32)]
+    assert server.connections == 1
+
+
+def test_response_body_streamed_undecoded(server, session):
+    response = session.get(server.url + "/gzip", stream=True)
+
+    raw = response.raw.read(decode_content=False)
+
+    assert gzip.decompress(raw) == b"compressed data"
+
+
+def test_response_content_decoded(server, session):
+    response = session.get(server.url + "/gzip")
+
+    assert response.content == b"compressed data"
+
+
+def test_media_download(server, session):
+    from google.cloud.storage._media.requests import RawDownload
+
+    stream = io.BytesIO()
+    download = RawDownload(server.url + "/gzip", stream=stream, checksum=None)
+
+    response = download.consume(session)
+
+    assert response.status_code == 200
+    assert gzip.decompress(stream.getvalue()) == b"compressed data"
+
+
+def test_send_connect_error(session):
+    # Nothing listens on the port of a closed socket.
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    url = "http://127.0.0.1:{}/".format(sock.getsockname()[1])
+    sock.close()
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get(url)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (httpx.ConnectTimeout("timeout"), requests.exceptions.ConnectTimeout),
+        (httpx.ReadTimeout("timeout"), requests.exceptions.ReadTimeout),
+        (httpx.RemoteProtocolError("reset"), requests.exceptions.ConnectionError),
+    ],
+)
+def test_send_errors(error, expected):
+    http_client = httpx.Client(transport=httpx.MockTransport(mock.Mock()))
+    adapter = _http2.HTTP2Adapter(http_client)
+    request = requests.Request("GET", "https://example.com/").prepare()
+
+    with mock.patch.object(http_client, "send", side_effect=error):
+        with pytest.raises(expected):
+            adapter.send(request)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (httpx.ReadTimeout("timeout"), TimeoutError),
+        (httpx.ReadError("reset"), ConnectionError),
+    ],
+)
+def test__response_stream_errors(error, expected):
+    def chunks():
+        raise error
+        yield  # pragma: NO COVER
+
+    http_response = mock.Mock(spec=["iter_raw", "close"])
+    http_response.iter_raw.return_value = chunks()
+    stream = _http2._ResponseStream(http_response)
+
+    with pytest.raises(expected):
+        stream.read(10)
+
+
+def test__response_stream_read():
+    http_response = mock.Mock(spec=["iter_raw", "close"])
+    http_response.iter_raw.return_value = iter([b"abc", b"defg"])
+    stream = _http2._ResponseStream(http_response)
+
+    assert stream.read(2) == b"ab"
+    assert stream.read(10) == b"c"
+    assert stream.read() == b"defg"
+    # The response is released as soon as it has been read.
+    http_response.close.assert_called_once_with()
+
+    stream.close()
+    assert stream.closed
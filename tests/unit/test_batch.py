@@ -263,6 +263,19 @@ class TestBatch(unittest.TestCase):
         with self.assertRaises(ValueError):
             batch._make_request("POST", url, data={"foo": 1})
 
+    def test__make_request_w_max_workers_past_max_batch_size(self):
+        url = "http://example.com/api"
+        http = _make_requests_session([])
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        batch = self._make_one(client, max_workers=2)
+        batch._MAX_BATCH_SIZE = 1
+        batch._requests.append(("POST", url, {}, {"bar": 2}))
+
+        batch._make_request("POST", url, data={"foo": 1})
+
+        self.assertEqual(len(batch._requests), 2)
+
     def test_finish_empty(self):
         http = _make_requests_session([])
         connection = _Connection(http=http)
@@ -272,6 +285,75 @@ class TestBatch(unittest.TestCase):
         with self.assertRaises(ValueError):
             batch.finish()
 
+    def test_finish_empty_w_max_workers(self):
+        http = _make_requests_session([])
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        batch = self._make_one(client, max_workers=2)
+
+        with self.assertRaises(ValueError):
+            batch.finish()
+
+    def test_finish_w_max_workers(self):
+        url = "http://api.example.com/other_api"
+
+        def respond(method, url, headers, data, timeout):
+            # Each shard is answered according to the bodies it contains.
+            if '"shard": 2' in data:
+                return _make_response(SERVICE_UNAVAILABLE)
+            parts = [
+                (
+                    "--DEADBEEF=\nContent-Type: application/json\n\n"
+                    "HTTP/1.1 200 OK\nContent-Type: application/json\n\n"
+                    f'{{"index": {index}}}\n\n'
+                )
+                for index in (0, 1, 2, 3)
+                if f'"index": {index}' in data
+            ]
+            return _make_response(
+                content=("".join(parts) + "--DEADBEEF=--\n").encode("utf-8"),
+                headers={"content-type": 'multipart/mixed; boundary="DEADBEEF="'},
+            )
+
+        http = _make_requests_session([])
+        http.request.side_effect = respond
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        batch = self._make_one(client, max_workers=3)
+        batch.API_BASE_URL = "http://api.example.com"
+        batch._MAX_BATCH_SIZE = 2
+        targets = [_MockObject() for _ in range(5)]
+
+        for index, target in enumerate(targets):
+            body = {"index": index, "shard": index // 2}
+            batch._do_request("PATCH", url, {}, body, target)
+        result = batch.finish(raise_exception=False)
+
+        self.assertEqual(http.request.call_count, 3)
+        self.assertEqual(client.pool_maxsize, 3)
+        self.assertEqual(len(result), 5)
+        self.assertEqual([response.status_code for response in result[:4]], [200] * 4)
+        self.assertEqual(result[4].status_code, SERVICE_UNAVAILABLE)
+        self.assertEqual(
+            [target._properties for target in targets[:4]],
+            [{"index": index} for index in range(4)],
+        )
+        # Only the writes of the successful batch requests are made.
+        self.assertEqual(client.invalidated, [url] * 4)
+
+    def test_finish_w_max_workers_w_transport_error(self):
+        url = "http://api.example.com/other_api"
+        http = _make_requests_session([ConnectionError("reset")])
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        batch = self._make_one(client, max_workers=2)
+        batch.API_BASE_URL = "http://api.example.com"
+
+        batch._do_request("DELETE", url, {}, None, None)
+
+        with self.assertRaises(ConnectionError):
+            batch.finish()
+
     def _get_payload_chunks(self, boundary, payload):
         divider = "--" + boundary[len('boundary="') : -1]
         chunks = payload.split(divider)[1:-1]  # discard prolog / epilog
@@ -380,6 +462,7 @@ class TestBatch(unittest.TestCase):
         self._check_subrequest_payload(chunks[0], "POST", url, {"foo": 1, "bar": 2})
         self._check_subrequest_payload(chunks[1], "PATCH", url, {"bar": 3})
         self._check_subrequest_no_payload(chunks[2], "DELETE", url)
+        self.assertEqual(client.invalidated, [url, url, url])
 
     def test_finish_responses_mismatch(self):
         url = "http://api.example.com/other_api"
@@ -685,6 +768,95 @@ class Test__unpack_batch_response(unittest.TestCase):
         CONTENT = _THREE_PART_MIME_RESPONSE
         self._unpack_helper(RESPONSE, CONTENT)
 
+    def test_crlf_folded_headers_preamble_epilogue(self):
+        content = (
+            b"preamble\r\n"
+            b"--BB  \r\n"
+            b"Content-Type: application/http\r\n\r\n"
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: application/json\r\n"
+            b"X-Folded: a\r\n  b\r\n"
+            b"Content-ID: <response-1>\r\n\r\n"
+            b'{"a": 1}\r\n'
+            b"--BB\r\n"
+            b"Content-Type: application/http\r\n\r\n"
+            b"HTTP/1.1 204 No Content\r\n\r\n"
+            b"--BBX\r\n"
+            b"--BB--\r\n"
+            b"epilogue"
+        )
+
+        first, second = self._call_fut(
+            {"content-type": "multipart/mixed; boundary=BB"}, content
+        )
+
+        self.assertEqual(first.status_code, http.client.OK)
+        self.assertEqual(
+            dict(first.headers),
+            {
+                "Content-Type": "application/json",
+                "X-Folded": "a\r\n  b",
+                "Content-ID": "<response-1>",
+            },
+        )
+        self.assertEqual(first.content, b'{"a": 1}')
+        self.assertEqual(first.request.method, "BATCH")
+        self.assertEqual(first.request.url, "contentid://<response-1>")
+        self.assertEqual(second.status_code, http.client.NO_CONTENT)
+        # Lines which are not delimiters belong to the part.
+        self.assertEqual(second.content, b"--BBX")
+
+    def test_wo_close_delimiter(self):
+        content = b"--BB\nHTTP/1.1 404 Not Found\nA: 1\n\nmissing\n"
+
+        (response,) = self._call_fut(
+            {"content-type": 'multipart/mixed; boundary="BB"'}, content
+        )
+
+        # A part without headers starts with its status line.
+        self.assertEqual(response.status_code, http.client.NOT_FOUND)
+        self.assertEqual(dict(response.headers), {"A": "1"})
+        self.assertEqual(response.content, b"missing\n")
+        self.assertEqual(response.request.url, "contentid://None")
+
+
+class Test__encode_multipart_mixed(unittest.TestCase):
+    def _call_fut(self, payloads):
+        from google.cloud.storage.batch import _encode_multipart_mixed
+
+        return _encode_multipart_mixed(payloads)
+
+    def test_matches_email_generator(self):
+        from email.generator import Generator
+        from email.mime.multipart import MIMEMultipart
+        import io
+
+        from google.cloud.storage.batch import MIMEApplicationHTTP
+
+        subrequests = [
+            ("PATCH", "http://example.com/o", {"A": "1"}, {"k": "v\u00e9"}),
+            ("DELETE", "http://example.com/o", {}, None),
+            ("PUT", "http://example.com/o", {}, "a\rb\r\nc\n"),
+        ]
+        payloads = [
+            MIMEApplicationHTTP(*subrequest).get_payload() for subrequest in subrequests
+        ]
+
+        headers, body = self._call_fut(payloads)
+
+        multi = MIMEMultipart()
+        for subrequest in subrequests:
+            multi.attach(MIMEApplicationHTTP(*subrequest))
+        multi.set_boundary(headers["Content-Type"].split('"')[1])
+        buf = io.StringIO()
+        Generator(buf, False, 0).flatten(multi)
+        _, expected = buf.getvalue().split("\n\n", 1)
+        self.assertEqual(headers, dict(multi._headers))
+        self.assertEqual(body, expected)
+        self.assertTrue(
+            headers["Content-Type"].startswith('multipart/mixed; boundary="==')
+        )
+
 
 _TWO_PART_MIME_RESPONSE_WITH_FAIL = b"""\
 --DEADBEEF=
@@ -765,6 +937,108 @@ class Test__FutureDict(unittest.TestCase):
             future[None] = None
 
 
+class Test_AutoBatcher(unittest.TestCase):
+    BASE_URL = "https://storage.googleapis.com/storage/v1"
+
+    @staticmethod
+    def _make_client(http):
+        from google.cloud.storage.client import Client
+
+        http.is_mtls = False
+        return Client(project="PROJECT", credentials=_make_credentials(), _http=http)
+
+    def _make_one(self, client, window=10.0, **kw):
+        from google.cloud.storage.batch import _AutoBatcher
+
+        return _AutoBatcher(client, window, **kw)
+
+    def test_ctor_w_negative_window(self):
+        client = self._make_client(_make_requests_session([]))
+
+        with self.assertRaises(ValueError):
+            self._make_one(client, -1.0)
+
+    def test_accepts(self):
+        client = self._make_client(_make_requests_session([]))
+        batcher = self._make_one(client)
+        object_url = self.BASE_URL + "/b/bucket/o/blob?prettyPrint=false"
+
+        self.assertTrue(batcher.accepts("PATCH", object_url))
+        self.assertTrue(batcher.accepts("PUT", self.BASE_URL + "/b/bucket"))
+        self.assertTrue(batcher.accepts("DELETE", object_url))
+        self.assertFalse(batcher.accepts("GET", object_url))
+        self.assertFalse(batcher.accepts("POST", object_url))
+        self.assertFalse(batcher.accepts("PUT", self.BASE_URL + "/projects/p"))
+        self.assertFalse(
+            batcher.accepts("DELETE", "https://example.com/storage/v1/b/bucket")
+        )
+
+    def test_submit_alone(self):
+        response = _make_response(NO_CONTENT)
+        http = _make_requests_session([response])
+        client = self._make_client(http)
+        batcher = self._make_one(client, 0.0)
+        url = self.BASE_URL + "/b/bucket/o/blob"
+
+        future = batcher.submit("DELETE", url, {"X-Header": "1"}, None, timeout=42)
+
+        # A request which no other joins is sent as is.
+        self.assertIs(future.result(), response)
+        http.request.assert_called_once_with(
+            url=url, method="DELETE", headers={"X-Header": "1"}, data=None, timeout=42
+        )
+        self.assertEqual(batcher.batches, 1)
+        self.assertEqual(batcher.requests, 1)
+
+    def test_submit_concurrent(self):
+        import threading
+
+        response = _make_response(
+            content=_TWO_PART_MIME_RESPONSE_WITH_FAIL,
+            headers={"content-type": 'multipart/mixed; boundary="DEADBEEF="'},
+        )
+        http = _make_requests_session([response])
+        client = self._make_client(http)
+        batcher = self._make_one(client, max_size=2)
+        first_url = self.BASE_URL + "/b/bucket/o/first"
+        second_url = self.BASE_URL + "/b/bucket/o/second"
+        futures = []
+
+        leader = threading.Thread(
+            target=lambda: futures.append(
+                batcher.submit("PATCH", first_url, {}, '{"foo": 1}')
+            )
+        )
+        leader.start()
+        while not batcher._pending:
+            leader.join(0.001)
+        # The second request fills the batch, which the leader then sends.
+        futures.append(batcher.submit("DELETE", second_url, {}, None))
+        leader.join()
+
+        second, first = futures
+        self.assertEqual(first.result().json(), {"foo": 1, "bar": 2})
+        self.assertEqual(second.result().status_code, 404)
+        self.assertEqual(batcher.batches, 1)
+        self.assertEqual(batcher.requests, 2)
+        http.request.assert_called_once()
+        kw = http.request.call_args[1]
+        self.assertEqual(kw["method"], "POST")
+        self.assertEqual(kw["url"], "https://storage.googleapis.com/batch/storage/v1")
+        self.assertIn(f"PATCH {first_url} HTTP/1.1", kw["data"])
+        self.assertIn(f"DELETE {second_url} HTTP/1.1", kw["data"])
+
+    def test_submit_w_transport_error(self):
+        http = _make_requests_session([ConnectionError("reset")])
+        client = self._make_client(http)
+        batcher = self._make_one(client, max_size=1)
+
+        future = batcher.submit("DELETE", self.BASE_URL + "/b/bucket", {}, None)
+
+        with self.assertRaises(ConnectionError):
+            future.result()
+
+
 class _Connection(object):
     project = "TESTING"
 
@@ -787,3 +1061,11 @@ class _Client(object):
     def __init__(self, connection):
         self._base_connection = connection
         self._connection = connection
+        self.invalidated = []
+        self.pool_maxsize = None
+
+    def _invalidate_object_metadata(self, path):
+        self.invalidated.append(path)
+
+    def _ensure_connection_pool_maxsize(self, maxsize):
+        self.pool_maxsize = maxsize
@@ -287,6 +287,25 @@ class Test_Blob(unittest.TestCase):
         with self.assertRaises(ValueError):
             blob.chunk_size = 11
 
+    def test_download_buffer_size_setter(self):
+        blob = self._make_one("blob-name", bucket=object())
+        self.assertIsNone(blob.download_buffer_size)
+        blob.download_buffer_size = 4096
+        self.assertEqual(blob.download_buffer_size, 4096)
+        blob.download_buffer_size = None
+        self.assertIsNone(blob.download_buffer_size)
+
+    def test_download_buffer_size_setter_bad_value(self):
+        blob = self._make_one("blob-name", bucket=object())
+        with self.assertRaises(ValueError):
+            blob.download_buffer_size = 0
+
+    def test_adaptive_chunk_size_setter(self):
+        blob = self._make_one("blob-name", bucket=object())
+        self.assertFalse(blob.adaptive_chunk_size)
+        blob.adaptive_chunk_size = True
+        self.assertTrue(blob.adaptive_chunk_size)
+
     def test_acl_property(self):
         from google.cloud.storage.acl import ObjectACL
 
@@ -1204,6 +1223,40 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(blob.metageneration, 4)
         self.assertEqual(blob._changes, set())
 
+    def test__extract_headers_from_download_w_content_range(self):
+        blob_name = "blob-name"
+        client = mock.Mock(spec=["_http"])
+        bucket = _Bucket(client)
+        blob = self._make_one(blob_name, bucket=bucket)
+
+        response = self._mock_requests_response(
+            http.client.PARTIAL_CONTENT,
+            headers={
+                "Content-Range": "bytes 0-3/1234",
+                "X-goog-generation": 42,
+            },
+            content=b"abcd",
+        )
+        blob._extract_headers_from_download(response)
+
+        self.assertEqual(blob.size, 1234)
+        self.assertEqual(blob.generation, 42)
+
+    def test__extract_headers_from_download_wo_content_range(self):
+        blob_name = "blob-name"
+        client = mock.Mock(spec=["_http"])
+        bucket = _Bucket(client)
+        blob = self._make_one(blob_name, bucket=bucket, properties={"size": "99"})
+
+        response = self._mock_requests_response(
+            http.client.OK,
+            headers={"Content-Range": "bytes */*"},
+            content=b"",
+        )
+        blob._extract_headers_from_download(response)
+
+        self.assertEqual(blob.size, 99)
+
     def test__extract_headers_from_download_w_hash_response_header_none(self):
         blob_name = "blob-name"
         md5_hash = "CS9tHYTtyFntzj7B9nkkJQ=="
@@ -1275,6 +1328,7 @@ class Test_Blob(unittest.TestCase):
         retry = extra_kwargs.get("retry", DEFAULT_RETRY)
 
         with patch as patched:
+            patched.return_value.consume.return_value.headers = {}
             if w_range:
                 blob._do_download(
                     transport,
@@ -1306,6 +1360,7 @@ class Test_Blob(unittest.TestCase):
                 checksum="auto",
                 retry=retry,
                 single_shot_download=False,
+                buffer_size=extra_kwargs.get("download_buffer_size"),
             )
         else:
             patched.assert_called_once_with(
@@ -1317,6 +1372,7 @@ class Test_Blob(unittest.TestCase):
                 checksum="auto",
                 retry=retry,
                 single_shot_download=False,
+                buffer_size=extra_kwargs.get("download_buffer_size"),
             )
 
         patched.return_value.consume.assert_called_once_with(
@@ -1373,8 +1429,23 @@ class Test_Blob(unittest.TestCase):
             w_range=False, raw_download=False, timeout=9.58
         )
 
+    def test__do_download_wo_chunks_w_download_buffer_size(self):
+        self._do_download_helper_wo_chunks(
+            w_range=False, raw_download=False, download_buffer_size=4096
+        )
+
+    def test__do_download_wo_chunks_w_raw_w_download_buffer_size(self):
+        self._do_download_helper_wo_chunks(
+            w_range=True, raw_download=True, download_buffer_size=4096
+        )
+
     def _do_download_helper_w_chunks(
-        self, w_range, raw_download, timeout=None, checksum="md5"
+        self,
+        w_range,
+        raw_download,
+        timeout=None,
+        checksum="md5",
+        adaptive_chunk_size=False,
     ):
         blob_name = "blob-name"
         client = self._make_client()
@@ -1382,13 +1453,18 @@ class Test_Blob(unittest.TestCase):
         blob = self._make_one(blob_name, bucket=bucket)
         blob._CHUNK_SIZE_MULTIPLE = 1
         chunk_size = blob.chunk_size = 3
+        blob.adaptive_chunk_size = adaptive_chunk_size
 
         transport = object()
         file_obj = io.BytesIO()
         download_url = "http://test.invalid"
         headers = {}
 
-        download = mock.Mock(finished=False, spec=["finished", "consume_next_chunk"])
+        download = mock.Mock(
+            finished=False,
+            chunk_size_decision=None,
+            spec=["finished", "consume_next_chunk", "chunk_size_decision"],
+        )
 
         def side_effect(*args, **kwargs):
             download.finished = True
@@ -1441,6 +1517,8 @@ class Test_Blob(unittest.TestCase):
                 start=1,
                 end=3,
                 retry=DEFAULT_RETRY,
+                checksum=checksum,
+                adaptive_chunk_size=adaptive_chunk_size,
             )
         else:
             patched.assert_called_once_with(
@@ -1451,6 +1529,8 @@ class Test_Blob(unittest.TestCase):
                 start=0,
                 end=None,
                 retry=DEFAULT_RETRY,
+                checksum=checksum,
+                adaptive_chunk_size=adaptive_chunk_size,
             )
         download.consume_next_chunk.assert_called_once_with(
             transport, timeout=expected_timeout
@@ -1472,24 +1552,19 @@ class Test_Blob(unittest.TestCase):
         self._do_download_helper_w_chunks(w_range=True, raw_download=True, timeout=9.58)
 
     def test__do_download_w_chunks_w_checksum(self):
-        from google.cloud.storage import blob as blob_module
-
-        with mock.patch.object(blob_module._logger, "info") as patch:
-            self._do_download_helper_w_chunks(
-                w_range=False, raw_download=False, checksum="md5"
-            )
-        patch.assert_called_once_with(
-            blob_module._CHUNKED_DOWNLOAD_CHECKSUM_MESSAGE.format("md5")
+        self._do_download_helper_w_chunks(
+            w_range=False, raw_download=False, checksum="crc32c"
         )
 
     def test__do_download_w_chunks_wo_checksum(self):
-        from google.cloud.storage import blob as blob_module
+        self._do_download_helper_w_chunks(
+            w_range=False, raw_download=False, checksum=None
+        )
 
-        with mock.patch.object(blob_module._logger, "info") as patch:
-            self._do_download_helper_w_chunks(
-                w_range=False, raw_download=False, checksum=None
-            )
-        patch.assert_not_called()
+    def test__do_download_w_chunks_w_adaptive_chunk_size(self):
+        self._do_download_helper_w_chunks(
+            w_range=False, raw_download=False, adaptive_chunk_size=True
+        )
 
     def test_download_to_file_with_failure(self):
         from google.cloud.exceptions import NotFound
@@ -2518,7 +2593,11 @@ class Test_Blob(unittest.TestCase):
             # Create mocks to be checked for doing transport.
             transport = self._mock_transport(http.client.OK, {})
 
-            client = mock.Mock(_http=transport, _connection=_Connection, spec=["_http"])
+            client = mock.Mock(
+                _http=transport,
+                _connection=_Connection,
+                spec=["_http", "_invalidate_object_metadata"],
+            )
             client._connection.API_BASE_URL = "https://storage.googleapis.com"
             client._extra_headers = {}
 
@@ -2629,8 +2708,11 @@ class Test_Blob(unittest.TestCase):
                 **client._extra_headers,
             }
         client._http.request.assert_called_once_with(
-            "POST", upload_url, data=payload, headers=headers, timeout=expected_timeout
+            "POST", upload_url, data=mock.ANY, headers=headers, timeout=expected_timeout
         )
+        sent = client._http.request.call_args.kwargs["data"]
+        self.assertEqual(bytes(sent), payload)
+        self.assertEqual(len(sent), len(payload))
 
     @mock.patch(
         "google.cloud.storage._media._upload.get_boundary", return_value=b"==0=="
@@ -2725,7 +2807,11 @@ class Test_Blob(unittest.TestCase):
     )
     def test__do_multipart_upload_with_client(self, mock_get_boundary):
         transport = self._mock_transport(http.client.OK, {})
-        client = mock.Mock(_http=transport, _connection=_Connection, spec=["_http"])
+        client = mock.Mock(
+            _http=transport,
+            _connection=_Connection,
+            spec=["_http", "_invalidate_object_metadata"],
+        )
         client._connection.API_BASE_URL = "https://storage.googleapis.com"
         client._extra_headers = {}
         self._do_multipart_success(mock_get_boundary, client=client)
@@ -2739,7 +2825,11 @@ class Test_Blob(unittest.TestCase):
             "x-goog-custom-audit-user": "baz",
         }
         transport = self._mock_transport(http.client.OK, {})
-        client = mock.Mock(_http=transport, _connection=_Connection, spec=["_http"])
+        client = mock.Mock(
+            _http=transport,
+            _connection=_Connection,
+            spec=["_http", "_invalidate_object_metadata"],
+        )
         client._connection.API_BASE_URL = "https://storage.googleapis.com"
         client._extra_headers = custom_headers
         self._do_multipart_success(mock_get_boundary, client=client)
@@ -2819,7 +2909,11 @@ class Test_Blob(unittest.TestCase):
             transport = self._mock_transport(http.client.OK, response_headers)
 
             # Create some mock arguments and call the method under test.
-            client = mock.Mock(_http=transport, _connection=_Connection, spec=["_http"])
+            client = mock.Mock(
+                _http=transport,
+                _connection=_Connection,
+                spec=["_http", "_invalidate_object_metadata"],
+            )
             client._connection.API_BASE_URL = "https://storage.googleapis.com"
             client._extra_headers = {}
 
@@ -3267,7 +3361,11 @@ class Test_Blob(unittest.TestCase):
             )
 
         # Create some mock arguments and call the method under test.
-        client = mock.Mock(_http=transport, _connection=_Connection, spec=["_http"])
+        client = mock.Mock(
+            _http=transport,
+            _connection=_Connection,
+            spec=["_http", "_invalidate_object_metadata"],
+        )
         client._connection.API_BASE_URL = "https://storage.googleapis.com"
         client._connection.user_agent = USER_AGENT
         client._extra_headers = {}
@@ -3382,6 +3480,291 @@ class Test_Blob(unittest.TestCase):
                 self.assertTrue(patch.called)
                 self.assertIsInstance(e, DataCorruption)
 
+    def _do_resumable_upload_w_session_helper(self, session=None, resume_error=None):
+        from google.cloud.storage.upload_session_store import UploadSessionStore
+
+        bucket = _Bucket(name="yesterday")
+        blob = self._make_one("blob-name", bucket=bucket)
+        client = mock.Mock(spec=["_invalidate_object_metadata"])
+        stream = mock.sentinel.stream
+        transport = mock.sentinel.transport
+        store = mock.create_autospec(UploadSessionStore, instance=True)
+        store.get.return_value = session
+
+        responses = [mock.sentinel.response1, mock.sentinel.response2]
+        upload = mock.Mock(
+            finished=False,
+            resumable_url="http://test.invalid?upload_id=new",
+            checksum_state={"type": "crc32c", "bytes": 3, "value": 7},
+            chunk_size_decision=None,
+            spec=[
+                "finished",
+                "resumable_url",
+                "checksum_state",
+                "chunk_size",
+                "chunk_size_decision",
+            ],
+        )
+
+        def transmit_next_chunk(transport, timeout=None):
+            response = responses[len(store.put.mock_calls) - 1]
+            upload.finished = response is responses[-1]
+            return response
+
+        upload.transmit_next_chunk = mock.Mock(side_effect=transmit_next_chunk)
+
+        def initiate(*args, resumable_url=None, **kwargs):
+            if resumable_url is not None and resume_error is not None:
+                raise resume_error
+            return upload, transport
+
+        blob._initiate_resumable_upload = mock.Mock(side_effect=initiate)
+
+        response = blob._do_resumable_upload(
+            client,
+            stream,
+            "text/plain",
+            100,
+            None,
+            None,
+            None,
+            None,
+            None,
+            upload_session=(store, "/path/to/file"),
+        )
+
+        self.assertIs(response, responses[-1])
+        session_key = ("yesterday", "blob-name", "/path/to/file")
+        store.get.assert_called_once_with(*session_key)
+        store.delete.assert_called_with(*session_key)
+        client._invalidate_object_metadata.assert_called_once_with(blob.path)
+        return blob, store, session_key
+
+    def test__do_resumable_upload_w_session_new(self):
+        blob, store, session_key = self._do_resumable_upload_w_session_helper()
+
+        self.assertEqual(blob._initiate_resumable_upload.call_count, 1)
+        self.assertNotIn(
+            "resumable_url", blob._initiate_resumable_upload.call_args.kwargs
+        )
+        # The session is saved when initiated, and after every chunk but the last.
+        self.assertEqual(
+            store.put.mock_calls,
+            [
+                mock.call(*session_key, "http://test.invalid?upload_id=new"),
+                mock.call(
+                    *session_key,
+                    "http://test.invalid?upload_id=new",
+                    {"type": "crc32c", "bytes": 3, "value": 7},
+                ),
+            ],
+        )
+        store.delete.assert_called_once_with(*session_key)
+
+    def test__do_resumable_upload_w_session_resumed(self):
+        session = {
+            "resumable_url": "http://test.invalid?upload_id=old",
+            "checksum_state": {"type": "crc32c", "bytes": 1, "value": 2},
+        }
+        blob, store, session_key = self._do_resumable_upload_w_session_helper(
+            session=session
+        )
+
+        blob._initiate_resumable_upload.assert_called_once()
+        kwargs = blob._initiate_resumable_upload.call_args.kwargs
+        self.assertEqual(kwargs["resumable_url"], "http://test.invalid?upload_id=old")
+        self.assertEqual(kwargs["checksum_state"], session["checksum_state"])
+        store.delete.assert_called_once_with(*session_key)
+
+    def test__do_resumable_upload_w_session_expired(self):
+        from google.cloud.storage.exceptions import InvalidResponse
+
+        session = {
+            "resumable_url": "http://test.invalid?upload_id=old",
+            "checksum_state": None,
+        }
+        blob, store, session_key = self._do_resumable_upload_w_session_helper(
+            session=session, resume_error=InvalidResponse(mock.sentinel.response)
+        )
+
+        # The expired session is dropped and a new one is started.
+        self.assertEqual(blob._initiate_resumable_upload.call_count, 2)
+        self.assertNotIn(
+            "resumable_url", blob._initiate_resumable_upload.call_args.kwargs
+        )
+        self.assertEqual(store.delete.call_count, 2)
+        store.put.assert_any_call(*session_key, "http://test.invalid?upload_id=new")
+
+    def test__do_resumable_upload_w_adaptive_chunk_size(self):
+        import contextlib
+
+        bucket = _Bucket(name="yesterday")
+        blob = self._make_one("blob-name", bucket=bucket)
+        blob.adaptive_chunk_size = True
+        span = mock.Mock(spec=["add_event"])
+        client = mock.Mock(spec=["_invalidate_object_metadata"])
+        decisions = [
+            {"action": "grow", "chunk_size": 2097152, "throughput": 1000.0},
+            None,
+        ]
+        upload = mock.Mock(
+            finished=False,
+            resumable_url="http://test.invalid?upload_id=new",
+            chunk_size=1048576,
+            spec=["finished", "resumable_url", "chunk_size", "chunk_size_decision"],
+        )
+
+        def transmit_next_chunk(transport, timeout=None):
+            upload.chunk_size_decision = decisions.pop(0)
+            upload.finished = not decisions
+            return mock.sentinel.response
+
+        upload.transmit_next_chunk = mock.Mock(side_effect=transmit_next_chunk)
+        blob._initiate_resumable_upload = mock.Mock(
+            return_value=(upload, mock.sentinel.transport)
+        )
+
+        @contextlib.contextmanager
+        def create_trace_span(**kwargs):
+            self.assertTrue(kwargs["attributes"]["upload.adaptive_chunk_size"])
+            yield span
+
+        with mock.patch(
+            "google.cloud.storage.blob.create_trace_span", new=create_trace_span
+        ):
+            response = blob._do_resumable_upload(
+                client,
+                mock.sentinel.stream,
+                "text/plain",
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+            )
+
+        self.assertIs(response, mock.sentinel.response)
+        kwargs = blob._initiate_resumable_upload.call_args.kwargs
+        self.assertTrue(kwargs["adaptive_chunk_size"])
+        # Only chunks which led to a decision are recorded.
+        span.add_event.assert_called_once_with(
+            "chunk_size_decision",
+            attributes={"action": "grow", "chunk_size": 2097152, "throughput": 1000.0},
+        )
+
+    def test__do_resumable_upload_failure_invalidates_metadata(self):
+        from google.cloud.storage.exceptions import InvalidResponse
+
+        bucket = _Bucket(name="yesterday")
+        blob = self._make_one("blob-name", bucket=bucket)
+        client = mock.Mock(spec=["_invalidate_object_metadata"])
+        upload = mock.Mock(
+            finished=False,
+            resumable_url="http://test.invalid?upload_id=new",
+            chunk_size=1048576,
+            chunk_size_decision=None,
+            spec=["finished", "resumable_url", "chunk_size", "chunk_size_decision"],
+        )
+        upload.transmit_next_chunk = mock.Mock(
+            side_effect=InvalidResponse(mock.sentinel.response)
+        )
+        blob._initiate_resumable_upload = mock.Mock(
+            return_value=(upload, mock.sentinel.transport)
+        )
+
+        with self.assertRaises(InvalidResponse):
+            blob._do_resumable_upload(
+                client,
+                mock.sentinel.stream,
+                "text/plain",
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+            )
+
+        # Earlier chunks may already have written the object.
+        client._invalidate_object_metadata.assert_called_once_with(blob.path)
+
+    def test__initiate_resumable_upload_w_adaptive_chunk_size(self):
+        from google.cloud.storage import blob as blob_module
+
+        bucket = _Bucket(name="yesterday")
+        blob = self._make_one("blob-name", bucket=bucket)
+        client = mock.Mock(_http=object(), _connection=_Connection, spec=["_http"])
+        client._connection.API_BASE_URL = "https://storage.googleapis.com"
+        client._connection.user_agent = "testing 1.2.3"
+        client._extra_headers = {}
+
+        with mock.patch.object(blob_module.ResumableUpload, "initiate", autospec=True):
+            upload, _ = blob._initiate_resumable_upload(
+                client, io.BytesIO(b"data"), "text/plain", 4, adaptive_chunk_size=True
+            )
+
+        # The upload starts small and grows up to the default chunk size.
+        self.assertEqual(upload.chunk_size, 1024 * 1024)
+        self.assertEqual(upload._chunk_sizer.maximum, blob_module._DEFAULT_CHUNKSIZE)
+
+    def test__add_chunk_size_decision_event_failure(self):
+        from google.cloud.storage.blob import _add_chunk_size_decision_event
+
+        span = mock.Mock(spec=["add_event"])
+        download = mock.Mock(
+            chunk_size_decision={
+                "action": "shrink",
+                "chunk_size": 524288,
+                "throughput": None,
+            }
+        )
+
+        _add_chunk_size_decision_event(span, download)
+        _add_chunk_size_decision_event(None, download)
+
+        span.add_event.assert_called_once_with(
+            "chunk_size_decision",
+            attributes={"action": "shrink", "chunk_size": 524288},
+        )
+
+    def test__initiate_resumable_upload_w_resumable_url(self):
+        from google.cloud.storage import blob as blob_module
+
+        bucket = _Bucket(name="yesterday")
+        blob = self._make_one("blob-name", bucket=bucket)
+        client = mock.Mock(_http=object(), _connection=_Connection, spec=["_http"])
+        client._connection.API_BASE_URL = "https://storage.googleapis.com"
+        client._connection.user_agent = "testing 1.2.3"
+        client._extra_headers = {}
+        stream = io.BytesIO(b"data")
+        checksum_state = {"type": "md5", "bytes": 0, "value": 0}
+
+        with mock.patch.object(
+            blob_module.ResumableUpload, "resume", autospec=True
+        ) as resume, mock.patch.object(
+            blob_module.ResumableUpload, "initiate", autospec=True
+        ) as initiate:
+            upload, _ = blob._initiate_resumable_upload(
+                client,
+                stream,
+                "text/plain",
+                4,
+                resumable_url="http://test.invalid?upload_id=old",
+                checksum_state=checksum_state,
+            )
+
+        initiate.assert_not_called()
+        resume.assert_called_once_with(
+            upload,
+            client._http,
+            stream,
+            "http://test.invalid?upload_id=old",
+            "text/plain",
+            total_bytes=4,
+            checksum_state=checksum_state,
+        )
+
     def _do_upload_helper(
         self,
         chunk_size=None,
@@ -3479,6 +3862,7 @@ class Test_Blob(unittest.TestCase):
                 retry=retry,
                 command=None,
                 crc32c_checksum_value=None,
+                upload_session=None,
             )
 
     def test__do_upload_uses_multipart(self):
@@ -3508,6 +3892,38 @@ class Test_Blob(unittest.TestCase):
     def test__do_upload_with_retry(self):
         self._do_upload_helper(retry=DEFAULT_RETRY)
 
+    def test__do_upload_w_retry_budget(self):
+        from google.cloud.storage.retry import RetryBudget
+        from google.cloud.storage.retry import _LimitedRetry
+
+        blob = self._make_one("blob-name", bucket=None)
+        response = mock.Mock(spec=["json"])
+        blob._do_multipart_upload = mock.Mock(return_value=response, spec=[])
+        budget = RetryBudget()
+        client = mock.Mock(
+            _retry_budget=budget,
+            _circuit_breaker=None,
+            spec=["_retry_budget", "_circuit_breaker"],
+        )
+
+        blob._do_upload(
+            client,
+            mock.sentinel.stream,
+            None,
+            3,
+            None,
+            None,
+            None,
+            None,
+            None,
+            retry=DEFAULT_RETRY,
+        )
+
+        retry = blob._do_multipart_upload.call_args.kwargs["retry"]
+        self.assertIsInstance(retry, _LimitedRetry)
+        self.assertIs(retry._retry_policy, DEFAULT_RETRY)
+        self.assertIs(retry._retry_budget, budget)
+
     def test__do_upload_with_conditional_retry_success(self):
         self._do_upload_helper(
             retry=DEFAULT_RETRY_IF_GENERATION_SPECIFIED, if_generation_match=123456
@@ -3568,6 +3984,7 @@ class Test_Blob(unittest.TestCase):
             retry=retry,
             command=None,
             crc32c_checksum_value=None,
+            upload_session=None,
         )
         return stream
 
@@ -3636,6 +4053,7 @@ class Test_Blob(unittest.TestCase):
                 "checksum": None,
                 "retry": retry,
                 "command": None,
+                "upload_session": None,
             },
         )
 
@@ -3672,6 +4090,27 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(stream.mode, "rb")
         self.assertEqual(stream.name, temp.name)
 
+    def test_upload_from_filename_w_upload_session_store(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        blob = self._make_one("blob-name", bucket=None)
+        blob._do_upload = mock.Mock(return_value={}, spec=[])
+        store = mock.sentinel.store
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, "wb") as file_obj:
+                file_obj.write(b"data")
+
+            blob.upload_from_filename(
+                temp.name,
+                client=mock.sentinel.client,
+                checksum=None,
+                upload_session_store=store,
+            )
+
+        kwargs = blob._do_upload.call_args.kwargs
+        self.assertEqual(kwargs["upload_session"], (store, temp.name))
+
     def test_upload_from_filename_with_retry(self):
         from google.cloud._testing import _NamedTemporaryFile
 
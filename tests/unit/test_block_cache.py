@@ -0,0 +1,136 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import mock
+
+
+class TestBlockCache(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+
+    def _make_one(self, *args, **kwargs):
+        from google.cloud.storage.block_cache import BlockCache
+
+        return BlockCache(self._directory.name, *args, **kwargs)
+
+    def test_ctor_defaults(self):
+        from google.cloud.storage.block_cache import DEFAULT_BLOCK_SIZE
+        from google.cloud.storage.block_cache import DEFAULT_MAX_BYTES
+
+        cache = self._make_one()
+        self.assertEqual(cache.directory, self._directory.name)
+        self.assertEqual(cache.block_size, DEFAULT_BLOCK_SIZE)
+        self.assertEqual(cache.max_bytes, DEFAULT_MAX_BYTES)
+        self.assertEqual(cache.size, 0)
+
+    def test_ctor_creates_directory(self):
+        from google.cloud.storage.block_cache import BlockCache
+
+        directory = os.path.join(self._directory.name, "nested", "cache")
+        BlockCache(directory)
+        self.assertTrue(os.path.isdir(directory))
+
+    def test_ctor_invalid_block_size(self):
+        with self.assertRaises(ValueError):
+            self._make_one(block_size=0)
+
+    def test_get_miss(self):
+        cache = self._make_one()
+        self.assertIsNone(cache.get("bucket", "blob", 1, 0))
+
+    def test_put_and_get(self):
+        cache = self._make_one(block_size=4)
+        cache.put("bucket", "blob", 1, 0, b"abcd")
+        cache.put("bucket", "blob", 1, 1, b"ef")
+
+        self.assertEqual(cache.get("bucket", "blob", 1, 0), b"abcd")
+        self.assertEqual(cache.get("bucket", "blob", 1, 1), b"ef")
+        self.assertEqual(cache.size, 6)
+        # Every part of the key is significant.
+        self.assertIsNone(cache.get("bucket", "blob", 2, 0))
+        self.assertIsNone(cache.get("bucket", "other", 1, 0))
+        self.assertIsNone(cache.get("other", "blob", 1, 0))
+        self.assertIsNone(self._make_one(block_size=8).get("bucket", "blob", 1, 0))
+
+    def test_put_and_get_raw_download(self):
+        cache = self._make_one()
+        cache.put("bucket", "blob", 1, 0, b"gzipped", raw_download=True)
+        cache.put("bucket", "blob", 1, 0, b"decoded")
+
+        self.assertEqual(
+            cache.get("bucket", "blob", 1, 0, raw_download=True), b"gzipped"
+        )
+        self.assertEqual(cache.get("bucket", "blob", 1, 0), b"decoded")
+
+    def test_put_scans_only_when_over_budget(self):
+        cache = self._make_one(max_bytes=8, block_size=4)
+        cache.put("bucket", "blob", 1, 0, b"abcd")
+
+        with mock.patch.object(
+            cache, "_list_blocks", wraps=cache._list_blocks
+        ) as list_blocks:
+            cache.put("bucket", "blob", 1, 1, b"efgh")
+            list_blocks.assert_not_called()
+
+            cache.put("bucket", "blob", 1, 2, b"ijkl")
+            list_blocks.assert_called_once_with()
+
+        self.assertEqual(cache.size, 8)
+        self.assertEqual(cache._size_estimate, 8)
+
+    def test_put_failure_removes_temp_file(self):
+        cache = self._make_one()
+        with mock.patch("os.replace", side_effect=OSError("boom")):
+            with self.assertRaises(OSError):
+                cache.put("bucket", "blob", 1, 0, b"abcd")
+
+        self.assertIsNone(cache.get("bucket", "blob", 1, 0))
+        for _, _, files in os.walk(self._directory.name):
+            self.assertEqual([name for name in files if name != ".lock"], [])
+
+    def test_put_evicts_least_recently_used(self):
+        cache = self._make_one(max_bytes=8, block_size=4)
+        cache.put("bucket", "blob", 1, 0, b"abcd")
+        cache.put("bucket", "blob", 1, 1, b"efgh")
+        # Make the first block the oldest, then access it so it is kept.
+        old_time = os.stat(cache._block_path("bucket", "blob", 1, 1)).st_mtime - 10
+        for index in (0, 1):
+            path = cache._block_path("bucket", "blob", 1, index)
+            os.utime(path, (old_time - index, old_time - index))
+        self.assertEqual(cache.get("bucket", "blob", 1, 0), b"abcd")
+
+        cache.put("bucket", "other", 1, 0, b"ijkl")
+
+        self.assertEqual(cache.size, 8)
+        self.assertEqual(cache.get("bucket", "blob", 1, 0), b"abcd")
+        self.assertIsNone(cache.get("bucket", "blob", 1, 1))
+        self.assertEqual(cache.get("bucket", "other", 1, 0), b"ijkl")
+
+    def test_shared_directory(self):
+        first = self._make_one(max_bytes=4, block_size=4)
+        second = self._make_one(max_bytes=4, block_size=4)
+        first.put("bucket", "blob", 1, 0, b"abcd")
+        self.assertEqual(second.get("bucket", "blob", 1, 0), b"abcd")
+
+        old_time = os.stat(first._block_path("bucket", "blob", 1, 0)).st_mtime - 10
+        os.utime(first._block_path("bucket", "blob", 1, 0), (old_time, old_time))
+        second.put("bucket", "blob", 1, 1, b"efgh")
+
+        self.assertIsNone(first.get("bucket", "blob", 1, 0))
+        self.assertEqual(first.get("bucket", "blob", 1, 1), b"efgh")
@@ -290,6 +290,142 @@ class TestClient(unittest.TestCase):
         )
         self.assertEqual(client._connection.extra_headers, custom_headers)
 
+    def test_ctor_wo_credential_refresh(self):
+        credentials = _make_credentials()
+
+        client = self._make_one(project="PROJECT", credentials=credentials)
+
+        self.assertIsNone(client._credential_refresher)
+
+    def test_ctor_w_credential_refresh(self):
+        credentials = _make_credentials()
+        patch = mock.patch("google.cloud.storage.client._CredentialRefresher")
+
+        with patch as refresher_cls:
+            client = self._make_one(
+                project="PROJECT",
+                credentials=credentials,
+                refresh_credentials_in_background=True,
+            )
+
+        refresher = refresher_cls.return_value
+        self.assertIs(client._credential_refresher, refresher)
+        refresher_cls.assert_called_once_with(credentials, mock.ANY)
+        refresher.start.assert_called_once_with()
+
+        client.close()
+
+        refresher.stop.assert_called_once_with()
+
+    def test_ctor_w_retry_limits(self):
+        from google.cloud.storage.retry import CircuitBreaker
+        from google.cloud.storage.retry import RetryBudget
+
+        credentials = _make_credentials()
+        budget = RetryBudget()
+        breaker = CircuitBreaker()
+
+        client = self._make_one(
+            project="PROJECT",
+            credentials=credentials,
+            retry_budget=budget,
+            circuit_breaker=breaker,
+        )
+
+        self.assertIs(client._retry_budget, budget)
+        self.assertIs(client._circuit_breaker, breaker)
+
+    def test_ctor_w_auto_batch_window(self):
+        from google.cloud.storage.batch import _AutoBatcher
+
+        credentials = _make_credentials()
+
+        client = self._make_one(
+            project="PROJECT", credentials=credentials, auto_batch_window=0.01
+        )
+
+        self.assertIsInstance(client._auto_batcher, _AutoBatcher)
+        self.assertIs(client._auto_batcher._client, client)
+        self.assertEqual(client._auto_batcher._window, 0.01)
+
+    def test_auto_batch_concurrent_deletes(self):
+        import threading
+        from google.cloud.exceptions import NotFound
+
+        boundary = "DEADBEEF="
+        parts = [
+            (
+                f"--{boundary}\nContent-Type: application/http\n\n"
+                f"HTTP/1.1 {status}\nContent-Length: 0\n\n\n"
+            )
+            for status in ("204 No Content", "404 Not Found")
+        ]
+        content = "".join(parts) + f"--{boundary}--\n"
+        response = _make_response(
+            content=content.encode("utf-8"),
+            headers={"content-type": f'multipart/mixed; boundary="{boundary}"'},
+        )
+        http = _make_requests_session([response])
+        client = self._make_one(
+            project="PROJECT",
+            credentials=_make_credentials(),
+            _http=http,
+            auto_batch_window=10.0,
+        )
+        client._auto_batcher._max_size = 2
+        bucket = client.bucket("bucket")
+        errors = []
+
+        def delete():
+            try:
+                bucket.delete_blob("first", retry=None)
+            except NotFound as exc:  # pragma: NO COVER
+                errors.append(exc)
+
+        thread = threading.Thread(target=delete)
+        thread.start()
+        while not client._auto_batcher._pending:
+            thread.join(0.001)
+        with self.assertRaises(NotFound):
+            bucket.delete_blob("second", retry=None)
+        thread.join()
+
+        self.assertEqual(errors, [])
+        http.request.assert_called_once()
+        self.assertEqual(http.request.call_args[1]["method"], "POST")
+
+    def test_ctor_w_credential_refresh_anonymous(self):
+        from google.auth.credentials import AnonymousCredentials
+
+        patch = mock.patch("google.cloud.storage.client._CredentialRefresher")
+
+        with patch as refresher_cls:
+            client = self._make_one(
+                project="PROJECT",
+                credentials=AnonymousCredentials(),
+                refresh_credentials_in_background=True,
+            )
+
+        refresher_cls.assert_not_called()
+        self.assertIsNone(client._credential_refresher)
+
+    def test_credential_refresh_stopped_on_garbage_collection(self):
+        import gc
+
+        credentials = _make_credentials()
+        patch = mock.patch("google.cloud.storage.client._CredentialRefresher")
+
+        with patch as refresher_cls:
+            client = self._make_one(
+                project="PROJECT",
+                credentials=credentials,
+                refresh_credentials_in_background=True,
+            )
+        del client
+        gc.collect()
+
+        refresher_cls.return_value.stop.assert_called_once_with(wait=False)
+
     def test_ctor_wo_project(self):
         PROJECT = "PROJECT"
         credentials = _make_credentials(project=PROJECT)
@@ -301,6 +437,157 @@ class TestClient(unittest.TestCase):
         self.assertIs(client._connection.credentials, credentials)
         self.assertIsNone(client.current_batch)
         self.assertEqual(list(client._batch_stack), [])
+        self.assertIsNone(client.download_buffer_size)
+
+    def test_ctor_w_download_buffer_size(self):
+        credentials = _make_credentials(project="PROJECT")
+
+        client = self._make_one(credentials=credentials, download_buffer_size=4096)
+
+        self.assertEqual(client.download_buffer_size, 4096)
+
+    def test_ctor_w_connection_pool_options(self):
+        credentials = _make_credentials(project="PROJECT")
+
+        client = self._make_one(
+            credentials=credentials,
+            connection_pool_size=4,
+            connection_pool_maxsize=32,
+            tcp_keepalive=60,
+        )
+
+        self.assertEqual(client._connection_pool_size, 4)
+        self.assertEqual(client._connection_pool_maxsize, 32)
+        self.assertEqual(client._tcp_keepalive, 60)
+        self.assertEqual(
+            client.connection_pool_stats,
+            {"requests": 0, "hits": 0, "misses": 0, "discards": 0},
+        )
+
+    def test__http_configures_connection_pools(self):
+        credentials = _make_credentials(project="PROJECT")
+        client = self._make_one(
+            credentials=credentials, connection_pool_maxsize=32, tcp_keepalive=60
+        )
+
+        with mock.patch(
+            "google.cloud.storage.client._configure_connection_pools"
+        ) as configure:
+            session = client._http
+            # The session is only configured once.
+            self.assertIs(client._http, session)
+
+        configure.assert_called_once_with(
+            session,
+            client._connection_pool_stats,
+            pool_size=None,
+            pool_maxsize=32,
+            tcp_keepalive=60,
+        )
+
+    def test__http_w_http2(self):
+        credentials = _make_credentials(project="PROJECT")
+        client = self._make_one(credentials=credentials, http2=True)
+
+        with mock.patch("google.cloud.storage.client.HTTP2Adapter") as adapter_cls:
+            session = client._http
+            self.addCleanup(session.close)
+
+        adapter_cls.assert_called_once_with()
+        self.assertIs(
+            session.get_adapter("https://storage.googleapis.com"),
+            adapter_cls.return_value,
+        )
+
+    def test__http_w_http2_and_mtls(self):
+        credentials = _make_credentials(project="PROJECT")
+        client = self._make_one(credentials=credentials, http2=True)
+
+        with mock.patch(
+            "google.auth.transport.requests.AuthorizedSession.is_mtls",
+            new_callable=mock.PropertyMock,
+            return_value=True,
+        ), mock.patch("google.cloud.storage.client.HTTP2Adapter") as adapter_cls:
+            session = client._http
+            self.addCleanup(session.close)
+
+        # HTTP/2 is not used for mutual TLS.
+        adapter_cls.assert_not_called()
+
+    def test__http_w_http_passed(self):
+        credentials = _make_credentials(project="PROJECT")
+        http = mock.Mock(spec=[])
+        client = self._make_one(credentials=credentials, _http=http)
+
+        with mock.patch(
+            "google.cloud.storage.client._configure_connection_pools"
+        ) as configure:
+            self.assertIs(client._http, http)
+            client._ensure_connection_pool_maxsize(100)
+
+        configure.assert_not_called()
+
+    def test__ensure_connection_pool_maxsize_w_session_passed(self):
+        import requests
+
+        credentials = _make_credentials(project="PROJECT")
+        http = requests.Session()
+        self.addCleanup(http.close)
+        adapter = http.get_adapter("https://storage.googleapis.com")
+        poolmanager = adapter.poolmanager
+        client = self._make_one(credentials=credentials, _http=http)
+
+        client._ensure_connection_pool_maxsize(32)
+
+        # The caller's session is left as it is.
+        self.assertIs(client._http, http)
+        self.assertIs(http.get_adapter("https://storage.googleapis.com"), adapter)
+        self.assertIs(adapter.poolmanager, poolmanager)
+        self.assertEqual(adapter._pool_maxsize, requests.adapters.DEFAULT_POOLSIZE)
+
+    def test__ensure_connection_pool_maxsize_below_default(self):
+        credentials = _make_credentials(project="PROJECT")
+        client = self._make_one(credentials=credentials)
+
+        client._ensure_connection_pool_maxsize(8)
+
+        self.assertIsNone(client._connection_pool_maxsize)
+
+    def test__ensure_connection_pool_maxsize_below_configured(self):
+        credentials = _make_credentials(project="PROJECT")
+        client = self._make_one(credentials=credentials, connection_pool_maxsize=64)
+
+        client._ensure_connection_pool_maxsize(32)
+
+        self.assertEqual(client._connection_pool_maxsize, 64)
+
+    def test__ensure_connection_pool_maxsize_before_session(self):
+        credentials = _make_credentials(project="PROJECT")
+        client = self._make_one(credentials=credentials)
+
+        with mock.patch(
+            "google.cloud.storage.client._configure_connection_pools"
+        ) as configure:
+            client._ensure_connection_pool_maxsize(32)
+
+        self.assertEqual(client._connection_pool_maxsize, 32)
+        configure.assert_not_called()
+
+    def test__ensure_connection_pool_maxsize_w_session(self):
+        import requests
+
+        credentials = _make_credentials(project="PROJECT")
+        client = self._make_one(credentials=credentials, tcp_keepalive=60)
+        session = client._http
+        self.addCleanup(session.close)
+        self.assertIsInstance(session, requests.Session)
+
+        client._ensure_connection_pool_maxsize(32)
+
+        self.assertEqual(client._connection_pool_maxsize, 32)
+        self.assertIs(client._http, session)
+        adapter = session.get_adapter("https://storage.googleapis.com")
+        self.assertEqual(adapter._pool_maxsize, 32)
 
     def test_ctor_w_project_explicit_none(self):
         credentials = _make_credentials()
@@ -614,6 +901,16 @@ class TestClient(unittest.TestCase):
         batch = client.batch()
         self.assertIsInstance(batch, Batch)
         self.assertIs(batch._client, client)
+        self.assertIsNone(batch._max_workers)
+
+    def test_batch_w_max_workers(self):
+        credentials = _make_credentials()
+        client = self._make_one(project="PROJECT", credentials=credentials)
+
+        batch = client.batch(raise_exception=False, max_workers=8)
+
+        self.assertFalse(batch._raise_exception)
+        self.assertEqual(batch._max_workers, 8)
 
     def test__get_resource_miss_w_defaults(self):
         from google.cloud.exceptions import NotFound
@@ -638,6 +935,19 @@ class TestClient(unittest.TestCase):
             _target_object=None,
         )
 
+    def test__get_resource_wo_coalesce_or_cache_builds_no_key(self):
+        credentials = _make_credentials()
+        client = self._make_one(project="PROJECT", credentials=credentials)
+        connection = client._base_connection = _make_connection({})
+
+        with mock.patch(
+            "google.cloud.storage.client._SingleFlight.make_key"
+        ) as make_key:
+            self.assertEqual(client._get_resource("/b/bucket/o/blob"), {})
+
+        make_key.assert_not_called()
+        connection.api_request.assert_called_once()
+
     def test__get_resource_hit_w_explicit(self):
         project = "PROJECT"
         path = "/path/to/something"
@@ -673,6 +983,216 @@ class TestClient(unittest.TestCase):
             _target_object=target,
         )
 
+    def test__get_resource_coalesced(self):
+        import threading
+        import time
+
+        project = "PROJECT"
+        path = "/b/bucket/o/blob"
+        credentials = _make_credentials()
+        client = self._make_one(
+            project=project, credentials=credentials, coalesce_get_requests=True
+        )
+
+        def api_request(**kwargs):
+            # Keep the request in flight until the other callers join it.
+            deadline = time.monotonic() + 5
+            while client._get_requests.merged < 3:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.001)
+            return {"name": "blob"}
+
+        connection = client._base_connection = _make_connection()
+        connection.api_request.side_effect = api_request
+        results = []
+
+        def get():
+            results.append(
+                client._get_resource(path, query_params={"projection": "noAcl"})
+            )
+
+        threads = [threading.Thread(target=get) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        connection.api_request.assert_called_once_with(
+            method="GET",
+            path=path,
+            query_params={"projection": "noAcl"},
+            headers=None,
+            timeout=self._get_default_timeout(),
+            retry=DEFAULT_RETRY,
+            _target_object=None,
+        )
+        self.assertEqual(results, [{"name": "blob"}] * 4)
+
+    def test__get_resource_coalesced_different_params(self):
+        project = "PROJECT"
+        path = "/b/bucket/o/blob"
+        credentials = _make_credentials()
+        client = self._make_one(
+            project=project, credentials=credentials, coalesce_get_requests=True
+        )
+        connection = client._base_connection = _make_connection({}, {})
+
+        client._get_resource(path, query_params={"userProject": "a"})
+        client._get_resource(path, query_params={"userProject": "b"})
+
+        self.assertEqual(connection.api_request.call_count, 2)
+        self.assertEqual(client._get_requests._in_flight, {})
+
+    def test__get_resource_coalesced_w_batch(self):
+        project = "PROJECT"
+        path = "/b/bucket/o/blob"
+        credentials = _make_credentials()
+        client = self._make_one(
+            project=project, credentials=credentials, coalesce_get_requests=True
+        )
+        batch = mock.Mock(spec=["api_request"])
+        client._push_batch(batch)
+
+        with mock.patch.object(client._get_requests, "do") as do:
+            client._get_resource(path)
+
+        do.assert_not_called()
+        batch.api_request.assert_called_once()
+
+    def _make_one_w_metadata_cache(self, **kwargs):
+        from google.cloud.storage.metadata_cache import MetadataCache
+
+        credentials = _make_credentials()
+        cache = MetadataCache()
+        client = self._make_one(
+            project="PROJECT", credentials=credentials, metadata_cache=cache, **kwargs
+        )
+        return client, cache
+
+    def test__get_resource_metadata_cache_hit(self):
+        client, cache = self._make_one_w_metadata_cache()
+        connection = client._base_connection = _make_connection({"name": "blob"})
+        path = "/b/bucket/o/blob"
+
+        first = client._get_resource(path, query_params={"projection": "noAcl"})
+        first["name"] = "changed"
+        second = client._get_resource(path, query_params={"projection": "noAcl"})
+
+        self.assertEqual(second, {"name": "blob"})
+        connection.api_request.assert_called_once()
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test__get_resource_metadata_cache_keyed_by_generation(self):
+        client, cache = self._make_one_w_metadata_cache()
+        connection = client._base_connection = _make_connection(
+            {"generation": "1"}, {"generation": "2"}
+        )
+        path = "/b/bucket/o/blob"
+
+        first = client._get_resource(path, query_params={"generation": 1})
+        second = client._get_resource(path, query_params={"generation": 2})
+
+        self.assertEqual(first, {"generation": "1"})
+        self.assertEqual(second, {"generation": "2"})
+        self.assertEqual(connection.api_request.call_count, 2)
+
+    def test__get_resource_metadata_cache_not_found(self):
+        from google.cloud.exceptions import NotFound
+
+        client, cache = self._make_one_w_metadata_cache()
+        connection = client._base_connection = _make_connection(NotFound("missing"))
+        path = "/b/bucket/o/my%2Fblob"
+
+        with self.assertRaises(NotFound):
+            client._get_resource(path)
+        with self.assertRaises(NotFound):
+            client._get_resource(path)
+
+        connection.api_request.assert_called_once()
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(len(cache._keys_by_object[("bucket", "my/blob")]), 1)
+
+    def test__get_resource_metadata_cache_skips_other_paths(self):
+        client, cache = self._make_one_w_metadata_cache()
+        connection = client._base_connection = _make_connection({}, {}, {}, {})
+
+        client._get_resource("/b/bucket")
+        client._get_resource("/b/bucket")
+        client._get_resource("/b/bucket/o/blob/acl")
+        client._get_resource("/b/bucket/o/blob/acl")
+
+        self.assertEqual(connection.api_request.call_count, 4)
+        self.assertEqual(len(cache), 0)
+
+    def test__get_resource_metadata_cache_w_batch(self):
+        client, cache = self._make_one_w_metadata_cache()
+        batch = mock.Mock(spec=["api_request"])
+        client._push_batch(batch)
+
+        client._get_resource("/b/bucket/o/blob")
+
+        batch.api_request.assert_called_once()
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+    def test__get_resource_metadata_cache_w_coalesce(self):
+        client, cache = self._make_one_w_metadata_cache(coalesce_get_requests=True)
+        connection = client._base_connection = _make_connection({"name": "blob"})
+
+        client._get_resource("/b/bucket/o/blob")
+        client._get_resource("/b/bucket/o/blob")
+
+        connection.api_request.assert_called_once()
+        self.assertEqual(cache.hits, 1)
+
+    def test__invalidate_object_metadata_wo_cache(self):
+        credentials = _make_credentials()
+        client = self._make_one(project="PROJECT", credentials=credentials)
+
+        self.assertIsNone(client._metadata_cache)
+        client._invalidate_object_metadata("/b/bucket/o/blob")
+
+    def test__patch_resource_invalidates_metadata_cache(self):
+        client, cache = self._make_one_w_metadata_cache()
+        connection = client._base_connection = _make_connection(
+            {"generation": "1"}, {"generation": "1", "metageneration": "2"}, {}
+        )
+        path = "/b/bucket/o/blob"
+
+        client._get_resource(path)
+        client._patch_resource(path, {"metadata": {"k": "v"}})
+        response = client._get_resource(path)
+
+        self.assertEqual(response, {})
+        self.assertEqual(connection.api_request.call_count, 3)
+
+    def test__delete_resource_failure_invalidates_metadata_cache(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        client, cache = self._make_one_w_metadata_cache()
+        client._base_connection = _make_connection(
+            {"name": "blob"}, ServiceUnavailable("try again")
+        )
+        path = "/b/bucket/o/blob"
+        client._get_resource(path)
+
+        with self.assertRaises(ServiceUnavailable):
+            client._delete_resource(path)
+
+        self.assertEqual(len(cache), 0)
+
+    def test__post_resource_rewrite_invalidates_metadata_cache(self):
+        client, cache = self._make_one_w_metadata_cache()
+        client._base_connection = _make_connection({}, {}, {}, {})
+        client._get_resource("/b/src/o/source")
+        client._get_resource("/b/dst/o/dest")
+        client._get_resource("/b/dst/o/other")
+
+        client._post_resource(
+            "/b/src/o/source/rewriteTo/b/dst/o/dest", {}, query_params={}
+        )
+
+        self.assertEqual(list(cache._keys_by_object), [("dst", "other")])
+
     def test__list_resource_w_defaults(self):
         import functools
         from google.api_core.page_iterator import HTTPIterator
@@ -1897,6 +2417,7 @@ class TestClient(unittest.TestCase):
             timeout=_DEFAULT_TIMEOUT,
             retry=DEFAULT_RETRY,
             single_shot_download=False,
+            download_buffer_size=None,
         )
 
     def test_download_blob_to_file_with_uri(self):
@@ -1937,6 +2458,7 @@ class TestClient(unittest.TestCase):
             timeout=_DEFAULT_TIMEOUT,
             retry=DEFAULT_RETRY,
             single_shot_download=False,
+            download_buffer_size=None,
         )
 
     def test_download_blob_to_file_with_invalid_uri(self):
@@ -2065,11 +2587,35 @@ class TestClient(unittest.TestCase):
             timeout=_DEFAULT_TIMEOUT,
             retry=expected_retry,
             single_shot_download=False,
+            download_buffer_size=None,
         )
 
     def test_download_blob_to_file_wo_chunks_wo_raw(self):
         self._download_blob_to_file_helper(use_chunks=False, raw_download=False)
 
+    def test_download_blob_to_file_w_download_buffer_size(self):
+        credentials = _make_credentials(project="PROJECT")
+        client = self._make_one(
+            credentials=credentials, download_buffer_size=2 * 1024 * 1024
+        )
+        blob = self._make_blob(name="blob_name", bucket=None)
+        blob._get_download_url = mock.Mock()
+        blob._do_download = mock.Mock()
+
+        client.download_blob_to_file(blob, io.BytesIO())
+        self.assertEqual(
+            blob._do_download.call_args.kwargs["download_buffer_size"],
+            2 * 1024 * 1024,
+        )
+
+        # The blob's own setting takes precedence over the client's.
+        blob.download_buffer_size = 4 * 1024 * 1024
+        client.download_blob_to_file(blob, io.BytesIO())
+        self.assertEqual(
+            blob._do_download.call_args.kwargs["download_buffer_size"],
+            4 * 1024 * 1024,
+        )
+
     def test_download_blob_to_file_w_chunks_wo_raw(self):
         self._download_blob_to_file_helper(use_chunks=True, raw_download=False)
 
@@ -17,6 +17,8 @@
 import unittest
 import io
 import string
+import tempfile
+import threading
 
 import mock
 
@@ -46,6 +48,15 @@ class _BlobWriterBase:
 
         return BlobWriter(*args, **kwargs)
 
+    @staticmethod
+    def _make_blob():
+        # The client has no retry budget or circuit breaker.
+        blob = mock.Mock()
+        for client in (blob.client, blob.bucket.client):
+            client._retry_budget = None
+            client._circuit_breaker = None
+        return blob
+
 
 class TestBlobReaderBinary(unittest.TestCase, _BlobReaderBase):
     def test_attributes(self):
@@ -283,6 +294,87 @@ class TestBlobReaderBinary(unittest.TestCase, _BlobReaderBase):
         self.assertEqual(reader.tell(), 1536)
         reader.close()
 
+    def _make_sizeless_blob(self):
+        blob = mock.Mock()
+        blob.chunk_size = None
+        blob.size = None
+
+        # Mimic Blob._extract_headers_from_download(), which records the size
+        # from the Content-Range header of the first ranged response.
+        def read_from_fake_data(start=0, end=None, **_):
+            blob.size = len(TEST_BINARY_DATA)
+            if start < 0:
+                return TEST_BINARY_DATA[start:]
+            return TEST_BINARY_DATA[start:end]
+
+        blob.download_as_bytes = mock.Mock(side_effect=read_from_fake_data)
+        return blob
+
+    def test_seek_from_end_discovers_size(self):
+        blob = self._make_sizeless_blob()
+        download_kwargs = {"if_metageneration_match": 1}
+        reader = self._make_blob_reader(blob, chunk_size=8, **download_kwargs)
+
+        self.assertEqual(reader.seek(-4, 2), len(TEST_BINARY_DATA) - 4)
+        blob.download_as_bytes.assert_called_once_with(
+            start=-8, end=None, checksum=None, retry=DEFAULT_RETRY, **download_kwargs
+        )
+        blob.reload.assert_not_called()
+        self.assertEqual(reader.read(4), TEST_BINARY_DATA[-4:])
+
+        # A second seek into the suffix is served from the buffer.
+        self.assertEqual(reader.seek(-8, 2), len(TEST_BINARY_DATA) - 8)
+        self.assertEqual(reader.read(4), TEST_BINARY_DATA[-8:-4])
+        blob.download_as_bytes.assert_called_once()
+        reader.close()
+
+    def test_seek_to_end_discovers_size(self):
+        blob = self._make_sizeless_blob()
+        reader = self._make_blob_reader(blob, chunk_size=8)
+
+        self.assertEqual(reader.seek(0, 2), len(TEST_BINARY_DATA))
+        blob.download_as_bytes.assert_called_once_with(
+            start=-1, end=None, checksum=None, retry=DEFAULT_RETRY
+        )
+        blob.reload.assert_not_called()
+        self.assertEqual(reader.read(), b"")
+        reader.close()
+
+    def test_seek_discovers_size_and_buffers_data(self):
+        blob = self._make_sizeless_blob()
+        reader = self._make_blob_reader(blob, chunk_size=8)
+
+        self.assertEqual(reader.read(2), TEST_BINARY_DATA[0:2])
+        blob.size = None
+        self.assertEqual(reader.seek(2, 1), 4)
+        blob.download_as_bytes.assert_called_with(
+            start=4, end=12, checksum=None, retry=DEFAULT_RETRY
+        )
+        blob.reload.assert_not_called()
+        self.assertEqual(reader.read(8), TEST_BINARY_DATA[4:12])
+        self.assertEqual(blob.download_as_bytes.call_count, 2)
+        reader.close()
+
+    def test_seek_discovery_falls_back_to_reload(self):
+        blob = mock.Mock()
+        blob.chunk_size = None
+        blob.size = None
+        blob.download_as_bytes = mock.Mock(
+            side_effect=RequestRangeNotSatisfiable("message")
+        )
+
+        def initialize_size(**_):
+            blob.size = 0
+
+        blob.reload = mock.Mock(side_effect=initialize_size)
+        download_kwargs = {"if_metageneration_match": 1, "raw_download": True}
+        reader = self._make_blob_reader(blob, chunk_size=8, **download_kwargs)
+
+        self.assertEqual(reader.seek(0, 2), 0)
+        blob.download_as_bytes.assert_called_once()
+        blob.reload.assert_called_once_with(if_metageneration_match=1)
+        reader.close()
+
     def test_close(self):
         blob = mock.Mock()
         reader = self._make_blob_reader(blob)
@@ -307,6 +399,116 @@ class TestBlobReaderBinary(unittest.TestCase, _BlobReaderBase):
         with self.assertRaises(ValueError):
             self._make_blob_reader(blob, invalid_kwarg=1)
 
+    def _make_cached_blob(self):
+        blob = mock.Mock()
+        blob.name = "blob-name"
+        blob.bucket.name = "bucket-name"
+        blob.size = None
+        blob.generation = None
+        blob._encryption_key = None
+
+        # Mimic Blob._extract_headers_from_download(), which records the
+        # generation of the first response.
+        def read_from_fake_data(start=0, end=None, **_):
+            blob.generation = 123
+            if start >= len(TEST_BINARY_DATA):
+                raise RequestRangeNotSatisfiable("416")
+            return TEST_BINARY_DATA[start : None if end is None else end + 1]
+
+        blob.download_as_bytes = mock.Mock(side_effect=read_from_fake_data)
+        return blob
+
+    def test_read_w_block_cache(self):
+        from google.cloud.storage.block_cache import BlockCache
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = BlockCache(directory, block_size=16)
+            blob = self._make_cached_blob()
+            reader = self._make_blob_reader(blob, chunk_size=8, block_cache=cache)
+
+            # Downloads are aligned to whole blocks.
+            self.assertEqual(reader.read(4), TEST_BINARY_DATA[0:4])
+            blob.download_as_bytes.assert_called_once_with(
+                start=0, end=15, checksum=None, retry=DEFAULT_RETRY
+            )
+            self.assertEqual(reader.read(), TEST_BINARY_DATA[4:])
+            self.assertEqual(blob.download_as_bytes.call_count, 4)
+            reader.close()
+
+            # A second reader is served entirely from the cache.
+            blob.download_as_bytes.reset_mock()
+            blob.size = len(TEST_BINARY_DATA)
+            reader = self._make_blob_reader(blob, chunk_size=8, block_cache=cache)
+            self.assertEqual(reader.read(), TEST_BINARY_DATA)
+            self.assertEqual(reader.seek(20), 20)
+            self.assertEqual(reader.read(10), TEST_BINARY_DATA[20:30])
+            blob.download_as_bytes.assert_not_called()
+            reader.close()
+
+            # Another generation of the blob is not served from the cache.
+            blob.generation = 456
+            reader = self._make_blob_reader(blob, chunk_size=8, block_cache=cache)
+            self.assertEqual(reader.read(4), TEST_BINARY_DATA[0:4])
+            blob.download_as_bytes.assert_called_once()
+            reader.close()
+
+    def test_read_w_block_cache_past_end(self):
+        from google.cloud.storage.block_cache import BlockCache
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = BlockCache(directory, block_size=len(TEST_BINARY_DATA))
+            blob = self._make_cached_blob()
+            reader = self._make_blob_reader(blob, block_cache=cache)
+
+            self.assertEqual(reader.read(), TEST_BINARY_DATA)
+            # The blob size is a multiple of the block size, so the last
+            # block download is empty and must not be cached.
+            self.assertEqual(blob.download_as_bytes.call_count, 2)
+            self.assertEqual(cache.size, len(TEST_BINARY_DATA))
+            self.assertEqual(reader.read(), b"")
+            reader.close()
+
+    def test_read_w_block_cache_raw_download(self):
+        from google.cloud.storage.block_cache import BlockCache
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = BlockCache(directory, block_size=len(TEST_BINARY_DATA) * 2)
+            blob = self._make_cached_blob()
+            reader = self._make_blob_reader(blob, block_cache=cache, raw_download=True)
+            self.assertEqual(reader.read(), TEST_BINARY_DATA)
+            reader.close()
+
+            # Raw blocks are not served to a decoding reader.
+            blob.download_as_bytes.reset_mock()
+            reader = self._make_blob_reader(blob, block_cache=cache)
+            self.assertEqual(reader.read(), TEST_BINARY_DATA)
+            blob.download_as_bytes.assert_called_once()
+            reader.close()
+
+            blob.download_as_bytes.reset_mock()
+            reader = self._make_blob_reader(blob, block_cache=cache, raw_download=True)
+            self.assertEqual(reader.read(), TEST_BINARY_DATA)
+            blob.download_as_bytes.assert_not_called()
+            reader.close()
+
+    def test_read_w_block_cache_encryption_key(self):
+        from google.cloud.storage.block_cache import BlockCache
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = BlockCache(directory, block_size=16)
+            blob = self._make_cached_blob()
+            blob._encryption_key = b"0" * 32
+            reader = self._make_blob_reader(blob, chunk_size=8, block_cache=cache)
+
+            self.assertEqual(reader.read(4), TEST_BINARY_DATA[0:4])
+
+            # The download is not aligned to blocks, nor stored on disk.
+            blob.download_as_bytes.assert_called_once_with(
+                start=0, end=8, checksum=None, retry=DEFAULT_RETRY
+            )
+            self.assertEqual(cache.size, 0)
+            reader.close()
+
 
 class TestBlobWriterBinary(unittest.TestCase, _BlobWriterBase):
     def test_attributes(self):
@@ -335,7 +537,7 @@ class TestBlobWriterBinary(unittest.TestCase, _BlobWriterBase):
 
     @mock.patch("warnings.warn")
     def test_write(self, mock_warn):
-        blob = mock.Mock()
+        blob = self._make_blob()
         upload = mock.Mock()
         transport = mock.Mock()
         timeout = 600
@@ -356,7 +558,7 @@ class TestBlobWriterBinary(unittest.TestCase, _BlobWriterBase):
                 blob,
                 chunk_size=chunk_size,
                 content_type=PLAIN_CONTENT_TYPE,
-                **upload_kwargs
+                **upload_kwargs,
             )
 
         # The transmit_next_chunk method must actually consume bytes from the
@@ -382,7 +584,7 @@ class TestBlobWriterBinary(unittest.TestCase, _BlobWriterBase):
             None,
             chunk_size=chunk_size,
             retry=DEFAULT_RETRY,
-            **upload_kwargs
+            **upload_kwargs,
         )
         upload.transmit_next_chunk.assert_called_with(transport, timeout=timeout)
         self.assertEqual(upload.transmit_next_chunk.call_count, 4)
@@ -393,6 +595,322 @@ class TestBlobWriterBinary(unittest.TestCase, _BlobWriterBase):
         writer.close()
         self.assertEqual(upload.transmit_next_chunk.call_count, 5)
 
+    def test_write_background_upload(self):
+        blob = mock.Mock()
+        upload = mock.Mock()
+        transport = mock.Mock()
+        blob._initiate_resumable_upload.return_value = (upload, transport)
+
+        with mock.patch("google.cloud.storage.fileio.CHUNK_SIZE_MULTIPLE", 1):
+            chunk_size = 8  # Note: Real upload requires a multiple of 256KiB.
+            writer = self._make_blob_writer(
+                blob,
+                chunk_size=chunk_size,
+                background_upload=True,
+                max_pending_chunks=1,
+            )
+
+        uploaded = []
+        upload.transmit_next_chunk.side_effect = lambda _: uploaded.append(
+            writer._buffer.read(chunk_size)
+        )
+
+        # Write under chunk_size. No background thread is needed yet.
+        writer.write(TEST_BINARY_DATA[0:4])
+        self.assertIsNone(writer._upload_thread)
+
+        # Write over chunk_size, in pieces of varying size.
+        writer.write(TEST_BINARY_DATA[4:30])
+        writer.write(TEST_BINARY_DATA[30:33])
+        self.assertEqual(writer.tell(), 33)
+        self.assertIsNotNone(writer._upload_thread)
+        self.assertEqual(writer._upload_queue.maxsize, 1)
+
+        writer.close()
+        self.assertFalse(writer._upload_thread.is_alive())
+        blob._initiate_resumable_upload.assert_called_once()
+        self.assertEqual(upload.transmit_next_chunk.call_count, 5)
+        self.assertEqual(b"".join(uploaded), TEST_BINARY_DATA[0:33])
+        self.assertTrue(writer.closed)
+
+    def test_background_upload_error_raised_by_next_write(self):
+        blob = mock.Mock()
+        upload = mock.Mock()
+        transport = mock.Mock()
+        blob._initiate_resumable_upload.return_value = (upload, transport)
+        upload.transmit_next_chunk.side_effect = ConnectionError("boom")
+
+        writer = self._make_blob_writer(
+            blob, chunk_size=CHUNK_SIZE_MULTIPLE, background_upload=True
+        )
+        writer.write(bytes(CHUNK_SIZE_MULTIPLE))
+
+        # Wait for the background thread to record the failure.
+        with self.assertRaises(ConnectionError):
+            for _ in range(1000):
+                writer.write(b"")
+                writer._upload_thread.join(0.01)
+
+        with self.assertRaises(ConnectionError):
+            writer.close()
+        self.assertTrue(writer.closed)
+        self.assertFalse(writer._upload_thread.is_alive())
+        upload.transmit_next_chunk.assert_called_once()
+
+    def test_background_upload_error_raised_by_close(self):
+        blob = mock.Mock()
+        upload = mock.Mock()
+        transport = mock.Mock()
+        blob._initiate_resumable_upload.return_value = (upload, transport)
+        upload.transmit_next_chunk.side_effect = ConnectionError("boom")
+
+        writer = self._make_blob_writer(
+            blob, chunk_size=CHUNK_SIZE_MULTIPLE, background_upload=True
+        )
+        writer.write(bytes(CHUNK_SIZE_MULTIPLE * 3))
+
+        with self.assertRaises(ConnectionError):
+            writer.close()
+        with self.assertRaises(ConnectionError):
+            writer.flush()
+        upload.transmit_next_chunk.assert_called_once()
+
+    def test_background_upload_terminate(self):
+        blob = mock.Mock()
+        upload = mock.Mock(upload_url="dummy")
+        transport = mock.Mock()
+        blob._initiate_resumable_upload.return_value = (upload, transport)
+        transmitted = threading.Event()
+        upload.transmit_next_chunk.side_effect = lambda _: transmitted.set()
+
+        with self.assertRaises(RuntimeError):
+            with self._make_blob_writer(
+                blob, chunk_size=CHUNK_SIZE_MULTIPLE, background_upload=True
+            ) as writer:
+                writer.write(bytes(CHUNK_SIZE_MULTIPLE + 1))
+                self.assertTrue(transmitted.wait(5))
+                raise RuntimeError
+
+        self.assertFalse(writer._upload_thread.is_alive())
+        self.assertTrue(writer.closed)
+        transport.delete.assert_called_with("dummy")
+
+    def test_background_upload_small_object_uploaded_inline(self):
+        blob = mock.Mock()
+        upload = mock.Mock()
+        transport = mock.Mock()
+        blob._initiate_resumable_upload.return_value = (upload, transport)
+
+        writer = self._make_blob_writer(
+            blob, chunk_size=CHUNK_SIZE_MULTIPLE, background_upload=True
+        )
+        writer.write(TEST_BINARY_DATA)
+        writer.close()
+
+        self.assertIsNone(writer._upload_thread)
+        upload.transmit_next_chunk.assert_called_once_with(transport)
+
+    def _make_parallel_blob_writer(self, blob, container, **kwargs):
+        from google.cloud.storage.fileio import MIN_PARALLEL_UPLOAD_PART_SIZE
+
+        container.upload_url = "https://example.com/bucket/blob"
+        container.upload_id = "upload-id"
+        patch = mock.patch(
+            "google.cloud.storage.transfer_manager._prepare_xml_mpu_container",
+            return_value=(container, {"x-goog-meta-a": "b"}, PLAIN_CONTENT_TYPE),
+        )
+        self.addCleanup(patch.stop)
+        prepare = patch.start()
+        writer = self._make_blob_writer(
+            blob,
+            chunk_size=MIN_PARALLEL_UPLOAD_PART_SIZE,
+            parallel_upload=True,
+            **kwargs,
+        )
+        return writer, prepare
+
+    def test_write_parallel_upload(self):
+        from google.cloud.storage.fileio import MIN_PARALLEL_UPLOAD_PART_SIZE
+
+        chunk_size = MIN_PARALLEL_UPLOAD_PART_SIZE
+        blob = self._make_blob()
+        container = mock.Mock()
+        writer, prepare = self._make_parallel_blob_writer(
+            blob,
+            container,
+            max_parallel_parts=2,
+            content_type=PLAIN_CONTENT_TYPE,
+            checksum="md5",
+            timeout=42,
+        )
+        data = bytes(range(256)) * (chunk_size * 3 // 256) + b"tail"
+
+        uploaded = {}
+
+        def fake_part(url, upload_id, filename, start, end, part_number, **kw):
+            part = mock.Mock(etag=f"etag-{part_number}")
+            uploaded[part_number] = (start, end, kw)
+            return part
+
+        with mock.patch(
+            "google.cloud.storage.fileio.XMLMPUPart", side_effect=fake_part
+        ) as part_class:
+            writer.write(data[: chunk_size - 1])
+            prepare.assert_not_called()
+            writer.write(data[chunk_size - 1 :])
+            self.assertEqual(writer.tell(), len(data))
+            writer.close()
+
+        prepare.assert_called_once_with(blob, PLAIN_CONTENT_TYPE, None, DEFAULT_RETRY)
+        container.initiate.assert_called_once_with(
+            blob._get_transport.return_value, PLAIN_CONTENT_TYPE, timeout=42
+        )
+        self.assertEqual(part_class.call_count, 4)
+        self.assertEqual(sorted(uploaded), [1, 2, 3, 4])
+        for part_number, (start, end, kw) in uploaded.items():
+            self.assertEqual(start, (part_number - 1) * chunk_size)
+            self.assertEqual(kw["data"], data[start:end])
+            self.assertEqual(kw["checksum"], "md5")
+            self.assertEqual(kw["headers"], {"x-goog-meta-a": "b"})
+        self.assertEqual(uploaded[4][2]["data"], b"tail")
+        container.register_part.assert_has_calls(
+            [mock.call(n, f"etag-{n}") for n in range(1, 5)]
+        )
+        container.finalize.assert_called_once_with(
+            blob._get_transport.return_value, timeout=42
+        )
+        container.cancel.assert_not_called()
+        blob._initiate_resumable_upload.assert_not_called()
+        self.assertTrue(writer.closed)
+
+    def test_parallel_upload_small_blob_uses_resumable_upload(self):
+        blob = mock.Mock()
+        upload = mock.Mock()
+        transport = mock.Mock()
+        blob._initiate_resumable_upload.return_value = (upload, transport)
+        container = mock.Mock()
+        writer, prepare = self._make_parallel_blob_writer(blob, container)
+
+        writer.write(TEST_BINARY_DATA)
+        writer.close()
+
+        prepare.assert_not_called()
+        upload.transmit_next_chunk.assert_called_once_with(transport)
+
+    def test_parallel_upload_part_error_cancels(self):
+        from google.cloud.storage.fileio import MIN_PARALLEL_UPLOAD_PART_SIZE
+
+        blob = mock.Mock()
+        container = mock.Mock()
+        writer, _ = self._make_parallel_blob_writer(blob, container)
+
+        with mock.patch("google.cloud.storage.fileio.XMLMPUPart") as part_class:
+            part_class.return_value.upload.side_effect = ConnectionError("boom")
+            writer.write(bytes(MIN_PARALLEL_UPLOAD_PART_SIZE + 1))
+            with self.assertRaises(ConnectionError):
+                writer.close()
+
+        container.finalize.assert_not_called()
+        container.cancel.assert_called_once_with(blob._get_transport.return_value)
+        self.assertTrue(writer.closed)
+
+    def test_parallel_upload_cancel_error_logged(self):
+        from google.cloud.storage.fileio import MIN_PARALLEL_UPLOAD_PART_SIZE
+
+        blob = mock.Mock()
+        container = mock.Mock()
+        container.cancel.side_effect = ValueError("cancel failed")
+        writer, _ = self._make_parallel_blob_writer(blob, container)
+
+        with mock.patch("google.cloud.storage.fileio.XMLMPUPart") as part_class:
+            part_class.return_value.upload.side_effect = ConnectionError("boom")
+            writer.write(bytes(MIN_PARALLEL_UPLOAD_PART_SIZE + 1))
+            with self.assertLogs("google.cloud.storage.fileio", "WARNING"):
+                # The error which led to cancelling is raised.
+                with self.assertRaises(ConnectionError):
+                    writer.close()
+
+        container.cancel.assert_called_once_with(blob._get_transport.return_value)
+        self.assertTrue(writer.closed)
+
+    def test_parallel_upload_terminate_cancel_error_logged(self):
+        from google.cloud.storage.fileio import MIN_PARALLEL_UPLOAD_PART_SIZE
+
+        blob = mock.Mock()
+        container = mock.Mock()
+        container.cancel.side_effect = ValueError("cancel failed")
+        writer, _ = self._make_parallel_blob_writer(blob, container)
+
+        with mock.patch("google.cloud.storage.fileio.XMLMPUPart"):
+            with self.assertLogs("google.cloud.storage.fileio", "WARNING"):
+                with self.assertRaises(RuntimeError):
+                    with writer:
+                        writer.write(bytes(MIN_PARALLEL_UPLOAD_PART_SIZE))
+                        raise RuntimeError
+
+        container.cancel.assert_called_once_with(blob._get_transport.return_value)
+        self.assertTrue(writer.closed)
+
+    def test_parallel_upload_terminate(self):
+        from google.cloud.storage.fileio import MIN_PARALLEL_UPLOAD_PART_SIZE
+
+        blob = mock.Mock()
+        container = mock.Mock()
+        writer, _ = self._make_parallel_blob_writer(blob, container)
+
+        with mock.patch("google.cloud.storage.fileio.XMLMPUPart"):
+            with self.assertRaises(RuntimeError):
+                with writer:
+                    writer.write(bytes(MIN_PARALLEL_UPLOAD_PART_SIZE))
+                    raise RuntimeError
+
+        container.finalize.assert_not_called()
+        container.cancel.assert_called_once_with(blob._get_transport.return_value)
+        self.assertTrue(writer.closed)
+
+    def test_parallel_upload_rejects_invalid_arguments(self):
+        from google.cloud.storage.fileio import MIN_PARALLEL_UPLOAD_PART_SIZE
+
+        blob = mock.Mock()
+        with self.assertRaises(ValueError):
+            self._make_blob_writer(
+                blob,
+                chunk_size=MIN_PARALLEL_UPLOAD_PART_SIZE,
+                parallel_upload=True,
+                if_generation_match=0,
+            )
+        with self.assertRaises(ValueError):
+            self._make_blob_writer(
+                blob,
+                chunk_size=MIN_PARALLEL_UPLOAD_PART_SIZE,
+                parallel_upload=True,
+                background_upload=True,
+            )
+        with self.assertRaises(ValueError):
+            self._make_blob_writer(
+                blob, chunk_size=CHUNK_SIZE_MULTIPLE, parallel_upload=True
+            )
+
+    def test_write_spill_to_disk(self):
+        blob = mock.Mock()
+        upload = mock.Mock()
+        transport = mock.Mock()
+        blob._initiate_resumable_upload.return_value = (upload, transport)
+
+        with mock.patch("google.cloud.storage.fileio.CHUNK_SIZE_MULTIPLE", 1):
+            writer = self._make_blob_writer(blob, chunk_size=8, spill_threshold=4)
+        self.assertEqual(writer._buffer._spill_threshold, 4)
+
+        uploaded = []
+        upload.transmit_next_chunk.side_effect = lambda _: uploaded.append(
+            writer._buffer.read(8)
+        )
+        writer.write(TEST_BINARY_DATA[:3])
+        writer.write(TEST_BINARY_DATA[3:20])
+        writer.close()
+
+        self.assertEqual(b"".join(uploaded), TEST_BINARY_DATA[:20])
+
     def test_close_errors(self):
         blob = mock.Mock(chunk_size=None)
 
@@ -408,6 +926,7 @@ class TestBlobWriterBinary(unittest.TestCase, _BlobWriterBase):
         writer.close()
 
         self.assertTrue(writer.closed)
+        blob.client._invalidate_object_metadata.assert_called_once_with(blob.path)
         # Try to write to closed file.
         with self.assertRaises(ValueError):
             writer.write(TEST_BINARY_DATA)
@@ -473,7 +992,7 @@ class TestBlobWriterBinary(unittest.TestCase, _BlobWriterBase):
             writer.seek(0)
 
     def test_retry_enabled(self):
-        blob = mock.Mock()
+        blob = self._make_blob()
 
         upload = mock.Mock()
         transport = mock.Mock()
@@ -525,7 +1044,7 @@ class TestBlobWriterBinary(unittest.TestCase, _BlobWriterBase):
         self.assertEqual(upload.transmit_next_chunk.call_count, 5)
 
     def test_forced_default_retry(self):
-        blob = mock.Mock()
+        blob = self._make_blob()
 
         upload = mock.Mock()
         transport = mock.Mock()
@@ -581,7 +1100,7 @@ class TestBlobWriterBinary(unittest.TestCase, _BlobWriterBase):
 
     def test_conditional_retry_w_condition(self):
         # Not the default, but still supported in the signature for compatibility.
-        blob = mock.Mock()
+        blob = self._make_blob()
 
         upload = mock.Mock()
         transport = mock.Mock()
@@ -627,7 +1146,7 @@ class TestBlobWriterBinary(unittest.TestCase, _BlobWriterBase):
 
     def test_conditional_retry_wo_condition(self):
         # Not the default, but still supported in the signature for compatibility.
-        blob = mock.Mock()
+        blob = self._make_blob()
 
         upload = mock.Mock()
         transport = mock.Mock()
@@ -669,6 +1188,32 @@ class TestBlobWriterBinary(unittest.TestCase, _BlobWriterBase):
             retry=None,
         )
 
+    def test_retry_w_retry_budget(self):
+        from google.cloud.storage.retry import RetryBudget
+        from google.cloud.storage.retry import _LimitedRetry
+
+        blob = self._make_blob()
+        retry_budget = RetryBudget()
+        blob.bucket.client._retry_budget = retry_budget
+        upload = mock.Mock()
+        blob._initiate_resumable_upload.return_value = (upload, mock.Mock())
+
+        with mock.patch("google.cloud.storage.fileio.CHUNK_SIZE_MULTIPLE", 1):
+            chunk_size = 8  # Note: Real upload requires a multiple of 256KiB.
+            writer = self._make_blob_writer(blob, chunk_size=chunk_size)
+        upload.transmit_next_chunk.side_effect = lambda _: writer._buffer.read(
+            chunk_size
+        )
+
+        writer.write(TEST_BINARY_DATA[0:16])
+
+        # The upload honors the client's retry budget.
+        retry = blob._initiate_resumable_upload.call_args.kwargs["retry"]
+        self.assertIsInstance(retry, _LimitedRetry)
+        self.assertIs(retry._retry_policy, DEFAULT_RETRY)
+        self.assertIs(retry._retry_budget, retry_budget)
+        self.assertIsNone(retry._circuit_breaker)
+
 
 class Test_SlidingBuffer(unittest.TestCase):
     @staticmethod
@@ -736,6 +1281,144 @@ class Test_SlidingBuffer(unittest.TestCase):
             buff.seek(0)
         self.assertEqual(pos, buff.tell())
 
+    def test_small_writes_coalesced(self):
+        buff = self._make_sliding_buffer()
+        for byte in TEST_BINARY_DATA:
+            buff.write(bytes([byte]))
+        self.assertEqual(len(buff._segments), 1)
+        self.assertEqual(len(buff), len(TEST_BINARY_DATA))
+
+        # Partially read and flush, then keep writing.
+        self.assertEqual(buff.read(8), TEST_BINARY_DATA[:8])
+        buff.flush()
+        buff.write(bytearray(b"tail"))
+        self.assertEqual(len(buff), len(TEST_BINARY_DATA) - 8 + 4)
+        self.assertEqual(buff.read(None), TEST_BINARY_DATA[8:] + b"tail")
+        self.assertEqual(buff.tell(), len(TEST_BINARY_DATA) + 4)
+
+    def test_large_write_not_copied_on_flush(self):
+        from google.cloud.storage.fileio import _MAX_COALESCED_SEGMENT_SIZE
+
+        data = b"x" * _MAX_COALESCED_SEGMENT_SIZE + b"y" * 8
+        buff = self._make_sliding_buffer()
+        self.assertEqual(buff.write(data), len(data))
+        self.assertIs(buff._segments[0], data)
+
+        self.assertEqual(buff.read(_MAX_COALESCED_SEGMENT_SIZE), data[:-8])
+        buff.flush()
+        self.assertEqual(len(buff), 8)
+        self.assertIs(buff._segments[0].obj, data)
+        self.assertEqual(buff.read(), b"y" * 8)
+        buff.flush()
+        self.assertEqual(len(buff), 0)
+        self.assertEqual(len(buff._segments), 0)
+
+    def test_read_and_seek_across_segments(self):
+        from google.cloud.storage.fileio import _MAX_COALESCED_SEGMENT_SIZE
+
+        large = bytes(range(256)) * (_MAX_COALESCED_SEGMENT_SIZE // 256)
+        expected = TEST_BINARY_DATA + large + TEST_BINARY_DATA
+        buff = self._make_sliding_buffer()
+        buff.write(TEST_BINARY_DATA)
+        buff.write(large)
+        buff.write(TEST_BINARY_DATA)
+        self.assertEqual(len(buff._segments), 3)
+
+        self.assertEqual(buff.read(10), expected[:10])
+        self.assertEqual(buff.read(len(large)), expected[10 : 10 + len(large)])
+        buff.seek(5)
+        self.assertEqual(buff.read(), expected[5:])
+        buff.seek(10)
+        buff.flush()
+        self.assertEqual(len(buff), len(expected) - 10)
+        with self.assertRaises(ValueError):
+            buff.seek(9)
+        self.assertEqual(buff.read(), expected[10:])
+
+    def test_spill_to_disk(self):
+        from google.cloud.storage.fileio import _SpilledSegment
+
+        buff = self._make_sliding_buffer(spill_threshold=8)
+        buff.write(TEST_BINARY_DATA[:6])
+        buff.write(TEST_BINARY_DATA[6:20])
+        buff.write(TEST_BINARY_DATA[20:30])
+        self.assertEqual(len(buff), 30)
+        self.assertEqual(len(buff._segments), 2)
+        self.assertIsInstance(buff._segments[0], bytearray)
+        spilled = buff._segments[1]
+        self.assertIsInstance(spilled, _SpilledSegment)
+        self.assertEqual(len(spilled), 24)
+
+        # Read across the memory and disk segments, then seek back.
+        self.assertEqual(buff.read(10), TEST_BINARY_DATA[:10])
+        buff.seek(4)
+        self.assertEqual(buff.read(8), TEST_BINARY_DATA[4:12])
+
+        # Flushing slices the spilled segment, and later writes use a new file.
+        buff.flush()
+        self.assertEqual(len(buff), 18)
+        self.assertEqual(buff._memory_size, 0)
+        buff.write(TEST_BINARY_DATA[30:34])
+        buff.write(TEST_BINARY_DATA[34:])
+        self.assertEqual(len(buff._segments), 3)
+        self.assertIsInstance(buff._segments[1], bytearray)
+        self.assertIsNot(buff._segments[2]._file, spilled._file)
+        self.assertEqual(buff.read(), TEST_BINARY_DATA[12:])
+
+        buff.flush()
+        self.assertEqual(len(buff), 0)
+        self.assertTrue(spilled._file.closed)
+
+    def test_read_file_chunk(self):
+        buff = self._make_sliding_buffer(spill_threshold=8)
+        buff.write(TEST_BINARY_DATA[:6])
+        buff.write(TEST_BINARY_DATA[6:20])
+        buff.write(TEST_BINARY_DATA[20:30])
+
+        # Data held in memory is not mapped.
+        self.assertIsNone(buff._read_file_chunk(4))
+        self.assertEqual(buff.tell(), 0)
+        self.assertEqual(buff.read(4), TEST_BINARY_DATA[:4])
+        self.assertIsNone(buff._read_file_chunk(8))
+        self.assertEqual(buff.read(2), TEST_BINARY_DATA[4:6])
+
+        chunk = buff._read_file_chunk(8)
+        self.assertEqual(buff.tell(), 14)
+        self.assertEqual(chunk.read(), TEST_BINARY_DATA[6:14])
+        chunk.close()
+
+        # The last chunk is truncated at the end of the buffer, and can still
+        # be read after the temporary file has been deleted.
+        chunk = buff._read_file_chunk(100)
+        self.assertEqual(buff.tell(), 30)
+        buff.flush()
+        self.assertEqual(chunk.read(), TEST_BINARY_DATA[14:30])
+        chunk.close()
+        self.assertIsNone(buff._read_file_chunk(8))
+
+    def test_get_next_chunk_w_spilled_data(self):
+        from google.cloud.storage._media import _upload
+
+        buff = self._make_sliding_buffer(spill_threshold=0)
+        buff.write(TEST_BINARY_DATA)
+
+        start_byte, payload, content_range = _upload.get_next_chunk(buff, 8, None)
+
+        self.assertEqual(start_byte, 0)
+        self.assertIsInstance(payload, _upload._FileChunk)
+        self.assertEqual(payload.read(), TEST_BINARY_DATA[:8])
+        self.assertEqual(content_range, "bytes 0-7/*")
+        self.assertEqual(buff.tell(), 8)
+        payload.close()
+
+    def test_spill_to_disk_close(self):
+        buff = self._make_sliding_buffer(spill_threshold=0)
+        buff.write(TEST_BINARY_DATA)
+        spilled = buff._segments[0]
+        buff.close()
+        self.assertTrue(spilled._file.closed)
+        self.assertEqual(len(buff), 0)
+
     def test_close(self):
         buff = self._make_sliding_buffer()
         buff.close()
@@ -833,17 +1516,18 @@ class TestBlobReaderText(unittest.TestCase, _BlobReaderBase):
 
         blob.reload = mock.Mock(side_effect=initialize_size)
 
-        # Seek, forcing a blob reload in order to validate the seek doesn't
-        # exceed the end of the blob.
+        # Seek. The fake download does not report the blob size, so the
+        # speculative read is discarded and the blob is reloaded in order to
+        # validate the seek doesn't exceed the end of the blob.
         self.assertEqual(reader.seek(4), 4)
         blob.reload.assert_called_once_with(**download_kwargs)
         self.assertEqual(reader.read(4), TEST_TEXT_DATA[4:8])
-        self.assertEqual(blob.download_as_bytes.call_count, 1)
+        self.assertEqual(blob.download_as_bytes.call_count, 2)
 
         # Seek to beginning. The next read will need to download data again.
         self.assertEqual(reader.seek(0), 0)
         self.assertEqual(reader.read(), TEST_TEXT_DATA)
-        self.assertEqual(blob.download_as_bytes.call_count, 2)
+        self.assertEqual(blob.download_as_bytes.call_count, 3)
 
         reader.close()
 
@@ -866,15 +1550,16 @@ class TestBlobReaderText(unittest.TestCase, _BlobReaderBase):
 
         blob.reload = mock.Mock(side_effect=initialize_size)
 
-        # Seek, forcing a blob reload in order to validate the seek doesn't
-        # exceed the end of the blob.
+        # Seek. The fake download does not report the blob size, so the
+        # speculative read is discarded and the blob is reloaded in order to
+        # validate the seek doesn't exceed the end of the blob.
         self.assertEqual(reader.seek(4), 4)
         blob.reload.assert_called_once_with(**download_kwargs)
 
         # Seek to beginning.
         self.assertEqual(reader.seek(0), 0)
         self.assertEqual(reader.read(), TEST_MULTIBYTE_TEXT_DATA)
-        self.assertEqual(blob.download_as_bytes.call_count, 1)
+        self.assertEqual(blob.download_as_bytes.call_count, 2)
 
         # tell() is an inherited method that uses seek().
         self.assertEqual(reader.tell(), len(TEST_MULTIBYTE_TEXT_DATA.encode("utf-8")))
@@ -898,7 +1583,7 @@ class TestBlobReaderText(unittest.TestCase, _BlobReaderBase):
 class TestBlobWriterText(unittest.TestCase, _BlobWriterBase):
     @mock.patch("warnings.warn")
     def test_write(self, mock_warn):
-        blob = mock.Mock()
+        blob = self._make_blob()
         upload = mock.Mock()
         transport = mock.Mock()
 
@@ -0,0 +1,135 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class TestMetadataCache(unittest.TestCase):
+    @staticmethod
+    def _make_one(*args, **kwargs):
+        from google.cloud.storage.metadata_cache import MetadataCache
+
+        return MetadataCache(*args, **kwargs)
+
+    def test_ctor_defaults(self):
+        from google.cloud.storage.metadata_cache import DEFAULT_MAX_ENTRIES
+        from google.cloud.storage.metadata_cache import DEFAULT_TTL
+
+        cache = self._make_one()
+        self.assertEqual(cache.ttl, DEFAULT_TTL)
+        self.assertEqual(cache.max_entries, DEFAULT_MAX_ENTRIES)
+        self.assertTrue(cache.cache_not_found)
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+        self.assertEqual(len(cache), 0)
+
+    def test_ctor_invalid_max_entries(self):
+        with self.assertRaises(ValueError):
+            self._make_one(max_entries=0)
+
+    def test_get_miss(self):
+        cache = self._make_one()
+        self.assertIsNone(cache.get("bucket", "blob", "key"))
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_put_and_get_returns_copy(self):
+        cache = self._make_one()
+        cache.put("bucket", "blob", "key", {"metadata": {"k": "v"}})
+
+        found = cache.get("bucket", "blob", "key")
+        found["metadata"]["k"] = "changed"
+
+        self.assertEqual(cache.get("bucket", "blob", "key"), {"metadata": {"k": "v"}})
+        self.assertEqual((cache.hits, cache.misses), (2, 0))
+        self.assertIsNone(cache.get("bucket", "blob", "other"))
+
+    def test_get_expired(self):
+        cache = self._make_one(ttl=10)
+        with mock.patch("time.monotonic", return_value=100.0):
+            cache.put("bucket", "blob", "key", {})
+        with mock.patch("time.monotonic", return_value=109.0):
+            self.assertEqual(cache.get("bucket", "blob", "key"), {})
+        with mock.patch("time.monotonic", return_value=110.0):
+            self.assertIsNone(cache.get("bucket", "blob", "key"))
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache._keys_by_object, {})
+
+    def test_put_evicts_least_recently_used(self):
+        cache = self._make_one(max_entries=2)
+        cache.put("bucket", "a", "key", {"name": "a"})
+        cache.put("bucket", "b", "key", {"name": "b"})
+        cache.get("bucket", "a", "key")
+
+        cache.put("bucket", "c", "key", {"name": "c"})
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("bucket", "b", "key"))
+        self.assertEqual(cache.get("bucket", "a", "key"), {"name": "a"})
+        self.assertEqual(cache.get("bucket", "c", "key"), {"name": "c"})
+
+    def test_put_not_found(self):
+        from google.cloud.exceptions import NotFound
+
+        cache = self._make_one()
+        cache.put("bucket", "blob", "key", NotFound("missing"))
+
+        with self.assertRaises(NotFound) as raised:
+            cache.get("bucket", "blob", "key")
+
+        self.assertEqual(raised.exception.message, "missing")
+        self.assertEqual(cache.hits, 1)
+
+    def test_put_not_found_disabled(self):
+        from google.cloud.exceptions import NotFound
+
+        cache = self._make_one(cache_not_found=False)
+        cache.put("bucket", "blob", "key", NotFound("missing"))
+
+        self.assertEqual(len(cache), 0)
+
+    def test_put_stale_epoch(self):
+        cache = self._make_one()
+        epoch = cache.epoch
+        cache.invalidate("bucket", "blob")
+
+        cache.put("bucket", "blob", "key", {}, epoch=epoch)
+        self.assertEqual(len(cache), 0)
+
+        cache.put("bucket", "blob", "key", {}, epoch=cache.epoch)
+        self.assertEqual(len(cache), 1)
+
+    def test_invalidate(self):
+        cache = self._make_one()
+        cache.put("bucket", "blob", "generation-1", {"generation": "1"})
+        cache.put("bucket", "blob", "generation-2", {"generation": "2"})
+        cache.put("bucket", "other", "generation-1", {"generation": "1"})
+
+        cache.invalidate("bucket", "blob")
+        cache.invalidate("bucket", "missing")
+
+        self.assertEqual(len(cache), 1)
+        self.assertIsNone(cache.get("bucket", "blob", "generation-1"))
+        self.assertIsNotNone(cache.get("bucket", "other", "generation-1"))
+
+    def test_clear(self):
+        cache = self._make_one()
+        cache.put("bucket", "blob", "key", {})
+        epoch = cache.epoch
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertNotEqual(cache.epoch, epoch)
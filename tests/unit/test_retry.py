@@ -271,3 +271,370 @@ class Test_default_conditional_retry_policies(unittest.TestCase):
             query_params={"ifGenerationMatch": 1}, data="I am invalid JSON!"
         )
         self.assertEqual(policy, None)
+
+
+class TestRetryBudget(unittest.TestCase):
+    @staticmethod
+    def _make_one(*args, **kwargs):
+        from google.cloud.storage.retry import RetryBudget
+
+        return RetryBudget(*args, **kwargs)
+
+    def test_ctor_defaults(self):
+        budget = self._make_one()
+
+        self.assertEqual(budget.ratio, 0.1)
+        self.assertEqual(budget.max_tokens, 100)
+        self.assertEqual(budget.tokens, 100)
+        self.assertEqual((budget.successes, budget.retries, budget.rejected), (0, 0, 0))
+
+    def test_ctor_invalid(self):
+        with self.assertRaises(ValueError):
+            self._make_one(ratio=-1)
+        with self.assertRaises(ValueError):
+            self._make_one(max_tokens=0.5)
+
+    def test_acquire_until_exhausted(self):
+        budget = self._make_one(max_tokens=2)
+
+        self.assertTrue(budget.acquire())
+        self.assertTrue(budget.acquire())
+        self.assertFalse(budget.acquire())
+
+        self.assertEqual((budget.retries, budget.rejected), (2, 1))
+
+    def test_record_success_earns_retries(self):
+        budget = self._make_one(ratio=0.5, max_tokens=1)
+        budget.acquire()
+
+        budget.record_success()
+        self.assertFalse(budget.acquire())
+        budget.record_success()
+        self.assertTrue(budget.acquire())
+
+        for _ in range(10):
+            budget.record_success()
+        self.assertEqual(budget.tokens, 1)
+        self.assertEqual(budget.successes, 12)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    @staticmethod
+    def _make_one(*args, **kwargs):
+        from google.cloud.storage.retry import CircuitBreaker
+
+        return CircuitBreaker(*args, **kwargs)
+
+    @staticmethod
+    def _overloaded():
+        from google.api_core import exceptions
+
+        return exceptions.ServiceUnavailable("overloaded")
+
+    def _open(self, breaker):
+        for _ in range(breaker.failure_threshold):
+            self.assertTrue(breaker.allow_request())
+            breaker.record(self._overloaded())
+
+    def test_ctor_defaults(self):
+        breaker = self._make_one()
+
+        self.assertEqual(breaker.failure_threshold, 20)
+        self.assertEqual(breaker.reset_timeout, 30.0)
+        self.assertEqual(breaker.state, breaker.CLOSED)
+
+    def test_ctor_invalid(self):
+        with self.assertRaises(ValueError):
+            self._make_one(failure_threshold=0)
+
+    def test_opens_after_consecutive_overload_errors(self):
+        breaker = self._make_one(failure_threshold=3)
+
+        self._open(breaker)
+
+        self.assertEqual(breaker.state, breaker.OPEN)
+        self.assertEqual((breaker.failures, breaker.opened), (3, 1))
+        self.assertFalse(breaker.allow_request())
+        self.assertFalse(breaker.allow_retry())
+        self.assertEqual(breaker.rejected, 1)
+
+    def test_other_outcomes_reset_failures(self):
+        from google.api_core import exceptions
+
+        breaker = self._make_one(failure_threshold=2)
+
+        breaker.record(self._overloaded())
+        breaker.record(exceptions.NotFound("missing"))
+        breaker.record(self._overloaded())
+        breaker.record()
+        breaker.record(self._overloaded())
+
+        self.assertEqual(breaker.state, breaker.CLOSED)
+        self.assertEqual(breaker.failures, 1)
+
+    def test_transport_errors_count_as_failures(self):
+        import requests
+
+        breaker = self._make_one(failure_threshold=3)
+
+        breaker.record(requests.exceptions.ConnectionError("reset"))
+        breaker.record(requests.exceptions.Timeout("slow"))
+        self.assertEqual(breaker.state, breaker.CLOSED)
+        self.assertEqual(breaker.failures, 2)
+        breaker.record(self._overloaded())
+
+        self.assertEqual(breaker.state, breaker.OPEN)
+        self.assertEqual(breaker.failures, 3)
+
+    def test_unrelated_errors_leave_failures(self):
+        breaker = self._make_one(failure_threshold=3)
+
+        breaker.record(self._overloaded())
+        breaker.record(ValueError("bad argument"))
+
+        self.assertEqual(breaker.state, breaker.CLOSED)
+        self.assertEqual(breaker.failures, 1)
+
+    def test_probe_after_reset_timeout(self):
+        breaker = self._make_one(failure_threshold=1, reset_timeout=10)
+        with mock.patch("time.monotonic", return_value=100.0):
+            self._open(breaker)
+
+        with mock.patch("time.monotonic", return_value=110.0):
+            self.assertTrue(breaker.allow_request())
+            self.assertEqual(breaker.state, breaker.HALF_OPEN)
+            self.assertTrue(breaker.allow_retry())
+            # Only one probe is let through at a time.
+            self.assertFalse(breaker.allow_request())
+
+        breaker.record()
+        self.assertEqual(breaker.state, breaker.CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+    def test_failed_probe_reopens(self):
+        breaker = self._make_one(failure_threshold=5, reset_timeout=10)
+        with mock.patch("time.monotonic", return_value=100.0):
+            self._open(breaker)
+        with mock.patch("time.monotonic", return_value=110.0):
+            breaker.allow_request()
+            breaker.record(self._overloaded())
+
+        self.assertEqual(breaker.state, breaker.OPEN)
+        self.assertEqual(breaker.opened, 2)
+        with mock.patch("time.monotonic", return_value=119.0):
+            self.assertFalse(breaker.allow_request())
+
+    def test_probe_w_connection_error_reopens(self):
+        import requests
+
+        breaker = self._make_one(failure_threshold=5, reset_timeout=10)
+        with mock.patch("time.monotonic", return_value=100.0):
+            self._open(breaker)
+        with mock.patch("time.monotonic", return_value=110.0):
+            self.assertTrue(breaker.allow_request())
+            breaker.record(requests.exceptions.ConnectionError("reset"))
+
+        self.assertEqual(breaker.state, breaker.OPEN)
+        self.assertEqual(breaker.failures, 6)
+        self.assertEqual(breaker.opened, 2)
+
+
+class Test_is_overloaded(unittest.TestCase):
+    def _call_fut(self, exc):
+        from google.cloud.storage.retry import _is_overloaded
+
+        return _is_overloaded(exc)
+
+    def test_w_google_api_call_error(self):
+        from google.api_core import exceptions
+
+        self.assertTrue(self._call_fut(exceptions.TooManyRequests("slow down")))
+        self.assertTrue(self._call_fut(exceptions.InternalServerError("oops")))
+        self.assertFalse(self._call_fut(exceptions.NotFound("missing")))
+
+    def test_w_invalid_response(self):
+        response = mock.Mock(status_code=503, spec=["status_code"])
+        self.assertTrue(self._call_fut(InvalidResponse(response)))
+
+        response = mock.Mock(status_code=412, spec=["status_code"])
+        self.assertFalse(self._call_fut(InvalidResponse(response)))
+
+    def test_w_other_error(self):
+        self.assertFalse(self._call_fut(ConnectionError("reset")))
+
+
+class Test_is_transport_error(unittest.TestCase):
+    def _call_fut(self, exc):
+        from google.cloud.storage.retry import _is_transport_error
+
+        return _is_transport_error(exc)
+
+    def test_w_transport_errors(self):
+        import requests
+        from google.auth import exceptions as auth_exceptions
+
+        self.assertTrue(self._call_fut(ConnectionError("reset")))
+        self.assertTrue(self._call_fut(TimeoutError("slow")))
+        self.assertTrue(self._call_fut(requests.exceptions.ChunkedEncodingError()))
+        self.assertTrue(
+            self._call_fut(
+                auth_exceptions.TransportError(requests.exceptions.ReadTimeout())
+            )
+        )
+
+    def test_w_other_errors(self):
+        from google.api_core import exceptions
+
+        self.assertFalse(self._call_fut(exceptions.ServiceUnavailable("down")))
+        self.assertFalse(self._call_fut(ValueError("bad argument")))
+
+
+class Test_LimitedRetry(unittest.TestCase):
+    @staticmethod
+    def _make_one(*args, **kwargs):
+        from google.cloud.storage.retry import _LimitedRetry
+
+        return _LimitedRetry(*args, **kwargs)
+
+    @staticmethod
+    def _fast_retry():
+        from google.cloud.storage.retry import DEFAULT_RETRY
+
+        return DEFAULT_RETRY.with_delay(initial=0.001, maximum=0.001)
+
+    @staticmethod
+    def _failing(*errors, result="done"):
+        errors = list(errors)
+
+        def func():
+            func.calls += 1
+            if errors:
+                raise errors.pop(0)
+            return result
+
+        func.calls = 0
+        return func
+
+    def test_retries_charged_to_budget(self):
+        from google.api_core import exceptions
+        from google.cloud.storage.retry import RetryBudget
+
+        budget = RetryBudget(max_tokens=5)
+        func = self._failing(
+            exceptions.ServiceUnavailable("1"), exceptions.ServiceUnavailable("2")
+        )
+
+        result = self._make_one(self._fast_retry(), retry_budget=budget)(func)()
+
+        self.assertEqual(result, "done")
+        self.assertEqual(func.calls, 3)
+        self.assertEqual((budget.retries, budget.successes), (2, 1))
+
+    def test_exhausted_budget_stops_retries(self):
+        from google.api_core import exceptions
+        from google.cloud.storage.retry import RetryBudget
+
+        budget = RetryBudget(max_tokens=1)
+        func = self._failing(
+            exceptions.ServiceUnavailable("1"), exceptions.ServiceUnavailable("2")
+        )
+
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            self._make_one(self._fast_retry(), retry_budget=budget)(func)()
+
+        self.assertEqual(func.calls, 2)
+        self.assertEqual(budget.rejected, 1)
+
+    def test_non_retryable_error_not_charged(self):
+        from google.api_core import exceptions
+        from google.cloud.storage.retry import RetryBudget
+
+        budget = RetryBudget()
+        func = self._failing(exceptions.NotFound("missing"))
+
+        with self.assertRaises(exceptions.NotFound):
+            self._make_one(self._fast_retry(), retry_budget=budget)(func)()
+
+        self.assertEqual(budget.tokens, budget.max_tokens)
+
+    def test_open_breaker_fails_fast(self):
+        from google.api_core import exceptions
+        from google.cloud.storage.retry import CircuitBreaker
+        from google.cloud.storage.retry import CircuitBreakerOpen
+
+        breaker = CircuitBreaker(failure_threshold=2)
+        func = self._failing(
+            exceptions.ServiceUnavailable("1"), exceptions.ServiceUnavailable("2")
+        )
+        limited = self._make_one(self._fast_retry(), circuit_breaker=breaker)
+
+        # The breaker opens on the second failure, which is then not retried.
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            limited(func)()
+        with self.assertRaises(CircuitBreakerOpen):
+            limited(func)()
+
+        self.assertEqual(func.calls, 2)
+        self.assertEqual(breaker.rejected, 1)
+
+    def test_wo_retry_policy(self):
+        from google.api_core import exceptions
+        from google.cloud.storage.retry import CircuitBreaker
+
+        breaker = CircuitBreaker(failure_threshold=1)
+        func = self._failing(exceptions.ServiceUnavailable("1"))
+
+        with self.assertRaises(exceptions.ServiceUnavailable):
+            self._make_one(None, circuit_breaker=breaker)(func)()
+
+        self.assertEqual(func.calls, 1)
+        self.assertEqual(breaker.state, breaker.OPEN)
+
+    def test_w_coroutine_function(self):
+        import asyncio
+        from google.api_core import exceptions
+        from google.api_core.retry_async import AsyncRetry
+        from google.cloud.storage.retry import RetryBudget
+        from google.cloud.storage.retry import _should_retry
+
+        budget = RetryBudget()
+        errors = [exceptions.ServiceUnavailable("1")]
+
+        async def func():
+            if errors:
+                raise errors.pop(0)
+            return "done"
+
+        retry = AsyncRetry(predicate=_should_retry, initial=0.001, maximum=0.001)
+        limited = self._make_one(retry, retry_budget=budget)
+
+        self.assertEqual(asyncio.run(limited(func)()), "done")
+        self.assertEqual((budget.retries, budget.successes), (1, 1))
+
+
+class Test_limit_retries(unittest.TestCase):
+    def _call_fut(self, retry_policy, client):
+        from google.cloud.storage.retry import _limit_retries
+
+        return _limit_retries(retry_policy, client)
+
+    def test_wo_limits(self):
+        from google.cloud.storage.retry import DEFAULT_RETRY
+
+        client = mock.Mock(_retry_budget=None, _circuit_breaker=None, spec=[])
+        self.assertIs(self._call_fut(DEFAULT_RETRY, client), DEFAULT_RETRY)
+        self.assertIs(self._call_fut(DEFAULT_RETRY, object()), DEFAULT_RETRY)
+
+    def test_w_limits(self):
+        from google.cloud.storage.retry import DEFAULT_RETRY
+        from google.cloud.storage.retry import RetryBudget
+        from google.cloud.storage.retry import _LimitedRetry
+
+        budget = RetryBudget()
+        client = mock.Mock(_retry_budget=budget, _circuit_breaker=None, spec=[])
+
+        limited = self._call_fut(DEFAULT_RETRY, client)
+
+        self.assertIsInstance(limited, _LimitedRetry)
+        self.assertIs(limited._retry_policy, DEFAULT_RETRY)
+        self.assertIs(limited._retry_budget, budget)
@@ -984,6 +984,7 @@ def test_download_chunks_concurrently_passes_concurrency_options():
 def test_upload_chunks_concurrently():
     bucket = mock.Mock()
     bucket.name = "bucket"
+    bucket.path = "/b/bucket"
     bucket.client = _PickleableMockClient(identify_as_client=True)
     transport = bucket.client._http
     bucket.user_project = None
@@ -1020,11 +1021,13 @@ def test_upload_chunks_concurrently():
         container_mock.finalize.assert_called_once_with(bucket.client._http)
 
         part_mock.upload.assert_called_with(transport)
+    assert bucket.client.invalidated_paths == [blob.path]
 
 
 def test_upload_chunks_concurrently_quotes_urls():
     bucket = mock.Mock()
     bucket.name = "bucket"
+    bucket.path = "/b/bucket"
     bucket.client = _PickleableMockClient(identify_as_client=True)
     transport = bucket.client._http
     bucket.user_project = None
@@ -1072,6 +1075,7 @@ def test_upload_chunks_concurrently_quotes_urls():
 def test_upload_chunks_concurrently_passes_concurrency_options():
     bucket = mock.Mock()
     bucket.name = "bucket"
+    bucket.path = "/b/bucket"
     bucket.client = _PickleableMockClient(identify_as_client=True)
     transport = bucket.client._http
     bucket.user_project = None
@@ -1108,9 +1112,11 @@ def test_upload_chunks_concurrently_passes_concurrency_options():
             # Conveniently, that gives us a chance to test the auto-delete
             # exception handling feature.
         container_mock.cancel.assert_called_once_with(transport)
+        assert bucket.client.invalidated_paths == [blob.path]
 
         pool_patch.assert_called_with(max_workers=MAX_WORKERS)
         wait_patch.assert_called_with(mock.ANY, timeout=DEADLINE, return_when=mock.ANY)
+        assert bucket.client.connection_pool_maxsize == MAX_WORKERS
 
 
 def test_upload_chunks_concurrently_with_metadata_and_encryption():
@@ -1139,6 +1145,7 @@ def test_upload_chunks_concurrently_with_metadata_and_encryption():
 
     bucket = mock.Mock()
     bucket.name = "bucket"
+    bucket.path = "/b/bucket"
     bucket.client = _PickleableMockClient(
         identify_as_client=True, extra_headers=custom_headers
     )
@@ -1251,6 +1258,14 @@ class _PickleableMockClient:
         self._connection = _PickleableMockConnection()
         self.identify_as_client = identify_as_client
         self._extra_headers = extra_headers
+        self.connection_pool_maxsize = None
+        self.invalidated_paths = []
+
+    def _ensure_connection_pool_maxsize(self, maxsize):
+        self.connection_pool_maxsize = maxsize
+
+    def _invalidate_object_metadata(self, path):
+        self.invalidated_paths.append(path)
 
     @property
     def __class__(self):
@@ -1353,6 +1368,43 @@ def test__upload_part():
         assert result == (1, ETAG)
 
 
+def test__ensure_connection_pool_size():
+    client = mock.create_autospec(Client, instance=True)
+
+    transfer_manager._ensure_connection_pool_size(client, 32)
+
+    client._ensure_connection_pool_maxsize.assert_called_once_with(32)
+
+
+def test__ensure_connection_pool_size_w_other_client():
+    client = mock.Mock(spec=[])
+
+    # Clients other than storage.Client are left alone.
+    transfer_manager._ensure_connection_pool_size(client, 32)
+
+
+def test_upload_many_sizes_connection_pool():
+    client = mock.create_autospec(Client, instance=True)
+    blob = mock.Mock(client=client)
+
+    transfer_manager.upload_many(
+        [("file", blob)], max_workers=32, worker_type=transfer_manager.THREAD
+    )
+
+    client._ensure_connection_pool_maxsize.assert_called_once_with(32)
+
+
+def test_download_many_sizes_connection_pool():
+    client = mock.create_autospec(Client, instance=True)
+    blob = mock.Mock(client=client)
+
+    transfer_manager.download_many(
+        [(blob, "file")], max_workers=32, worker_type=transfer_manager.THREAD
+    )
+
+    client._ensure_connection_pool_maxsize.assert_called_once_with(32)
+
+
 def test__get_pool_class_and_requirements_error():
     with pytest.raises(ValueError):
         transfer_manager._get_pool_class_and_requirements("garbage")
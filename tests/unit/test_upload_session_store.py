@@ -0,0 +1,105 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import stat
+import tempfile
+import unittest
+
+RESUMABLE_URL = "https://storage.googleapis.com/upload?upload_id=abc"
+
+
+class TestUploadSessionStore(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self._store_directory = os.path.join(self._directory.name, "sessions")
+        self._filename = os.path.join(self._directory.name, "data.bin")
+        with open(self._filename, "wb") as data_file:
+            data_file.write(b"0123456789")
+
+    def _make_one(self):
+        from google.cloud.storage.upload_session_store import UploadSessionStore
+
+        return UploadSessionStore(self._store_directory)
+
+    def test_ctor_creates_directory(self):
+        store = self._make_one()
+        self.assertEqual(store.directory, self._store_directory)
+        self.assertTrue(os.path.isdir(self._store_directory))
+
+    def test_get_miss(self):
+        store = self._make_one()
+        self.assertIsNone(store.get("bucket", "blob", self._filename))
+
+    def test_put_and_get(self):
+        store = self._make_one()
+        checksum_state = {"type": "crc32c", "bytes": 4, "value": 1234}
+        store.put("bucket", "blob", self._filename, RESUMABLE_URL, checksum_state)
+
+        session = store.get("bucket", "blob", self._filename)
+
+        self.assertEqual(session["resumable_url"], RESUMABLE_URL)
+        self.assertEqual(session["checksum_state"], checksum_state)
+        self.assertEqual(session["file"]["path"], os.path.abspath(self._filename))
+        self.assertEqual(session["file"]["size"], 10)
+        # Sessions are keyed by bucket, blob and file.
+        self.assertIsNone(store.get("other", "blob", self._filename))
+        self.assertIsNone(store.get("bucket", "other", self._filename))
+
+    def test_put_is_owner_only(self):
+        store = self._make_one()
+        store.put("bucket", "blob", self._filename, RESUMABLE_URL)
+
+        (name,) = os.listdir(self._store_directory)
+        mode = os.stat(os.path.join(self._store_directory, name)).st_mode
+        self.assertEqual(stat.S_IMODE(mode) & 0o077, 0)
+
+    def test_put_overwrites(self):
+        store = self._make_one()
+        store.put("bucket", "blob", self._filename, RESUMABLE_URL)
+        store.put("bucket", "blob", self._filename, RESUMABLE_URL + "2")
+
+        session = store.get("bucket", "blob", self._filename)
+        self.assertEqual(session["resumable_url"], RESUMABLE_URL + "2")
+        self.assertEqual(len(os.listdir(self._store_directory)), 1)
+
+    def test_get_file_changed(self):
+        store = self._make_one()
+        store.put("bucket", "blob", self._filename, RESUMABLE_URL)
+        with open(self._filename, "ab") as data_file:
+            data_file.write(b"more")
+
+        self.assertIsNone(store.get("bucket", "blob", self._filename))
+        # The stale session is removed.
+        self.assertEqual(os.listdir(self._store_directory), [])
+
+    def test_get_corrupt(self):
+        store = self._make_one()
+        store.put("bucket", "blob", self._filename, RESUMABLE_URL)
+        (name,) = os.listdir(self._store_directory)
+        with open(os.path.join(self._store_directory, name), "w") as session_file:
+            session_file.write("{not json")
+
+        self.assertIsNone(store.get("bucket", "blob", self._filename))
+        self.assertEqual(os.listdir(self._store_directory), [])
+
+    def test_delete(self):
+        store = self._make_one()
+        store.put("bucket", "blob", self._filename, RESUMABLE_URL)
+
+        store.delete("bucket", "blob", self._filename)
+        self.assertIsNone(store.get("bucket", "blob", self._filename))
+        # Deleting a missing session is a no-op.
+        store.delete("bucket", "blob", self._filename)